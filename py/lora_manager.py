@@ -466,6 +466,13 @@ class LoraManager:
                     scanner.cancel_task()
                     logger.debug("LoRA Manager: Cancelled %s", name)
 
+            # Write model edits still queued in the scanners' write-behind
+            # journals before the process exits.
+            for name in ("lora_scanner", "checkpoint_scanner", "embedding_scanner"):
+                scanner = ServiceRegistry.get_service_sync(name)
+                if scanner is not None and hasattr(scanner, "flush_persistent_cache"):
+                    await scanner.flush_persistent_cache()
+
             # Close shared aiohttp sessions to avoid "Unclosed client session" warnings
             try:
                 from py.routes.handlers.hf_handlers import close_hf_api_session
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import re
@@ -6,6 +7,7 @@ import uuid
 from typing import Any, Dict, Optional
 import numpy as np
 import folder_paths  # pyright: ignore[reportMissingImports]
+from ..services.recipe_cache import RecipeCache
 from ..services.service_registry import ServiceRegistry
 from ..metadata_collector.metadata_processor import MetadataProcessor
 from ..metadata_collector import get_metadata
@@ -169,6 +171,11 @@ BASE_MODEL_AIR_SLUG = {
 logger = logging.getLogger(__name__)
 
 
+def _log_recipe_cache_failure(future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Failed to add saved recipe to the cache: %s", future.exception())
+
+
 class SaveImageLM:
     NAME = "Save Image (LoraManager)"
     CATEGORY = "Lora Manager/utils"
@@ -696,29 +703,50 @@ class SaveImageLM:
 
     @staticmethod
     def _sync_recipe_cache(recipe_scanner, recipe_data, json_path):
+        recipe_id = str(recipe_data.get("id", ""))
+        if recipe_id:
+            recipe_scanner._json_path_map[recipe_id] = json_path
+
         cache = getattr(recipe_scanner, "_cache", None)
+        loop = getattr(recipe_scanner, "loop", None)
+        if (
+            isinstance(cache, RecipeCache)
+            and isinstance(loop, asyncio.AbstractEventLoop)
+            and loop.is_running()
+        ):
+            # Nodes run on the execution thread, while the cache's sorted
+            # views are only patched on the server loop; add_recipe also
+            # updates the FTS index and the persistent cache there.
+            future = asyncio.run_coroutine_threadsafe(
+                recipe_scanner.add_recipe(recipe_data), loop
+            )
+            future.add_done_callback(_log_recipe_cache_failure)
+            return future
+
         if cache is not None:
             cache.raw_data.append(recipe_data)
-            cache.sorted_by_name = sorted(
-                cache.raw_data, key=lambda item: item.get("title", "").lower()
-            )
-            cache.sorted_by_date = sorted(
-                cache.raw_data,
-                key=lambda item: (
-                    item.get("modified", item.get("created_date", 0)),
-                    item.get("file_path", ""),
-                ),
-                reverse=True,
-            )
+            if isinstance(cache, RecipeCache):
+                # No server loop is running, so nothing else reads the views
+                cache.sync_sorted_views()
+            else:
+                cache.sorted_by_name = sorted(
+                    cache.raw_data, key=lambda item: item.get("title", "").lower()
+                )
+                cache.sorted_by_date = sorted(
+                    cache.raw_data,
+                    key=lambda item: (
+                        item.get("modified", item.get("created_date", 0)),
+                        item.get("file_path", ""),
+                    ),
+                    reverse=True,
+                )
             recipe_scanner._update_folder_metadata(cache)
             recipe_scanner._update_fts_index_for_recipe(recipe_data, "add")
 
-        recipe_id = str(recipe_data.get("id", ""))
-        if recipe_id:
-            recipe_scanner._json_path_map[recipe_id] = json_path
         persistent_cache = getattr(recipe_scanner, "_persistent_cache", None)
         if persistent_cache:
             persistent_cache.update_recipe(recipe_data, json_path)
+        return None
 
     def _save_image_as_recipe(self, file_path, metadata_dict):
         if not metadata_dict:
@@ -2553,8 +2553,11 @@ class ModelLibraryHandler:
             scanner = scanner_map.get(found_type or "")
             if scanner:
                 scanner.bump_cache_version()
+                mark_models_dirty: Any = getattr(scanner, "mark_models_dirty", None)
                 persist: Any = getattr(scanner, "_persist_current_cache", None)
-                if persist:
+                if mark_models_dirty:
+                    mark_models_dirty(file_paths)
+                elif persist:
                     await persist()
 
             history_service = await self._get_download_history_service()
@@ -3290,7 +3293,9 @@ class CustomWordsHandler:
             if category_param:
                 categories = self._parse_category_param(category_param)
 
-            results = self._service.search_words(
+            # The FTS query is blocking SQLite work; keep it off the event loop
+            results = await asyncio.to_thread(
+                self._service.search_words,
                 search_term,
                 limit,
                 offset=offset,
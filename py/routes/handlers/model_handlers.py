@@ -41,6 +41,13 @@ from ...services.download_queue_service import DownloadQueueService
 from ...services.errors import RateLimitError, ResourceNotFoundError
 from ...utils.civitai_utils import resolve_license_payload
 from ...utils.file_utils import calculate_sha256
+from ...utils.http_responses import (
+    build_etag,
+    etag_matches,
+    json_response,
+    not_modified,
+    query_fingerprint,
+)
 from ...utils.metadata_manager import MetadataManager
 
 LICENSE_FIELDS = (
@@ -54,6 +61,20 @@ LICENSE_FIELDS = (
 _broadcast_models_changed_tasks: set = set()
 
 
+async def _state_etag(
+    service, request: web.Request, endpoint: str, sort_by: Optional[str] = None
+) -> Optional[str]:
+    """Return the ETag of a read-only response, or ``None`` if it cannot be derived."""
+
+    get_state_token = getattr(service, "get_state_token", None)
+    if get_state_token is None:
+        return None
+    token = await get_state_token(sort_by)
+    if token is None:
+        return None
+    return build_etag(endpoint, token, query_fingerprint(request))
+
+
 def _broadcast_models_changed() -> None:
     """Notify connected clients that the local model library changed.
 
@@ -233,6 +254,11 @@ class ModelListingHandler:
         start_time = time.perf_counter()
         try:
             params = self._parse_common_params(request)
+            etag = await _state_etag(
+                self._service, request, "list", sort_by=params["sort_by"]
+            )
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             result = await self._service.get_paginated_data(**params)
 
             format_start = time.perf_counter()
@@ -261,7 +287,7 @@ class ModelListingHandler:
                 duration,
                 format_duration,
             )
-            return web.json_response(formatted_result)
+            return await json_response(request, formatted_result, etag=etag)
         except Exception as exc:
             self._logger.error(
                 "Error retrieving %ss: %s", self._service.model_type, exc, exc_info=True
@@ -1036,8 +1062,13 @@ class ModelQueryHandler:
                 limit = 20
             elif limit > 200:
                 limit = 20
+            etag = await _state_etag(self._service, request, "top-tags")
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             top_tags = await self._service.get_top_tags(limit)
-            return web.json_response({"success": True, "tags": top_tags})
+            return await json_response(
+                request, {"success": True, "tags": top_tags}, etag=etag
+            )
         except Exception as exc:
             self._logger.error("Error getting top tags: %s", exc, exc_info=True)
             return web.json_response(
@@ -1065,8 +1096,13 @@ class ModelQueryHandler:
             limit = int(request.query.get("limit", "20"))
             if limit < 0 or limit > 100:
                 limit = 20
+            etag = await _state_etag(self._service, request, "base-models")
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             base_models = await self._service.get_base_models(limit)
-            return web.json_response({"success": True, "base_models": base_models})
+            return await json_response(
+                request, {"success": True, "base_models": base_models}, etag=etag
+            )
         except Exception as exc:
             self._logger.error("Error retrieving base models: %s", exc)
             return web.json_response({"success": False, "error": str(exc)}, status=500)
@@ -1085,8 +1121,11 @@ class ModelQueryHandler:
     async def scan_models(self, request: web.Request) -> web.Response:
         try:
             full_rebuild = request.query.get("full_rebuild", "false").lower() == "true"
+            deep_reconcile = request.query.get("deep", "false").lower() == "true"
             await self._service.scan_models(
-                force_refresh=True, rebuild_cache=full_rebuild
+                force_refresh=True,
+                rebuild_cache=full_rebuild,
+                deep_reconcile=deep_reconcile,
             )
             _broadcast_models_changed()
             if self._service.scanner.is_cancelled():
@@ -1149,16 +1188,26 @@ class ModelQueryHandler:
                     {"success": False, "error": "model_root parameter is required"},
                     status=400,
                 )
+            etag = await _state_etag(self._service, request, "folder-tree")
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             folder_tree = await self._service.get_folder_tree(model_root)
-            return web.json_response({"success": True, "tree": folder_tree})
+            return await json_response(
+                request, {"success": True, "tree": folder_tree}, etag=etag
+            )
         except Exception as exc:
             self._logger.error("Error getting folder tree: %s", exc)
             return web.json_response({"success": False, "error": str(exc)}, status=500)
 
     async def get_unified_folder_tree(self, request: web.Request) -> web.Response:
         try:
+            etag = await _state_etag(self._service, request, "unified-folder-tree")
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             unified_tree = await self._service.get_unified_folder_tree()
-            return web.json_response({"success": True, "tree": unified_tree})
+            return await json_response(
+                request, {"success": True, "tree": unified_tree}, etag=etag
+            )
         except Exception as exc:
             self._logger.error("Error getting unified folder tree: %s", exc)
             return web.json_response({"success": False, "error": str(exc)}, status=500)
@@ -241,7 +241,17 @@ class PendingDeleteHandler:
             )
             return
 
-        for snapshot in snapshots:
+        # Manifests staged before snapshots were hydrated may lack the
+        # deferred columns; load them while the persisted row still exists so
+        # the write-behind flush does not persist them empty.
+        restored_entries = [dict(snapshot) for snapshot in snapshots]
+        ensure_hydrated = getattr(scanner, "ensure_hydrated", None)
+        if callable(ensure_hydrated):
+            result = ensure_hydrated(restored_entries)
+            if inspect.isawaitable(result):
+                await result
+
+        for snapshot in restored_entries:
             file_path = str(snapshot["file_path"])
             # A rescan between delete and undo may have re-added a stale entry
             # for this path - drop it so exactly one (the snapshot) remains.
@@ -258,7 +268,7 @@ class PendingDeleteHandler:
                         continue
                     scanner._tags_count[tag] = scanner._tags_count.get(tag, 0) + 1
 
-            cache.raw_data.append(dict(snapshot))
+            cache.raw_data.append(snapshot)
 
             # Re-register the path in the hash index (add_entry guards a
             # missing sha256 internally; still guard defensively here).
@@ -276,6 +286,11 @@ class PendingDeleteHandler:
 
         scanner.bump_cache_version()
 
+        mark_models_dirty = getattr(scanner, "mark_models_dirty", None)
+        if callable(mark_models_dirty):
+            mark_models_dirty([str(snapshot["file_path"]) for snapshot in snapshots])
+            return
+
         persist = getattr(scanner, "_persist_current_cache", None)
         if callable(persist):
             result = persist()
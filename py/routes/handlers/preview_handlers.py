@@ -11,6 +11,7 @@ from pathlib import Path
 from aiohttp import web
 
 from ...config import config as global_config
+from ...services.thumbnail_service import ThumbnailService, content_type_for
 
 logger = logging.getLogger(__name__)
 
@@ -24,16 +25,24 @@ _VIDEO_EXTENSIONS = frozenset({".mp4", ".webm", ".mov", ".avi", ".mkv"})
 class PreviewHandler:
     """Serve preview assets for the active library at request time."""
 
-    def __init__(self, *, config=global_config) -> None:
+    def __init__(self, *, config=global_config, thumbnail_service: ThumbnailService | None = None) -> None:
         self._config = config
+        self._thumbnail_service = thumbnail_service
 
     async def serve_preview(self, request: web.Request) -> web.StreamResponse:
-        """Return the preview file referenced by the encoded ``path`` query."""
+        """Return the preview file referenced by the encoded ``path`` query.
+
+        With a ``w`` query the response is a downscaled thumbnail of at most
+        that width (a poster frame for videos); ``format=avif`` selects AVIF
+        instead of WebP where Pillow supports it.
+        """
 
         raw_path = request.query.get("path", "")
         if not raw_path:
             raise web.HTTPBadRequest(text="Missing 'path' query parameter")
 
+        width = self._parse_width(request.query.get("w"))
+
         try:
             decoded_path = urllib.parse.unquote(raw_path)
         except Exception as exc:  # pragma: no cover - defensive guard
@@ -57,6 +66,19 @@ class PreviewHandler:
             asyncio.create_task(self._cleanup_stale_preview_url(normalized))
             raise web.HTTPNotFound(text="Preview file not found")
 
+        if width is not None:
+            thumbnail_service = self._thumbnail_service or await ThumbnailService.get_instance()
+            fmt = request.query.get("format", "webp").lower()
+            thumbnail = await thumbnail_service.get_thumbnail(resolved, width, fmt)
+            if thumbnail is not None:
+                resp = web.FileResponse(path=thumbnail, chunk_size=_CHUNK_SIZE)
+                resp.headers["Content-Type"] = content_type_for(thumbnail)
+                resp.headers["Cache-Control"] = "public, max-age=86400"
+                return resp
+            if resolved.suffix.lower() in _VIDEO_EXTENSIONS:
+                # A poster was requested; the full video is no substitute
+                raise web.HTTPNotFound(text="Preview poster not available")
+
         # aiohttp's FileResponse handles range requests, content headers, and
         # uses kernel sendfile (zero-copy DMA) on Linux/macOS. On Windows it
         # uses IOCP-based _sendfile_native which can crash when the client
@@ -71,6 +93,18 @@ class PreviewHandler:
         resp.headers["Cache-Control"] = "public, max-age=86400"
         return resp
 
+    @staticmethod
+    def _parse_width(raw_width: str | None) -> int | None:
+        if raw_width is None or raw_width == "":
+            return None
+        try:
+            width = int(raw_width)
+        except ValueError as exc:
+            raise web.HTTPBadRequest(text="Invalid 'w' query parameter") from exc
+        if width <= 0:
+            raise web.HTTPBadRequest(text="Invalid 'w' query parameter")
+        return width
+
     async def _cleanup_stale_preview_url(self, normalized_preview_path: str) -> None:
         """Fire-and-forget: clear stale preview_url from all model caches.
 
@@ -89,11 +123,11 @@ class PreviewHandler:
                 if cache is None or not hasattr(cache, "clear_preview_by_path"):
                     continue
                 cleared = await cache.clear_preview_by_path(normalized_preview_path)
-                if cleared and hasattr(scanner, "_persist_current_cache"):
-                    await scanner._persist_current_cache()
+                if cleared and hasattr(scanner, "mark_models_dirty"):
+                    scanner.mark_models_dirty(cleared)
                     logger.info(
                         "Cleared stale preview_url for %d %s entries (%s)",
-                        cleared,
+                        len(cleared),
                         service_name,
                         normalized_preview_path,
                     )
@@ -34,6 +34,13 @@ from ...utils.civitai_utils import (
 )
 from ...utils.constants import NSFW_LEVELS
 from ...utils.exif_utils import ExifUtils
+from ...utils.http_responses import (
+    build_etag,
+    etag_matches,
+    json_response,
+    not_modified,
+    query_fingerprint,
+)
 from ...utils.recipe_open_stats import RecipeOpenStats
 from ...recipes.merger import GenParamsMerger
 from ...recipes.enrichment import RecipeEnricher
@@ -46,6 +53,20 @@ RecipeScannerGetter = Callable[[], Any]
 CivitaiClientGetter = Callable[[], Any]
 
 
+async def _state_etag(
+    recipe_scanner, request: web.Request, endpoint: str, sort_by: Optional[str] = None
+) -> Optional[str]:
+    """Return the ETag of a read-only response, or ``None`` if it cannot be derived."""
+
+    get_state_token = getattr(recipe_scanner, "get_state_token", None)
+    if get_state_token is None:
+        return None
+    token = await get_state_token(sort_by)
+    if token is None:
+        return None
+    return build_etag(endpoint, token, query_fingerprint(request))
+
+
 class PromptServerProtocol(Protocol):
     """Subset of PromptServer used by the recipe workflow handler."""
 
@@ -223,6 +244,9 @@ class RecipeListingHandler:
             page = int(request.query.get("page", "1"))
             page_size = int(request.query.get("page_size", "20"))
             sort_by = request.query.get("sort_by", "date")
+            etag = await _state_etag(recipe_scanner, request, "list", sort_by=sort_by)
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             search = request.query.get("search")
             folder = request.query.get("folder")
             recursive = request.query.get("recursive", "true").lower() == "true"
@@ -312,7 +336,7 @@ class RecipeListingHandler:
                         item = items[idx]
                         item["width"], item["height"] = dims
 
-            return web.json_response(result)
+            return await json_response(request, result, etag=etag)
         except Exception as exc:
             self._logger.error("Error retrieving recipes: %s", exc, exc_info=True)
             return web.json_response({"error": str(exc)}, status=500)
@@ -379,13 +403,18 @@ class RecipeQueryHandler:
                 limit = 20
             elif limit > 200:
                 limit = 20
+            etag = await _state_etag(recipe_scanner, request, "top-tags")
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             tag_counts = await self._get_recipe_tag_counts(recipe_scanner)
 
             sorted_tags = [
                 {"tag": tag, "count": count} for tag, count in tag_counts.items()
             ]
             sorted_tags.sort(key=lambda entry: entry["count"], reverse=True)
-            return web.json_response({"success": True, "tags": sorted_tags[:limit]})
+            return await json_response(
+                request, {"success": True, "tags": sorted_tags[:limit]}, etag=etag
+            )
         except Exception as exc:
             self._logger.error("Error retrieving top tags: %s", exc, exc_info=True)
             return web.json_response({"success": False, "error": str(exc)}, status=500)
@@ -447,6 +476,9 @@ class RecipeQueryHandler:
                 raise RuntimeError("Recipe scanner unavailable")
 
             limit = int(request.query.get("limit", "20"))
+            etag = await _state_etag(recipe_scanner, request, "base-models")
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             cache = await recipe_scanner.get_cached_data()
 
             base_model_counts: Dict[str, int] = {}
@@ -464,7 +496,9 @@ class RecipeQueryHandler:
             sorted_models.sort(key=lambda entry: entry["count"], reverse=True)
             if limit > 0:
                 sorted_models = sorted_models[:limit]
-            return web.json_response({"success": True, "base_models": sorted_models})
+            return await json_response(
+                request, {"success": True, "base_models": sorted_models}, etag=etag
+            )
         except Exception as exc:
             self._logger.error("Error retrieving base models: %s", exc, exc_info=True)
             return web.json_response({"success": False, "error": str(exc)}, status=500)
@@ -504,8 +538,13 @@ class RecipeQueryHandler:
             if recipe_scanner is None:
                 raise RuntimeError("Recipe scanner unavailable")
 
+            etag = await _state_etag(recipe_scanner, request, "folder-tree")
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             folder_tree = await recipe_scanner.get_folder_tree()
-            return web.json_response({"success": True, "tree": folder_tree})
+            return await json_response(
+                request, {"success": True, "tree": folder_tree}, etag=etag
+            )
         except Exception as exc:
             self._logger.error(
                 "Error retrieving recipe folder tree: %s", exc, exc_info=True
@@ -519,8 +558,13 @@ class RecipeQueryHandler:
             if recipe_scanner is None:
                 raise RuntimeError("Recipe scanner unavailable")
 
+            etag = await _state_etag(recipe_scanner, request, "unified-folder-tree")
+            if etag is not None and etag_matches(request, etag):
+                return not_modified(etag)
             folder_tree = await recipe_scanner.get_folder_tree()
-            return web.json_response({"success": True, "tree": folder_tree})
+            return await json_response(
+                request, {"success": True, "tree": folder_tree}, etag=etag
+            )
         except Exception as exc:
             self._logger.error(
                 "Error retrieving unified recipe folder tree: %s", exc, exc_info=True
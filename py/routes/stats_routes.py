@@ -3,9 +3,9 @@ import json
 import jinja2
 from aiohttp import web
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, Counter
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
 from ..config import config
 from ..services.settings_manager import get_settings_manager
@@ -141,7 +141,8 @@ class StatsRoutes:
             embedding_size = sum(emb.get('size', 0) for emb in embedding_cache.raw_data)
             
             # Get usage statistics
-            usage_data = await self.usage_stats.get_stats()
+            usage_counts = await self._get_usage_counts()
+            total_executions = await self.usage_stats.get_total_executions()
             
             # CivitAI model type distribution across all model types
             # Use the same logic as the filter panel: normalize_sub_type(resolve_sub_type(entry))
@@ -169,10 +170,10 @@ class StatsRoutes:
                     'lora_size': lora_size,
                     'checkpoint_size': checkpoint_size,
                     'embedding_size': embedding_size,
-                    'total_generations': usage_data.get('total_executions', 0),
-                    'unused_loras': self._count_unused_models(lora_cache.raw_data, usage_data.get('loras', {})),
-                    'unused_checkpoints': self._count_unused_models(checkpoint_cache.raw_data, usage_data.get('checkpoints', {})),
-                    'unused_embeddings': self._count_unused_models(embedding_cache.raw_data, usage_data.get('embeddings', {})),
+                    'total_generations': total_executions,
+                    'unused_loras': self._count_unused_models(lora_cache.raw_data, usage_counts['loras']),
+                    'unused_checkpoints': self._count_unused_models(checkpoint_cache.raw_data, usage_counts['checkpoints']),
+                    'unused_embeddings': self._count_unused_models(embedding_cache.raw_data, usage_counts['embeddings']),
                     'model_types_distribution': dict(model_types_counter.most_common())
                 }
             })
@@ -188,9 +189,10 @@ class StatsRoutes:
         """Get usage analytics data"""
         try:
             await self.init_services()
-            
-            # Get usage statistics
-            usage_data = await self.usage_stats.get_stats()
+
+            granularity = request.query.get('granularity', 'day')
+            if granularity not in ('day', 'week'):
+                return web.json_response({'success': False, 'error': f"Invalid granularity: {granularity}"}, status=400)
             
             # Get model data for enrichment
             lora_cache = await self.lora_scanner.get_cached_data()
@@ -203,12 +205,16 @@ class StatsRoutes:
             embedding_map = {emb['sha256']: emb for emb in embedding_cache.raw_data}
             
             # Prepare top used models
-            top_loras = self._get_top_used_models(usage_data.get('loras', {}), lora_map, 10)
-            top_checkpoints = self._get_top_used_models(usage_data.get('checkpoints', {}), checkpoint_map, 10)
-            top_embeddings = self._get_top_used_models(usage_data.get('embeddings', {}), embedding_map, 10)
-            
-            # Prepare usage timeline (last 30 days)
-            timeline = self._get_usage_timeline(usage_data, 30)
+            top_loras = self._get_top_used_models(await self.usage_stats.get_top_models('loras', 10), lora_map)
+            top_checkpoints = self._get_top_used_models(await self.usage_stats.get_top_models('checkpoints', 10), checkpoint_map)
+            top_embeddings = self._get_top_used_models(await self.usage_stats.get_top_models('embeddings', 10), embedding_map)
+            
+            # Prepare usage timeline (last 30 days, or last 12 weeks)
+            timeline = await self.usage_stats.get_usage_timeline(
+                30 if granularity == 'day' else 12,
+                granularity=granularity,
+                today=datetime.now().date(),
+            )
             
             return web.json_response({
                 'success': True,
@@ -217,7 +223,7 @@ class StatsRoutes:
                     'top_checkpoints': top_checkpoints,
                     'top_embeddings': top_embeddings,
                     'usage_timeline': timeline,
-                    'total_executions': usage_data.get('total_executions', 0)
+                    'total_executions': await self.usage_stats.get_total_executions()
                 }
             })
             
@@ -243,28 +249,27 @@ class StatsRoutes:
                 limit = 50
                 offset = 0
 
-            # Get usage statistics
-            usage_data = await self.usage_stats.get_stats()
-            
-            # Select proper cache and usage dict based on type
+            # Select proper cache and usage category based on type
             if model_type == 'lora':
                 cache = await self.lora_scanner.get_cached_data()
-                type_usage_data = usage_data.get('loras', {})
+                category = 'loras'
             elif model_type == 'checkpoint':
                 cache = await self.checkpoint_scanner.get_cached_data()
-                type_usage_data = usage_data.get('checkpoints', {})
+                category = 'checkpoints'
             elif model_type == 'embedding':
                 cache = await self.embedding_scanner.get_cached_data()
-                type_usage_data = usage_data.get('embeddings', {})
+                category = 'embeddings'
             else:
                 return web.json_response({'success': False, 'error': f"Invalid model type: {model_type}"}, status=400)
 
+            # Get usage statistics
+            type_usage_counts = await self.usage_stats.get_usage_counts(category)
+
             # Create list of all models
             all_models = []
             for item in cache.raw_data:
                 sha256 = item.get('sha256')
-                usage_info = type_usage_data.get(sha256, {}) if sha256 else {}
-                usage_count = usage_info.get('total', 0) if isinstance(usage_info, dict) else 0
+                usage_count = type_usage_counts.get(sha256, 0) if sha256 else 0
                 
                 all_models.append({
                     'name': item.get('model_name', 'Unknown'),
@@ -378,7 +383,7 @@ class StatsRoutes:
             await self.init_services()
             
             # Get usage statistics
-            usage_data = await self.usage_stats.get_stats()
+            usage_counts = await self._get_usage_counts()
             
             # Get model data
             lora_cache = await self.lora_scanner.get_cached_data()
@@ -388,9 +393,7 @@ class StatsRoutes:
             # Create models with usage data
             lora_storage = []
             for lora in lora_cache.raw_data:
-                usage_count = 0
-                if lora['sha256'] in usage_data.get('loras', {}):
-                    usage_count = usage_data['loras'][lora['sha256']].get('total', 0)
+                usage_count = usage_counts['loras'].get(lora['sha256'], 0)
                 
                 lora_storage.append({
                     'name': lora['model_name'],
@@ -402,9 +405,7 @@ class StatsRoutes:
             
             checkpoint_storage = []
             for cp in checkpoint_cache.raw_data:
-                usage_count = 0
-                if cp['sha256'] in usage_data.get('checkpoints', {}):
-                    usage_count = usage_data['checkpoints'][cp['sha256']].get('total', 0)
+                usage_count = usage_counts['checkpoints'].get(cp['sha256'], 0)
                 
                 checkpoint_storage.append({
                     'name': cp['model_name'],
@@ -416,9 +417,7 @@ class StatsRoutes:
             
             embedding_storage = []
             for emb in embedding_cache.raw_data:
-                usage_count = 0
-                if emb['sha256'] in usage_data.get('embeddings', {}):
-                    usage_count = usage_data['embeddings'][emb['sha256']].get('total', 0)
+                usage_count = usage_counts['embeddings'].get(emb['sha256'], 0)
                 
                 embedding_storage.append({
                     'name': emb['model_name'],
@@ -455,7 +454,8 @@ class StatsRoutes:
             await self.init_services()
             
             # Get usage statistics
-            usage_data = await self.usage_stats.get_stats()
+            usage_counts = await self._get_usage_counts()
+            total_executions = await self.usage_stats.get_total_executions()
             
             # Get model data
             lora_cache = await self.lora_scanner.get_cached_data()
@@ -465,9 +465,9 @@ class StatsRoutes:
             insights = []
             
             # Calculate unused models
-            unused_loras = self._count_unused_models(lora_cache.raw_data, usage_data.get('loras', {}))
-            unused_checkpoints = self._count_unused_models(checkpoint_cache.raw_data, usage_data.get('checkpoints', {}))
-            unused_embeddings = self._count_unused_models(embedding_cache.raw_data, usage_data.get('embeddings', {}))
+            unused_loras = self._count_unused_models(lora_cache.raw_data, usage_counts['loras'])
+            unused_checkpoints = self._count_unused_models(checkpoint_cache.raw_data, usage_counts['checkpoints'])
+            unused_embeddings = self._count_unused_models(embedding_cache.raw_data, usage_counts['embeddings'])
             
             total_loras = len(lora_cache.raw_data)
             total_checkpoints = len(checkpoint_cache.raw_data)
@@ -527,12 +527,12 @@ class StatsRoutes:
                 })
             
             # Recent activity insight
-            if usage_data.get('total_executions', 0) > 100:
+            if total_executions > 100:
                 insights.append({
                     'type': 'success',
                     'key': 'insights.activity.active',
                     'params': {
-                        'count': str(usage_data['total_executions'])
+                        'count': str(total_executions)
                     }
                 })
             
@@ -550,9 +550,16 @@ class StatsRoutes:
                 'error': str(e)
             }, status=500)
 
-    def _count_unused_models(self, models: List[Dict[str, Any]], usage_data: Dict[str, Any]) -> int:
+    async def _get_usage_counts(self) -> Dict[str, Dict[str, int]]:
+        """Get total usage per model hash for every model category"""
+        return {
+            category: await self.usage_stats.get_usage_counts(category)
+            for category in ('loras', 'checkpoints', 'embeddings')
+        }
+
+    def _count_unused_models(self, models: List[Dict[str, Any]], usage_counts: Dict[str, int]) -> int:
         """Count models that have never been used"""
-        used_hashes = set(usage_data.keys())
+        used_hashes = set(usage_counts.keys())
         unused_count = 0
         
         for model in models:
@@ -561,17 +568,15 @@ class StatsRoutes:
                 
         return unused_count
 
-    def _get_top_used_models(self, usage_data: Dict[str, Any], model_map: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
-        """Get top used models with their metadata"""
-        sorted_usage = sorted(usage_data.items(), key=lambda x: x[1].get('total', 0), reverse=True)
-        
+    def _get_top_used_models(self, top_usage: List[Tuple[str, int]], model_map: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Attach model metadata to the most used hashes, skipping removed models"""
         top_models = []
-        for sha256, usage_info in sorted_usage[:limit]:
+        for sha256, usage_count in top_usage:
             if sha256 in model_map:
                 model = model_map[sha256]
                 top_models.append({
                     'name': model['model_name'],
-                    'usage_count': usage_info.get('total', 0),
+                    'usage_count': usage_count,
                     'base_model': model.get('base_model', 'Unknown'),
                     'preview_url': config.get_preview_static_url(model.get('preview_url', '')),
                     'folder': model.get('folder', '')
@@ -579,42 +584,6 @@ class StatsRoutes:
         
         return top_models
 
-    def _get_usage_timeline(self, usage_data: Dict[str, Any], days: int) -> List[Dict[str, Any]]:
-        """Get usage timeline for the past N days"""
-        timeline = []
-        today = datetime.now()
-        
-        for i in range(days):
-            date = today - timedelta(days=i)
-            date_str = date.strftime('%Y-%m-%d')
-            
-            lora_usage = 0
-            checkpoint_usage = 0
-            embedding_usage = 0
-            
-            # Count usage for this date
-            for model_usage in usage_data.get('loras', {}).values():
-                if isinstance(model_usage, dict) and 'history' in model_usage:
-                    lora_usage += model_usage['history'].get(date_str, 0)
-            
-            for model_usage in usage_data.get('checkpoints', {}).values():
-                if isinstance(model_usage, dict) and 'history' in model_usage:
-                    checkpoint_usage += model_usage['history'].get(date_str, 0)
-            
-            for model_usage in usage_data.get('embeddings', {}).values():
-                if isinstance(model_usage, dict) and 'history' in model_usage:
-                    embedding_usage += model_usage['history'].get(date_str, 0)
-            
-            timeline.append({
-                'date': date_str,
-                'lora_usage': lora_usage,
-                'checkpoint_usage': checkpoint_usage,
-                'embedding_usage': embedding_usage,
-                'total_usage': lora_usage + checkpoint_usage + embedding_usage
-            })
-        
-        return list(reversed(timeline))  # Oldest to newest
-
     def _format_size(self, size_bytes: float) -> str:
         """Format file size in human readable format"""
         for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -8,7 +8,7 @@ from filename, base_model, and CivitAI version name — no manual tagging requir
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Pattern, Set, Tuple
 
 # ── Tag category definitions ──────────────────────────────────────────
 # Each category maps a display label to a regex pattern.
@@ -52,6 +52,28 @@ AUTO_TAG_GROUPS = {
 DEFAULT_ENABLED_GROUPS = {"mode", "video"}
 
 
+def _compile_detector(label: str, pattern: str) -> Pattern[str]:
+    if label in MODE_TAGS:
+        # Use case-insensitive character class + case-sensitive boundary,
+        # so "HighNoise" (camelCase) matches but "highlight" doesn't.
+        # Boundary: not followed by lowercase letter (= word has ended).
+        ci = "".join(f"[{c.lower()}{c.upper()}]" for c in label)
+        if label == "LOW":
+            return re.compile(r"(?<![Ff])" + ci + r"(?![a-z])")
+        return re.compile(ci + r"(?![a-z])")
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Compiled once at import: (label, regex, Wan-only flag)
+_DETECTORS: List[Tuple[str, Pattern[str], bool]] = [
+    (label, _compile_detector(label, pattern), label in MODE_TAGS)
+    for label, pattern in AUTO_TAG_CATEGORIES.items()
+]
+
+# Lower-cased label -> canonical label, for user-defined tag fallback
+_LABEL_MAP: Dict[str, str] = {label.lower(): label for label in AUTO_TAG_CATEGORIES}
+
+
 def _collect_sources(model_data: Dict[str, Any]) -> List[str]:
     """Collect all text sources from model data for tag matching."""
     sources: List[str] = []
@@ -73,6 +95,22 @@ def _collect_sources(model_data: Dict[str, Any]) -> List[str]:
     return sources
 
 
+def auto_tag_signature(model_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the inputs :func:`extract_auto_tags` depends on.
+
+    Auto tags only need recomputing when this signature changes.
+    """
+    civitai = model_data.get("civitai")
+    version_name = civitai.get("name", "") if isinstance(civitai, dict) else ""
+    tags = model_data.get("tags")
+    return (
+        model_data.get("file_name", ""),
+        model_data.get("base_model", ""),
+        version_name,
+        tuple(tags) if tags else (),
+    )
+
+
 def extract_auto_tags(model_data: Dict[str, Any]) -> List[str]:
     """Extract auto-detected tags from model metadata.
 
@@ -102,21 +140,10 @@ def extract_auto_tags(model_data: Dict[str, Any]) -> List[str]:
 
     # ── Layer 1: regex-based detection ────────────────────────────
     if sources:
-        for label, pattern in AUTO_TAG_CATEGORIES.items():
+        for label, regex, wan_only in _DETECTORS:
             # HIGH/LOW are Wan-specific — skip for non-Wan to avoid noise
-            if label in ("HIGH", "LOW"):
-                if not is_wan:
-                    continue
-                # Use case-insensitive character class + case-sensitive boundary,
-                # so "HighNoise" (camelCase) matches but "highlight" doesn't.
-                # Boundary: not followed by lowercase letter (= word has ended).
-                ci = "".join(f"[{c.lower()}{c.upper()}]" for c in label)
-                if label == "LOW":
-                    regex = re.compile(r"(?<![Ff])" + ci + r"(?![a-z])")
-                else:
-                    regex = re.compile(ci + r"(?![a-z])")
-            else:
-                regex = re.compile(pattern, re.IGNORECASE)
+            if wan_only and not is_wan:
+                continue
             for source in sources:
                 if regex.search(source):
                     found.add(label)
@@ -130,10 +157,22 @@ def extract_auto_tags(model_data: Dict[str, Any]) -> List[str]:
     # "high"/"High"/"HIGH" all resolve to the canonical label.
     user_tags = model_data.get("tags")
     if user_tags:
-        label_map = {label.lower(): label for label in AUTO_TAG_CATEGORIES}
         for t in user_tags:
-            canonical = label_map.get(t.lower())
+            canonical = _LABEL_MAP.get(t.lower())
             if canonical:
                 found.add(canonical)
 
     return sorted(found)
+
+
+def ensure_auto_tags(model_data: Dict[str, Any]) -> List[str]:
+    """Return ``model_data["auto_tags"]``, computing it only when missing.
+
+    Cache entries get their auto tags maintained by ``ModelCache``; this
+    covers entries that never went through it.
+    """
+    auto_tags = model_data.get("auto_tags")
+    if auto_tags is None:
+        auto_tags = extract_auto_tags(model_data)
+        model_data["auto_tags"] = auto_tags
+    return auto_tags
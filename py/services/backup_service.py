@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import shutil
+import sqlite3
 import tempfile
 import time
 import zipfile
@@ -22,6 +23,7 @@ from typing import Any, Iterable, Optional
 from ..utils.cache_paths import CacheType, get_cache_base_dir, get_cache_file_path
 from ..utils.settings_paths import get_settings_dir
 from .settings_manager import get_settings_manager
+from .sqlite_executor import get_sqlite_executor
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +107,10 @@ class BackupService:
         os.makedirs(history_dir, exist_ok=True)
         return os.path.join(history_dir, "downloaded_versions.sqlite")
 
+    @staticmethod
+    def _usage_stats_path(filename: str = "usage_stats.sqlite") -> str:
+        return os.path.join(get_settings_dir(create=True), "stats", filename)
+
     def _model_update_dir(self) -> str:
         return str(Path(get_cache_file_path(CacheType.MODEL_UPDATE, create_dir=True)).parent)
 
@@ -145,18 +151,46 @@ class BackupService:
                     )
                 )
 
-        stats_path = os.path.join(get_settings_dir(create=True), "stats", "lora_manager_stats.json")
+        stats_path = self._usage_stats_path()
         if os.path.exists(stats_path):
             targets.append(
                 (
                     "usage_stats",
-                    "stats/lora_manager_stats.json",
+                    "stats/usage_stats.sqlite",
                     stats_path,
                 )
             )
 
         return targets
 
+    @staticmethod
+    def _checkpoint_sqlite(path: str) -> None:
+        """Fold committed WAL pages into ``path`` so a plain file copy is complete."""
+
+        try:
+            conn = sqlite3.connect(path)
+            try:
+                conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            logger.debug("Could not checkpoint %s before backup: %s", path, exc)
+
+    @staticmethod
+    def _replace_sqlite_database(source: str, target: str) -> None:
+        """Swap ``source`` in for the database at ``target``.
+
+        Pooled connections would keep using the replaced file, and a WAL left
+        next to the restored file would be replayed over it, so both go first.
+        The executor reopens its connections on the next call.
+        """
+
+        get_sqlite_executor(target).close()
+        for suffix in ("-wal", "-shm"):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(target + suffix)
+        os.replace(source, target)
+
     @staticmethod
     def _hash_file(path: str) -> tuple[str, int, float]:
         digest = hashlib.sha256()
@@ -221,6 +255,8 @@ class BackupService:
             for kind, archive_path, target_path in raw_targets:
                 if not os.path.exists(target_path):
                     continue
+                if target_path.endswith(".sqlite"):
+                    self._checkpoint_sqlite(target_path)
                 sha256, size, mtime = self._hash_file(target_path)
                 entries.append(
                     BackupEntry(
@@ -342,7 +378,10 @@ class BackupService:
 
                     for extracted_path, target_path in extracted_paths:
                         os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                        os.replace(extracted_path, target_path)
+                        if target_path.endswith(".sqlite"):
+                            self._replace_sqlite_database(extracted_path, target_path)
+                        else:
+                            os.replace(extracted_path, target_path)
                 finally:
                     shutil.rmtree(temp_dir, ignore_errors=True)
 
@@ -363,7 +402,11 @@ class BackupService:
             filename = os.path.basename(archive_member)
             return str(Path(get_cache_file_path(CacheType.MODEL_UPDATE, create_dir=True)).parent / filename)
         if kind == "usage_stats":
-            return os.path.join(get_settings_dir(create=True), "stats", "lora_manager_stats.json")
+            # Archives made before the SQLite store carry the JSON file, which
+            # is imported on the next start
+            if archive_member.endswith(".json"):
+                return self._usage_stats_path("lora_manager_stats.json")
+            return self._usage_stats_path()
         return None
 
     async def create_auto_snapshot_if_due(self) -> Optional[dict[str, Any]]:
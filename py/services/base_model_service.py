@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 import asyncio
 import re
+import inspect
 import random
-from typing import Any, Awaitable, Dict, List, Optional, Type, Union, TYPE_CHECKING, cast
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, Tuple, Type, Union, TYPE_CHECKING, cast
 import logging
 import os
 import time
@@ -20,6 +21,9 @@ from .model_query import (
     normalize_sub_type,
     resolve_sub_type,
 )
+from .model_query_index import ModelQueryIndex, ModelQuerySelection
+from .model_search_index import ModelSearchIndex, normalize_search_path
+from .query_result_cache import QueryResultCache, freeze_query_value
 from .settings_manager import get_settings_manager
 from ..utils.civitai_utils import build_civitai_model_page_url
 
@@ -43,6 +47,7 @@ class BaseModelService(ABC):
         search_strategy: Optional[SearchStrategy] = None,
         settings_provider: Optional[SettingsProvider] = None,
         update_service: Optional["ModelUpdateService"] = None,
+        result_cache: Optional[QueryResultCache] = None,
     ):
         """Initialize the service.
 
@@ -55,6 +60,7 @@ class BaseModelService(ABC):
             search_strategy: Search component for fuzzy/text matching.
             settings_provider: Settings object; defaults to the global settings manager.
             update_service: Service used to determine whether models have remote updates available.
+            result_cache: LRU of filtered list results reused across pages.
         """
         self.model_type = model_type
         self.scanner = scanner
@@ -64,6 +70,7 @@ class BaseModelService(ABC):
         self.filter_set = filter_set or ModelFilterSet(self.settings)
         self.search_strategy = search_strategy or SearchStrategy()
         self.update_service = update_service
+        self.result_cache = result_cache or QueryResultCache()
 
     async def get_paginated_data(
         self,
@@ -92,16 +99,126 @@ class BaseModelService(ABC):
         overall_start = time.perf_counter()
 
         sort_params = self.cache_repository.parse_sort(sort_by)
+        query = dict(
+            folder=folder,
+            folder_include=folder_include,
+            folder_exclude=folder_exclude,
+            search=search,
+            fuzzy_search=fuzzy_search,
+            base_models=base_models,
+            model_types=model_types,
+            tags=tags,
+            auto_tags=auto_tags,
+            search_options=search_options,
+            hash_filters=hash_filters,
+            favorites_only=favorites_only,
+            credit_required=credit_required,
+            allow_selling_generated_content=allow_selling_generated_content,
+            tag_logic=tag_logic,
+            **kwargs,
+        )
+        result_key = self._result_cache_key(sort_params, query)
+        generation = None
+        if result_key is not None:
+            generation = await self.cache_repository.fetch_generation()
+
+        filtered_data = None
+        if generation is not None:
+            filtered_data = self.result_cache.get(generation, result_key)
+        cache_hit = filtered_data is not None
+        if cache_hit:
+            # Later pages of a query only pay for slicing and annotation
+            fetch_duration = filter_duration = 0.0
+            initial_count = post_filter_count = len(filtered_data)
+            dedup_lost = 0
+        else:
+            filtered_data, fetch_duration, filter_duration, initial_count, dedup_lost = (
+                await self._filter_sorted_data(sort_params, **query)
+            )
+            post_filter_count = len(filtered_data)
+            # Only store results computed against an unchanged cache; the
+            # list is copied because it may alias one of the cache's views
+            if generation is not None and generation == await self.cache_repository.fetch_generation():
+                filtered_data = list(filtered_data)
+                self.result_cache.put(generation, result_key, filtered_data)
+
+        t2 = time.perf_counter()
+        if update_available_only:
+            update_flags = await self._resolve_update_flags(filtered_data)
+            filtered_data = [
+                item for item, flag in zip(filtered_data, update_flags) if flag
+            ]
+        update_filter_duration = time.perf_counter() - t2
+        final_count = len(filtered_data)
+
+        t3 = time.perf_counter()
+        paginated = self._paginate(filtered_data, page, page_size)
+        await self._ensure_hydrated(paginated["items"])
+        pagination_duration = time.perf_counter() - t3
+
+        t4 = time.perf_counter()
+        if update_available_only:
+            # Every remaining item passed the update filter
+            paginated["items"] = [
+                {**item, "update_available": True} for item in paginated["items"]
+            ]
+        else:
+            paginated["items"] = await self._annotate_update_flags(
+                paginated["items"],
+            )
+        annotate_duration = time.perf_counter() - t4
+
+        overall_duration = time.perf_counter() - overall_start
+        logger.debug(
+            "%s.get_paginated_data took %.3fs (fetch: %.3fs, filter: %.3fs, update_filter: %.3fs, pagination: %.3fs, annotate: %.3fs). "
+            "Counts: initial=%d, dedup=%d, post_filter=%d, final=%d, result_cache_hit=%s",
+            self.__class__.__name__,
+            overall_duration,
+            fetch_duration,
+            filter_duration,
+            update_filter_duration,
+            pagination_duration,
+            annotate_duration,
+            initial_count,
+            dedup_lost,
+            post_filter_count,
+            final_count,
+            cache_hit,
+        )
+        return paginated
+
+    async def _filter_sorted_data(
+        self,
+        sort_params,
+        *,
+        folder: str | None,
+        folder_include: list[str] | None,
+        folder_exclude: list[str] | None,
+        search: str | None,
+        fuzzy_search: bool,
+        base_models: list[str] | None,
+        model_types: list[str] | None,
+        tags: Optional[Dict[str, str]],
+        auto_tags: Optional[Dict[str, str]],
+        search_options: dict[str, Any] | None,
+        hash_filters: dict[str, Any] | None,
+        favorites_only: bool,
+        credit_required: Optional[bool],
+        allow_selling_generated_content: Optional[bool],
+        tag_logic: str,
+        **kwargs,
+    ) -> Tuple[List[Dict[str, Any]], float, float, int, int]:
+        """Sort, group and filter the cache for a list query.
+
+        Returns the filtered (unpaginated) entries together with the fetch
+        and filter durations, the initial count and the number of entries
+        folded away by version grouping.
+        """
         t0 = time.perf_counter()
         if sort_params.key == "usage":
             sorted_data = await self._fetch_with_usage_sort(sort_params)
         else:
             sorted_data = await self.cache_repository.fetch_sorted(sort_params)
-        # Pre-compute auto_tags for every item — needed for both filtering
-        # and display. Computation is cheap (string regex on 2-3 fields).
-        from .auto_tag_service import extract_auto_tags
-        for item in sorted_data:
-            item["auto_tags"] = extract_auto_tags(item)
         fetch_duration = time.perf_counter() - t0
         initial_count = len(sorted_data)
 
@@ -212,6 +329,9 @@ class BaseModelService(ABC):
         if hash_filters:
             filtered_data = await self._apply_hash_filters(sorted_data, hash_filters)
         else:
+            # The index only matches the cache's own sorted view, so grouped,
+            # usage-sorted and model-scoped lists fall back to a linear scan.
+            query_index = await self.cache_repository.fetch_query_index(sorted_data)
             filtered_data = await self._apply_common_filters(
                 sorted_data,
                 folder=folder,
@@ -224,14 +344,19 @@ class BaseModelService(ABC):
                 favorites_only=favorites_only,
                 search_options=search_options,
                 tag_logic=tag_logic,
+                query_index=query_index,
             )
 
             if search:
+                if (search_options or {}).get("creator"):
+                    # Creator names are loaded after the first page
+                    await self._ensure_hydrated()
                 filtered_data = await self._apply_search_filters(
                     filtered_data,
                     search,
                     fuzzy_search,
                     search_options,
+                    search_index=await self.cache_repository.fetch_search_index(),
                 )
 
             filtered_data = await self._apply_specific_filters(filtered_data, **kwargs)
@@ -247,49 +372,50 @@ class BaseModelService(ABC):
                     filtered_data, allow_selling_generated_content
                 )
         filter_duration = time.perf_counter() - t1
-        post_filter_count = len(filtered_data)
+        return filtered_data, fetch_duration, filter_duration, initial_count, dedup_lost
 
-        annotated_for_filter: Optional[List[Dict[str, Any]]] = None
-        t2 = time.perf_counter()
-        if update_available_only:
-            annotated_for_filter = await self._annotate_update_flags(filtered_data)
-            filtered_data = [
-                item for item in annotated_for_filter if item.get("update_available")
-            ]
-        update_filter_duration = time.perf_counter() - t2
-        final_count = len(filtered_data)
+    def _result_cache_key(self, sort_params, params: Dict[str, Any]) -> Optional[tuple]:
+        """Return the result cache key for a list query, or ``None`` if uncacheable.
 
-        t3 = time.perf_counter()
-        paginated = self._paginate(filtered_data, page, page_size)
-        pagination_duration = time.perf_counter() - t3
+        Hash lookups are one-off queries and usage-sorted lists depend on
+        usage statistics that do not move the cache generation.
+        """
+        if params.get("hash_filters") or sort_params.key == "usage":
+            return None
+        return (
+            (sort_params.key, sort_params.order, sort_params.seed),
+            tuple(
+                sorted(
+                    (name, freeze_query_value(value)) for name, value in params.items()
+                )
+            ),
+            bool(self.settings.get("show_only_sfw", False)),
+            self.settings.get("version_grouping", "same_base"),
+            bool(self.settings.get("hide_early_access_updates", False)),
+        )
 
-        t4 = time.perf_counter()
-        if update_available_only:
-            # Items already include update flags thanks to the pre-filter annotation.
-            paginated["items"] = list(paginated["items"])
-        else:
-            paginated["items"] = await self._annotate_update_flags(
-                paginated["items"],
-            )
-        annotate_duration = time.perf_counter() - t4
+    async def get_state_token(self, sort_by: Optional[str] = None) -> Optional[tuple]:
+        """Return a token that changes whenever list or summary responses may change.
 
-        overall_duration = time.perf_counter() - overall_start
-        logger.debug(
-            "%s.get_paginated_data took %.3fs (fetch: %.3fs, filter: %.3fs, update_filter: %.3fs, pagination: %.3fs, annotate: %.3fs). "
-            "Counts: initial=%d, dedup=%d, post_filter=%d, final=%d",
-            self.__class__.__name__,
-            overall_duration,
-            fetch_duration,
-            filter_duration,
-            update_filter_duration,
-            pagination_duration,
-            annotate_duration,
-            initial_count,
-            dedup_lost,
-            post_filter_count,
-            final_count,
-        )
-        return paginated
+        Combines the cache generation, the settings revision and the update
+        records. ``None`` means the state cannot be captured: stand-in caches
+        and settings have no revision, and usage-sorted lists follow usage
+        statistics.
+        """
+        if sort_by is not None and self.cache_repository.parse_sort(sort_by).key == "usage":
+            return None
+        generation = await self.cache_repository.fetch_generation()
+        settings_revision = getattr(self.settings, "revision", None)
+        if generation is None or not isinstance(settings_revision, int):
+            return None
+
+        update_revision = None
+        if self.update_service is not None:
+            current_revision = getattr(self.update_service, "current_revision", None)
+            if not callable(current_revision):
+                return None
+            update_revision = current_revision()
+        return (self.model_type, generation, settings_revision, update_revision)
 
     async def get_excluded_paginated_data(
         self,
@@ -324,8 +450,11 @@ class BaseModelService(ABC):
                 self.scanner._excluded_models = [
                     path for path in current_excluded if path not in stale_set
                 ]
+                mark_models_dirty = getattr(self.scanner, "mark_models_dirty", None)
                 persist_current_cache = getattr(self.scanner, "_persist_current_cache", None)
-                if callable(persist_current_cache):
+                if callable(mark_models_dirty):
+                    mark_models_dirty(stale_paths)
+                elif callable(persist_current_cache):
                     await cast(Awaitable[Any], persist_current_cache())
 
         excluded_entries = self._sort_entries(excluded_entries, sort_by)
@@ -355,20 +484,14 @@ class BaseModelService(ABC):
         }
         bucket_key = bucket_map.get(self.model_type, "")
 
-        usage_stats = UsageStats()
-        stats = await usage_stats.get_stats()
-        usage_bucket = stats.get(bucket_key, {}) if bucket_key else {}
+        usage_counts = (
+            await UsageStats().get_usage_counts(bucket_key) if bucket_key else {}
+        )
 
         annotated = []
         for item in raw_items:
             sha = (item.get("sha256") or "").lower()
-            usage_info = (
-                usage_bucket.get(sha, {}) if isinstance(usage_bucket, dict) else {}
-            )
-            usage_count = (
-                usage_info.get("total", 0) if isinstance(usage_info, dict) else 0
-            )
-            annotated.append({**item, "usage_count": usage_count})
+            annotated.append({**item, "usage_count": usage_counts.get(sha, 0)})
 
         reverse = sort_params.order == "desc"
         annotated.sort(
@@ -487,8 +610,13 @@ class BaseModelService(ABC):
         favorites_only: bool = False,
         search_options: dict[str, Any] | None = None,
         tag_logic: str = "any",
-    ) -> List[Dict[str, Any]]:
-        """Apply common filters that work across all model types"""
+        query_index: Optional[ModelQueryIndex] = None,
+    ) -> Sequence[Dict[str, Any]]:
+        """Apply common filters that work across all model types
+
+        When ``query_index`` is given the filters are resolved against it and a
+        lazy selection over ``data`` is returned instead of a new list.
+        """
         normalized_options = self.search_strategy.normalize_options(search_options)
         criteria = FilterCriteria(
             folder=folder,
@@ -502,6 +630,8 @@ class BaseModelService(ABC):
             search_options=normalized_options,
             tag_logic=tag_logic,
         )
+        if query_index is not None:
+            return self.filter_set.apply_index(query_index, criteria)
         return self.filter_set.apply(data, criteria)
 
     async def _apply_search_filters(
@@ -510,11 +640,16 @@ class BaseModelService(ABC):
         search: str,
         fuzzy_search: bool,
         search_options: dict[str, Any] | None,
+        search_index: Optional[ModelSearchIndex] = None,
     ) -> List[Dict[str, Any]]:
         """Apply search filtering"""
         normalized_options = self.search_strategy.normalize_options(search_options)
+        if search_index is None:
+            return self.search_strategy.apply(
+                data, search, normalized_options, fuzzy_search
+            )
         return self.search_strategy.apply(
-            data, search, normalized_options, fuzzy_search
+            data, search, normalized_options, fuzzy_search, search_index=search_index
         )
 
     async def _apply_specific_filters(self, data: List[Dict[str, Any]], **kwargs) -> List[Dict[str, Any]]:
@@ -532,6 +667,15 @@ class BaseModelService(ABC):
                 - True: Return items where credit is required (allowNoCredit=False)
                 - False: Return items where credit is not required (allowNoCredit=True)
         """
+        if isinstance(data, ModelQuerySelection):
+            # Bit 0 represents allowNoCredit; match on the distinct flag values only
+            return data.narrow(
+                data.index.mask_where(
+                    "license_flags",
+                    lambda flags: bool(flags & (1 << 0)) != credit_required,
+                )
+            )
+
         filtered_data = []
         for item in data:
             license_flags = item.get(
@@ -563,6 +707,15 @@ class BaseModelService(ABC):
                 - True: Return items where selling generated content is allowed (allowCommercialUse contains Image)
                 - False: Return items where selling generated content is not allowed (allowCommercialUse does not contain Image)
         """
+        if isinstance(data, ModelQuerySelection):
+            # Bit 1 represents the Image commercial use permission
+            return data.narrow(
+                data.index.mask_where(
+                    "license_flags",
+                    lambda flags: bool(flags & (1 << 1)) == allow_selling,
+                )
+            )
+
         filtered_data = []
         for item in data:
             license_flags = item.get(
@@ -595,27 +748,18 @@ class BaseModelService(ABC):
         if not items:
             return []
 
-        annotated = [dict(item) for item in items]
-
-        if self.update_service is None:
-            for item in annotated:
-                item["update_available"] = False
-            return annotated
-
-        id_to_items: Dict[int, List[Dict[str, Any]]] = {}
-        ordered_ids: List[int] = []
-        for item in annotated:
-            model_id = self._extract_model_id(item)
-            if model_id is None:
-                item["update_available"] = False
-                continue
-            if model_id not in id_to_items:
-                id_to_items[model_id] = []
-                ordered_ids.append(model_id)
-            id_to_items[model_id].append(item)
+        flags = await self._resolve_update_flags(items)
+        annotated = []
+        for item, flag in zip(items, flags):
+            copy = dict(item)
+            copy["update_available"] = flag
+            annotated.append(copy)
+        return annotated
 
-        if not ordered_ids:
-            return annotated
+    async def _resolve_update_flags(self, items: List[Dict[str, Any]]) -> List[bool]:
+        """Return the update_available flag of each item, in order."""
+        if not items or self.update_service is None:
+            return [False] * len(items)
 
         strategy_value = self.settings.get("version_grouping")
         if isinstance(strategy_value, str) and strategy_value.strip():
@@ -640,6 +784,43 @@ class BaseModelService(ABC):
         except Exception:
             hide_paid = False
 
+        availability_method = getattr(self.update_service, "get_update_availability", None)
+        if callable(availability_method):
+            try:
+                availability = await cast(Awaitable[Any], availability_method(
+                    hide_early_access=hide_early_access,
+                    hide_paid=hide_paid,
+                ))
+            except Exception as exc:
+                logger.error(
+                    "Failed to load update availability index for %s models: %s",
+                    self.model_type,
+                    exc,
+                    exc_info=True,
+                )
+            else:
+                flags: List[bool] = []
+                for item in items:
+                    model_id = self._extract_model_id(item)
+                    if model_id is None:
+                        flags.append(False)
+                    elif same_base_mode:
+                        flags.append(
+                            availability.has_update_for_base(
+                                model_id,
+                                self._extract_base_model(item),
+                                self._extract_version_id(item),
+                            )
+                        )
+                    else:
+                        flags.append(availability.has_update(model_id))
+                return flags
+
+        model_ids: List[Optional[int]] = [self._extract_model_id(item) for item in items]
+        ordered_ids = list(dict.fromkeys(mid for mid in model_ids if mid is not None))
+        if not ordered_ids:
+            return [False] * len(items)
+
         records = None
         resolved: Optional[Dict[int, bool]] = None
         if same_base_mode:
@@ -708,36 +889,38 @@ class BaseModelService(ABC):
                     continue
                 resolved[model_id] = bool(result)
 
-        for model_id, items_for_id in id_to_items.items():
-            default_flag = bool(resolved.get(model_id, False)) if resolved else False
+        base_highest_cache: Dict[int, Dict[str, int]] = {}
+        flags = []
+        for item, model_id in zip(items, model_ids):
+            if model_id is None:
+                flags.append(False)
+                continue
             record = records.get(model_id) if records else None
-            base_highest_versions = (
-                self._build_highest_local_versions_by_base(record)
-                if same_base_mode and record
-                else {}
+            if not (same_base_mode and record is not None):
+                flags.append(bool(resolved.get(model_id, False)) if resolved else False)
+                continue
+            base_highest_versions = base_highest_cache.get(model_id)
+            if base_highest_versions is None:
+                base_highest_versions = self._build_highest_local_versions_by_base(record)
+                base_highest_cache[model_id] = base_highest_versions
+            base_model = self._extract_base_model(item)
+            normalized_base = self._normalize_base_model_name(base_model)
+            threshold_version = (
+                base_highest_versions.get(normalized_base)
+                if normalized_base
+                else None
             )
-            for item in items_for_id:
-                if same_base_mode and record is not None:
-                    base_model = self._extract_base_model(item)
-                    normalized_base = self._normalize_base_model_name(base_model)
-                    threshold_version = (
-                        base_highest_versions.get(normalized_base)
-                        if normalized_base
-                        else None
-                    )
-                    if threshold_version is None:
-                        threshold_version = self._extract_version_id(item)
-                    flag = record.has_update_for_base(
-                        threshold_version,
-                        base_model,
-                        hide_early_access=hide_early_access,
-                        hide_paid=hide_paid,
-                    )
-                else:
-                    flag = default_flag
-                item["update_available"] = flag
-
-        return annotated
+            if threshold_version is None:
+                threshold_version = self._extract_version_id(item)
+            flags.append(
+                record.has_update_for_base(
+                    threshold_version,
+                    base_model,
+                    hide_early_access=hide_early_access,
+                    hide_paid=hide_paid,
+                )
+            )
+        return flags
 
     @staticmethod
     def _extract_hf_group_key(item: Dict[str, Any]) -> Optional[str]:
@@ -931,16 +1114,32 @@ class BaseModelService(ABC):
         return self.scanner.get_hash_by_path(file_path)
 
     async def scan_models(
-        self, force_refresh: bool = False, rebuild_cache: bool = False
+        self,
+        force_refresh: bool = False,
+        rebuild_cache: bool = False,
+        deep_reconcile: bool = False,
     ):
         """Trigger model scanning"""
         return await self.scanner.get_cached_data(
-            force_refresh=force_refresh, rebuild_cache=rebuild_cache
+            force_refresh=force_refresh,
+            rebuild_cache=rebuild_cache,
+            deep_reconcile=deep_reconcile,
         )
 
     async def get_model_info_by_name(self, name: str):
         """Get model information by name"""
-        return await self.scanner.get_model_info_by_name(name)
+        model = await self.scanner.get_model_info_by_name(name)
+        if model:
+            await self._ensure_hydrated([model])
+        return model
+
+    async def _ensure_hydrated(self, items: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Load deferred cache columns (notes, trigger words...) for ``items``."""
+        ensure_hydrated = getattr(self.scanner, "ensure_hydrated", None)
+        if callable(ensure_hydrated):
+            result = ensure_hydrated(items)
+            if inspect.isawaitable(result):
+                await result
 
     def get_model_roots(self) -> List[str]:
         """Get model root directories"""
@@ -1037,6 +1236,7 @@ class BaseModelService(ABC):
         syntax (``Anima/character/OWSMianne_ANIMA_V1``).
         """
         cache = await self.scanner.get_cached_data()
+        await self._ensure_hydrated()
 
         for model in cache.raw_data:
             file_name = model.get("file_name", "")
@@ -1328,16 +1528,6 @@ class BaseModelService(ABC):
             ]
         )
         if has_filters:
-            # Auto-tags are not stored in the scanner cache — they are computed
-            # on the fly. Pre-compute them only when an auto-tag filter is
-            # active to avoid mutating cache entries unnecessarily.
-            if auto_tags:
-                from .auto_tag_service import extract_auto_tags
-
-                for item in data:
-                    if not item.get("auto_tags"):
-                        item["auto_tags"] = extract_auto_tags(item)
-
             criteria = FilterCriteria(
                 folder=folder,
                 folder_include=folder_include,
@@ -1359,10 +1549,31 @@ class BaseModelService(ABC):
                     data, allow_selling_generated_content
                 )
 
+        # Narrow to entries whose file path can contain the longest include
+        # term before computing any relative path
+        index_term = max(include_terms, key=len, default="")
+        search_index = (
+            await self.cache_repository.fetch_search_index() if index_term else None
+        )
+        if search_index is not None:
+            candidates = search_index.candidates(normalize_search_path(index_term))
+            if candidates is not None:
+                if has_filters:
+                    candidate_ids = {id(item) for item in candidates}
+                    data = [
+                        item
+                        for item in data
+                        if id(item) in candidate_ids or item not in search_index
+                    ]
+                else:
+                    data = candidates
+
         matching_paths = []
 
         # Get model roots for path calculation
-        model_roots = self.scanner.get_model_roots()
+        normalized_roots = [
+            os.path.normpath(root) for root in self.scanner.get_model_roots()
+        ]
 
         # Collect all matching paths first (needed for proper sorting and offset)
         for model in data:
@@ -1372,11 +1583,8 @@ class BaseModelService(ABC):
 
             # Calculate relative path from model root
             relative_path = None
-            for root in model_roots:
-                # Normalize paths for comparison
-                normalized_root = os.path.normpath(root)
-                normalized_file = os.path.normpath(file_path)
-
+            normalized_file = os.path.normpath(file_path)
+            for normalized_root in normalized_roots:
                 if normalized_file.startswith(normalized_root):
                     # Remove root and leading separator to get relative path
                     relative_path = normalized_file[len(normalized_root) :].lstrip(
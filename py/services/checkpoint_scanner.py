@@ -15,6 +15,7 @@ from ..utils.metadata_manager import MetadataManager
 from ..config import config
 from .model_scanner import ModelScanner, _is_excluded_dir
 from .model_hash_index import ModelHashIndex
+from .hash_service import HashPriority, get_hash_service, hash_priority
 
 logger = logging.getLogger(__name__)
 
@@ -268,7 +269,9 @@ class CheckpointScanner(ModelScanner):
         """Calculate hashes for all checkpoints with pending hash status.
 
         If cache is not initialized, scans filesystem directly for metadata files
-        with hash_status != 'completed'.
+        with hash_status != 'completed'. Files are hashed concurrently in the
+        background lane of the hash service, and progress is reported in
+        completion order.
 
         Args:
             progress_callback: Optional callback(progress, total, current_file)
@@ -296,27 +299,50 @@ class CheckpointScanner(ModelScanner):
         total = len(pending_models)
         completed = 0
         failed = 0
+        processed = 0
 
-        for i, model_data in enumerate(pending_models):
+        # Hash several files at once; the hash service bounds the actual
+        # parallel reads and serves interactive requests first.
+        semaphore = asyncio.Semaphore(get_hash_service().max_workers)
+
+        async def hash_one(file_path: str) -> Optional[str]:
+            async with semaphore:
+                with hash_priority(HashPriority.BACKGROUND):
+                    return await self.calculate_hash_for_model(file_path)
+
+        tasks: Dict[asyncio.Task, str] = {}
+        for model_data in pending_models:
             file_path = model_data.get("file_path")
-            if not file_path:
-                continue
+            if file_path:
+                tasks[asyncio.ensure_future(hash_one(file_path))] = file_path
 
-            try:
-                sha256 = await self.calculate_hash_for_model(file_path)
-                if sha256:
-                    completed += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                logger.error(f"Error calculating hash for {file_path}: {e}")
-                failed += 1
-
-            if progress_callback:
-                try:
-                    await progress_callback(i + 1, total, file_path)
-                except Exception:
-                    pass
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    file_path = tasks[task]
+                    try:
+                        sha256 = task.result()
+                        if sha256:
+                            completed += 1
+                        else:
+                            failed += 1
+                    except Exception as e:
+                        logger.error(f"Error calculating hash for {file_path}: {e}")
+                        failed += 1
+
+                    processed += 1
+                    if progress_callback:
+                        try:
+                            await progress_callback(processed, total, file_path)
+                        except Exception:
+                            pass
+        finally:
+            for task in tasks:
+                task.cancel()
 
         return {"completed": completed, "failed": failed, "total": total}
 
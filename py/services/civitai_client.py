@@ -326,42 +326,13 @@ class CivitaiClient:
     ) -> Optional[Dict[int, Dict[str, Any]]]:
         """Fetch model metadata for multiple ids using the batch API."""
 
-        deduped: Dict[int, None] = {}
-        for raw_id in model_ids:
-            try:
-                normalized = int(raw_id)
-            except (TypeError, ValueError):
-                continue
-            deduped.setdefault(normalized, None)
-
-        normalized_ids = [str(model_id) for model_id in deduped.keys()]
-        if not normalized_ids:
-            return {}
-
         try:
-            query = ",".join(normalized_ids)
-            success, result = await self._make_request(
-                "GET",
-                f"{self.base_url}/models",
-                use_auth=True,
-                params={"ids": query, "nsfw": "true"},
-            )
-            if not success:
+            items = await self._fetch_models_by_ids(model_ids)
+            if items is None:
                 return None
 
-            items = result.get("items") if isinstance(result, dict) else None
-            if not isinstance(items, list):
-                return {}
-
             payload: Dict[int, Dict[str, Any]] = {}
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                model_id = item.get("id")
-                try:
-                    normalized_id = int(cast(Any, model_id))
-                except (TypeError, ValueError):
-                    continue
+            for normalized_id, item in items.items():
                 payload[normalized_id] = {
                     "modelVersions": item.get("modelVersions", []),
                     "type": item.get("type", ""),
@@ -378,6 +349,49 @@ class CivitaiClient:
             logger.error(f"Error fetching model versions in bulk: {exc}")
             return None
 
+    async def _fetch_models_by_ids(
+        self, model_ids: Sequence[Any]
+    ) -> Optional[Dict[int, Dict[str, Any]]]:
+        """Return the raw ``/models`` items for ``model_ids`` keyed by id."""
+
+        deduped: Dict[int, None] = {}
+        for raw_id in model_ids:
+            try:
+                normalized = int(raw_id)
+            except (TypeError, ValueError):
+                continue
+            deduped.setdefault(normalized, None)
+
+        normalized_ids = [str(model_id) for model_id in deduped.keys()]
+        if not normalized_ids:
+            return {}
+
+        query = ",".join(normalized_ids)
+        success, result = await self._make_request(
+            "GET",
+            f"{self.base_url}/models",
+            use_auth=True,
+            params={"ids": query, "nsfw": "true"},
+        )
+        if not success:
+            return None
+
+        items = result.get("items") if isinstance(result, dict) else None
+        if not isinstance(items, list):
+            return {}
+
+        payload: Dict[int, Dict[str, Any]] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            model_id = item.get("id")
+            try:
+                normalized_id = int(cast(Any, model_id))
+            except (TypeError, ValueError):
+                continue
+            payload[normalized_id] = item
+        return payload
+
     async def get_model_version(
         self, model_id: int | None = None, version_id: int | None = None
     ) -> Optional[Dict[str, Any]]:
@@ -762,6 +776,68 @@ class CivitaiClient:
 
         return all_versions if all_versions else None
 
+    async def get_models_by_hashes(
+        self, hashes: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Batch counterpart of :meth:`get_model_by_hash`.
+
+        Resolves up to 100 hashes per ``POST /model-versions/by-hash`` request
+        and enriches the versions with one ``/models?ids=`` request per batch
+        instead of one model request per hash.
+
+        Returns:
+            Version payloads keyed by lowercase SHA256, shaped like the
+            result of :meth:`get_model_by_hash`. Hashes that were not found
+            or whose batch failed are absent.
+        """
+        wanted = {value.lower() for value in hashes if value}
+        if not wanted:
+            return {}
+
+        versions = await self.get_model_versions_by_hashes(sorted(wanted))
+        if not versions:
+            return {}
+
+        resolved: Dict[str, Dict[str, Any]] = {}
+        matched: Dict[int, Dict[str, Any]] = {}
+        for version in versions:
+            if not isinstance(version, dict):
+                continue
+            for file_info in version.get("files") or []:
+                if not isinstance(file_info, dict):
+                    continue
+                file_hash = str((file_info.get("hashes") or {}).get("SHA256") or "").lower()
+                if file_hash in wanted and file_hash not in resolved:
+                    resolved[file_hash] = version
+                    matched[id(version)] = version
+
+        BATCH_SIZE = 100
+        model_ids = sorted(
+            {version["modelId"] for version in matched.values() if version.get("modelId")}
+        )
+        models: Dict[int, Dict[str, Any]] = {}
+        for start in range(0, len(model_ids), BATCH_SIZE):
+            try:
+                batch = await self._fetch_models_by_ids(model_ids[start : start + BATCH_SIZE])
+            except RateLimitError:
+                raise
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.error("Error fetching models for hash batch: %s", exc)
+                batch = None
+            if batch:
+                models.update(batch)
+
+        for version in matched.values():
+            try:
+                model_data = models.get(int(version.get("modelId") or 0))
+            except (TypeError, ValueError):
+                model_data = None
+            if model_data:
+                self._enrich_version_with_model_data(version, model_data)
+            self._remove_comfy_metadata(version)
+
+        return resolved
+
     async def get_user_models(
         self, username: str, cursor: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
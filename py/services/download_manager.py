@@ -32,7 +32,12 @@ from ..utils.metadata_manager import MetadataManager
 from .service_registry import ServiceRegistry
 from .settings_manager import get_settings_manager
 from .metadata_service import get_default_metadata_provider, get_metadata_provider
-from .downloader import get_downloader, DownloadProgress, DownloadStreamControl
+from .downloader import (
+    SEGMENT_MAP_SUFFIX,
+    DownloadProgress,
+    DownloadStreamControl,
+    get_downloader,
+)
 from .aria2_downloader import Aria2Error, get_aria2_downloader
 from .aria2_transfer_state import Aria2TransferStateStore
 from .download_queue_service import DownloadQueueService
@@ -741,6 +746,9 @@ class DownloadManager:
                 logger.debug(f"Deleted partial download: {part_path}")
             elif os.path.exists(part_path):
                 logger.error(f"Error deleting part file: {part_path}")
+            segment_map_path = part_path + SEGMENT_MAP_SUFFIX
+            if os.path.exists(segment_map_path):
+                await self._delete_file_with_retries(segment_map_path)
 
         aria2_control_path = None
         if isinstance(download_info, dict):
@@ -2319,6 +2327,7 @@ class DownloadManager:
                 if download_id and download_id in self._active_downloads:
                     self._active_downloads[download_id]["status"] = "downloading"
             last_error = None
+            downloaded_sha256: Optional[str] = None
             for download_url in download_urls:
                 download_url = normalize_civitai_download_url(download_url)
                 if download_url is None:
@@ -2353,7 +2362,32 @@ class DownloadManager:
                 )
 
                 if success:
-                    break
+                    # The python backend hashes the file while writing it
+                    downloaded_sha256 = (
+                        pause_control.completed_sha256
+                        if transfer_backend == "python" and pause_control is not None
+                        else None
+                    )
+                    expected_sha256 = (getattr(metadata, "sha256", "") or "").lower()
+                    if (
+                        not downloaded_sha256
+                        or not expected_sha256
+                        or downloaded_sha256 == expected_sha256
+                    ):
+                        break
+
+                    logger.error(
+                        "SHA256 mismatch for %s: expected %s, got %s",
+                        save_path,
+                        expected_sha256,
+                        downloaded_sha256,
+                    )
+                    success = False
+                    result = (
+                        "Downloaded file is corrupt: its SHA256 does not match "
+                        "the hash published by the model host"
+                    )
+                    downloaded_sha256 = None
 
                 last_error = result
                 # For aria2: if the .aria2 control file is missing, aria2 considers
@@ -2446,7 +2480,9 @@ class DownloadManager:
                     )
 
             metadata_entries = await self._build_metadata_entries(
-                metadata, actual_file_paths
+                metadata,
+                actual_file_paths,
+                sha256=downloaded_sha256 if actual_file_paths == [save_path] else None,
             )
             if preview_path:
                 preview_targets = self._distribute_preview_to_entries(
@@ -2625,8 +2661,13 @@ class DownloadManager:
         return await loop.run_in_executor(self._archive_executor, _extract_sync)
 
     async def _build_metadata_entries(
-        self, base_metadata, file_paths: List[str]
+        self, base_metadata, file_paths: List[str], sha256: Optional[str] = None
     ) -> List[Any]:
+        """Build one metadata entry per downloaded file.
+
+        ``sha256`` is the digest computed while the single downloaded file was
+        written; it spares re-reading the file when the API omitted the hash.
+        """
         if not file_paths:
             return []
 
@@ -2642,9 +2683,9 @@ class DownloadManager:
             entry.size = os.path.getsize(file_path)
             # Compute SHA256 locally when the API response didn't include it
             if not entry.sha256:
-                sha256 = await calculate_sha256(file_path)
-                if sha256:
-                    entry.sha256 = sha256.lower()
+                file_sha256 = sha256 or await calculate_sha256(file_path)
+                if file_sha256:
+                    entry.sha256 = file_sha256.lower()
             # AutoV3: the Civitai-reported value for the downloaded file (set
             # by from_civitai_info) takes precedence. Only the un-checked
             # state (None) triggers a header read; '' (checked-unavailable)
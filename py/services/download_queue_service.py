@@ -6,9 +6,11 @@ import logging
 import os
 import sqlite3
 import time
+import uuid
 from typing import Any, Optional
 
 from ..utils.cache_paths import get_cache_base_dir
+from .sqlite_executor import get_sqlite_executor
 
 logger = logging.getLogger(__name__)
 
@@ -102,10 +104,11 @@ class DownloadQueueService:
 
     def __init__(self, db_path: Optional[str] = None) -> None:
         self._db_path = db_path or _resolve_database_path()
-        self._lock = asyncio.Lock()
-        self._conn: Optional[sqlite3.Connection] = None
         self._schema_initialized = False
         self._ensure_directory()
+        # Writes are serialised on the executor's writer thread, which also
+        # keeps the multi-statement operations below atomic
+        self._db = get_sqlite_executor(self._db_path)
         self._initialize_schema()
 
     def _ensure_directory(self) -> None:
@@ -113,45 +116,34 @@ class DownloadQueueService:
         if directory:
             os.makedirs(directory, exist_ok=True)
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        return conn
-
-    def _get_conn(self) -> sqlite3.Connection:
-        if self._conn is None:
-            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
-
     def _initialize_schema(self) -> None:
         if self._schema_initialized:
             return
-        with self._connect() as conn:
-            conn.executescript(self._SCHEMA_TABLES)
-
-            # Databases created by older versions lack
-            # download_history.file_params; add it so retry-from-history can
-            # restore the originally selected file (#1058).
-            history_columns = {
-                row["name"]
-                for row in conn.execute("PRAGMA table_info(download_history)")
-            }
-            if "file_params" not in history_columns:
-                conn.execute(
-                    "ALTER TABLE download_history ADD COLUMN file_params TEXT"
-                )
+        self._db.write_sync(self._create_schema)
+        self._schema_initialized = True
 
-            # Creating the unique index on download_history.download_id can
-            # fail if pre-existing rows have duplicate values (e.g. from a
-            # previous version that lacked the index).  Deduplicate first so
-            # that the migration does not crash on startup.
-            if not self._index_exists(conn, "idx_dh_download_id"):
-                self._remove_duplicate_download_ids(conn)
-                conn.executescript(self._CREATE_UNIQUE_INDEX)
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(self._SCHEMA_TABLES)
 
-            conn.commit()
-        self._schema_initialized = True
+        # Databases created by older versions lack
+        # download_history.file_params; add it so retry-from-history can
+        # restore the originally selected file (#1058).
+        history_columns = {
+            row["name"]
+            for row in conn.execute("PRAGMA table_info(download_history)")
+        }
+        if "file_params" not in history_columns:
+            conn.execute(
+                "ALTER TABLE download_history ADD COLUMN file_params TEXT"
+            )
+
+        # Creating the unique index on download_history.download_id can
+        # fail if pre-existing rows have duplicate values (e.g. from a
+        # previous version that lacked the index).  Deduplicate first so
+        # that the migration does not crash on startup.
+        if not self._index_exists(conn, "idx_dh_download_id"):
+            self._remove_duplicate_download_ids(conn)
+            conn.executescript(self._CREATE_UNIQUE_INDEX)
 
     @staticmethod
     def _index_exists(conn: sqlite3.Connection, name: str) -> bool:
@@ -178,19 +170,14 @@ class DownloadQueueService:
         return self._db_path
 
     def close(self) -> None:
-        """Close the persistent SQLite connection, if open.
+        """Close the pooled SQLite connections, if open.
 
         This is called before plugin update operations to release the
         database file lock on Windows, allowing ``shutil.rmtree()`` to
         succeed when the cache resides inside the plugin directory.
+        Later calls transparently reopen them.
         """
-        if self._conn is not None:
-            try:
-                self._conn.close()
-            except Exception:
-                pass
-            finally:
-                self._conn = None
+        self._db.close()
 
     # ------------------------------------------------------------------
     # Queue methods
@@ -216,16 +203,14 @@ class DownloadQueueService:
         now = time.time()
         file_params_json = json.dumps(file_params) if file_params is not None else None
 
-        async with self._lock:
-            conn = self._get_conn()
-
+        def _insert(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
             # Reject download_ids that already have a terminal record in history.
             history_row = conn.execute(
                 "SELECT 1 FROM download_history WHERE download_id = ? LIMIT 1",
                 (download_id,),
             ).fetchone()
             if history_row is not None:
-                return {}
+                return None
 
             conn.execute(
                 """
@@ -247,30 +232,32 @@ class DownloadQueueService:
                     now,
                 ),
             )
-            conn.commit()
-            row = conn.execute(
+            return conn.execute(
                 "SELECT * FROM download_queue WHERE download_id = ?",
                 (download_id,),
             ).fetchone()
 
+        row = await self._db.write(_insert)
         return dict(row) if row else {}
 
     async def get_queue(self) -> list[dict[str, Any]]:
         """Return all items in the queue ordered by priority then added time."""
-        async with self._lock:
-            conn = self._get_conn()
-            rows = conn.execute(
+        def _select(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            return conn.execute(
                 "SELECT * FROM download_queue ORDER BY priority DESC, added_at ASC"
             ).fetchall()
+
+        rows = await self._db.read(_select)
         return [dict(row) for row in rows]
 
     async def get_queued_count(self) -> int:
         """Return the number of items with status ``'queued'``."""
-        async with self._lock:
-            conn = self._get_conn()
-            row = conn.execute(
+        def _count(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
+            return conn.execute(
                 "SELECT COUNT(*) AS cnt FROM download_queue WHERE status = 'queued'"
             ).fetchone()
+
+        row = await self._db.read(_count)
         return row["cnt"] if row else 0
 
     async def update_status(
@@ -314,37 +301,34 @@ class DownloadQueueService:
 
         params.append(download_id)
 
-        async with self._lock:
-            conn = self._get_conn()
-            cursor = conn.execute(
+        def _update(conn: sqlite3.Connection) -> int:
+            return conn.execute(
                 f"UPDATE download_queue SET {', '.join(set_clauses)} "
                 "WHERE download_id = ?",
                 params,
-            )
-            conn.commit()
-        return cursor.rowcount > 0
+            ).rowcount
+
+        return await self._db.write(_update) > 0
 
     async def remove_from_queue(self, download_id: str) -> bool:
         """Remove a single item from the queue by download_id.
 
         Returns ``True`` if a row was deleted.
         """
-        async with self._lock:
-            conn = self._get_conn()
-            cursor = conn.execute(
+        def _delete(conn: sqlite3.Connection) -> int:
+            return conn.execute(
                 "DELETE FROM download_queue WHERE download_id = ?",
                 (download_id,),
-            )
-            conn.commit()
-        return cursor.rowcount > 0
+            ).rowcount
+
+        return await self._db.write(_delete) > 0
 
     async def move_to_top(self, download_id: str) -> bool:
         """Move an item to the front of the queue (highest priority).
 
         Returns ``True`` if the item was found and updated.
         """
-        async with self._lock:
-            conn = self._get_conn()
+        def _move(conn: sqlite3.Connection) -> bool:
             row = conn.execute(
                 "SELECT priority FROM download_queue WHERE download_id = ?",
                 (download_id,),
@@ -361,16 +345,16 @@ class DownloadQueueService:
                 "UPDATE download_queue SET priority = ? WHERE download_id = ?",
                 (max_priority + 1, download_id),
             )
-            conn.commit()
-        return True
+            return True
+
+        return await self._db.write(_move)
 
     async def move_to_end(self, download_id: str) -> bool:
         """Move an item to the end of the queue (lowest priority).
 
         Returns ``True`` if the item was found and updated.
         """
-        async with self._lock:
-            conn = self._get_conn()
+        def _move(conn: sqlite3.Connection) -> bool:
             row = conn.execute(
                 "SELECT priority FROM download_queue WHERE download_id = ?",
                 (download_id,),
@@ -387,8 +371,9 @@ class DownloadQueueService:
                 "UPDATE download_queue SET priority = ? WHERE download_id = ?",
                 (min_priority - 1, download_id),
             )
-            conn.commit()
-        return True
+            return True
+
+        return await self._db.write(_move)
 
     async def clear_queue(self, status_filter: Optional[str] = None) -> int:
         """Remove items from the queue.
@@ -396,8 +381,7 @@ class DownloadQueueService:
         When *status_filter* is provided only items with that status are
         deleted.  Returns the number of deleted rows.
         """
-        async with self._lock:
-            conn = self._get_conn()
+        def _delete(conn: sqlite3.Connection) -> int:
             if status_filter is not None:
                 cursor = conn.execute(
                     "DELETE FROM download_queue WHERE status = ?",
@@ -405,8 +389,9 @@ class DownloadQueueService:
                 )
             else:
                 cursor = conn.execute("DELETE FROM download_queue")
-            conn.commit()
-        return cursor.rowcount
+            return cursor.rowcount
+
+        return await self._db.write(_delete)
 
     async def complete_download(
         self,
@@ -430,8 +415,7 @@ class DownloadQueueService:
         Returns the original queue record (before deletion) on success,
         or ``None`` if the download was not found in the queue.
         """
-        async with self._lock:
-            conn = self._get_conn()
+        def _complete(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
             row = conn.execute(
                 "SELECT * FROM download_queue WHERE download_id = ?",
                 (download_id,),
@@ -474,8 +458,10 @@ class DownloadQueueService:
                     now,
                 ),
             )
-            conn.commit()
-        return dict(row)
+            return row
+
+        row = await self._db.write(_complete)
+        return dict(row) if row is not None else None
 
     async def pop_next_download(self) -> Optional[dict[str, Any]]:
         """Atomically fetch and mark the next queued item as ``downloading``.
@@ -485,8 +471,7 @@ class DownloadQueueService:
         ``'downloading'``, and returned as a dict.  Returns ``None`` if
         the queue is empty.
         """
-        async with self._lock:
-            conn = self._get_conn()
+        def _pop(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
             row = conn.execute(
                 """
                 SELECT * FROM download_queue
@@ -506,12 +491,12 @@ class DownloadQueueService:
                 "WHERE download_id = ?",
                 (now, download_id),
             )
-            conn.commit()
-            updated = conn.execute(
+            return conn.execute(
                 "SELECT * FROM download_queue WHERE download_id = ?",
                 (download_id,),
             ).fetchone()
 
+        updated = await self._db.write(_pop)
         return dict(updated) if updated else None
 
     # ------------------------------------------------------------------
@@ -542,8 +527,7 @@ class DownloadQueueService:
         now = time.time()
         file_params_json = json.dumps(file_params) if file_params is not None else None
 
-        async with self._lock:
-            conn = self._get_conn()
+        def _insert(conn: sqlite3.Connection) -> Optional[int]:
             cursor = conn.execute(
                 """
                 INSERT INTO download_history (
@@ -570,8 +554,9 @@ class DownloadQueueService:
                     is_already_exists,
                 ),
             )
-            conn.commit()
-        return cursor.lastrowid or 0
+            return cursor.lastrowid
+
+        return await self._db.write(_insert) or 0
 
     async def get_history(
         self,
@@ -584,9 +569,7 @@ class DownloadQueueService:
         Returns a dict with keys ``items``, ``total``, ``limit``, and
         ``offset``.
         """
-        async with self._lock:
-            conn = self._get_conn()
-
+        def _page(conn: sqlite3.Connection) -> tuple[Optional[sqlite3.Row], list[sqlite3.Row]]:
             if status_filter is not None:
                 count_row = conn.execute(
                     "SELECT COUNT(*) AS cnt FROM download_history WHERE status = ?",
@@ -606,7 +589,9 @@ class DownloadQueueService:
                     "ORDER BY completed_at DESC LIMIT ? OFFSET ?",
                     (limit, offset),
                 ).fetchall()
+            return count_row, rows
 
+        count_row, rows = await self._db.read(_page)
         return {
             "items": [dict(row) for row in rows],
             "total": count_row["cnt"] if count_row else 0,
@@ -621,22 +606,17 @@ class DownloadQueueService:
 
         Returns ``True`` if a row was deleted.
         """
-        async with self._lock:
-            conn = self._get_conn()
-            if download_id:
-                cursor = conn.execute(
-                    "DELETE FROM download_history WHERE download_id = ?",
-                    (download_id,),
-                )
-            elif id is not None:
-                cursor = conn.execute(
-                    "DELETE FROM download_history WHERE id = ?",
-                    (id,),
-                )
-            else:
-                return False
-            conn.commit()
-        return cursor.rowcount > 0
+        if download_id:
+            sql, params = "DELETE FROM download_history WHERE download_id = ?", (download_id,)
+        elif id is not None:
+            sql, params = "DELETE FROM download_history WHERE id = ?", (id,)
+        else:
+            return False
+
+        def _delete(conn: sqlite3.Connection) -> int:
+            return conn.execute(sql, params).rowcount
+
+        return await self._db.write(_delete) > 0
 
     async def clear_history(
         self,
@@ -648,43 +628,41 @@ class DownloadQueueService:
         Both ``status_filter`` and ``before_timestamp`` can be combined
         (AND logic).  Returns the number of deleted rows.
         """
-        async with self._lock:
-            conn = self._get_conn()
-
-            clauses: list[str] = []
-            params: list[Any] = []
-
-            if status_filter is not None:
-                clauses.append("status = ?")
-                params.append(status_filter)
-            if before_timestamp is not None:
-                clauses.append("completed_at < ?")
-                params.append(before_timestamp)
-
-            where = ""
-            if clauses:
-                where = " WHERE " + " AND ".join(clauses)
-
-            cursor = conn.execute(
+        clauses: list[str] = []
+        params: list[Any] = []
+
+        if status_filter is not None:
+            clauses.append("status = ?")
+            params.append(status_filter)
+        if before_timestamp is not None:
+            clauses.append("completed_at < ?")
+            params.append(before_timestamp)
+
+        where = ""
+        if clauses:
+            where = " WHERE " + " AND ".join(clauses)
+
+        def _delete(conn: sqlite3.Connection) -> int:
+            return conn.execute(
                 f"DELETE FROM download_history{where}",
                 params,
-            )
-            conn.commit()
-        return cursor.rowcount
+            ).rowcount
+
+        return await self._db.write(_delete)
 
     async def get_history_count(self, status_filter: Optional[str] = None) -> int:
         """Return the number of history entries, optionally filtered by status."""
-        async with self._lock:
-            conn = self._get_conn()
+        def _count(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
             if status_filter is not None:
-                row = conn.execute(
+                return conn.execute(
                     "SELECT COUNT(*) AS cnt FROM download_history WHERE status = ?",
                     (status_filter,),
                 ).fetchone()
-            else:
-                row = conn.execute(
-                    "SELECT COUNT(*) AS cnt FROM download_history"
-                ).fetchone()
+            return conn.execute(
+                "SELECT COUNT(*) AS cnt FROM download_history"
+            ).fetchone()
+
+        row = await self._db.read(_count)
         return row["cnt"] if row else 0
 
     # ------------------------------------------------------------------
@@ -705,28 +683,21 @@ class DownloadQueueService:
         prevent exponential growth when the retried item is later
         canceled or fails again and re-retried.
         """
-        async with self._lock:
-            conn = self._get_conn()
-            if download_id:
-                row = conn.execute(
-                    "SELECT * FROM download_history WHERE download_id = ?",
-                    (download_id,),
-                ).fetchone()
-            elif item_id is not None:
-                row = conn.execute(
-                    "SELECT * FROM download_history WHERE id = ?",
-                    (item_id,),
-                ).fetchone()
-            else:
-                return None
+        if download_id:
+            sql, params = "SELECT * FROM download_history WHERE download_id = ?", (download_id,)
+        elif item_id is not None:
+            sql, params = "SELECT * FROM download_history WHERE id = ?", (item_id,)
+        else:
+            return None
+
+        def _requeue(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
+            row = conn.execute(sql, params).fetchone()
             if row is None:
                 return None
             status = str(row["status"])
             if status not in ("failed", "canceled"):
                 return None
 
-            import uuid
-
             new_id = str(uuid.uuid4())
             now = time.time()
             conn.execute(
@@ -753,12 +724,12 @@ class DownloadQueueService:
                 "DELETE FROM download_history WHERE id = ?",
                 (row["id"],),
             )
-            conn.commit()
-            queued = conn.execute(
+            return conn.execute(
                 "SELECT * FROM download_queue WHERE download_id = ?",
                 (new_id,),
             ).fetchone()
 
+        queued = await self._db.write(_requeue)
         return dict(queued) if queued else None
 
     async def retry_all_failed(self) -> int:
@@ -769,16 +740,13 @@ class DownloadQueueService:
 
         Returns the number of items that were re-queued.
         """
-        async with self._lock:
-            conn = self._get_conn()
+        def _requeue_all(conn: sqlite3.Connection) -> int:
             rows = conn.execute(
                 "SELECT * FROM download_history WHERE status IN ('failed', 'canceled')"
             ).fetchall()
             if not rows:
                 return 0
 
-            import uuid
-
             now = time.time()
             count = 0
             for row in rows:
@@ -808,9 +776,9 @@ class DownloadQueueService:
                     (row["id"],),
                 )
                 count += 1
-            conn.commit()
+            return count
 
-        return count
+        return await self._db.write(_requeue_all)
 
     # ------------------------------------------------------------------
     # Stats
@@ -823,22 +791,22 @@ class DownloadQueueService:
         (all from the queue table) and ``completed``, ``failed``,
         ``canceled`` (all from the history table).
         """
-        async with self._lock:
-            conn = self._get_conn()
-
+        def _counts(conn: sqlite3.Connection) -> tuple[list[sqlite3.Row], list[sqlite3.Row]]:
             queue_rows = conn.execute(
                 "SELECT status, COUNT(*) AS cnt FROM download_queue GROUP BY status"
             ).fetchall()
-            queue_stats: dict[str, int] = {}
-            for row in queue_rows:
-                queue_stats[str(row["status"])] = row["cnt"]
-
             history_rows = conn.execute(
                 "SELECT status, COUNT(*) AS cnt FROM download_history GROUP BY status"
             ).fetchall()
-            history_stats: dict[str, int] = {}
-            for row in history_rows:
-                history_stats[str(row["status"])] = row["cnt"]
+            return queue_rows, history_rows
+
+        queue_rows, history_rows = await self._db.read(_counts)
+        queue_stats: dict[str, int] = {}
+        for row in queue_rows:
+            queue_stats[str(row["status"])] = row["cnt"]
+        history_stats: dict[str, int] = {}
+        for row in history_rows:
+            history_stats[str(row["status"])] = row["cnt"]
 
         return {
             "queued": queue_stats.get("queued", 0),
@@ -872,9 +840,7 @@ class DownloadQueueService:
             "removed_orphan_queue": 0,
         }
 
-        async with self._lock:
-            conn = self._get_conn()
-
+        def _deduplicate(conn: sqlite3.Connection) -> None:
             # 1. History: for each (model_id, model_version_id, file_id,
             #    status) group keep only the row with the highest id (most
             #    recently inserted). file_id comes from file_params (#1058)
@@ -975,7 +941,7 @@ class DownloadQueueService:
                 "SELECT changes()"
             ).fetchone()[0]
 
-            conn.commit()
+        await self._db.write(_deduplicate)
 
         logger.info(
             "Deduplicate: removed %s history rows, %s queue rows, "
@@ -4,7 +4,6 @@
 # import cycles. Breaking them would require an architectural refactor.
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 import sqlite3
@@ -13,6 +12,7 @@ from typing import Iterable, Mapping, Optional, Sequence
 
 from ..utils.cache_paths import get_cache_base_dir
 from .settings_manager import get_settings_manager
+from .sqlite_executor import get_sqlite_executor
 
 logger = logging.getLogger(__name__)
 
@@ -75,10 +75,9 @@ class DownloadedVersionHistoryService:
     def __init__(self, db_path: str | None = None, *, settings_manager=None) -> None:
         self._db_path = db_path or _resolve_database_path()
         self._settings = settings_manager or get_settings_manager()
-        self._lock = asyncio.Lock()
-        self._conn: sqlite3.Connection | None = None
         self._schema_initialized = False
         self._ensure_directory()
+        self._db = get_sqlite_executor(self._db_path)
         self._initialize_schema()
 
     def _ensure_directory(self) -> None:
@@ -86,42 +85,24 @@ class DownloadedVersionHistoryService:
         if directory:
             os.makedirs(directory, exist_ok=True)
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        return conn
-
-    def _get_conn(self) -> sqlite3.Connection:
-        if self._conn is None:
-            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
-
     def _initialize_schema(self) -> None:
         if self._schema_initialized:
             return
-        with self._connect() as conn:
-            conn.executescript(self._SCHEMA)
-            conn.commit()
+        self._db.write_sync(lambda conn: conn.executescript(self._SCHEMA), label="schema")
         self._schema_initialized = True
 
     def get_database_path(self) -> str:
         return self._db_path
 
     def close(self) -> None:
-        """Close the persistent SQLite connection, if open.
+        """Close the pooled SQLite connections, if open.
 
         This is called before plugin update operations to release the
         database file lock on Windows, allowing ``shutil.rmtree()`` to
         succeed when the cache resides inside the plugin directory.
+        Later calls transparently reopen them.
         """
-        if self._conn is not None:
-            try:
-                self._conn.close()
-            except Exception:
-                pass
-            finally:
-                self._conn = None
+        self._db.close()
 
     def _get_active_library_name(self) -> str | None:
         try:
@@ -152,8 +133,7 @@ class DownloadedVersionHistoryService:
         active_library_name = library_name or self._get_active_library_name()
         timestamp = time.time()
 
-        async with self._lock:
-            conn = self._get_conn()
+        def _upsert(conn: sqlite3.Connection) -> None:
             conn.execute(
                 """
                 INSERT INTO downloaded_model_versions (
@@ -198,7 +178,8 @@ class DownloadedVersionHistoryService:
                         timestamp,
                     ),
                 )
-            conn.commit()
+
+        await self._db.write(_upsert)
 
     async def mark_downloaded_bulk(
         self,
@@ -235,8 +216,7 @@ class DownloadedVersionHistoryService:
         if not payload:
             return
 
-        async with self._lock:
-            conn = self._get_conn()
+        def _upsert_many(conn: sqlite3.Connection) -> None:
             conn.executemany(
                 """
                 INSERT INTO downloaded_model_versions (
@@ -253,7 +233,8 @@ class DownloadedVersionHistoryService:
                 """,
                 payload,
             )
-            conn.commit()
+
+        await self._db.write(_upsert_many)
 
     async def mark_as_deleted(self, model_type: str, version_id: int) -> None:
         normalized_type = _normalize_model_type(model_type)
@@ -263,8 +244,9 @@ class DownloadedVersionHistoryService:
 
         timestamp = time.time()
 
-        async with self._lock:
-            conn = self._get_conn()
+        library_name = self._get_active_library_name()
+
+        def _mark(conn: sqlite3.Connection) -> None:
             conn.execute(
                 """
                 INSERT INTO downloaded_model_versions (
@@ -282,7 +264,7 @@ class DownloadedVersionHistoryService:
                     normalized_version_id,
                     timestamp,
                     timestamp,
-                    self._get_active_library_name(),
+                    library_name,
                 ),
             )
             # Whole-version deletion also clears the per-file records (#1058)
@@ -293,7 +275,8 @@ class DownloadedVersionHistoryService:
                 """,
                 (normalized_type, normalized_version_id),
             )
-            conn.commit()
+
+        await self._db.write(_mark)
 
     async def mark_file_deleted(
         self, model_type: str, version_id: int, file_id: int
@@ -309,8 +292,7 @@ class DownloadedVersionHistoryService:
         ):
             return
 
-        async with self._lock:
-            conn = self._get_conn()
+        def _delete(conn: sqlite3.Connection) -> None:
             conn.execute(
                 """
                 DELETE FROM downloaded_version_files
@@ -318,7 +300,8 @@ class DownloadedVersionHistoryService:
                 """,
                 (normalized_type, normalized_version_id, normalized_file_id),
             )
-            conn.commit()
+
+        await self._db.write(_delete)
 
     async def get_downloaded_file_ids(
         self, model_type: str, version_id: int
@@ -329,9 +312,8 @@ class DownloadedVersionHistoryService:
         if normalized_type is None or normalized_version_id is None:
             return []
 
-        async with self._lock:
-            conn = self._get_conn()
-            rows = conn.execute(
+        def _select(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            return conn.execute(
                 """
                 SELECT file_id
                 FROM downloaded_version_files
@@ -340,6 +322,8 @@ class DownloadedVersionHistoryService:
                 """,
                 (normalized_type, normalized_version_id),
             ).fetchall()
+
+        rows = await self._db.read(_select)
         return [int(row["file_id"]) for row in rows]
 
     async def has_been_downloaded(self, model_type: str, version_id: int) -> bool:
@@ -348,9 +332,8 @@ class DownloadedVersionHistoryService:
         if normalized_type is None or normalized_version_id is None:
             return False
 
-        async with self._lock:
-            conn = self._get_conn()
-            row = conn.execute(
+        def _select(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
+            return conn.execute(
                 """
                 SELECT is_deleted_override
                 FROM downloaded_model_versions
@@ -358,6 +341,8 @@ class DownloadedVersionHistoryService:
                 """,
                 (normalized_type, normalized_version_id),
             ).fetchone()
+
+        row = await self._db.read(_select)
         return bool(row) and not bool(row["is_deleted_override"])
 
     async def get_downloaded_version_ids(
@@ -368,9 +353,8 @@ class DownloadedVersionHistoryService:
         if normalized_type is None or normalized_model_id is None:
             return []
 
-        async with self._lock:
-            conn = self._get_conn()
-            rows = conn.execute(
+        def _select(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            return conn.execute(
                 """
                 SELECT version_id
                 FROM downloaded_model_versions
@@ -379,6 +363,8 @@ class DownloadedVersionHistoryService:
                 """,
                 (normalized_type, normalized_model_id),
             ).fetchall()
+
+        rows = await self._db.read(_select)
         return [int(row["version_id"]) for row in rows]
 
     async def get_downloaded_version_ids_bulk(
@@ -401,9 +387,8 @@ class DownloadedVersionHistoryService:
         placeholders = ", ".join(["?"] * len(normalized_model_ids))
         params: list[object] = [normalized_type, *normalized_model_ids]
 
-        async with self._lock:
-            conn = self._get_conn()
-            rows = conn.execute(
+        def _select(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            return conn.execute(
                 f"""
                 SELECT model_id, version_id
                 FROM downloaded_model_versions
@@ -414,6 +399,7 @@ class DownloadedVersionHistoryService:
                 params,
             ).fetchall()
 
+        rows = await self._db.read(_select)
         result: dict[int, set[int]] = {}
         for row in rows:
             model_id = _normalize_int(row["model_id"])
@@ -9,13 +9,17 @@ This module provides a centralized download service with:
 - Singleton pattern for global session management
 - Support for authenticated downloads (e.g., CivitAI API key)
 - Resumable downloads with automatic retry
+- Segmented multi-connection transfers for large files on range-capable hosts
 - Progress tracking and callbacks
 - Optimized connection pooling and timeouts
 - Unified error handling and logging
 """
 
 import os
+import hashlib
+import json
 import logging
+import re
 import asyncio
 import ssl
 import aiohttp
@@ -24,7 +28,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse
-from typing import Optional, Dict, Tuple, Callable, Union, Awaitable, Any, cast
+from typing import Optional, Dict, List, Tuple, Callable, Union, Awaitable, Any, cast
 from ..services.settings_manager import get_settings_manager
 from .connectivity_guard import (
     OFFLINE_COOLDOWN_ERROR,
@@ -93,6 +97,8 @@ class DownloadStreamControl:
         self._event.set()
         self._reconnect_requested = False
         self.last_progress_timestamp: Optional[float] = None
+        # SHA256 of the last completed transfer, hashed while it was written
+        self.completed_sha256: Optional[str] = None
         self.stall_timeout: float = (
             float(stall_timeout) if stall_timeout is not None else 120.0
         )
@@ -156,6 +162,185 @@ class DownloadStalledError(Exception):
     """Raised when download progress stalls beyond the configured timeout."""
 
 
+# Sidecar next to a segmented ``.part`` file recording which ranges are on disk
+SEGMENT_MAP_SUFFIX = ".segments"
+_SEGMENT_MAP_VERSION = 1
+
+
+@dataclass
+class _Segment:
+    """Inclusive byte range of a segmented download and the bytes written so far."""
+
+    start: int
+    end: int
+    downloaded: int = 0
+
+    @property
+    def offset(self) -> int:
+        return self.start + self.downloaded
+
+    @property
+    def remaining(self) -> int:
+        return self.end - self.offset + 1
+
+    @property
+    def complete(self) -> bool:
+        return self.remaining <= 0
+
+
+class _SegmentRangeUnsupported(Exception):
+    """Raised when a segment request is answered without the requested range."""
+
+    def __init__(self, message: str, redirect_url: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.redirect_url = redirect_url
+
+
+class _SegmentHTTPError(Exception):
+    """Raised when a segment request fails with a non-retryable status."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__(f"Segment request failed with status {status}")
+        self.status = status
+
+
+def _write_chunk(handle: Any, chunk: bytes, hasher: Any = None) -> None:
+    handle.write(chunk)
+    # Flush so concurrent readers of the part file see what was counted
+    handle.flush()
+    if hasher is not None:
+        hasher.update(chunk)
+
+
+def _hash_file_range(handle: Any, hasher: Any, start: int, length: int) -> None:
+    handle.seek(start)
+    while length > 0:
+        block = handle.read(min(length, 1024 * 1024))
+        if not block:
+            raise OSError(f"Unexpected end of file at byte {handle.tell()}")
+        hasher.update(block)
+        length -= len(block)
+
+
+def _hash_file_prefix(path: str, length: int) -> Any:
+    """Return a SHA256 object fed with the first ``length`` bytes of ``path``."""
+
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        _hash_file_range(handle, hasher, 0, length)
+    return hasher
+
+
+def _plan_segments(total_size: int, count: int) -> List[_Segment]:
+    """Split ``total_size`` bytes into ``count`` contiguous ranges."""
+
+    segment_size = -(-total_size // max(1, count))
+    return [
+        _Segment(start, min(start + segment_size, total_size) - 1)
+        for start in range(0, total_size, segment_size)
+    ]
+
+
+_CONTENT_RANGE_RE = re.compile(r"^\s*bytes\s+(\d+)-(\d+)/(\d+|\*)\s*$", re.IGNORECASE)
+
+
+def _parse_content_range(value: Optional[str]) -> Optional[Tuple[int, int, Optional[int]]]:
+    """Parse ``bytes start-end/total`` into ``(start, end, total)``.
+
+    ``total`` is ``None`` when the host reports it as ``*``; an absent or
+    malformed header yields ``None``.
+    """
+
+    match = _CONTENT_RANGE_RE.match(value or "")
+    if match is None:
+        return None
+    total = match.group(3)
+    return int(match.group(1)), int(match.group(2)), None if total == "*" else int(total)
+
+
+def _range_validator(headers: Any) -> Optional[str]:
+    """Return the ``If-Range`` validator for a response: a strong ETag or Last-Modified.
+
+    Weak ETags may not be used with ``If-Range``, so they fall through to
+    ``Last-Modified``.
+    """
+
+    etag = (headers.get("ETag") or "").strip()
+    if etag and not etag.startswith("W/"):
+        return etag
+    last_modified = (headers.get("Last-Modified") or "").strip()
+    return last_modified or None
+
+
+def _write_segment_map(
+    map_path: str,
+    total_size: int,
+    segments: List[_Segment],
+    validator: Optional[str] = None,
+) -> None:
+    payload = {
+        "version": _SEGMENT_MAP_VERSION,
+        "total_size": total_size,
+        "validator": validator,
+        "segments": [[seg.start, seg.end, seg.downloaded] for seg in segments],
+    }
+    temp_path = f"{map_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle)
+    os.replace(temp_path, map_path)
+
+
+def _read_segment_map(
+    part_path: str,
+) -> Optional[Tuple[int, List[_Segment], Optional[str]]]:
+    """Load the segment map of ``part_path`` as ``(total_size, segments, validator)``.
+
+    Returns ``None`` when there is no usable map. An unreadable or
+    inconsistent map is removed together with its part file, because a
+    preallocated file with holes cannot be resumed sequentially.
+    """
+
+    map_path = part_path + SEGMENT_MAP_SUFFIX
+    if not os.path.exists(map_path):
+        return None
+
+    try:
+        with open(map_path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if payload.get("version") != _SEGMENT_MAP_VERSION:
+            raise ValueError("unsupported segment map version")
+        total_size = int(payload["total_size"])
+        validator = payload.get("validator")
+        if validator is not None and not isinstance(validator, str):
+            raise ValueError("invalid range validator")
+        segments = [
+            _Segment(int(start), int(end), int(downloaded))
+            for start, end, downloaded in payload["segments"]
+        ]
+        expected_start = 0
+        for segment in segments:
+            if segment.start != expected_start or segment.end < segment.start:
+                raise ValueError("segments do not cover the file")
+            if not 0 <= segment.downloaded <= segment.end - segment.start + 1:
+                raise ValueError("invalid segment progress")
+            expected_start = segment.end + 1
+        if total_size <= 0 or expected_start != total_size:
+            raise ValueError("segments do not cover the file")
+        if os.path.getsize(part_path) != total_size:
+            raise ValueError("part file size does not match the segment map")
+        return total_size, segments, validator
+    except (OSError, ValueError, TypeError, KeyError) as exc:
+        logger.warning("Discarding unusable segment map %s: %s", map_path, exc)
+
+    for path in (map_path, part_path):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as exc:
+            logger.warning("Failed to remove %s: %s", path, exc)
+    return None
+
+
 def _disable_netrc_auth(session: aiohttp.ClientSession) -> None:
     """Prevent the session from loading credentials from netrc files.
 
@@ -210,6 +395,10 @@ class Downloader:
         self.base_delay = 2.0  # Base delay for exponential backoff
         self.session_timeout = 300  # 5 minutes
         self.stall_timeout = self._resolve_stall_timeout()
+        # Large files on hosts that honour Range requests are fetched over
+        # several connections at once; a single connection disables this
+        self.segment_count = self._resolve_segment_count()
+        self.segment_min_size = 64 * 1024 * 1024
 
         # Default headers
         self.default_headers = {
@@ -273,6 +462,19 @@ class Downloader:
 
         return max(0, retries)
 
+    def _resolve_segment_count(self) -> int:
+        """Determine how many connections a segmented download may use."""
+        default_connections = 4
+        raw_value = os.environ.get("COMFYUI_DOWNLOAD_CONNECTIONS")
+
+        try:
+            connections = int(cast(Any, raw_value))
+        except (TypeError, ValueError):
+            connections = default_connections
+
+        # The session connector allows eight connections in total
+        return min(8, max(1, connections))
+
     def _should_refresh_session(self) -> bool:
         """Check if session should be refreshed"""
         if self._session is None:
@@ -451,12 +653,44 @@ class Downloader:
         """
         retry_count = 0
         part_path = save_path + ".part" if allow_resume else save_path
+        if pause_event is not None:
+            pause_event.completed_sha256 = None
 
         # Prepare headers
         headers = self._get_auth_headers(use_auth)
         if custom_headers:
             headers.update(custom_headers)
 
+        segmentable = (
+            allow_resume and part_path != save_path and self.segment_count > 1
+        )
+        if segmentable:
+            # A segment map means an earlier attempt used several connections;
+            # its preallocated part file can only be resumed range by range.
+            segment_state = _read_segment_map(part_path)
+            if segment_state is not None:
+                segment_total, segments, validator = segment_state
+                logger.info(
+                    "Resuming segmented download of %s (%s/%s bytes)",
+                    save_path,
+                    sum(segment.downloaded for segment in segments),
+                    segment_total,
+                )
+                result = await self._download_segmented(
+                    url,
+                    save_path,
+                    part_path,
+                    headers,
+                    segment_total,
+                    segments,
+                    progress_callback,
+                    pause_event,
+                    validator,
+                )
+                if result is not None:
+                    return result
+                segmentable = False
+
         # Get existing file size for resume
         resume_offset = 0
         if allow_resume and os.path.exists(part_path):
@@ -465,6 +699,10 @@ class Downloader:
 
         total_size = 0
         range_redirect_retry_urls: set[str] = set()
+        # Bytes are hashed as they are written so callers tracking the
+        # transfer get its SHA256 without reading the file again
+        hasher: Any = None
+        hashed_bytes = 0
 
         while retry_count <= self.max_retries:
             try:
@@ -608,6 +846,35 @@ class Downloader:
                             # For partial content, add the offset to get total file size
                             total_size += resume_offset
 
+                    if (
+                        segmentable
+                        and resume_offset == 0
+                        and response.status == 200
+                        and total_size >= self.segment_min_size
+                        and response.headers.get("Accept-Ranges", "").lower()
+                        == "bytes"
+                    ):
+                        # The host advertises byte ranges, so fetch the file
+                        # over parallel range requests instead of this stream
+                        validator = _range_validator(response.headers)
+                        response.release()
+                        result = await self._download_segmented(
+                            url,
+                            save_path,
+                            part_path,
+                            headers,
+                            total_size,
+                            _plan_segments(total_size, self.segment_count),
+                            progress_callback,
+                            pause_event,
+                            validator,
+                        )
+                        if result is not None:
+                            return result
+                        segmentable = False
+                        total_size = 0
+                        continue
+
                     current_size = resume_offset
                     last_progress_report_time = datetime.now()
                     progress_samples: deque[tuple[datetime, int]] = deque()
@@ -623,6 +890,15 @@ class Downloader:
 
                     if control is not None:
                         control.update_stall_timeout(self.stall_timeout)
+                        if mode == "wb":
+                            hasher = hashlib.sha256()
+                            hashed_bytes = 0
+                        elif hasher is None or hashed_bytes != resume_offset:
+                            # Only bytes left by an earlier run are read back
+                            hasher = await loop.run_in_executor(
+                                None, _hash_file_prefix, part_path, resume_offset
+                            )
+                            hashed_bytes = resume_offset
 
                     with open(part_path, mode) as f:
                         while True:
@@ -663,8 +939,11 @@ class Downloader:
                                 break
 
                             # Run blocking file write in executor
-                            await loop.run_in_executor(None, f.write, chunk)
+                            await loop.run_in_executor(
+                                None, _write_chunk, f, chunk, hasher
+                            )
                             current_size += len(chunk)
+                            hashed_bytes += len(chunk)
 
                             now = datetime.now()
                             if control is not None:
@@ -793,38 +1072,17 @@ class Downloader:
 
                     # Atomically rename .part to final file (only if using resume)
                     if allow_resume and part_path != save_path:
-                        max_rename_attempts = 5
-                        rename_attempt = 0
-                        rename_success = False
-
-                        while (
-                            rename_attempt < max_rename_attempts and not rename_success
-                        ):
-                            try:
-                                # If the destination file exists, remove it first (Windows safe)
-                                if os.path.exists(save_path):
-                                    os.remove(save_path)
-
-                                os.rename(part_path, save_path)
-                                rename_success = True
-                            except PermissionError as e:
-                                rename_attempt += 1
-                                if rename_attempt < max_rename_attempts:
-                                    logger.info(
-                                        f"File still in use, retrying rename in 2 seconds (attempt {rename_attempt}/{max_rename_attempts})"
-                                    )
-                                    await asyncio.sleep(2)
-                                else:
-                                    logger.error(
-                                        f"Failed to rename file after {max_rename_attempts} attempts: {e}"
-                                    )
-                                    return (
-                                        False,
-                                        f"Failed to finalize download: {str(e)}",
-                                    )
+                        rename_error = await self._promote_part_file(
+                            part_path, save_path
+                        )
+                        if rename_error is not None:
+                            return False, rename_error
 
                         final_size = os.path.getsize(save_path)
 
+                    if control is not None and hasher is not None:
+                        control.completed_sha256 = hasher.hexdigest()
+
                     # Ensure 100% progress is reported
                     if progress_callback:
                         final_snapshot = DownloadProgress(
@@ -892,6 +1150,463 @@ class Downloader:
 
         return False, f"Download failed after {self.max_retries + 1} attempts"
 
+    async def _promote_part_file(self, part_path: str, save_path: str) -> Optional[str]:
+        """Rename a finished ``.part`` file into place, returning an error on failure."""
+        max_rename_attempts = 5
+        rename_attempt = 0
+
+        while True:
+            try:
+                # If the destination file exists, remove it first (Windows safe)
+                if os.path.exists(save_path):
+                    os.remove(save_path)
+
+                os.rename(part_path, save_path)
+                return None
+            except PermissionError as e:
+                rename_attempt += 1
+                if rename_attempt < max_rename_attempts:
+                    logger.info(
+                        f"File still in use, retrying rename in 2 seconds (attempt {rename_attempt}/{max_rename_attempts})"
+                    )
+                    await asyncio.sleep(2)
+                else:
+                    logger.error(
+                        f"Failed to rename file after {max_rename_attempts} attempts: {e}"
+                    )
+                    return f"Failed to finalize download: {str(e)}"
+
+    async def _download_segmented(
+        self,
+        url: str,
+        save_path: str,
+        part_path: str,
+        headers: Dict[str, str],
+        total_size: int,
+        segments: List[_Segment],
+        progress_callback: Optional[Callable[..., Awaitable[None]]],
+        control: Optional[DownloadStreamControl],
+        validator: Optional[str] = None,
+    ) -> Optional[Tuple[bool, str]]:
+        """Download ``url`` over parallel range requests into a preallocated part file.
+
+        Each segment streams into its own region of ``part_path`` while a
+        sidecar map records the bytes written per segment, so an interrupted
+        transfer resumes every range where it stopped, even after a restart.
+        ``validator`` (the file's strong ETag or Last-Modified) is kept in the
+        map and sent as ``If-Range``, so ranges of a file that changed on the
+        host are never mixed into the part file.
+        Returns ``None`` when the host stops honouring ranges; the partial
+        state is discarded and the caller falls back to a single stream.
+
+        With a stream control, a background task hashes the part file in
+        order while the ranges arrive, trailing the first incomplete segment,
+        so the digest is ready moments after the last byte.
+        """
+        map_path = part_path + SEGMENT_MAP_SUFFIX
+
+        try:
+            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            # Write the map before preallocating so a sized part file never
+            # exists without one; it would look complete to a sequential resume
+            _write_segment_map(map_path, total_size, segments, validator)
+            if (
+                not os.path.exists(part_path)
+                or os.path.getsize(part_path) != total_size
+            ):
+                with open(part_path, "wb") as handle:
+                    handle.truncate(total_size)
+        except OSError as e:
+            logger.error(f"Failed to prepare segmented download {part_path}: {e}")
+            return False, str(e)
+
+        if control is not None:
+            control.update_stall_timeout(self.stall_timeout)
+
+        written = asyncio.Event()
+        hash_task: Optional[asyncio.Task] = None
+        if control is not None:
+            hash_task = asyncio.create_task(
+                self._hash_segments(part_path, segments, written)
+            )
+        try:
+            result = await self._run_segments(
+                url,
+                part_path,
+                headers,
+                total_size,
+                segments,
+                progress_callback,
+                control,
+                written,
+                validator,
+            )
+            if result is None or not result[0]:
+                return result
+            sha256 = await self._finish_hashing(hash_task)
+        finally:
+            if hash_task is not None:
+                hash_task.cancel()
+                await asyncio.gather(hash_task, return_exceptions=True)
+
+        final_size = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if final_size != total_size or not all(segment.complete for segment in segments):
+            # Keep the part file and map so the next attempt resumes the gaps
+            integrity_error = (
+                f"File size mismatch. Expected: {total_size}, Got: {final_size}"
+            )
+            logger.error(
+                "Download integrity check failed for %s: %s", save_path, integrity_error
+            )
+            return False, integrity_error
+
+        try:
+            os.remove(map_path)
+        except OSError as e:
+            logger.warning(f"Failed to remove segment map {map_path}: {e}")
+
+        rename_error = await self._promote_part_file(part_path, save_path)
+        if rename_error is not None:
+            return False, rename_error
+
+        if control is not None:
+            control.completed_sha256 = sha256
+
+        if progress_callback:
+            await self._dispatch_progress_callback(
+                progress_callback,
+                DownloadProgress(
+                    percent_complete=100.0,
+                    bytes_downloaded=total_size,
+                    total_bytes=total_size,
+                    bytes_per_second=0.0,
+                    timestamp=datetime.now().timestamp(),
+                ),
+            )
+
+        return True, save_path
+
+    async def _run_segments(
+        self,
+        url: str,
+        part_path: str,
+        headers: Dict[str, str],
+        total_size: int,
+        segments: List[_Segment],
+        progress_callback: Optional[Callable[..., Awaitable[None]]],
+        control: Optional[DownloadStreamControl],
+        written: asyncio.Event,
+        validator: Optional[str] = None,
+    ) -> Optional[Tuple[bool, str]]:
+        """Drive the segment connections until every range is on disk.
+
+        Returns ``(True, "")`` once all segments are complete, an error tuple
+        when the download failed, or ``None`` to fall back to a single stream.
+        """
+        map_path = part_path + SEGMENT_MAP_SUFFIX
+        retry_count = 0
+        range_redirect_retry_urls: set[str] = set()
+
+        def downloaded() -> int:
+            return sum(segment.downloaded for segment in segments)
+
+        last_reported = downloaded()
+        progress_samples: deque[tuple[datetime, int]] = deque()
+        progress_samples.append((datetime.now(), last_reported))
+
+        while True:
+            failure: Optional[BaseException] = None
+            session = await self.session
+            pending = {
+                asyncio.create_task(
+                    self._download_segment(
+                        session,
+                        url,
+                        headers,
+                        part_path,
+                        total_size,
+                        segment,
+                        control,
+                        written,
+                        validator,
+                    )
+                )
+                for segment in segments
+                if not segment.complete
+            }
+            logger.debug(
+                "Downloading %s over %s connections (attempt %s/%s)",
+                url,
+                len(pending),
+                retry_count + 1,
+                self.max_retries + 1,
+            )
+
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, timeout=1.0, return_when=asyncio.FIRST_EXCEPTION
+                    )
+                    failure = next(
+                        (task.exception() for task in done if task.exception()),
+                        None,
+                    )
+                    if failure is not None:
+                        break
+
+                    await asyncio.to_thread(
+                        _write_segment_map, map_path, total_size, segments, validator
+                    )
+
+                    current_size = downloaded()
+                    if progress_callback and current_size != last_reported:
+                        now = datetime.now()
+                        progress_samples.append((now, current_size))
+                        cutoff = now - timedelta(seconds=5)
+                        while progress_samples and progress_samples[0][0] < cutoff:
+                            progress_samples.popleft()
+
+                        bytes_per_second = 0.0
+                        if len(progress_samples) >= 2:
+                            first_time, first_bytes = progress_samples[0]
+                            last_time, last_bytes = progress_samples[-1]
+                            elapsed = (last_time - first_time).total_seconds()
+                            if elapsed > 0:
+                                bytes_per_second = (last_bytes - first_bytes) / elapsed
+
+                        await self._dispatch_progress_callback(
+                            progress_callback,
+                            DownloadProgress(
+                                percent_complete=(current_size / total_size) * 100,
+                                bytes_downloaded=current_size,
+                                total_bytes=total_size,
+                                bytes_per_second=bytes_per_second,
+                                timestamp=now.timestamp(),
+                            ),
+                        )
+                        last_reported = current_size
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+                # Record the ranges written so far, also when cancelled
+                try:
+                    _write_segment_map(map_path, total_size, segments, validator)
+                except OSError as e:
+                    logger.warning(f"Failed to persist segment map {map_path}: {e}")
+
+            if failure is None:
+                break
+
+            if isinstance(failure, _SegmentRangeUnsupported):
+                if (
+                    failure.redirect_url
+                    and failure.redirect_url not in range_redirect_retry_urls
+                ):
+                    range_redirect_retry_urls.add(failure.redirect_url)
+                    logger.info(
+                        "Range request was not honored after redirect; retrying final URL directly: %s",
+                        failure.redirect_url,
+                    )
+                    url = failure.redirect_url
+                    continue
+
+                logger.warning(
+                    "Server stopped honoring range requests, restarting as a single stream"
+                )
+                for path in (map_path, part_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                return None
+
+            if isinstance(failure, _SegmentHTTPError):
+                if failure.status == 401:
+                    logger.warning(f"Unauthorized access to resource: {url} (Status 401)")
+                    return (
+                        False,
+                        "Invalid or missing API key, or early access restriction.",
+                    )
+                if failure.status == 403:
+                    logger.warning(f"Forbidden access to resource: {url} (Status 403)")
+                    return (
+                        False,
+                        "Access forbidden: You don't have permission to download this file.",
+                    )
+                if failure.status == 404:
+                    logger.warning(f"Resource not found: {url} (Status 404)")
+                    return (
+                        False,
+                        "File not found - the download link may be invalid or expired.",
+                    )
+                logger.error(f"Download failed for {url} with status {failure.status}")
+                return False, f"Download failed with status {failure.status}"
+
+            if not isinstance(
+                failure,
+                (
+                    aiohttp.ClientError,
+                    asyncio.TimeoutError,
+                    DownloadStalledError,
+                    DownloadRestartRequested,
+                ),
+            ):
+                logger.error(f"Unexpected download error: {failure}")
+                return False, str(failure)
+
+            retry_count += 1
+            logger.warning(
+                f"Network error during download (attempt {retry_count}/{self.max_retries + 1}): {failure}"
+            )
+            if retry_count > self.max_retries:
+                logger.error(f"Max retries exceeded for download: {failure}")
+                return (
+                    False,
+                    f"Network error after {self.max_retries + 1} attempts: {str(failure)}",
+                )
+
+            delay = self.base_delay * (2 ** (retry_count - 1))
+            logger.info(f"Retrying in {delay} seconds...")
+            await asyncio.sleep(delay)
+            async with self._session_lock:
+                await self._create_session()
+
+        return True, ""
+
+    async def _hash_segments(
+        self, part_path: str, segments: List[_Segment], written: asyncio.Event
+    ) -> str:
+        """Hash ``part_path`` front to back as the segments fill it in."""
+        hasher = hashlib.sha256()
+        loop = asyncio.get_running_loop()
+        # Unbuffered, so read-ahead never caches regions still being written
+        with open(part_path, "rb", buffering=0) as handle:
+            for segment in segments:
+                position = segment.start
+                while position <= segment.end:
+                    available = segment.offset - position
+                    if available <= 0:
+                        written.clear()
+                        if segment.offset - position <= 0:
+                            await written.wait()
+                        continue
+                    length = min(available, self.chunk_size)
+                    await loop.run_in_executor(
+                        None, _hash_file_range, handle, hasher, position, length
+                    )
+                    position += length
+        return hasher.hexdigest()
+
+    @staticmethod
+    async def _finish_hashing(hash_task: Optional[asyncio.Task]) -> Optional[str]:
+        if hash_task is None:
+            return None
+        try:
+            return await hash_task
+        except Exception as exc:
+            logger.warning("Failed to hash segmented download: %s", exc)
+            return None
+
+    async def _download_segment(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Dict[str, str],
+        part_path: str,
+        total_size: int,
+        segment: _Segment,
+        control: Optional[DownloadStreamControl],
+        written: asyncio.Event,
+        validator: Optional[str] = None,
+    ) -> None:
+        """Stream the missing bytes of ``segment`` into its region of ``part_path``."""
+        request_headers = headers.copy()
+        request_headers["Range"] = f"bytes={segment.offset}-{segment.end}"
+        request_headers["Accept-Encoding"] = "identity"
+        if validator:
+            # A changed file is answered with a full 200 instead of the range
+            request_headers["If-Range"] = validator
+
+        async with session.get(
+            url,
+            headers=request_headers,
+            allow_redirects=True,
+            proxy=self.proxy_url,
+        ) as response:
+            if response.status in (200, 416):
+                redirected_url = str(response.url)
+                raise _SegmentRangeUnsupported(
+                    f"Range {segment.offset}-{segment.end} answered with status {response.status}",
+                    redirect_url=(
+                        redirected_url
+                        if response.history and redirected_url != url
+                        else None
+                    ),
+                )
+            if response.status != 206:
+                raise _SegmentHTTPError(response.status)
+
+            content_range = _parse_content_range(response.headers.get("Content-Range"))
+            if (
+                content_range is None
+                or content_range[:2] != (segment.offset, segment.end)
+                or content_range[2] not in (None, total_size)
+            ):
+                raise _SegmentRangeUnsupported(
+                    f"Range {segment.offset}-{segment.end} answered with "
+                    f"Content-Range {response.headers.get('Content-Range')!r}"
+                )
+
+            loop = asyncio.get_running_loop()
+            with open(part_path, "r+b") as handle:
+                handle.seek(segment.offset)
+                while not segment.complete:
+                    active_stall_timeout = (
+                        control.stall_timeout if control else self.stall_timeout
+                    )
+
+                    if control is not None:
+                        if control.is_paused():
+                            await control.wait()
+                            if control.consume_reconnect_request():
+                                raise DownloadRestartRequested(
+                                    "Reconnect requested after resume"
+                                )
+                        elif control.consume_reconnect_request():
+                            raise DownloadRestartRequested("Reconnect requested")
+
+                    try:
+                        chunk = await asyncio.wait_for(
+                            response.content.read(self.chunk_size),
+                            timeout=active_stall_timeout,
+                        )
+                    except asyncio.TimeoutError as exc:
+                        logger.warning(
+                            "Download stalled for %.1f seconds without progress from %s",
+                            active_stall_timeout,
+                            url,
+                        )
+                        raise DownloadStalledError(
+                            f"No data received for {active_stall_timeout:.1f} seconds"
+                        ) from exc
+
+                    if not chunk:
+                        break
+
+                    # Never write past the segment, even if the host sends more
+                    chunk = chunk[: segment.remaining]
+                    await loop.run_in_executor(None, _write_chunk, handle, chunk)
+                    segment.downloaded += len(chunk)
+                    written.set()
+                    if control is not None:
+                        control.mark_progress()
+
+        if not segment.complete:
+            raise aiohttp.ClientPayloadError(
+                f"Connection closed with {segment.remaining} bytes of range "
+                f"{segment.start}-{segment.end} outstanding"
+            )
+
     async def _dispatch_progress_callback(
         self,
         progress_callback: Callable[..., Awaitable[None]],
@@ -0,0 +1,126 @@
+"""Bounded edit-distance lookups over a token vocabulary.
+
+``fuzzy_match`` accepts a search word when it is a substring of a field or
+when ``SequenceMatcher.ratio()`` against one of the field's whitespace
+separated tokens reaches the threshold. Running that comparison for every
+token of every cached model is what makes fuzzy search slow on large
+libraries, so this module keeps the distinct tokens in a BK-tree instead.
+
+The tree is keyed by the insertion/deletion edit distance
+``len(a) + len(b) - 2 * LCS(a, b)``, which is a metric. A ratio of at least
+``threshold`` implies a distance of at most ``(1 - threshold) * (len(a) +
+len(b))``, so a range query returns a superset of the similar tokens, which
+are then confirmed with ``SequenceMatcher`` to keep the exact semantics.
+"""
+
+from __future__ import annotations
+
+import heapq
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+
+FUZZY_THRESHOLD = 0.85
+
+
+def lcs_length(a: str, b: str) -> int:
+    """Length of the longest common subsequence (bit-parallel)."""
+
+    if not a or not b:
+        return 0
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(a):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    full = (1 << len(a)) - 1
+    row = full
+    for char in b:
+        matched = row & masks.get(char, 0)
+        row = ((row + matched) | (row - matched)) & full
+    return len(a) - bin(row).count("1")
+
+
+def indel_distance(a: str, b: str) -> int:
+    return len(a) + len(b) - 2 * lcs_length(a, b)
+
+
+class _Node:
+    __slots__ = ("token", "children")
+
+    def __init__(self, token: str) -> None:
+        self.token = token
+        self.children: Dict[int, _Node] = {}
+
+
+class FuzzyTokenIndex:
+    """BK-tree over distinct lower-cased tokens."""
+
+    def __init__(self, threshold: float = FUZZY_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._root: Optional[_Node] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, token: str) -> None:
+        if not token:
+            return
+        node = self._root
+        if node is None:
+            self._root = _Node(token)
+            self._size = 1
+            return
+        while True:
+            distance = indel_distance(token, node.token)
+            if distance == 0:
+                return
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _Node(token)
+                self._size += 1
+                return
+            node = child
+
+    def update(self, tokens: Iterable[str]) -> None:
+        for token in tokens:
+            self.add(token)
+
+    def lookup(self, word: str, limit: Optional[int] = None) -> List[Tuple[float, str]]:
+        """Return ``(ratio, token)`` pairs similar to ``word``, best first.
+
+        With ``limit`` only the ``limit`` closest tokens are kept and the
+        search radius shrinks as soon as that many have been found.
+        """
+
+        if self._root is None or not word:
+            return []
+
+        slack = 1.0 - self.threshold
+        word_length = len(word)
+        # Longest token that can still reach the threshold against ``word``
+        longest = word_length * (1.0 + slack) / self.threshold
+        radius = int(slack * (word_length + longest) + 1e-9)
+
+        # Max-heap on distance (negated) holding the best matches so far
+        best: List[Tuple[int, float, str]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            token = node.token
+            distance = indel_distance(word, token)
+            if distance <= radius and distance <= slack * (word_length + len(token)) + 1e-9:
+                ratio = SequenceMatcher(None, token, word).ratio()
+                if ratio >= self.threshold:
+                    heapq.heappush(best, (-distance, ratio, token))
+                    if limit is not None and len(best) > limit:
+                        heapq.heappop(best)
+                    if limit is not None and len(best) == limit:
+                        radius = min(radius, -best[0][0])
+            low = distance - radius
+            high = distance + radius
+            for edge, child in node.children.items():
+                if low <= edge <= high:
+                    stack.append(child)
+
+        ranked = [(ratio, token) for _, ratio, token in best]
+        ranked.sort(key=lambda pair: (-pair[0], pair[1]))
+        return ranked
@@ -0,0 +1,282 @@
+"""Persistent SHA256 memo keyed by file identity rather than path.
+
+Moving or renaming a model keeps its device, inode, size and modification
+time, so the memo lets :class:`~py.services.hash_service.HashService` return
+the digest of a relocated file without reading it again. An entry is dropped
+as soon as the inode reports a different size or ``mtime_ns``, and the least
+recently used entries are evicted once the memo exceeds ``MAX_ENTRIES``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Set, Tuple
+
+from ..utils.cache_paths import CacheType, resolve_cache_path_with_migration
+
+logger = logging.getLogger(__name__)
+
+# Files modified this recently may still change within the same timestamp
+# tick, so their digests are not trusted to the stat key (like git's "racily
+# clean" entries).
+RACY_WINDOW_NS = 2_000_000_000
+
+# Deleted files cannot be stat'ed to find their identity, so stale entries
+# are only ever evicted by this bound rather than on removal.
+MAX_ENTRIES = 100_000
+
+# Device and inode numbers can exceed SQLite's signed 64-bit integers on some
+# filesystems, so they are stored as text.
+_IdentityKey = Tuple[str, str]
+
+
+def _identity(stat_result: os.stat_result) -> Optional[_IdentityKey]:
+    # Some filesystems (e.g. FAT or network shares on Windows) report no inode
+    if not stat_result.st_ino:
+        return None
+    return str(stat_result.st_dev), str(stat_result.st_ino)
+
+
+class HashMemo:
+    """Thread-safe ``(st_dev, st_ino, size, mtime_ns) -> sha256`` table.
+
+    Rows live in a small SQLite file shared by every library; lookups are
+    served from an in-memory copy loaded on first use, kept in least recently
+    used order and capped at ``max_entries``.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = MAX_ENTRIES) -> None:
+        self._db_path = db_path
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Optional[OrderedDict[_IdentityKey, Tuple[int, int, str]]] = None
+        self._pending_deletes: Set[_IdentityKey] = set()
+        self._schema_ready = False
+
+    def is_enabled(self) -> bool:
+        return os.environ.get("LORA_MANAGER_DISABLE_PERSISTENT_CACHE", "0") != "1"
+
+    def get_database_path(self) -> str:
+        if self._db_path is None:
+            self._db_path = resolve_cache_path_with_migration(CacheType.HASH_MEMO)
+        return self._db_path
+
+    def lookup(self, file_path: str) -> Optional[str]:
+        """Return the memoised digest for ``file_path`` if the file is unchanged."""
+        if not self.is_enabled():
+            return None
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        key = _identity(stat_result)
+        if key is None:
+            return None
+
+        with self._lock:
+            entries = self._load_locked()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            size, mtime_ns, sha256 = entry
+            if size == stat_result.st_size and mtime_ns == stat_result.st_mtime_ns:
+                entries.move_to_end(key)
+                self._write_locked(
+                    "UPDATE hash_memo SET last_used = ? WHERE st_dev = ? AND st_ino = ?",
+                    [(time.time_ns(),) + key],
+                )
+                return sha256
+            # Same inode, different content: forget it on the next write
+            del entries[key]
+            self._pending_deletes.add(key)
+            return None
+
+    def record(self, file_path: str, sha256: str, before: Optional[os.stat_result] = None) -> bool:
+        """Remember ``sha256`` for the current identity of ``file_path``.
+
+        Pass ``before`` (the stat taken before hashing) to skip files that
+        changed while they were being read. Returns ``True`` when stored.
+        """
+        if not self.is_enabled() or not sha256:
+            return False
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return False
+        if before is not None and (
+            _identity(before) != _identity(stat_result)
+            or before.st_size != stat_result.st_size
+            or before.st_mtime_ns != stat_result.st_mtime_ns
+        ):
+            return False
+        row = self._row_for(stat_result, sha256.lower())
+        if row is None:
+            return False
+        self._store({row[:2]: row[2:]}, replace=True)
+        return True
+
+    def seed(
+        self,
+        hash_rows: Iterable[Tuple[str, str]],
+        sizes: Optional[Mapping[str, int]] = None,
+        modified: Optional[Mapping[str, float]] = None,
+    ) -> int:
+        """Pre-populate the memo from ``(sha256, file_path)`` hash index rows.
+
+        Paths that already have an entry are left alone. When ``sizes`` maps a
+        path to the size recorded alongside its hash, files whose size has
+        since changed are skipped. When ``modified`` maps a path to the time
+        it was indexed, files written after that (or without a recorded time)
+        are skipped too, since a same-size rewrite would otherwise inherit
+        the old digest. Returns the number of rows added.
+        """
+        if not self.is_enabled():
+            return 0
+        with self._lock:
+            known = set(self._load_locked())
+
+        rows: Dict[_IdentityKey, Tuple[int, int, str]] = {}
+        for sha256, file_path in hash_rows:
+            if not sha256 or not file_path:
+                continue
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                continue
+            if sizes is not None:
+                expected = sizes.get(file_path)
+                if expected is not None and int(expected) != stat_result.st_size:
+                    continue
+            if modified is not None:
+                indexed_at = modified.get(file_path)
+                if not indexed_at or stat_result.st_mtime > float(indexed_at):
+                    continue
+            row = self._row_for(stat_result, sha256.lower())
+            if row is None or row[:2] in known:
+                continue
+            rows[row[:2]] = row[2:]
+
+        if rows:
+            self._store(rows, replace=False)
+        return len(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
+            self._pending_deletes.clear()
+            if self.is_enabled():
+                self._write_locked(clear=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_locked())
+
+    # Internal helpers -------------------------------------------------
+
+    @staticmethod
+    def _row_for(stat_result: os.stat_result, sha256: str) -> Optional[Tuple[str, str, int, int, str]]:
+        key = _identity(stat_result)
+        if key is None:
+            return None
+        if time.time_ns() - stat_result.st_mtime_ns < RACY_WINDOW_NS:
+            return None
+        return key + (stat_result.st_size, stat_result.st_mtime_ns, sha256)
+
+    def _store(self, rows: Dict[_IdentityKey, Tuple[int, int, str]], replace: bool) -> None:
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        now = time.time_ns()
+        with self._lock:
+            entries = self._load_locked()
+            for key, value in rows.items():
+                if replace or key not in entries:
+                    entries[key] = value
+                    entries.move_to_end(key)
+                self._pending_deletes.discard(key)
+            while len(entries) > self._max_entries:
+                evicted, _ = entries.popitem(last=False)
+                self._pending_deletes.add(evicted)
+            deletes = list(self._pending_deletes)
+            self._pending_deletes.clear()
+            self._write_locked(
+                f"{verb} INTO hash_memo (st_dev, st_ino, size, mtime_ns, sha256, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                [key + value + (now,) for key, value in rows.items() if key in entries],
+                deletes,
+            )
+
+    def _load_locked(self) -> "OrderedDict[_IdentityKey, Tuple[int, int, str]]":
+        if self._entries is not None:
+            return self._entries
+        self._entries = OrderedDict()
+        try:
+            conn = self._connect()
+            try:
+                for row in conn.execute(
+                    "SELECT st_dev, st_ino, size, mtime_ns, sha256 FROM hash_memo ORDER BY last_used, rowid"
+                ):
+                    self._entries[(row[0], row[1])] = (row[2], row[3], row[4])
+            finally:
+                conn.close()
+        except Exception as exc:
+            logger.warning("Failed to load hash memo: %s", exc)
+        return self._entries
+
+    def _write_locked(
+        self,
+        sql: Optional[str] = None,
+        rows: Sequence[Tuple] = (),
+        deletes: Sequence[_IdentityKey] = (),
+        clear: bool = False,
+    ) -> None:
+        try:
+            conn = self._connect()
+            try:
+                if clear:
+                    conn.execute("DELETE FROM hash_memo")
+                if deletes:
+                    conn.executemany("DELETE FROM hash_memo WHERE st_dev = ? AND st_ino = ?", deletes)
+                if sql and rows:
+                    conn.executemany(sql, rows)
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as exc:
+            logger.warning("Failed to persist hash memo: %s", exc)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.get_database_path(), check_same_thread=False)
+        if not self._schema_ready:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS hash_memo (
+                    st_dev TEXT NOT NULL,
+                    st_ino TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    last_used INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (st_dev, st_ino)
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(hash_memo)")}
+            if "last_used" not in columns:
+                conn.execute("ALTER TABLE hash_memo ADD COLUMN last_used INTEGER NOT NULL DEFAULT 0")
+            conn.commit()
+            self._schema_ready = True
+        return conn
+
+
+_hash_memo: Optional[HashMemo] = None
+
+
+def get_hash_memo() -> HashMemo:
+    """Return the process-wide :class:`HashMemo`."""
+    global _hash_memo
+    if _hash_memo is None:
+        _hash_memo = HashMemo()
+    return _hash_memo
@@ -0,0 +1,356 @@
+"""Off-loop SHA256 hashing with a bounded worker pool.
+
+Model files are hashed in worker threads (``hashlib`` releases the GIL while
+digesting large buffers) so multi-GB reads never block the aiohttp event loop.
+Concurrent requests for the same file share one job, interactive requests are
+scheduled ahead of background backfills, and a job can be cancelled while it
+is queued or between chunks. Digests of unchanged files are answered from the
+stat-keyed :class:`~py.services.hash_memo.HashMemo` without reading them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..utils.file_utils import _get_hash_chunk_size_bytes
+from .hash_memo import HashMemo, get_hash_memo
+from .websocket_manager import ws_manager
+
+logger = logging.getLogger(__name__)
+
+# Sequential readers thrash spinning disks, so stay well below the CPU count.
+DEFAULT_HASH_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# Only files at least this large broadcast websocket progress.
+HASH_PROGRESS_MIN_BYTES = 100 * 1024 * 1024
+
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class HashPriority(IntEnum):
+    """Scheduling lanes; lower values are served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class HashCancelledError(RuntimeError):
+    """Raised to waiters when a hash job is cancelled."""
+
+
+_current_priority: ContextVar[HashPriority] = ContextVar(
+    "hash_priority", default=HashPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def hash_priority(priority: HashPriority) -> Iterator[None]:
+    """Set the default priority for hashes requested in this context.
+
+    Tasks created inside the block inherit it, so a backfill can route every
+    nested ``calculate_sha256`` call into the background lane.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def _hash_file_blocking(
+    file_path: str,
+    chunk_size: int,
+    cancel_event: threading.Event,
+    report: Optional[Callable[[int, int], None]] = None,
+) -> str:
+    """Hash ``file_path`` in the calling thread, checking for cancellation per chunk.
+
+    Uses ``posix_fadvise`` with ``POSIX_FADV_DONTNEED`` where available so the
+    read does not linger in the OS page cache (see ``calculate_sha256``).
+    """
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        fd = f.fileno()
+        total = os.fstat(fd).st_size
+        done = 0
+        for byte_block in iter(lambda: f.read(chunk_size), b""):
+            if cancel_event.is_set():
+                raise HashCancelledError(f"Hashing cancelled: {file_path}")
+            sha256_hash.update(byte_block)
+            done += len(byte_block)
+            if report is not None:
+                report(done, total)
+        if hasattr(os, "posix_fadvise") and hasattr(os, "POSIX_FADV_DONTNEED"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    return sha256_hash.hexdigest()
+
+
+@dataclass(eq=False)
+class _HashJob:
+    key: str
+    file_path: str
+    priority: HashPriority
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    callbacks: List[ProgressCallback] = field(default_factory=list)
+    task: Optional[asyncio.Task] = None
+    slot_waiter: Optional[asyncio.Future] = None
+    started: bool = False
+    waiters: int = 0
+    last_percent: int = -1
+
+
+@dataclass(eq=False)
+class _LoopState:
+    """Jobs and slot accounting owned by one event loop."""
+
+    inflight: Dict[str, _HashJob] = field(default_factory=dict)
+    waiting: List[Tuple[int, int, _HashJob]] = field(default_factory=list)
+    active: int = 0
+    sequence: Iterator[int] = field(default_factory=itertools.count)
+
+
+class HashService:
+    """Bounded, prioritised SHA256 worker pool with per-file singleflight.
+
+    The thread pool is shared process-wide. Scheduling state is kept per event
+    loop because background scans run their own loop in a worker thread.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, memo: Optional[HashMemo] = None) -> None:
+        self.max_workers = max(1, max_workers or DEFAULT_HASH_WORKERS)
+        self._memo = memo
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = _LoopState()
+            self._states[loop] = state
+        return state
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="lm-hash"
+                )
+            return self._executor
+
+    @staticmethod
+    def _job_key(file_path: str) -> str:
+        return os.path.normcase(os.path.realpath(file_path))
+
+    async def hash_file(
+        self,
+        file_path: str,
+        *,
+        priority: Optional[HashPriority] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> str:
+        """Return the SHA256 hex digest of ``file_path``.
+
+        Args:
+            file_path: File to hash.
+            priority: Scheduling lane; defaults to the :func:`hash_priority`
+                context, which is interactive unless set otherwise.
+            progress_callback: Optional ``callback(file_path, bytes_done, total)``
+                invoked on the event loop as the hash advances.
+
+        Raises:
+            HashCancelledError: If the job was cancelled via :meth:`cancel`.
+            OSError: If the file cannot be read.
+        """
+        if self._memo is not None:
+            # The first lookup loads the memo table and every lookup stats the
+            # file (slow on network shares), so keep both off the event loop
+            memoised = await asyncio.to_thread(self._memo.lookup, file_path)
+            if memoised:
+                return memoised
+
+        state = self._get_state()
+        if priority is None:
+            priority = _current_priority.get()
+
+        key = self._job_key(file_path)
+        job = state.inflight.get(key)
+        if job is None or job.cancel_event.is_set():
+            job = _HashJob(key=key, file_path=file_path, priority=priority)
+            state.inflight[key] = job
+            job.task = asyncio.get_running_loop().create_task(self._run(state, job))
+            job.task.add_done_callback(_consume_task_result)
+        elif priority < job.priority:
+            self._promote(state, job, priority)
+
+        if progress_callback is not None:
+            job.callbacks.append(progress_callback)
+        job.waiters += 1
+        assert job.task is not None
+        try:
+            return await asyncio.shield(job.task)
+        finally:
+            job.waiters -= 1
+            if progress_callback is not None and progress_callback in job.callbacks:
+                job.callbacks.remove(progress_callback)
+            if job.waiters == 0 and not job.task.done():
+                # Every waiter went away: nobody needs the digest any more
+                self._cancel_job(job)
+
+    def cancel(self, file_path: str) -> bool:
+        """Cancel the queued or running hash for ``file_path`` on this loop.
+
+        Returns ``True`` when a job was found; its waiters receive
+        :class:`HashCancelledError`.
+        """
+        job = self._get_state().inflight.get(self._job_key(file_path))
+        if job is None or job.task is None or job.task.done():
+            return False
+        self._cancel_job(job)
+        return True
+
+    def pending_count(self) -> int:
+        """Return the number of queued or running hash jobs on this loop."""
+        return len(self._get_state().inflight)
+
+    @staticmethod
+    def _cancel_job(job: _HashJob) -> None:
+        job.cancel_event.set()
+        waiter = job.slot_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(HashCancelledError(f"Hashing cancelled: {job.file_path}"))
+
+    @staticmethod
+    def _promote(state: _LoopState, job: _HashJob, priority: HashPriority) -> None:
+        job.priority = priority
+        if not job.started and job.slot_waiter is not None:
+            # The stale heap entry is skipped once this one hands over a slot
+            heapq.heappush(state.waiting, (priority, next(state.sequence), job))
+
+    async def _acquire_slot(self, state: _LoopState, job: _HashJob) -> None:
+        if state.active < self.max_workers and not state.waiting:
+            state.active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        job.slot_waiter = waiter
+        heapq.heappush(state.waiting, (job.priority, next(state.sequence), job))
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # A slot was handed over just before we were interrupted
+                self._release_slot(state)
+            raise
+        finally:
+            job.slot_waiter = None
+
+    @staticmethod
+    def _release_slot(state: _LoopState) -> None:
+        while state.waiting:
+            _, _, job = heapq.heappop(state.waiting)
+            waiter = job.slot_waiter
+            if waiter is None or waiter.done():
+                continue
+            waiter.set_result(None)
+            return
+        state.active -= 1
+
+    async def _run(self, state: _LoopState, job: _HashJob) -> str:
+        try:
+            await self._acquire_slot(state, job)
+            try:
+                job.started = True
+                if job.cancel_event.is_set():
+                    raise HashCancelledError(f"Hashing cancelled: {job.file_path}")
+                loop = asyncio.get_running_loop()
+                chunk_size = _get_hash_chunk_size_bytes()
+
+                def report(done: int, total: int) -> None:
+                    percent = done * 100 // total if total else 100
+                    if percent != job.last_percent:
+                        job.last_percent = percent
+                        loop.call_soon_threadsafe(self._emit_progress, job, done, total)
+
+                return await loop.run_in_executor(
+                    self._get_executor(),
+                    self._hash_and_memoise,
+                    job.file_path,
+                    chunk_size,
+                    job.cancel_event,
+                    report,
+                )
+            finally:
+                self._release_slot(state)
+        finally:
+            if state.inflight.get(job.key) is job:
+                del state.inflight[job.key]
+
+    def _hash_and_memoise(
+        self,
+        file_path: str,
+        chunk_size: int,
+        cancel_event: threading.Event,
+        report: Callable[[int, int], None],
+    ) -> str:
+        if self._memo is None:
+            return _hash_file_blocking(file_path, chunk_size, cancel_event, report)
+        before = os.stat(file_path)
+        sha256 = _hash_file_blocking(file_path, chunk_size, cancel_event, report)
+        self._memo.record(file_path, sha256, before)
+        return sha256
+
+    @staticmethod
+    def _emit_progress(job: _HashJob, done: int, total: int) -> None:
+        for callback in list(job.callbacks):
+            try:
+                callback(job.file_path, done, total)
+            except Exception as exc:
+                logger.debug("Hash progress callback failed for %s: %s", job.file_path, exc)
+
+        if total >= HASH_PROGRESS_MIN_BYTES:
+            asyncio.ensure_future(
+                ws_manager.broadcast(
+                    {
+                        "type": "hash_progress",
+                        "file_path": job.file_path,
+                        "progress": job.last_percent,
+                        "bytes_done": done,
+                        "total_bytes": total,
+                        "background": job.priority == HashPriority.BACKGROUND,
+                    }
+                )
+            )
+
+
+def _consume_task_result(task: asyncio.Task) -> None:
+    # Abandoned jobs may finish with an error nobody awaits any more
+    if not task.cancelled():
+        task.exception()
+
+
+_hash_service: Optional[HashService] = None
+
+
+def get_hash_service() -> HashService:
+    """Return the process-wide :class:`HashService`."""
+    global _hash_service
+    if _hash_service is None:
+        _hash_service = HashService(memo=get_hash_memo())
+    return _hash_service
@@ -20,12 +20,15 @@ class LoraScanner(ModelScanner):
 
         # Initialize parent class with ModelHashIndex
         from .model_hash_index import ModelHashIndex
+        from .model_name_index import ModelNameIndex
 
         super().__init__(
             model_type="lora",
             model_class=LoraMetadata, 
             file_extensions=file_extensions,
-            hash_index=ModelHashIndex()  # Changed from LoraHashIndex to ModelHashIndex
+            hash_index=ModelHashIndex(),  # Changed from LoraHashIndex to ModelHashIndex
+            # Nodes resolve LoRA names synchronously at queue time
+            name_index=ModelNameIndex(),
         )
     
     def get_model_roots(self) -> List[str]:
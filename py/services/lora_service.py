@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 
 from .base_model_service import BaseModelService
 from .model_query import resolve_sub_type
-from .auto_tag_service import extract_auto_tags
+from .auto_tag_service import ensure_auto_tags
 from ..utils.models import LoraMetadata
 from ..config import config
 
@@ -76,7 +76,7 @@ class LoraService(BaseModelService):
             "civitai": self.filter_civitai_data(
                 model_data.get("civitai", {}), minimal=True
             ),
-            "auto_tags": model_data.get("auto_tags") or extract_auto_tags(model_data),
+            "auto_tags": ensure_auto_tags(model_data),
             "version_count": model_data.get("version_count"),
             "hf_url": model_data.get("hf_url", ""),
         }
@@ -276,6 +276,7 @@ class LoraService(BaseModelService):
         Supports both simple names and full-path syntax.
         """
         cache = await self.scanner.get_cached_data()
+        await self._ensure_hydrated()
 
         for lora in cache.raw_data:
             file_name = lora.get("file_name", "")
@@ -290,6 +291,7 @@ class LoraService(BaseModelService):
     ) -> Optional[str]:
         """Get usage tips for a LoRA by its relative path"""
         cache = await self.scanner.get_cached_data()
+        await self._ensure_hydrated()
 
         for lora in cache.raw_data:
             file_path = lora.get("file_path", "")
@@ -456,6 +458,9 @@ class LoraService(BaseModelService):
         selected = []
         if slots_needed > 0:
             selected = rng.sample(available_pool, slots_needed)
+        if use_recommended_strength:
+            # Recommended strengths come from the deferred usage tips
+            await self._ensure_hydrated(selected)
 
         # Generate random strengths for selected LoRAs
         result_loras = []
@@ -6,7 +6,7 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Protocol
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Protocol, Sequence
 
 from ..services.settings_manager import SettingsManager
 from ..utils.civitai_utils import resolve_license_payload
@@ -172,6 +172,28 @@ class MetadataSyncService:
         await self._metadata_manager.save_metadata(metadata_path, local_metadata)
         return local_metadata
 
+    async def prefetch_by_hashes(self, hashes: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Resolve many hashes at once through the default provider's batch lookup.
+
+        Returns payloads keyed by lowercase SHA256, ready to be passed to
+        :meth:`fetch_and_update_model` as ``prefetched_metadata``. Hashes that
+        are missing (not found, or no batch lookup available) must still go
+        through the per-hash lookup so not-found handling stays unchanged.
+        ``RateLimitError`` propagates to the caller.
+        """
+
+        if not hashes:
+            return {}
+        provider = await self._get_default_provider()
+        lookup = getattr(provider, "get_models_by_hashes", None)
+        if lookup is None:
+            return {}
+        try:
+            result = await lookup(list(hashes))
+        except NotImplementedError:
+            return {}
+        return result or {}
+
     async def fetch_and_update_model(
         self,
         *,
@@ -179,12 +201,14 @@ class MetadataSyncService:
         file_path: str,
         model_data: Dict[str, Any],
         update_cache_func: Callable[[str, str, Dict[str, Any]], Awaitable[bool]],
+        prefetched_metadata: Optional[Dict[str, Any]] = None,
     ) -> tuple[bool, Optional[str]]:
         """Fetch metadata for a model and update both disk and cache state.
 
         Callers should hydrate ``model_data`` via ``MetadataManager.hydrate_model_data``
         before invoking this method so that the persisted payload retains all known
-        metadata fields.
+        metadata fields. ``prefetched_metadata`` (from :meth:`prefetch_by_hashes`)
+        stands in for the default provider's ``get_model_by_hash`` result.
         """
 
         if not isinstance(model_data, dict):
@@ -247,7 +271,10 @@ class MetadataSyncService:
 
             for provider_name, provider in provider_attempts:
                 try:
-                    civitai_metadata_candidate, error = await provider.get_model_by_hash(sha256)
+                    if provider_name is None and prefetched_metadata:
+                        civitai_metadata_candidate, error = prefetched_metadata, None
+                    else:
+                        civitai_metadata_candidate, error = await provider.get_model_by_hash(sha256)
                 except RateLimitError as exc:
                     logger.warning(
                         "Provider %s is rate-limited (retry_after=%.0fs); skipping to next provider",
@@ -4,9 +4,14 @@ import logging
 import random
 
 logger = logging.getLogger(__name__)
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
-from natsort import natsorted
+from natsort import natsort_keygen, natsorted
+
+from .auto_tag_service import auto_tag_signature, extract_auto_tags
+from .model_query_index import ModelQueryIndex
+from .model_search_index import ModelSearchIndex
+from .sorted_view import SortedView
 
 # Supported sort modes: (sort_key, order)
 # order: 'asc' for ascending, 'desc' for descending
@@ -26,6 +31,21 @@ SUPPORTED_SORT_MODES = [
 
 DISPLAY_NAME_MODES = {"model_name", "file_name"}
 
+# Sort keys served from a maintained permutation, mapped to the view they use.
+# versions_count pre-sorts by name; the real ordering happens after dedup.
+SORT_VIEW_KEYS = {
+    'name': 'name',
+    'versions_count': 'name',
+    'date': 'date',
+    'size': 'size',
+    'usage': 'usage',
+}
+
+# Above this share of changed entries a view is rebuilt instead of patched
+SORT_VIEW_REBUILD_RATIO = 0.125
+
+_natsort_key = natsort_keygen()
+
 
 @dataclass
 class ModelCache:
@@ -45,13 +65,46 @@ class ModelCache:
     _last_sort: Tuple[Optional[str], str, Optional[str]] = field(
         init=False, repr=False, default=(None, "asc", None)
     )
-    _last_sorted_data: List[Dict[str, Any]] = field(
+    _last_sorted_data: Sequence[Dict[str, Any]] = field(
         init=False, repr=False, default_factory=list
     )
+    # Query index over _last_sorted_data plus the generation it was built for
+    _query_index: Optional[ModelQueryIndex] = field(
+        init=False, repr=False, default=None
+    )
+    _query_index_generation: Any = field(init=False, repr=False, default=None)
+    # Maintained sort permutations (view name -> SortedView) and, per tracked
+    # entry id, (entry, sort signature, {view name: sort key})
+    _sort_views: Dict[str, SortedView] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _sort_entries: Dict[int, Tuple[Dict[str, Any], Tuple[Any, ...], Dict[str, Any]]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    # Per tracked entry id: (entry, auto tag signature) the stored auto_tags
+    # were computed from
+    _auto_tag_entries: Dict[int, Tuple[Dict[str, Any], Tuple[Any, ...]]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    # Trigram index for substring search plus the generation it was synced
+    # for; resort() marks it stale
+    _search_index: ModelSearchIndex = field(
+        init=False, repr=False, default_factory=ModelSearchIndex
+    )
+    _search_index_generation: Any = field(init=False, repr=False, default=None)
+    _search_index_stale: bool = field(init=False, repr=False, default=True)
+    # Bumped by every mutation made through the cache itself, so results
+    # derived from it can be told apart from stale ones
+    _revision: int = field(init=False, repr=False, default=0)
+    # file_path -> last known position in raw_data, checked on every lookup
+    _path_positions: Dict[str, int] = field(
+        init=False, repr=False, default_factory=dict
+    )
 
     def __post_init__(self):
         self._lock = asyncio.Lock()
         self._normalize_raw_data()
+        self._refresh_auto_tags()
         self.name_display_mode = self._normalize_display_mode(self.name_display_mode)
         # Default sort on init
         asyncio.create_task(self.resort())
@@ -89,6 +142,32 @@ class ModelCache:
         for item in self.raw_data:
             self._normalize_item(item)
 
+    def _refresh_auto_tags(self) -> None:
+        """Keep each entry's ``auto_tags`` in line with its source fields.
+
+        Entries are tracked by identity; the tags are only re-extracted for
+        new entries or when file_name, base_model, civitai.name or tags
+        changed, so an unchanged cache costs no regex work.
+        """
+
+        tracked = self._auto_tag_entries
+        refreshed: Dict[int, Tuple[Dict[str, Any], Tuple[Any, ...]]] = {}
+        for item in self.raw_data:
+            if not isinstance(item, dict):
+                continue
+            signature = auto_tag_signature(item)
+            record = tracked.get(id(item))
+            if (
+                record is None
+                or record[0] is not item
+                or record[1] != signature
+                or 'auto_tags' not in item
+            ):
+                item['auto_tags'] = extract_auto_tags(item)
+                record = (item, signature)
+            refreshed[id(item)] = record
+        self._auto_tag_entries = refreshed
+
     def _get_display_name(self, item: Dict[str, Any]) -> str:
         """Return the value used for name-based sorting based on display settings."""
 
@@ -270,15 +349,55 @@ class ModelCache:
 
         return list(self.version_files_index.get(normalized_id, []))
 
+    def get_entries_by_path(self, paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return ``{file_path: entry}`` for the cached entries among ``paths``.
+
+        Positions in ``raw_data`` are remembered between calls and verified
+        on every lookup, so entries edited or replaced in place cost O(1) each.
+        The position map is rebuilt once per call only when a path is not at
+        its recorded position, e.g. after entries were added or removed;
+        paths that are not cached are left out of the result.
+        """
+
+        found: Dict[str, Dict[str, Any]] = {}
+        misses: List[str] = []
+        for path in paths:
+            entry = self._entry_at_known_position(path)
+            if entry is None:
+                misses.append(path)
+            else:
+                found[path] = entry
+        if misses:
+            self._path_positions = {
+                item['file_path']: position
+                for position, item in enumerate(self.raw_data)
+                if item.get('file_path')
+            }
+            for path in misses:
+                entry = self._entry_at_known_position(path)
+                if entry is not None:
+                    found[path] = entry
+        return found
+
+    def _entry_at_known_position(self, path: str) -> Optional[Dict[str, Any]]:
+        position = self._path_positions.get(path)
+        if position is None or position >= len(self.raw_data):
+            return None
+        entry = self.raw_data[position]
+        return entry if entry.get('file_path') == path else None
+
     async def resort(self):
         """Resort cached data according to last sort mode if set"""
         async with self._lock:
             sort_key, order, seed = self._last_sort
             if sort_key is not None:
-                sorted_data = self._sort_data(self.raw_data, sort_key, order, seed)
+                sorted_data = self._get_sorted_view(sort_key, order, seed)
                 self._last_sorted_data = sorted_data
                 # Update folder list
             # else: do nothing
+            self._query_index = None
+            self._search_index_stale = True
+            self._revision += 1
 
             all_folders = {
                 self._ensure_string(item.get('folder'))
@@ -288,6 +407,12 @@ class ModelCache:
             self.folders = sorted(list(all_folders), key=lambda x: x.lower())
             self.rebuild_version_index()
 
+    @property
+    def revision(self) -> int:
+        """Counter bumped by resorts and in-place edits made through the cache."""
+
+        return self._revision
+
     def _sort_data(self, data: List[Dict[str, Any]], sort_key: str, order: str, seed: Optional[str] = None) -> List[Dict[str, Any]]:
         """Sort data by sort_key and order"""
         start_time = time.perf_counter()
@@ -362,7 +487,137 @@ class ModelCache:
             logger.debug("ModelCache._sort_data(%s, %s) for %d items took %.3fs", sort_key, order, len(data), duration)
         return result
 
-    async def get_sorted_data(self, sort_key: str = 'name', order: str = 'asc', seed: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _sort_signature(self, item: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Return the entry fields that feed any maintained sort key."""
+
+        return (
+            self._get_display_name(item),
+            item.get('file_path', ''),
+            item.get('modified', 0.0),
+            item.get('size', 0),
+            item.get('usage_count', 0),
+        )
+
+    def _entry_sort_key(self, view: str, item: Dict[str, Any]) -> Any:
+        """Return the ascending sort key of ``item`` for a maintained view.
+
+        Mirrors the keys used by :meth:`_sort_data`; the name key is stored
+        pre-transformed by natsort so views compare with plain ``sorted``.
+        """
+
+        name = self._get_display_name(item).lower()
+        path = item.get('file_path', '').lower()
+        if view == 'name':
+            return _natsort_key((name, path))
+        if view == 'date':
+            return (item.get('modified', 0.0), name, path)
+        if view == 'size':
+            return (item.get('size', 0), name, path)
+        return (item.get('usage_count', 0), name, path)
+
+    def _reset_sort_views(self) -> None:
+        self._sort_views = {}
+        self._sort_entries = {}
+
+    def _build_sort_view(self, view: str) -> SortedView:
+        """Sort the whole cache once for ``view``; entries must be in sync."""
+
+        entries = self._sort_entries
+        pairs = []
+        for item in self.raw_data:
+            record = entries.get(id(item))
+            if record is None:
+                record = (item, self._sort_signature(item), {})
+                entries[id(item)] = record
+            keys = record[2]
+            if view not in keys:
+                keys[view] = self._entry_sort_key(view, item)
+            pairs.append((keys[view], item))
+        sort_view = SortedView.build(pairs)
+        self._sort_views[view] = sort_view
+        return sort_view
+
+    def _sync_sort_views(self) -> None:
+        """Bring maintained sort views in line with ``raw_data``.
+
+        Callers add, drop or edit entries in place and then ask for a resort,
+        so entries are diffed by identity and sort signature. Each change is
+        a bisect removal plus insertion per view; large batches (a rescan, a
+        bulk refresh) rebuild the views instead.
+        """
+
+        views = self._sort_views
+        if not views:
+            self._sort_entries = {}
+            return
+
+        entries = self._sort_entries
+        seen = set()
+        changed = []
+        for item in self.raw_data:
+            ident = id(item)
+            seen.add(ident)
+            signature = self._sort_signature(item)
+            record = entries.get(ident)
+            if record is None or record[1] != signature:
+                changed.append((item, signature, record))
+
+        if len(seen) != len(self.raw_data):
+            # The same entry object listed twice cannot be tracked by identity
+            self._reset_sort_views()
+            return
+
+        removed = [ident for ident in entries if ident not in seen]
+        if not changed and not removed:
+            return
+
+        if len(changed) + len(removed) > len(self.raw_data) * SORT_VIEW_REBUILD_RATIO:
+            names = list(views)
+            self._reset_sort_views()
+            for name in names:
+                self._build_sort_view(name)
+            return
+
+        stale_views = set()
+        for ident in removed:
+            item, _, keys = entries.pop(ident)
+            for name, view in views.items():
+                if name in keys and not view.remove(keys[name], item):
+                    stale_views.add(name)
+
+        for item, signature, record in changed:
+            if record is not None:
+                for name, view in views.items():
+                    if name in record[2] and not view.remove(record[2][name], item):
+                        stale_views.add(name)
+            keys = {name: self._entry_sort_key(name, item) for name in views}
+            entries[id(item)] = (item, signature, keys)
+            for name, view in views.items():
+                view.insert(keys[name], item)
+
+        for name in stale_views:
+            logger.debug("ModelCache sort view %s lost track of an entry; rebuilding", name)
+            self._build_sort_view(name)
+
+    def _get_sorted_view(self, sort_key: str, order: str, seed: Optional[str] = None) -> Sequence[Dict[str, Any]]:
+        """Return ``raw_data`` sorted by ``sort_key``, reusing maintained views."""
+
+        self._refresh_auto_tags()
+        view_name = SORT_VIEW_KEYS.get(sort_key)
+        if view_name is None:
+            return self._sort_data(self.raw_data, sort_key, order, seed)
+
+        self._sync_sort_views()
+        view = self._sort_views.get(view_name)
+        if view is None:
+            start_time = time.perf_counter()
+            view = self._build_sort_view(view_name)
+            duration = time.perf_counter() - start_time
+            if duration > 0.05:
+                logger.debug("ModelCache built %s sort view for %d items in %.3fs", view_name, len(self.raw_data), duration)
+        return view.materialize(order == 'desc')
+
+    async def get_sorted_data(self, sort_key: str = 'name', order: str = 'asc', seed: Optional[str] = None) -> Sequence[Dict[str, Any]]:
         """Get sorted data by sort_key and order, using cache if possible"""
         async with self._lock:
             cache_key = (sort_key, order, seed)
@@ -370,7 +625,7 @@ class ModelCache:
                 return self._last_sorted_data
             
             start_time = time.perf_counter()
-            sorted_data = self._sort_data(self.raw_data, sort_key, order, seed)
+            sorted_data = self._get_sorted_view(sort_key, order, seed)
             self._last_sort = cache_key
             self._last_sorted_data = sorted_data
             
@@ -380,6 +635,63 @@ class ModelCache:
             
             return sorted_data
 
+    async def get_query_index(
+        self, data: List[Dict[str, Any]], generation: Any = None
+    ) -> Optional[ModelQueryIndex]:
+        """Return the query index for ``data`` if it is the current sorted view.
+
+        The index is rebuilt lazily the first time it is requested after the
+        sorted view changed or ``generation`` (the owning scanner's cache
+        version) moved on. Lists not produced by :meth:`get_sorted_data`
+        have no index and yield ``None``.
+        """
+        async with self._lock:
+            if data is not self._last_sorted_data:
+                return None
+
+            index = self._query_index
+            if (
+                index is not None
+                and index.entries is data
+                and self._query_index_generation == generation
+            ):
+                return index
+
+            start_time = time.perf_counter()
+            # The index is rebuilt after cache mutations; pick up entries
+            # edited in place since the sorted view was produced
+            self._refresh_auto_tags()
+            index = ModelQueryIndex(data)
+            self._query_index = index
+            self._query_index_generation = generation
+
+            duration = time.perf_counter() - start_time
+            if duration > 0.1:
+                logger.debug("ModelCache.get_query_index built index for %d items in %.3fs", len(data), duration)
+            return index
+
+    async def get_search_index(self, generation: Any = None) -> ModelSearchIndex:
+        """Return the substring search index over ``raw_data``.
+
+        The index is synced incrementally after a resort or when
+        ``generation`` (the owning scanner's cache version) moved on; a
+        ``None`` generation always syncs.
+        """
+        async with self._lock:
+            if (
+                self._search_index_stale
+                or generation is None
+                or generation != self._search_index_generation
+            ):
+                start_time = time.perf_counter()
+                self._search_index.sync(self.raw_data)
+                self._search_index_generation = generation
+                self._search_index_stale = False
+                duration = time.perf_counter() - start_time
+                if duration > 0.1:
+                    logger.debug("ModelCache synced search index for %d items in %.3fs", len(self.raw_data), duration)
+            return self._search_index
+
     async def update_name_display_mode(self, display_mode: str) -> None:
         """Update the display mode used for name sorting and refresh cached results."""
 
@@ -389,10 +701,14 @@ class ModelCache:
                 return
 
             self.name_display_mode = normalized
+            # Every precomputed key embeds the display name
+            self._reset_sort_views()
+            self._revision += 1
 
             sort_key, order, seed = self._last_sort
             if sort_key == 'name':
-                self._last_sorted_data = self._sort_data(self.raw_data, sort_key, order, seed)
+                self._last_sorted_data = self._get_sorted_view(sort_key, order, seed)
+                self._query_index = None
 
     async def update_preview_url(self, file_path: str, preview_url: str, preview_nsfw_level: int) -> bool:
         """Update preview_url for a specific model in all cached data
@@ -414,10 +730,12 @@ class ModelCache:
                     break
             else:
                 return False  # Model not found
-                    
+
+            self._query_index = None
+            self._revision += 1
             return True
 
-    async def clear_preview_by_path(self, preview_file_path: str) -> int:
+    async def clear_preview_by_path(self, preview_file_path: str) -> List[str]:
         """Clear ``preview_url`` for every cached entry referencing a file path.
 
         When a preview file has been deleted from disk, this removes its
@@ -425,15 +743,18 @@ class ModelCache:
         response returns an empty ``preview_url`` instead of a stale URL
         that produces 404s.
 
-        Returns the number of entries that were updated.
+        Returns the file paths of the entries that were updated.
         """
         normalized = preview_file_path.replace("\\", "/")
-        cleared = 0
+        cleared: List[str] = []
         async with self._lock:
             for item in self.raw_data:
                 cached_url = item.get("preview_url", "")
                 if cached_url.replace("\\", "/") == normalized:
                     item["preview_url"] = ""
                     item["preview_nsfw_level"] = 0
-                    cleared += 1
+                    cleared.append(item.get("file_path", ""))
+            if cleared:
+                self._query_index = None
+                self._revision += 1
         return cleared
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+Compact Model Entry Store
+
+Builds the per-model dictionaries held in ``ModelCache.raw_data`` so that a
+large library costs less memory while callers keep working with plain dicts.
+
+Two techniques are combined:
+
+* Entries are the ``__dict__`` of a bare record class. CPython lets instance
+  dictionaries share one key table when their keys are inserted in the same
+  order, so each entry only stores its values (roughly 8 bytes per field
+  instead of 24). The result is still an ordinary ``dict``: JSON encoding,
+  ``isinstance`` checks, copying and mutation behave exactly as before, and
+  adding or deleting keys merely falls back to a regular key table.
+* Low-cardinality strings (folders, base models, tags, sub types, creator
+  names...) are interned, so thousands of entries share a single object.
+
+Set ``LORA_MANAGER_DISABLE_COMPACT_ENTRIES=1`` to store plain dicts instead.
+"""
+
+import os
+import sys
+from typing import Any, Dict, Mapping
+
+# Canonical insertion order; keeping it stable is what lets entries share keys
+ENTRY_FIELD_ORDER = (
+    'file_path',
+    'file_name',
+    'model_name',
+    'folder',
+    'size',
+    'modified',
+    'sha256',
+    'autov3',
+    'base_model',
+    'preview_url',
+    'preview_nsfw_level',
+    'from_civitai',
+    'favorite',
+    'notes',
+    'usage_tips',
+    'metadata_source',
+    'exclude',
+    'db_checked',
+    'last_checked_at',
+    'tags',
+    'civitai',
+    'civitai_deleted',
+    'skip_metadata_refresh',
+    'hf_url',
+    'license_flags',
+    'sub_type',
+    'hash_status',
+)
+
+# Top-level string fields shared by many entries
+_INTERNED_FIELDS = ('folder', 'base_model', 'metadata_source', 'sub_type', 'hash_status')
+
+
+class _ModelEntryRecord:
+    """Attribute holder whose ``__dict__`` becomes the cache entry."""
+
+
+
+def compact_entries_enabled() -> bool:
+    return os.environ.get("LORA_MANAGER_DISABLE_COMPACT_ENTRIES", "0") != "1"
+
+
+def intern_string(value: Any) -> Any:
+    """Return the interned form of ``value`` when it is a non-empty string."""
+    if type(value) is str and value:
+        return sys.intern(value)
+    return value
+
+
+def _intern_tags(tags: Any) -> Any:
+    if isinstance(tags, list):
+        return [intern_string(tag) for tag in tags]
+    return tags
+
+
+def _intern_civitai(civitai: Any) -> Any:
+    if not isinstance(civitai, dict):
+        return civitai
+
+    name = civitai.get('name')
+    if type(name) is str:
+        civitai['name'] = intern_string(name)
+
+    creator = civitai.get('creator')
+    if isinstance(creator, dict) and type(creator.get('username')) is str:
+        creator['username'] = intern_string(creator['username'])
+
+    model = civitai.get('model')
+    if isinstance(model, dict) and type(model.get('type')) is str:
+        model['type'] = intern_string(model['type'])
+
+    return civitai
+
+
+def compact_entry(entry: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return a compact dict holding the same items as ``entry``.
+
+    Canonical fields are inserted first in ``ENTRY_FIELD_ORDER`` followed by
+    any extra keys in their original order. Nested ``tags`` and ``civitai``
+    values are reused (with their strings interned), not copied.
+    """
+    if not compact_entries_enabled():
+        return dict(entry)
+
+    values: Dict[str, Any] = _ModelEntryRecord().__dict__
+    for key in ENTRY_FIELD_ORDER:
+        if key in entry:
+            values[key] = entry[key]
+    for key, value in entry.items():
+        if key not in values:
+            values[key] = value
+
+    for key in _INTERNED_FIELDS:
+        value = values.get(key)
+        if type(value) is str:
+            values[key] = intern_string(value)
+    if 'tags' in values:
+        values['tags'] = _intern_tags(values['tags'])
+    if 'civitai' in values:
+        values['civitai'] = _intern_civitai(values['civitai'])
+
+    return values
@@ -0,0 +1,256 @@
+"""Concurrent discovery of model files under the library roots.
+
+Directory listings (``scandir`` plus the ``stat`` and ``realpath`` calls for
+every entry) run in a thread pool and are prefetched ahead of the traversal,
+so slow or network-mounted libraries list many folders at once. The
+traversal itself stays depth-first in listing order on the event loop, which
+keeps symlink de-duplication identical to a sequential scan: the first path
+that reaches a real directory or file wins.
+
+Every directory visited is fingerprinted by ``(mtime_ns, entry_count)``.
+Given the fingerprints of a previous walk, a directory whose modification
+time is unchanged is not listed again: its files are assumed unchanged and
+only its known sub-directories are probed, so a warm walk of an unchanged
+tree costs one ``stat`` per directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from .hash_memo import RACY_WINDOW_NS
+
+logger = logging.getLogger(__name__)
+
+# Concurrent directory listings; network shares benefit from more than the CPU count.
+SCAN_WALK_WORKERS = 8
+# Concurrent sidecar loaders consuming discovered files.
+SCAN_LOAD_WORKERS = 8
+# Discovered files waiting for a loader before the walk pauses.
+SCAN_QUEUE_SIZE = 256
+
+
+class DiscoveredModelFile(NamedTuple):
+    """A model file found by :class:`ModelFileWalker`."""
+
+    index: int  # position in depth-first discovery order
+    file_path: str  # forward-slash path as stored in the cache
+    real_path: str
+    root_path: str
+
+
+class DirFingerprint(NamedTuple):
+    """Directory state recorded by a walk."""
+
+    mtime_ns: int  # -1 when the directory was too recently modified to trust
+    entry_count: int  # model files directly inside the directory
+
+
+# Decides whether an unchanged directory may be skipped, e.g. by checking the
+# cache still holds ``entry_count`` models for it. Runs in a worker thread.
+TrustCallback = Callable[[str, DirFingerprint], bool]
+
+# (path, real_path or None for directories)
+_ListingEntry = Tuple[str, Optional[str]]
+
+
+class _DirectoryListing(NamedTuple):
+    real_path: Optional[str]  # None for trusted directories, which are not resolved
+    entries: List[_ListingEntry]
+    fingerprint: DirFingerprint
+    trusted: bool
+
+
+def dir_key(path: str) -> str:
+    """Normalise a directory path the way fingerprints and cache folders are keyed."""
+    normalized = path.replace(os.sep, "/")
+    return normalized.rstrip("/") or normalized
+
+
+def _fingerprint(mtime_ns: int, entry_count: int) -> DirFingerprint:
+    if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+        # Changes within the same timestamp tick would go unnoticed
+        mtime_ns = -1
+    return DirFingerprint(mtime_ns, entry_count)
+
+
+def _list_directory(
+    path: str,
+    file_extensions: Iterable[str],
+    skip_dir: Callable[[str], bool],
+    previous: Optional[DirFingerprint] = None,
+    known_children: Iterable[str] = (),
+    trust: Optional[TrustCallback] = None,
+) -> _DirectoryListing:
+    """List ``path`` in a worker thread, keeping model files and sub-directories.
+
+    When ``previous`` matches the directory's current ``mtime_ns`` (and
+    ``trust`` agrees) the listing is skipped and ``known_children`` returned.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    if (
+        previous is not None
+        and previous.mtime_ns == mtime_ns
+        and (trust is None or trust(dir_key(path), previous))
+    ):
+        return _DirectoryListing(None, [(child, None) for child in known_children], previous, True)
+
+    real_path = os.path.realpath(path)
+    entries: List[_ListingEntry] = []
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            try:
+                if entry.is_file(follow_symlinks=True):
+                    if os.path.splitext(entry.name)[1].lower() in file_extensions:
+                        entries.append((entry.path, os.path.realpath(entry.path)))
+                elif entry.is_dir(follow_symlinks=True) and not skip_dir(entry.name):
+                    entries.append((entry.path, None))
+            except Exception as entry_error:
+                logger.error(f"Error processing entry {entry.path}: {entry_error}")
+    file_count = sum(1 for _, entry_real in entries if entry_real is not None)
+    return _DirectoryListing(real_path, entries, _fingerprint(mtime_ns, file_count), False)
+
+
+class ModelFileWalker:
+    """Depth-first model file discovery backed by prefetched directory listings.
+
+    After a walk, :attr:`fingerprints` holds the fingerprint of every
+    directory visited and :attr:`trusted_dirs` the keys of those skipped
+    because they were unchanged.
+    """
+
+    def __init__(
+        self,
+        file_extensions: Iterable[str],
+        *,
+        skip_dir: Callable[[str], bool] = lambda _name: False,
+        max_workers: int = SCAN_WALK_WORKERS,
+    ) -> None:
+        self._file_extensions = frozenset(ext.lower() for ext in file_extensions)
+        self._skip_dir = skip_dir
+        self._max_workers = max(1, max_workers)
+        # Listings requested but not yet consumed by the traversal
+        self._prefetch_limit = self._max_workers * 4
+        self.fingerprints: Dict[str, DirFingerprint] = {}
+        self.trusted_dirs: Set[str] = set()
+
+    async def walk(
+        self,
+        roots: Iterable[str],
+        *,
+        visited_real_dirs: Optional[Set[str]] = None,
+        seen_real_files: Optional[Set[str]] = None,
+        unique_files: bool = True,
+        previous: Optional[Mapping[str, DirFingerprint]] = None,
+        trust: Optional[TrustCallback] = None,
+    ) -> AsyncIterator[DiscoveredModelFile]:
+        """Yield model files under ``roots`` in depth-first listing order.
+
+        Directories and files already present in ``visited_real_dirs`` /
+        ``seen_real_files`` (by real path) are skipped; both sets are updated
+        as the walk proceeds. With ``unique_files=False`` every alias of a
+        file in distinct real directories is yielded.
+
+        ``previous`` holds fingerprints from an earlier walk, keyed by
+        :func:`dir_key`; directories that still match yield no files.
+        """
+        visited_real_dirs = visited_real_dirs if visited_real_dirs is not None else set()
+        seen_real_files = seen_real_files if seen_real_files is not None else set()
+        previous = previous or {}
+        children: Dict[str, List[str]] = {}
+        for key in sorted(previous):
+            parent = dir_key(os.path.dirname(key))
+            if parent != key:
+                children.setdefault(parent, []).append(key)
+        self.fingerprints = {}
+        self.trusted_dirs = set()
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="lm-scan")
+        pending: Dict[str, asyncio.Future] = {}
+        prefetched_real_dirs: Set[str] = set()
+
+        def request(path: str) -> asyncio.Future:
+            future = pending.get(path)
+            if future is None:
+                key = dir_key(path)
+                future = loop.run_in_executor(
+                    executor,
+                    _list_directory,
+                    path,
+                    self._file_extensions,
+                    self._skip_dir,
+                    previous.get(key),
+                    children.get(key, ()),
+                    trust,
+                )
+                future.add_done_callback(prefetch_children)
+                pending[path] = future
+            return future
+
+        def prefetch_children(future: asyncio.Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            real_path, entries, _, trusted = future.result()
+            if not trusted:
+                if real_path in prefetched_real_dirs:
+                    return  # symlink loop or alias; never list the same tree twice ahead of time
+                prefetched_real_dirs.add(real_path)
+            for child, child_real in entries:
+                if child_real is None and len(pending) < self._prefetch_limit:
+                    request(child)
+
+        async def listing(path: str) -> Optional[List[_ListingEntry]]:
+            try:
+                real_path, entries, fingerprint, trusted = await request(path)
+            except Exception as scan_error:
+                logger.error(f"Error scanning {path}: {scan_error}")
+                return None
+            finally:
+                pending.pop(path, None)
+            # A prefetched listing resolves without suspending; yield to the loop anyway
+            await asyncio.sleep(0)
+            key = dir_key(path)
+            if trusted:
+                # Its tree was de-duplicated when the fingerprint was recorded
+                self.trusted_dirs.add(key)
+            elif real_path in visited_real_dirs:
+                return None
+            else:
+                visited_real_dirs.add(real_path)
+            self.fingerprints[key] = fingerprint
+            return entries
+
+        index = 0
+        try:
+            for root_path in roots:
+                entries = await listing(root_path)
+                if entries is None:
+                    continue
+                stack = [iter(entries)]
+                while stack:
+                    entry = next(stack[-1], None)
+                    if entry is None:
+                        stack.pop()
+                        continue
+                    path, real_path = entry
+                    if real_path is None:
+                        child_entries = await listing(path)
+                        if child_entries is not None:
+                            stack.append(iter(child_entries))
+                        continue
+                    if unique_files:
+                        if real_path in seen_real_files:
+                            continue
+                        seen_real_files.add(real_path)
+                    yield DiscoveredModelFile(index, path.replace(os.sep, "/"), real_path, root_path)
+                    index += 1
+        finally:
+            for future in pending.values():
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
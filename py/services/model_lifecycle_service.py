@@ -163,9 +163,7 @@ class ModelLifecycleService:
 
         await self._sync_update_for_model(model_id)
 
-        persist_current_cache = getattr(self._scanner, "_persist_current_cache", None)
-        if callable(persist_current_cache):
-            await cast(Awaitable[Any], persist_current_cache())
+        await self._persist_changed_models([file_path])
 
         return {
             "success": True,
@@ -231,6 +229,18 @@ class ModelLifecycleService:
                 "Failed to sync update record for model %s: %s", model_id, exc
             )
 
+    async def _persist_changed_models(self, file_paths: List[str]) -> None:
+        """Queue a targeted persistent-cache write, or save the whole cache."""
+
+        mark_models_dirty = getattr(self._scanner, "mark_models_dirty", None)
+        if callable(mark_models_dirty):
+            mark_models_dirty(file_paths)
+            return
+
+        persist_current_cache = getattr(self._scanner, "_persist_current_cache", None)
+        if callable(persist_current_cache):
+            await cast(Awaitable[Any], persist_current_cache())
+
     async def exclude_model(self, file_path: str) -> Dict[str, object]:
         """Mark a model as excluded and prune cache references."""
 
@@ -276,9 +286,7 @@ class ModelLifecycleService:
             if file_path not in excluded:
                 excluded.append(file_path)
 
-        persist_current_cache = getattr(self._scanner, "_persist_current_cache", None)
-        if callable(persist_current_cache):
-            await cast(Awaitable[Any], persist_current_cache())
+        await self._persist_changed_models([file_path])
 
         message = f"Model {os.path.basename(file_path)} excluded"
         return {"success": True, "message": message}
@@ -131,6 +131,17 @@ class ModelMetadataProvider(ABC):
         default ``NotImplementedError`` propagate.
         """
         raise NotImplementedError
+
+    async def get_models_by_hashes(
+        self, hashes: List[str]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Batch counterpart of :meth:`get_model_by_hash`.
+
+        Returns payloads keyed by lowercase SHA256 for the hashes that were
+        found. Providers without a batch lookup should let the default
+        ``NotImplementedError`` propagate.
+        """
+        raise NotImplementedError
         
     @abstractmethod
     async def get_model_version(self, model_id: Optional[int] = None, version_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
@@ -176,6 +187,11 @@ class CivitaiModelMetadataProvider(ModelMetadataProvider):
         self, hashes: List[str]
     ) -> Optional[List[Dict[str, Any]]]:
         return await self.client.get_model_versions_by_hashes(hashes)
+
+    async def get_models_by_hashes(
+        self, hashes: List[str]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        return await self.client.get_models_by_hashes(hashes)
         
     async def get_model_version(self, model_id: Optional[int] = None, version_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
         return await self.client.get_model_version(model_id, version_id)
@@ -613,6 +629,36 @@ class FallbackMetadataProvider(ModelMetadataProvider):
                 continue
         return None
 
+    async def get_models_by_hashes(
+        self, hashes: List[str]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        for provider, label in self._iter_providers():
+            try:
+                result = await self._call_with_rate_limit(
+                    label,
+                    provider.get_models_by_hashes,
+                    hashes,
+                )
+                if result is not None:
+                    return result
+            except NotImplementedError:
+                continue
+            except RateLimitError as exc:
+                logger.warning(
+                    "Provider %s is rate-limited (retry_after=%.0fs); skipping to next provider",
+                    label,
+                    exc.retry_after or 0,
+                )
+                continue
+            except Exception as e:
+                logger.debug(
+                    "Provider %s failed for get_models_by_hashes: %s",
+                    label,
+                    e,
+                )
+                continue
+        return None
+
     async def get_user_models(self, username: str, cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
         for provider, label in self._iter_providers():
             try:
@@ -714,6 +760,15 @@ class RateLimitRetryingProvider(ModelMetadataProvider):
             hashes,
         )
 
+    async def get_models_by_hashes(
+        self, hashes: List[str]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        return await self._rate_limit_helper.run(
+            self._label,
+            self._provider.get_models_by_hashes,
+            hashes,
+        )
+
     async def get_model_version(self, model_id: Optional[int] = None, version_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
         return await self._rate_limit_helper.run(
             self._label,
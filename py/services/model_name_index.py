@@ -0,0 +1,144 @@
+import os
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+MODEL_NAME_EXTENSIONS = (".safetensors", ".ckpt", ".pt", ".bin")
+
+
+def strip_model_extension(name: str) -> str:
+    """Strip a known model extension from a name (case-insensitive)."""
+    lowered = name.lower()
+    for ext in MODEL_NAME_EXTENSIONS:
+        if lowered.endswith(ext):
+            return name[: -len(ext)]
+    return name
+
+
+class ModelNameMatch(NamedTuple):
+    """Cache entry resolved from a node-style model name."""
+
+    item: Dict[str, Any]
+    # True when the name matched the file name or ``folder/file`` exactly,
+    # False for the basename fallback of a name whose folder moved.
+    exact: bool
+
+
+class ModelNameIndex:
+    """Thread-safe lookup of cache entries by file name and relative path.
+
+    Node code runs outside the server event loop, so lookups are synchronous
+    and guarded by a lock instead of going through the async cache API. The
+    index is stamped with the scanner cache version it reflects; the scanner
+    rebuilds it when the version moves on without an incremental update.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}  # file_path -> entry
+        self._by_name: Dict[str, List[str]] = {}  # name or folder/name -> file_paths
+        self._by_basename: Dict[str, List[str]] = {}  # name -> file_paths
+        self.generation: Optional[int] = None
+
+    @staticmethod
+    def _entry_keys(item: Dict[str, Any]) -> tuple:
+        file_name = strip_model_extension(item.get("file_name", "") or "")
+        folder = (item.get("folder", "") or "").replace("\\", "/")
+        path_name = f"{folder}/{file_name}" if folder else file_name
+        return file_name, path_name
+
+    @staticmethod
+    def _append(bucket: Dict[str, List[str]], key: str, file_path: str) -> None:
+        paths = bucket.setdefault(key, [])
+        if file_path not in paths:
+            paths.append(file_path)
+
+    @staticmethod
+    def _discard(bucket: Dict[str, List[str]], key: str, file_path: str) -> None:
+        paths = bucket.get(key)
+        if not paths:
+            return
+        try:
+            paths.remove(file_path)
+        except ValueError:
+            return
+        if not paths:
+            del bucket[key]
+
+    def _add(self, item: Dict[str, Any]) -> None:
+        file_path = item.get("file_path") if isinstance(item, dict) else None
+        if not file_path:
+            return
+        if file_path in self._entries:
+            self._remove(file_path)
+        self._entries[file_path] = item
+        file_name, path_name = self._entry_keys(item)
+        self._append(self._by_name, file_name, file_path)
+        self._append(self._by_name, path_name, file_path)
+        self._append(self._by_basename, file_name, file_path)
+
+    def _remove(self, file_path: str) -> None:
+        item = self._entries.pop(file_path, None)
+        if item is None:
+            return
+        file_name, path_name = self._entry_keys(item)
+        self._discard(self._by_name, file_name, file_path)
+        self._discard(self._by_name, path_name, file_path)
+        self._discard(self._by_basename, file_name, file_path)
+
+    def rebuild(self, items: Iterable[Dict[str, Any]], generation: Optional[int] = None) -> None:
+        """Replace the index contents with ``items``, in cache order."""
+        with self._lock:
+            self._entries = {}
+            self._by_name = {}
+            self._by_basename = {}
+            for item in items:
+                self._add(item)
+            self.generation = generation
+
+    def apply(
+        self,
+        removed_paths: Iterable[str] = (),
+        added: Optional[Dict[str, Any]] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Apply one cache mutation and stamp the resulting cache version."""
+        with self._lock:
+            for file_path in removed_paths:
+                self._remove(file_path)
+            if added is not None:
+                self._add(added)
+            self.generation = generation
+
+    def clear(self) -> None:
+        self.rebuild(())
+
+    def resolve(self, name: str) -> Optional[ModelNameMatch]:
+        """Resolve a node-style name such as ``folder/model.safetensors``.
+
+        Matches the exact file name or ``folder/file`` path first. A name with
+        a folder that only matches by basename falls back to the last entry
+        whose folder prefixes the name, else the first basename match.
+        """
+        name_no_ext = strip_model_extension(name.replace("\\", "/"))
+        with self._lock:
+            paths = self._by_name.get(name_no_ext)
+            if paths:
+                return ModelNameMatch(self._entries[paths[0]], True)
+
+            if "/" not in name_no_ext:
+                return None
+
+            candidates = self._by_basename.get(os.path.basename(name_no_ext))
+            if not candidates:
+                return None
+
+            fallback = None
+            for file_path in candidates:
+                item = self._entries[file_path]
+                folder = (item.get("folder", "") or "").replace("\\", "/")
+                if folder and name_no_ext.startswith(folder + "/"):
+                    fallback = item
+            return ModelNameMatch(fallback or self._entries[candidates[0]], False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
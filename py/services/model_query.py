@@ -12,16 +12,22 @@ from typing import (
     Tuple,
     Protocol,
     Callable,
+    TYPE_CHECKING,
     cast,
 )
 
 from ..utils.constants import NSFW_LEVELS
 from ..utils.utils import fuzzy_match as default_fuzzy_match
+from .auto_tag_service import ensure_auto_tags
 import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from .model_query_index import ModelQueryIndex, ModelQuerySelection
+    from .model_search_index import ModelSearchIndex
+
 
 DEFAULT_CIVITAI_MODEL_TYPE = "LORA"
 
@@ -115,11 +121,64 @@ class ModelCacheRepository:
         """Return the underlying cache instance from the scanner."""
         return await self._scanner.get_cached_data()
 
-    async def fetch_sorted(self, params: SortParams) -> List[Dict[str, Any]]:
+    async def fetch_sorted(self, params: SortParams) -> Sequence[Dict[str, Any]]:
         """Fetch cached data pre-sorted according to ``params``."""
         cache = await self.get_cache()
         return await cache.get_sorted_data(params.key, params.order, params.seed)
 
+    async def fetch_query_index(
+        self, data: List[Dict[str, Any]]
+    ) -> Optional[ModelQueryIndex]:
+        """Return the query index backing ``data`` when the cache provides one.
+
+        Only the cache's own sorted views are indexed; derived lists (usage
+        sort, version grouping) and stand-in scanners get ``None`` and keep
+        the list-based filter path.
+        """
+        from .model_cache import ModelCache
+
+        if not hasattr(self._scanner, "get_cached_data"):
+            return None
+
+        cache = await self.get_cache()
+        if not isinstance(cache, ModelCache):
+            return None
+        return await cache.get_query_index(
+            data, generation=getattr(self._scanner, "cache_version", None)
+        )
+
+    async def fetch_search_index(self) -> Optional["ModelSearchIndex"]:
+        """Return the cache's substring search index, or ``None`` for stand-ins."""
+        from .model_cache import ModelCache
+
+        if not hasattr(self._scanner, "get_cached_data"):
+            return None
+
+        cache = await self.get_cache()
+        if not isinstance(cache, ModelCache):
+            return None
+        return await cache.get_search_index(
+            generation=getattr(self._scanner, "cache_version", None)
+        )
+
+    async def fetch_generation(self) -> Optional[Tuple[Any, ...]]:
+        """Return a token that changes whenever the cached entries change.
+
+        Combines the scanner's cache version with the cache identity and its
+        revision counter. Stand-in scanners and caches get ``None``, meaning
+        results derived from them must not be reused.
+        """
+        from .model_cache import ModelCache
+
+        version = getattr(self._scanner, "cache_version", None)
+        if not isinstance(version, int) or not hasattr(self._scanner, "get_cached_data"):
+            return None
+
+        cache = await self.get_cache()
+        if not isinstance(cache, ModelCache):
+            return None
+        return (version, id(cache), cache.revision)
+
     @staticmethod
     def parse_sort(sort_by: str) -> SortParams:
         """Parse an incoming sort string into key/order primitives."""
@@ -394,13 +453,13 @@ class ModelFilterSet:
             if include_at:
                 items = [
                     item for item in items
-                    if any(tag in include_at for tag in (item.get("auto_tags") or []))
+                    if any(tag in include_at for tag in ensure_auto_tags(item))
                 ]
 
             if exclude_at:
                 items = [
                     item for item in items
-                    if not any(tag in exclude_at for tag in (item.get("auto_tags") or []))
+                    if not any(tag in exclude_at for tag in ensure_auto_tags(item))
                 ]
             auto_tags_duration = time.perf_counter() - t0
 
@@ -422,6 +481,151 @@ class ModelFilterSet:
             )
         return items
 
+    def apply_index(
+        self, index: ModelQueryIndex, criteria: FilterCriteria
+    ) -> ModelQuerySelection:
+        """Resolve ``criteria`` against a :class:`ModelQueryIndex`.
+
+        Mirrors :meth:`apply` using bitmap intersections over the index
+        postings. The only difference is that several ``folder_include``
+        entries are combined as a union in sort order, so overlapping folders
+        cannot produce duplicates in the first place.
+        """
+        start = time.perf_counter()
+        mask = index.full_mask
+
+        if self._settings.get("show_only_sfw", False):
+            threshold = self._nsfw_levels.get("R", 0)
+            mask &= index.mask_where(
+                "preview_nsfw_level", lambda level: not level or level < threshold
+            )
+
+        if criteria.favorites_only:
+            mask &= index.mask_for("favorite", True)
+
+        folder = criteria.folder
+        folder_include = criteria.folder_include or []
+        folder_exclude = criteria.folder_exclude or []
+        options = criteria.search_options or {}
+        recursive = bool(options.get("recursive", True))
+
+        for exclude_folder in folder_exclude:
+            if exclude_folder:
+                exclude_prefix = (
+                    exclude_folder
+                    if exclude_folder.endswith("/")
+                    else f"{exclude_folder}/"
+                )
+                mask &= ~(
+                    index.mask_for("folder", exclude_folder)
+                    | index.folder_prefix_mask(exclude_prefix)
+                )
+
+        if folder is not None:
+            if not recursive:
+                mask &= index.folder_mask(folder, recursive=False)
+            elif folder:
+                mask &= index.folder_mask(folder)
+                if folder.endswith("/") and not folder_include:
+                    mask &= index.mask_for(
+                        "folder", folder
+                    ) | index.folder_prefix_mask(folder)
+
+        if folder_include:
+            include_mask = 0
+            for include_folder in folder_include:
+                if not include_folder:
+                    continue
+                if recursive:
+                    include_prefix = (
+                        include_folder
+                        if include_folder.endswith("/")
+                        else f"{include_folder}/"
+                    )
+                    include_mask |= index.mask_for(
+                        "folder", include_folder
+                    ) | index.folder_prefix_mask(include_prefix)
+                else:
+                    include_mask |= index.mask_for("folder", include_folder)
+            mask &= include_mask
+
+        base_models = criteria.base_models or []
+        if base_models:
+            mask &= index.mask_any("base_model", set(base_models))
+
+        tag_filters = criteria.tags or {}
+        if tag_filters:
+            include_tags = set()
+            exclude_tags = set()
+            if isinstance(tag_filters, dict):
+                for tag, state in tag_filters.items():
+                    if not tag:
+                        continue
+                    normalized = tag.strip().lower()
+                    if state == "exclude":
+                        exclude_tags.add(normalized)
+                    else:
+                        include_tags.add(normalized)
+            else:
+                include_tags = {tag.strip().lower() for tag in cast(Iterable[Any], tag_filters) if tag}
+
+            if include_tags:
+                tag_logic = criteria.tag_logic.lower() if criteria.tag_logic else "any"
+                untagged = (
+                    index.mask_for("untagged", True)
+                    if "__no_tags__" in include_tags
+                    else 0
+                )
+                if tag_logic == "all":
+                    tagged = index.mask_all("tags", include_tags - {"__no_tags__"})
+                else:
+                    tagged = index.mask_any("tags", include_tags)
+                mask &= untagged | tagged
+
+            if exclude_tags:
+                excluded = index.mask_any("tags", exclude_tags)
+                if "__no_tags__" in exclude_tags:
+                    excluded |= index.mask_for("untagged", True)
+                mask &= ~excluded
+
+        model_types = criteria.model_types or []
+        if model_types:
+            normalized_model_types = {
+                model_type
+                for model_type in (
+                    normalize_sub_type(value) for value in model_types
+                )
+                if model_type
+            }
+            if normalized_model_types:
+                mask &= index.mask_any("sub_type", normalized_model_types)
+
+        auto_tag_filters = criteria.auto_tags or {}
+        if auto_tag_filters:
+            include_at = {
+                tag for tag, state in auto_tag_filters.items()
+                if tag and state != "exclude"
+            }
+            exclude_at = {
+                tag for tag, state in auto_tag_filters.items()
+                if tag and state == "exclude"
+            }
+            if include_at:
+                mask &= index.mask_any("auto_tags", include_at)
+            if exclude_at:
+                mask &= ~index.mask_any("auto_tags", exclude_at)
+
+        selection = index.select(mask)
+        duration = time.perf_counter() - start
+        if duration > 0.1:
+            logger.debug(
+                "ModelFilterSet.apply_index took %.3fs. Count: %d -> %d",
+                duration,
+                index.size,
+                len(selection),
+            )
+        return selection
+
 
 class SearchStrategy:
     """Encapsulates text and fuzzy matching behaviour for model queries."""
@@ -452,14 +656,30 @@ class SearchStrategy:
         search_term: str,
         options: Dict[str, Any],
         fuzzy: bool = False,
+        search_index: Optional["ModelSearchIndex"] = None,
     ) -> List[Dict[str, Any]]:
-        """Return items matching the search term using the configured strategy."""
+        """Return items matching the search term using the configured strategy.
+
+        With a ``search_index`` only the index candidates are verified
+        instead of every item. Fuzzy searches use it only while the default
+        matcher is configured, since the index mirrors ``fuzzy_match``.
+        """
         if not search_term:
             return list(data)
 
         search_lower = search_term.lower()
         results: List[Dict[str, Any]] = []
 
+        if search_index is not None:
+            if not fuzzy:
+                candidates = search_index.candidates(search_lower)
+            elif self._fuzzy_match is default_fuzzy_match:
+                candidates = search_index.fuzzy_candidates(search_lower)
+            else:
+                candidates = None
+            if candidates is not None:
+                data = self._restrict_to_candidates(data, candidates, search_index)
+
         for item in data:
             if options.get("filename", True):
                 candidate = item.get("file_name", "")
@@ -496,6 +716,28 @@ class SearchStrategy:
 
         return results
 
+    @staticmethod
+    def _restrict_to_candidates(
+        data: Iterable[Dict[str, Any]],
+        candidates: List[Dict[str, Any]],
+        search_index: "ModelSearchIndex",
+    ) -> Iterable[Dict[str, Any]]:
+        """Drop items the index rules out, keeping the order of ``data``.
+
+        Items the index does not know (copies made by derived lists) are
+        kept so they still get verified.
+        """
+        restrict_to = getattr(data, "restrict_to", None)
+        if callable(restrict_to):
+            return restrict_to(candidates)
+
+        candidate_ids = {id(item) for item in candidates}
+        return [
+            item
+            for item in data
+            if id(item) in candidate_ids or item not in search_index
+        ]
+
     def _matches(
         self, candidate: str, search_term: str, search_lower: str, fuzzy: bool
     ) -> bool:
@@ -0,0 +1,280 @@
+"""Columnar inverted index used to answer list queries without full scans.
+
+The index is built over one pre-sorted view of a :class:`ModelCache` and maps
+each filterable field value to the positions of the entries holding it.
+Posting lists are turned into integer bitmaps on first use, so a
+``FilterCriteria`` resolves to a handful of bitwise intersections and a page
+is read straight out of the sorted view.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    overload,
+)
+
+from .model_query import normalize_sub_type, resolve_sub_type
+
+# Fields with a posting list per distinct value.
+INDEXED_FIELDS = (
+    "folder",
+    "folder_tree",
+    "base_model",
+    "favorite",
+    "preview_nsfw_level",
+    "tags",
+    "untagged",
+    "sub_type",
+    "auto_tags",
+    "license_flags",
+)
+
+# Entries without license information are treated as fully permissive, the
+# same default the list filters use.
+DEFAULT_LICENSE_FLAGS = 127
+
+
+def mask_from_positions(positions: Iterable[int], size: int) -> int:
+    """Build an integer bitmap with the given bit positions set."""
+
+    buffer = bytearray((size + 7) >> 3)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def iter_set_bits(mask: int, start_rank: int = 0) -> Iterator[int]:
+    """Yield the positions of set bits in ascending order.
+
+    ``start_rank`` skips that many set bits first; whole 64-bit words are
+    skipped by popcount so seeking to a deep page stays cheap.
+    """
+
+    if mask <= 0:
+        return
+    raw = mask.to_bytes((mask.bit_length() + 7) >> 3, "little")
+    rank = 0
+    for offset in range(0, len(raw), 8):
+        word = int.from_bytes(raw[offset : offset + 8], "little")
+        if not word:
+            continue
+        count = word.bit_count()
+        if rank + count <= start_rank:
+            rank += count
+            continue
+        base = offset << 3
+        while word:
+            low = word & -word
+            if rank >= start_rank:
+                yield base + low.bit_length() - 1
+            rank += 1
+            word ^= low
+
+
+def _folder_ancestors(folder: str) -> Iterator[str]:
+    """Yield ``folder`` and every prefix of it that ends at a ``/`` boundary."""
+
+    yield folder
+    index = folder.find("/")
+    while index != -1:
+        yield folder[:index]
+        index = folder.find("/", index + 1)
+
+
+class ModelQueryIndex:
+    """Per-field inverted index over an ordered list of cache entries."""
+
+    def __init__(self, entries: Sequence[Dict[str, Any]]) -> None:
+        self.entries = entries
+        self.size = len(entries)
+        self.full_mask = (1 << self.size) - 1
+        self._postings: Dict[str, Dict[Any, List[int]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        self._mask_cache: Dict[Tuple[str, Any], int] = {}
+        # id(entry) -> position, built on first use
+        self._positions: Optional[Dict[int, int]] = None
+
+        for position, item in enumerate(entries):
+            self._index_entry(position, item)
+
+    def _add(self, field: str, key: Any, position: int) -> None:
+        try:
+            bucket = self._postings[field].setdefault(key, [])
+        except TypeError:
+            # Unhashable metadata values cannot be looked up by key anyway.
+            return
+        if not bucket or bucket[-1] != position:
+            bucket.append(position)
+
+    def _index_entry(self, position: int, item: Mapping[str, Any]) -> None:
+        folder = item.get("folder", "")
+        self._add("folder", folder, position)
+        if isinstance(folder, str):
+            for prefix in _folder_ancestors(folder):
+                self._add("folder_tree", prefix, position)
+
+        self._add("base_model", item.get("base_model"), position)
+        self._add("favorite", bool(item.get("favorite", False)), position)
+        self._add("preview_nsfw_level", item.get("preview_nsfw_level"), position)
+        self._add(
+            "license_flags",
+            item.get("license_flags", DEFAULT_LICENSE_FLAGS),
+            position,
+        )
+        self._add(
+            "sub_type", normalize_sub_type(resolve_sub_type(item)), position
+        )
+
+        tags = item.get("tags")
+        if not tags:
+            self._add("untagged", True, position)
+        else:
+            for tag in tags:
+                if isinstance(tag, str):
+                    self._add("tags", tag.strip().lower(), position)
+
+        for auto_tag in item.get("auto_tags") or []:
+            self._add("auto_tags", auto_tag, position)
+
+    def mask_for(self, field: str, key: Any) -> int:
+        """Return the bitmap of entries whose ``field`` equals ``key``."""
+
+        cache_key = (field, key)
+        try:
+            cached = self._mask_cache.get(cache_key)
+        except TypeError:
+            return 0
+        if cached is not None:
+            return cached
+
+        positions = self._postings[field].get(key)
+        mask = mask_from_positions(positions, self.size) if positions else 0
+        self._mask_cache[cache_key] = mask
+        return mask
+
+    def mask_any(self, field: str, keys: Iterable[Any]) -> int:
+        """Return the union of the bitmaps for ``keys``."""
+
+        mask = 0
+        for key in keys:
+            mask |= self.mask_for(field, key)
+        return mask
+
+    def mask_all(self, field: str, keys: Iterable[Any]) -> int:
+        """Return the intersection of the bitmaps for ``keys``."""
+
+        mask = self.full_mask
+        for key in keys:
+            mask &= self.mask_for(field, key)
+            if not mask:
+                break
+        return mask
+
+    def mask_where(self, field: str, predicate: Callable[[Any], bool]) -> int:
+        """Return the union of bitmaps for every distinct value matching ``predicate``."""
+
+        return self.mask_any(
+            field, [key for key in self._postings[field] if predicate(key)]
+        )
+
+    def folder_mask(self, folder: str, *, recursive: bool = True) -> int:
+        """Return entries stored in ``folder`` (and below it when recursive)."""
+
+        if not recursive:
+            return self.mask_for("folder", folder)
+        return self.mask_for("folder_tree", folder)
+
+    def folder_prefix_mask(self, prefix: str) -> int:
+        """Return entries whose folder starts with ``prefix`` (ending in ``/``)."""
+
+        parent = prefix[:-1]
+        return self.mask_for("folder_tree", parent) & ~self.mask_for("folder", parent)
+
+    def mask_of_entries(self, items: Iterable[Dict[str, Any]]) -> int:
+        """Return the bitmap of the given entry objects; unknown ones are skipped."""
+
+        if self._positions is None:
+            self._positions = {id(item): position for position, item in enumerate(self.entries)}
+        positions = self._positions
+        return mask_from_positions(
+            (positions[id(item)] for item in items if id(item) in positions),
+            self.size,
+        )
+
+    def select(self, mask: Optional[int] = None) -> "ModelQuerySelection":
+        """Return a lazy, ordered view of the entries selected by ``mask``."""
+
+        if mask is None:
+            mask = self.full_mask
+        return ModelQuerySelection(self, mask & self.full_mask)
+
+
+class ModelQuerySelection(Sequence):
+    """Read-only sequence of index entries selected by a bitmap.
+
+    Length is a popcount and slicing seeks by rank, so paginating a result
+    only touches the requested page.
+    """
+
+    __slots__ = ("index", "mask", "_length")
+
+    def __init__(self, index: ModelQueryIndex, mask: int) -> None:
+        self.index = index
+        self.mask = mask
+        self._length: Optional[int] = None
+
+    def narrow(self, mask: int) -> "ModelQuerySelection":
+        """Return a new selection intersected with ``mask``."""
+
+        return ModelQuerySelection(self.index, self.mask & mask)
+
+    def restrict_to(self, items: Iterable[Dict[str, Any]]) -> "ModelQuerySelection":
+        """Return the selected entries that are among ``items``, in view order."""
+
+        return self.narrow(self.index.mask_of_entries(items))
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = self.mask.bit_count()
+        return self._length
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        entries = self.index.entries
+        for position in iter_set_bits(self.mask):
+            yield entries[position]
+
+    @overload
+    def __getitem__(self, key: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(self, key):
+        entries = self.index.entries
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return list(self)[key]
+            if start >= stop:
+                return []
+            positions = islice(iter_set_bits(self.mask, start), stop - start)
+            return [entries[position] for position in positions]
+
+        length = len(self)
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("selection index out of range")
+        return entries[next(iter_set_bits(self.mask, key))]
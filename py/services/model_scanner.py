@@ -5,7 +5,7 @@ import asyncio
 import time
 import shutil
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Set, Type, Union, cast
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Type, Union, cast
 
 from ..utils.models import BaseModelMetadata, autov3_from_civitai_files
 from ..config import config
@@ -13,11 +13,23 @@ from ..utils.file_utils import find_preview_file, get_preview_extension, calcula
 from ..utils.metadata_manager import MetadataManager
 from ..utils.civitai_utils import resolve_license_info
 from .model_cache import ModelCache
+from .model_entry_store import compact_entry
 from .model_hash_index import ModelHashIndex
+from .model_file_walker import (
+    SCAN_LOAD_WORKERS,
+    SCAN_QUEUE_SIZE,
+    DirFingerprint,
+    ModelFileWalker,
+    dir_key,
+)
+from .model_name_index import ModelNameIndex
+from .hash_memo import get_hash_memo
+from .hash_service import HashPriority, hash_priority
 from .model_lifecycle_service import delete_model_artifacts, _require_path_in_library_roots
 from .service_registry import ServiceRegistry
 from .websocket_manager import ws_manager
-from .persistent_model_cache import get_persistent_cache
+from .persistent_model_cache import PersistentModelCache, get_persistent_cache
+from .persistent_cache_journal import PersistentCacheJournal
 from .settings_manager import get_settings_manager
 from .pending_delete_service import PENDING_DELETE_DIR_NAME, get_pending_delete_service
 from .cache_entry_validator import CacheEntryValidator
@@ -25,6 +37,12 @@ from .cache_health_monitor import CacheHealthMonitor, CacheHealthStatus
 
 logger = logging.getLogger(__name__)
 
+# Entries hydrated per event-loop turn when deferred cache columns arrive
+DEFERRED_HYDRATE_BATCH = 2000
+
+# Card thumbnails rendered after startup: one virtual-scroller page
+THUMBNAIL_PREWARM_COUNT = 100
+
 # Canonical set of weight-file extensions stripped when normalizing model
 # names for matching (ModelScanner.find_matching_models and the recipe rematch
 # filename key share this set). It is the union of the LoRA scanner set
@@ -71,6 +89,8 @@ class CacheBuildResult:
     hash_index: ModelHashIndex
     tags_count: Dict[str, int]
     excluded_models: List[str]
+    # Directory fingerprints recorded by the walk; None when not walked
+    dir_fingerprints: Optional[Dict[str, DirFingerprint]] = None
 
 class ModelScanner:
     """Base service for scanning and managing model files"""
@@ -100,7 +120,7 @@ class ModelScanner:
                 cls._instances[cls] = cls()  # pyright: ignore[reportCallIssue]
             return cls._instances[cls]
     
-    def __init__(self, model_type: str, model_class: Type[BaseModelMetadata], file_extensions: Set[str], hash_index: Optional[ModelHashIndex] = None):
+    def __init__(self, model_type: str, model_class: Type[BaseModelMetadata], file_extensions: Set[str], hash_index: Optional[ModelHashIndex] = None, name_index: Optional[ModelNameIndex] = None):
         """Initialize the scanner
         
         Args:
@@ -108,6 +128,7 @@ class ModelScanner:
             model_class: Class used to create metadata instances
             file_extensions: Set of supported file extensions including the dot (e.g. {'.safetensors'})
             hash_index: Hash index instance (optional)
+            name_index: Name/path lookup index for synchronous node-time resolution (optional)
         """
         # Ensure initialization happens only once per instance
         if hasattr(self, '_initialized'):
@@ -119,10 +140,15 @@ class ModelScanner:
         self._cache: Any = None
         self._cache_version: int = 0
         self._hash_index = hash_index or ModelHashIndex()
+        self._name_index = name_index
         self._tags_count = {}  # Dictionary to store tag counts
         self._is_initializing = False  # Flag to track initialization state
         self._excluded_models = []  # List to track excluded models
         self._persistent_cache = get_persistent_cache()
+        self._persist_journal = PersistentCacheJournal(self._flush_persist_journal)
+        # Entries loaded without their deferred columns, by file path
+        self._deferred_entries: Dict[str, Dict[str, Any]] = {}
+        self._hydration_task: Optional[asyncio.Task] = None
         self._name_display_mode = self._resolve_name_display_mode()
         self._cancel_requested = False  # Flag for cancellation
         self._autov3_backfill_scheduled = False  # One-time AutoV3 backfill trigger per process
@@ -156,11 +182,45 @@ class ModelScanner:
         """
         self._cache_version += 1
 
+    def get_name_index(self) -> Optional[ModelNameIndex]:
+        """Return the name index synced to the current cache, if available.
+
+        Safe to call from any thread. Returns ``None`` when this scanner has no
+        name index or its cache is not ready yet, so callers can fall back to
+        the async cache API. A stale index is rebuilt from ``raw_data`` here.
+        """
+        index = self._name_index
+        cache = self._cache
+        if index is None or cache is None or self._is_initializing:
+            return None
+        if getattr(self, '_deferred_entries', None):
+            # Trigger words are still being loaded
+            return None
+        version = self._cache_version
+        if index.generation != version:
+            index.rebuild(list(cache.raw_data), version)
+        return index
+
+    def _sync_name_index(self, removed_paths: Sequence[str] = (), added: Optional[Dict[str, Any]] = None) -> None:
+        """Apply a cache mutation to the name index right after a version bump.
+
+        Only applied when the index reflected the version just before this
+        bump; otherwise it is already stale and the next lookup rebuilds it.
+        """
+        index = self._name_index
+        if index is None or index.generation != self._cache_version - 1:
+            return
+        index.apply(removed_paths, added, generation=self._cache_version)
+
     def on_library_changed(self) -> None:
         """Reset caches when the active library changes."""
+        drain = self._drain_persist_journal()
+        self._reset_deferred_entries()
         self._persistent_cache = get_persistent_cache()
         self._cache = None
         self._hash_index = ModelHashIndex()
+        if self._name_index is not None:
+            self._name_index.clear()
         self._tags_count = {}
         self._excluded_models = []
         self._is_initializing = False
@@ -175,7 +235,14 @@ class ModelScanner:
         if loop and not loop.is_closed():
             self._loop = loop
             self.loop = loop
-            loop.create_task(self.initialize_in_background())
+            loop.create_task(self._initialize_after_drain(drain))
+
+    async def _initialize_after_drain(self, drain: Optional[asyncio.Future]) -> None:
+        """Initialize the new library once the previous one's changes are written."""
+        if drain is not None:
+            # Failures were already logged by the drain
+            await asyncio.gather(drain, return_exceptions=True)
+        await self.initialize_in_background()
 
     def _resolve_name_display_mode(self) -> str:
         """Return the configured display mode for name sorting."""
@@ -367,7 +434,7 @@ class ModelScanner:
         if hash_status:
             entry['hash_status'] = hash_status
 
-        return entry
+        return compact_entry(entry)
 
     def _ensure_license_flags(self, entry: Dict[str, Any]) -> None:
         """Ensure cached entries include an integer license flag bitset."""
@@ -452,6 +519,7 @@ class ModelScanner:
                 logger.info(
                     f"{self.model_type.capitalize()} cache hydrated from persisted snapshot with {len(self._cache.raw_data)} models"
                 )
+                self._schedule_thumbnail_prewarm()
                 return
 
             # Persistent load failed; fall back to a full scan
@@ -514,6 +582,7 @@ class ModelScanner:
                 'scanner_type': self.model_type,
                 'pageType': page_type
             })
+            self._schedule_thumbnail_prewarm()
             
         except Exception as e:
             logger.error(f"{self.model_type.capitalize()} Scanner: Error initializing cache in background: {e}")
@@ -528,10 +597,10 @@ class ModelScanner:
 
         loop = asyncio.get_event_loop()
         try:
-            persisted = await loop.run_in_executor(
-                None,
+            persisted = await asyncio.to_thread(
                 self._persistent_cache.load_cache,
-                self.model_type
+                self.model_type,
+                defer_heavy_columns=True,
             )
         except FileNotFoundError:
             return False
@@ -554,10 +623,16 @@ class ModelScanner:
             if autov3_value and path:
                 hash_index.add_autov3(autov3_value.lower(), path)
 
+        # Teach the hash memo the persisted digests in the background so a
+        # later move or re-add of these files does not re-read them
+        sizes = {item.get('file_path'): item.get('size') for item in persisted.raw_data}
+        modified = {item.get('file_path'): item.get('modified') for item in persisted.raw_data}
+        loop.run_in_executor(None, get_hash_memo().seed, persisted.hash_rows, sizes, modified)
+
         tags_count: Dict[str, int] = {}
         adjusted_raw_data: List[Dict[str, Any]] = []
         for item in persisted.raw_data:
-            adjusted_item = self.adjust_cached_entry(dict(item))
+            adjusted_item = compact_entry(self.adjust_cached_entry(dict(item)))
             adjusted_raw_data.append(adjusted_item)
 
             for tag in adjusted_item.get('tags') or []:
@@ -613,6 +688,8 @@ class ModelScanner:
         )
 
         await self._apply_scan_result(scan_result)
+        if persisted.deferred and self._cache is not None:
+            self._defer_entries(self._cache.raw_data)
         await self._sync_download_history(adjusted_raw_data, source='scan')
 
         await ws_manager.broadcast_init_progress({
@@ -638,6 +715,36 @@ class ModelScanner:
 
         return True
 
+    def _schedule_thumbnail_prewarm(self) -> None:
+        """Render card thumbnails for the first page of the library in the background."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.create_task(self._prewarm_thumbnails())
+
+    async def _prewarm_thumbnails(self) -> None:
+        try:
+            from .thumbnail_service import DEFAULT_THUMBNAIL_WIDTH, ThumbnailService
+
+            if self._cache is None:
+                return
+            sorted_data = await self._cache.get_sorted_data('name', 'asc')
+            previews = [
+                item['preview_url']
+                for item in sorted_data[:THUMBNAIL_PREWARM_COUNT]
+                if item.get('preview_url')
+            ]
+            if not previews:
+                return
+            service = await ThumbnailService.get_instance()
+            warmed = await service.prewarm(previews, DEFAULT_THUMBNAIL_WIDTH)
+            logger.debug(
+                "Pre-warmed %d/%d %s card thumbnails", warmed, len(previews), self.model_type
+            )
+        except Exception as exc:
+            logger.debug(f"{self.model_type.capitalize()} thumbnail pre-warm failed: {exc}")
+
     async def _run_autov3_backfill(self) -> None:
         """Backfill autov3 for entries loaded from the persisted cache that lack it."""
         try:
@@ -670,6 +777,13 @@ class ModelScanner:
                 list(scan_result.excluded_models),
                 autov3_snapshot,
             )
+            if scan_result.dir_fingerprints is not None:
+                await loop.run_in_executor(
+                    None,
+                    self._persistent_cache.save_dir_fingerprints,
+                    self.model_type,
+                    dict(scan_result.dir_fingerprints),
+                )
         except Exception as exc:
             logger.warning("%s Scanner: Failed to persist cache: %s", self.model_type.capitalize(), exc)
 
@@ -712,6 +826,13 @@ class ModelScanner:
         if self._cache is None or not getattr(self, '_persistent_cache', None):
             return
 
+        # Rows are rewritten whole, so deferred columns must be loaded first
+        await self.ensure_hydrated()
+
+        # The full snapshot below covers every journaled change
+        journal = getattr(self, '_persist_journal', None)
+        if journal is not None:
+            journal.clear()
         snapshot = CacheBuildResult(
             raw_data=list(self._cache.raw_data),
             hash_index=self._hash_index,
@@ -720,6 +841,264 @@ class ModelScanner:
         )
         await self._save_persistent_cache(snapshot)
         await self._sync_download_history(snapshot.raw_data, source='scan')
+
+    def mark_models_dirty(self, file_paths: Iterable[str]) -> None:
+        """Queue changed models for a targeted write to the persistent cache.
+
+        Public because external services (model lifecycle, route handlers)
+        edit scanner raw_data directly. Cheaper than
+        :meth:`_persist_current_cache` for a handful of models: the paths are
+        coalesced by a background flusher and written as one small
+        transaction, without diffing the persisted library. A path that is no
+        longer cached has its rows deleted.
+        """
+        journal = getattr(self, '_persist_journal', None)
+        if journal is None:
+            return
+        journal.mark_dirty(file_paths)
+
+    async def flush_persistent_cache(self) -> None:
+        """Write all queued model changes to the persistent cache now."""
+        journal = getattr(self, '_persist_journal', None)
+        if journal is not None:
+            await journal.flush()
+
+    def _collect_persist_changes(
+        self, paths: Set[str]
+    ) -> Tuple[List[Dict[str, Any]], List[str], Dict[str, bool]]:
+        """Split journaled paths into cached entries, removed paths and exclusion states.
+
+        Entries are shallow copies, so they can be hydrated and written after
+        the cache moved on.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        if self._cache is not None:
+            found = self._cache.get_entries_by_path(paths)
+        entries = [dict(entry) for entry in found.values()]
+        removed = [path for path in paths if path not in found]
+        excluded = set(self._excluded_models)
+        excluded_states = {path: path in excluded for path in paths}
+        return entries, removed, excluded_states
+
+    @classmethod
+    def _write_persist_changes(
+        cls,
+        persistent_cache: PersistentModelCache,
+        model_type: str,
+        entries: List[Dict[str, Any]],
+        removed: List[str],
+        excluded_states: Dict[str, bool],
+        deferred_paths: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Hydrate deferred entries from ``persistent_cache`` and write the changes.
+
+        Runs on a worker thread. Returns the deferred fields that were loaded.
+        """
+        fields: Dict[str, Dict[str, Any]] = {}
+        if deferred_paths:
+            fields = persistent_cache.load_deferred_fields(model_type, deferred_paths)
+            for entry in entries:
+                entry_fields = fields.get(entry['file_path'])
+                if entry_fields is not None:
+                    cls._fill_deferred_fields(entry, entry_fields)
+        persistent_cache.save_changes(model_type, entries, removed, excluded_states)
+        return fields
+
+    async def _flush_persist_journal(self, paths: Set[str]) -> None:
+        persistent_cache = getattr(self, '_persistent_cache', None)
+        if persistent_cache is None:
+            return
+
+        # Snapshot before awaiting: a library switch resets the cache
+        entries, removed, excluded_states = self._collect_persist_changes(paths)
+        deferred_paths = [
+            entry['file_path'] for entry in entries if entry['file_path'] in self._deferred_entries
+        ]
+        fields = await asyncio.to_thread(
+            self._write_persist_changes,
+            persistent_cache,
+            self.model_type,
+            entries,
+            removed,
+            excluded_states,
+            deferred_paths,
+        )
+        if fields and self._persistent_cache is persistent_cache:
+            self._apply_deferred_fields(fields)
+        await self._sync_download_history(entries, source='scan')
+
+    def _drain_persist_journal(self) -> Optional[asyncio.Future]:
+        """Write pending changes to the current library before caches are reset.
+
+        The changes are collected now; the write runs on a worker thread when
+        a loop is running, and its future is returned so the next library can
+        wait for it. Without a loop the write happens before returning.
+        """
+        journal = getattr(self, '_persist_journal', None)
+        persistent_cache = getattr(self, '_persistent_cache', None)
+        if journal is None:
+            return None
+        paths = journal.take_pending()
+        if not paths or persistent_cache is None:
+            return None
+
+        entries, removed, excluded_states = self._collect_persist_changes(paths)
+        deferred_paths = [
+            entry['file_path'] for entry in entries if entry['file_path'] in self._deferred_entries
+        ]
+        args = (persistent_cache, self.model_type, entries, removed, excluded_states, deferred_paths)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                self._write_persist_changes(*args)
+            except Exception as exc:
+                logger.warning(
+                    "%s Scanner: Failed to persist %d pending changes before switching libraries: %s",
+                    self.model_type.capitalize(),
+                    len(paths),
+                    exc,
+                )
+            return None
+
+        future = loop.run_in_executor(None, self._write_persist_changes, *args)
+        future.add_done_callback(
+            lambda done: self._log_drain_failure(done, len(paths))
+        )
+        return future
+
+    def _log_drain_failure(self, future: asyncio.Future, count: int) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        logger.warning(
+            "%s Scanner: Failed to persist %d pending changes before switching libraries: %s",
+            self.model_type.capitalize(),
+            count,
+            future.exception(),
+        )
+
+    def _defer_entries(self, entries: Sequence[Dict[str, Any]]) -> None:
+        """Track entries loaded without deferred columns and hydrate them in the background."""
+        self._deferred_entries = {
+            item['file_path']: item for item in entries if item.get('file_path')
+        }
+        if not self._deferred_entries:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._hydration_task = loop.create_task(self._hydrate_deferred_entries())
+
+    def _reset_deferred_entries(self) -> None:
+        task = getattr(self, '_hydration_task', None)
+        if task is not None and not task.done():
+            task.cancel()
+        self._hydration_task = None
+        self._deferred_entries = {}
+
+    def _forget_deferred(self, paths: Iterable[str]) -> None:
+        """Stop hydrating paths whose entries were rebuilt from full metadata."""
+        deferred = getattr(self, '_deferred_entries', None)
+        if not deferred:
+            return
+        for path in paths:
+            deferred.pop(path, None)
+
+    def _apply_deferred_fields(
+        self,
+        fields_by_path: Mapping[str, Mapping[str, Any]],
+        copies: Sequence[Dict[str, Any]] = (),
+    ) -> None:
+        """Fill deferred columns into tracked entries and any copies of them."""
+        targets: Dict[str, List[Dict[str, Any]]] = {}
+        for item in copies:
+            path = item.get('file_path')
+            if path in self._deferred_entries and item is not self._deferred_entries[path]:
+                targets.setdefault(path, []).append(item)
+
+        for path, fields in fields_by_path.items():
+            entry = self._deferred_entries.pop(path, None)
+            if entry is None:
+                continue
+            for item in [entry, *targets.get(path, [])]:
+                self._fill_deferred_fields(item, fields)
+
+    @staticmethod
+    def _fill_deferred_fields(item: Dict[str, Any], fields: Mapping[str, Any]) -> None:
+        item['notes'] = fields.get('notes', '')
+        item['usage_tips'] = fields.get('usage_tips', '')
+        trained_words = fields.get('trained_words')
+        creator_username = fields.get('creator_username')
+        if not trained_words and not creator_username:
+            return
+        civitai = item.get('civitai')
+        if not isinstance(civitai, dict):
+            civitai = {}
+        else:
+            civitai = dict(civitai)
+        if trained_words:
+            civitai['trainedWords'] = trained_words
+        if creator_username:
+            civitai['creator'] = {**(civitai.get('creator') or {}), 'username': creator_username}
+        item['civitai'] = civitai
+
+    async def _hydrate_deferred_entries(self) -> None:
+        persistent_cache = getattr(self, '_persistent_cache', None)
+        if persistent_cache is None:
+            return
+        start_time = time.time()
+        fields = await asyncio.to_thread(persistent_cache.load_deferred_fields, self.model_type)
+        paths = list(fields)
+        for start in range(0, len(paths), DEFERRED_HYDRATE_BATCH):
+            self._apply_deferred_fields({path: fields[path] for path in paths[start:start + DEFERRED_HYDRATE_BATCH]})
+            await asyncio.sleep(0)
+        # Rows that vanished from the database keep the empty defaults
+        self._deferred_entries = {}
+        self.bump_cache_version()
+        logger.debug(
+            "%s Scanner: Loaded deferred cache fields for %d models in %.2f seconds",
+            self.model_type.capitalize(),
+            len(paths),
+            time.time() - start_time,
+        )
+
+    async def ensure_hydrated(self, items: Optional[Sequence[Dict[str, Any]]] = None) -> None:
+        """Make sure entries carry notes, usage tips, trained words and creator.
+
+        The persisted cache is loaded without those columns so the first page
+        can be served sooner; they are filled in by a background task. Pass the
+        entries about to be returned to load just their fields now, including
+        shallow copies of cache entries. Without ``items`` this waits until
+        every entry is hydrated.
+        """
+        if not getattr(self, '_deferred_entries', None):
+            return
+
+        if items is None:
+            task = self._hydration_task
+            if task is not None and not task.done():
+                try:
+                    await asyncio.shield(task)
+                except asyncio.CancelledError:
+                    if not task.cancelled():
+                        raise
+                except Exception as exc:
+                    logger.warning("%s Scanner: Background hydration failed: %s", self.model_type.capitalize(), exc)
+            paths: Optional[List[str]] = list(self._deferred_entries)
+        else:
+            paths = [item.get('file_path') for item in items if item.get('file_path') in self._deferred_entries]
+        if not paths:
+            return
+
+        persistent_cache = getattr(self, '_persistent_cache', None)
+        if persistent_cache is None:
+            return
+        fields = await asyncio.to_thread(persistent_cache.load_deferred_fields, self.model_type, paths)
+        self._apply_deferred_fields(fields, items or ())
+        if items is None:
+            self._deferred_entries = {}
+
     def _count_model_files(self) -> int:
         """Count all model files with supported extensions in all roots
         
@@ -810,12 +1189,19 @@ class ModelScanner:
             asyncio.set_event_loop(None)
             loop.close()
 
-    async def get_cached_data(self, force_refresh: bool = False, rebuild_cache: bool = False) -> ModelCache:
+    async def get_cached_data(
+        self,
+        force_refresh: bool = False,
+        rebuild_cache: bool = False,
+        deep_reconcile: bool = False,
+    ) -> ModelCache:
         """Get cached model data, refresh if needed
         
         Args:
             force_refresh: Whether to refresh the cache
             rebuild_cache: Whether to completely rebuild the cache
+            deep_reconcile: Whether reconciliation should list every directory
+                instead of skipping those unchanged since the last walk
         """
         # If cache is not initialized, return an empty cache
         # Actual initialization should be done via initialize_in_background
@@ -831,7 +1217,7 @@ class ModelScanner:
             if rebuild_cache:
                 await self._initialize_cache()
             else:
-                await self._reconcile_cache()
+                await self._reconcile_cache(deep=deep_reconcile)
         
         return cast(ModelCache, self._cache)
 
@@ -874,8 +1260,12 @@ class ModelScanner:
         finally:
             self._is_initializing = False # Unset flag
 
-    async def _reconcile_cache(self) -> None:
-        """Fast cache reconciliation - only process differences between cache and filesystem"""
+    async def _reconcile_cache(self, deep: bool = False) -> None:
+        """Fast cache reconciliation - only process differences between cache and filesystem
+
+        Directories whose fingerprint is unchanged since the last walk are not
+        listed again unless ``deep`` is set.
+        """
         self.reset_cancellation()
         self._is_initializing = True # Set flag for reconciliation duration
         try:
@@ -885,145 +1275,216 @@ class ModelScanner:
             # Get current cached file paths
             cached_paths = {item['file_path'] for item in self._cache.raw_data}
             path_to_item = {item['file_path']: item for item in self._cache.raw_data}
-            cached_real_paths = {}
-            for cached_path in cached_paths:
-                try:
-                    cached_real_paths.setdefault(os.path.realpath(cached_path), cached_path)
-                except Exception:
-                    continue
+
+            def resolve_real_paths(paths: Iterable[str], per_directory: bool) -> Dict[str, str]:
+                resolved: Dict[str, str] = {}
+                real_dirs: Dict[str, Optional[str]] = {}
+                for cached_path in paths:
+                    try:
+                        if not per_directory:
+                            resolved.setdefault(os.path.realpath(cached_path), cached_path)
+                            continue
+                        directory, name = os.path.split(cached_path)
+                        if directory not in real_dirs:
+                            real_dirs[directory] = os.path.realpath(directory)
+                        resolved.setdefault(os.path.join(real_dirs[directory], name), cached_path)
+                    except Exception:
+                        continue
+                return resolved
+
+            previous_fingerprints: Dict[str, DirFingerprint] = {}
+            persistent_cache = getattr(self, '_persistent_cache', None)
+            if not deep and persistent_cache is not None:
+                stored = await asyncio.to_thread(persistent_cache.load_dir_fingerprints, self.model_type)
+                previous_fingerprints = {
+                    path: DirFingerprint(*values) for path, values in stored.items()
+                }
+
+            # An unchanged directory is only trusted while the cache still
+            # accounts for every model file it held at the last walk
+            expected_counts: Dict[str, int] = {}
+            for known_path in list(cached_paths) + list(self._excluded_models):
+                folder_key = dir_key(os.path.dirname(known_path))
+                expected_counts[folder_key] = expected_counts.get(folder_key, 0) + 1
+
+            def trust_directory(key: str, fingerprint: DirFingerprint) -> bool:
+                return expected_counts.get(key, 0) == fingerprint.entry_count
             
             # Track found files and new files
             found_paths = set()
             new_files = []
-            visited_real_paths = set()
             discovered_real_files = set()
+            # Real paths of cached entries, taken from the walk where possible
+            cached_real_paths: Dict[str, str] = {}
+            # Files not in the cache by path, matched by real path after the walk
+            unmatched: List[Tuple[str, str]] = []
             
-            # Scan all model roots
-            for root_path in self.get_model_roots():
-                if not os.path.exists(root_path):
-                    continue
-                
-                # Recursively scan directory
-                for root, dirnames, files in os.walk(root_path, followlinks=True):
-                    dirnames[:] = [d for d in dirnames if not _is_excluded_dir(d)]
-                    real_root = os.path.realpath(root)
-                    if real_root in visited_real_paths:
+            # Scan all model roots; directory listings are prefetched in parallel
+            walker = ModelFileWalker(self.file_extensions, skip_dir=_is_excluded_dir)
+            roots = [root for root in self.get_model_roots() if os.path.exists(root)]
+            stream = walker.walk(
+                roots,
+                unique_files=False,
+                previous=previous_fingerprints,
+                trust=trust_directory,
+            )
+            try:
+                async for discovered in stream:
+                    # Construct paths exactly as they would be in cache
+                    file_path = discovered.file_path
+                    real_file_path = discovered.real_path
+
+                    # Check if this file is already in cache
+                    if file_path in cached_paths:
+                        found_paths.add(file_path)
+                        cached_real_paths.setdefault(real_file_path, file_path)
                         continue
-                    visited_real_paths.add(real_root)
-                    
-                    for file in files:
-                        ext = os.path.splitext(file)[1].lower()
-                        if ext in self.file_extensions:
-                            # Construct paths exactly as they would be in cache
-                            file_path = os.path.join(root, file).replace(os.sep, '/')
-                            real_file_path = os.path.realpath(os.path.join(root, file))
-                            
-                            # Check if this file is already in cache
-                            if file_path in cached_paths:
-                                found_paths.add(file_path)
-                                continue
-
-                            cached_real_match = cached_real_paths.get(real_file_path)
-                            if cached_real_match:
-                                found_paths.add(cached_real_match)
-                                continue
-
-                            if file_path in self._excluded_models:
-                                continue
-                                
-                            # Try case-insensitive match on Windows
-                            if os.name == 'nt':
-                                lower_path = file_path.lower()
-                                matched = False
-                                for cached_path in cached_paths:
-                                    if cached_path.lower() == lower_path:
-                                        found_paths.add(cached_path)
-                                        matched = True
-                                        break
-                                if matched:
-                                    continue
-                                
-                            if real_file_path in discovered_real_files:
-                                continue
-
-                            discovered_real_files.add(real_file_path)
-                            # This is a new file to process
-                            new_files.append(file_path)
-                    
-                    # Yield control periodically
-                    await asyncio.sleep(0)
+
+                    unmatched.append((file_path, real_file_path))
                     if self.is_cancelled():
                         logger.info(f"{self.model_type.capitalize()} Scanner: Reconcile scan cancelled")
                         return
-            
-            # Process new files in batches
+            finally:
+                await stream.aclose()
+            if self.is_cancelled():
+                logger.info(f"{self.model_type.capitalize()} Scanner: Reconcile scan cancelled")
+                return
+
+            # Models in unchanged directories are still where the cache says
+            walked_paths = set(found_paths)
+            if walker.trusted_dirs:
+                for cached_path in cached_paths:
+                    if dir_key(os.path.dirname(cached_path)) in walker.trusted_dirs:
+                        found_paths.add(cached_path)
+
+            # Unmatched files may be cached under another path to the same
+            # file. Only then are cached paths resolved: per file in the
+            # directories that were listed, and per directory in trusted ones,
+            # whose files were de-duplicated when they were last listed.
+            unresolved = cached_paths - walked_paths
+            for in_trusted_dir in (False, True):
+                if not unresolved or all(real in cached_real_paths for _, real in unmatched):
+                    break
+                group = [
+                    cached_path for cached_path in unresolved
+                    if (dir_key(os.path.dirname(cached_path)) in walker.trusted_dirs) == in_trusted_dir
+                ]
+                resolved = await asyncio.to_thread(resolve_real_paths, group, in_trusted_dir)
+                for real, cached_path in resolved.items():
+                    cached_real_paths.setdefault(real, cached_path)
+
+            for file_path, real_file_path in unmatched:
+                cached_real_match = cached_real_paths.get(real_file_path)
+                if cached_real_match:
+                    found_paths.add(cached_real_match)
+                    continue
+
+                if file_path in self._excluded_models:
+                    continue
+
+                # Try case-insensitive match on Windows
+                if os.name == 'nt':
+                    lower_path = file_path.lower()
+                    matched = False
+                    for cached_path in cached_paths:
+                        if cached_path.lower() == lower_path:
+                            found_paths.add(cached_path)
+                            matched = True
+                            break
+                    if matched:
+                        continue
+
+                if real_file_path in discovered_real_files:
+                    continue
+
+                discovered_real_files.add(real_file_path)
+                # This is a new file to process
+                new_files.append(file_path)
+
+            async def load_new_file(path: str) -> Optional[Dict[str, Any]]:
+                logger.info(f"{self.model_type.capitalize()} Scanner: Processing {path}")
+                try:
+                    # Find the appropriate root path for this file
+                    root_path = None
+                    model_roots = self.get_model_roots()
+                    for potential_root in model_roots:
+                        # Normalize both paths for comparison
+                        normalized_path = os.path.normpath(path)
+                        normalized_root = os.path.normpath(potential_root)
+                        if normalized_path.startswith(normalized_root):
+                            root_path = potential_root
+                            break
+
+                    if not root_path:
+                        logger.error(f"Could not determine root path for {path}")
+                        return None
+
+                    # Reconcile hashing yields to interactive requests
+                    with hash_priority(HashPriority.BACKGROUND):
+                        model_data = await self._process_model_file(path, root_path)
+                    if not model_data:
+                        return None
+                    model_data = self.adjust_cached_entry(dict(model_data))
+                    if not model_data:
+                        return None
+
+                    # Validate the new entry before adding
+                    validation_result = CacheEntryValidator.validate(
+                        model_data, auto_repair=True
+                    )
+                    if not validation_result.is_valid:
+                        logger.warning(
+                            f"Skipping invalid entry during reconcile: {path}"
+                        )
+                        return None
+                    return validation_result.entry
+                except Exception as e:
+                    logger.error(f"Error adding {path} to cache: {e}")
+                    return None
+
+            # Process new files in batches; files within a batch load concurrently
             total_added = 0
             if new_files:
                 logger.info(f"{self.model_type.capitalize()} Scanner: Found {len(new_files)} new files to process")
                 batch_size = 50
+                semaphore = asyncio.Semaphore(SCAN_LOAD_WORKERS)
+
+                async def load_bounded(path: str) -> Optional[Dict[str, Any]]:
+                    async with semaphore:
+                        if self.is_cancelled():
+                            return None
+                        return await load_new_file(path)
+
                 for i in range(0, len(new_files), batch_size):
                     batch = new_files[i:i+batch_size]
-                    for path in batch:
-                        logger.info(f"{self.model_type.capitalize()} Scanner: Processing {path}")
-                        try:
-                            # Find the appropriate root path for this file
-                            root_path = None
-                            model_roots = self.get_model_roots()
-                            for potential_root in model_roots:
-                                # Normalize both paths for comparison
-                                normalized_path = os.path.normpath(path)
-                                normalized_root = os.path.normpath(potential_root)
-                                if normalized_path.startswith(normalized_root):
-                                    root_path = potential_root
-                                    break
-                            
-                            if root_path:
-                                model_data = await self._process_model_file(path, root_path)
-                                if model_data:
-                                    model_data = self.adjust_cached_entry(dict(model_data))
-                                    if not model_data:
-                                        continue
+                    loaded = await asyncio.gather(*(load_bounded(path) for path in batch))
+                    if self.is_cancelled():
+                        logger.info(f"{self.model_type.capitalize()} Scanner: Reconcile processing cancelled")
+                        return
 
-                                    # Validate the new entry before adding
-                                    validation_result = CacheEntryValidator.validate(
-                                        model_data, auto_repair=True
-                                    )
-                                    if not validation_result.is_valid:
-                                        logger.warning(
-                                            f"Skipping invalid entry during reconcile: {path}"
-                                        )
-                                        continue
-                                    model_data = validation_result.entry
-                                    if model_data is None:
-                                        continue
+                    for model_data in loaded:
+                        if model_data is None:
+                            continue
+
+                        self._ensure_license_flags(model_data)
+                        # Add to cache
+                        self._cache.raw_data.append(model_data)
+                        self._cache.add_to_version_index(model_data)
+
+                        # Update hash index if available
+                        if 'sha256' in model_data and 'file_path' in model_data:
+                            self._hash_index.add_entry(
+                                model_data['sha256'].lower(),
+                                model_data['file_path'],
+                                model_data.get('autov3') or None
+                            )
 
-                                    self._ensure_license_flags(model_data)
-                                    # Add to cache
-                                    self._cache.raw_data.append(model_data)
-                                    self._cache.add_to_version_index(model_data)
-
-                                    # Update hash index if available
-                                    if 'sha256' in model_data and 'file_path' in model_data:
-                                        self._hash_index.add_entry(
-                                            model_data['sha256'].lower(),
-                                            model_data['file_path'],
-                                            model_data.get('autov3') or None
-                                        )
-                                    
-                                    # Update tags count
-                                    if 'tags' in model_data and model_data['tags']:
-                                        for tag in model_data['tags']:
-                                            self._tags_count[tag] = self._tags_count.get(tag, 0) + 1
-                                            
-                                    total_added += 1
-                            else:
-                                logger.error(f"Could not determine root path for {path}")
-                        except Exception as e:
-                            logger.error(f"Error adding {path} to cache: {e}")
-                        
-                        if self.is_cancelled():
-                            logger.info(f"{self.model_type.capitalize()} Scanner: Reconcile processing cancelled")
-                            return
+                        # Update tags count
+                        if 'tags' in model_data and model_data['tags']:
+                            for tag in model_data['tags']:
+                                self._tags_count[tag] = self._tags_count.get(tag, 0) + 1
+
+                        total_added += 1
             
             # Find missing files (in cache but not in filesystem)
             missing_files = cached_paths - found_paths
@@ -1087,7 +1548,18 @@ class ModelScanner:
 
                 await self._persist_current_cache()
                 
-            logger.info(f"{self.model_type.capitalize()} Scanner: Cache reconciliation completed in {time.time() - start_time:.2f} seconds. Added {total_added}, removed {total_removed} models.")
+            if persistent_cache is not None:
+                await asyncio.to_thread(
+                    persistent_cache.save_dir_fingerprints,
+                    self.model_type,
+                    dict(walker.fingerprints),
+                )
+
+            logger.info(
+                f"{self.model_type.capitalize()} Scanner: Cache reconciliation completed in {time.time() - start_time:.2f} seconds. "
+                f"Added {total_added}, removed {total_removed} models, "
+                f"skipped {len(walker.trusted_dirs)} unchanged of {len(walker.fingerprints)} directories."
+            )
         except Exception as e:
             logger.error(f"{self.model_type.capitalize()} Scanner: Error reconciling cache: {e}", exc_info=True)
         finally:
@@ -1316,6 +1788,7 @@ class ModelScanner:
             )
             return
 
+        self._reset_deferred_entries()
         self._hash_index = scan_result.hash_index
         self._tags_count = dict(scan_result.tags_count)
         self._excluded_models = list(scan_result.excluded_models)
@@ -1424,8 +1897,8 @@ class ModelScanner:
         tags_count: Dict[str, int] = {}
         excluded_models: List[str] = []
         processed_files = 0
-        processed_real_files: Set[str] = set()
-        visited_real_dirs: Set[str] = set()
+        results: Dict[int, Dict[str, Any]] = {}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SCAN_QUEUE_SIZE)
 
         async def handle_progress() -> None:
             if progress_callback is None:
@@ -1437,93 +1910,82 @@ class ModelScanner:
 
         self.reset_cancellation()
 
-        async def scan_recursive(current_path: str, root_path: str, visited_paths: Set[str]) -> None:
-            nonlocal processed_files
+        walker = ModelFileWalker(self.file_extensions, skip_dir=_is_excluded_dir)
 
+        async def discover() -> None:
+            roots = [root for root in self.get_model_roots() if os.path.exists(root)]
+            stream = walker.walk(roots)
             try:
-                real_path = os.path.realpath(current_path)
-                if real_path in visited_paths or real_path in visited_real_dirs:
-                    return
-                visited_paths.add(real_path)
-                visited_real_dirs.add(real_path)
-
-                with os.scandir(current_path) as iterator:
-                    entries = list(iterator)
-
-                for entry in entries:
-                    try:
-                        if entry.is_file(follow_symlinks=True):
-                            ext = os.path.splitext(entry.name)[1].lower()
-                            if ext not in self.file_extensions:
-                                continue
-
-                            file_path = entry.path.replace(os.sep, "/")
-                            real_file_path = os.path.realpath(entry.path)
-                            if real_file_path in processed_real_files:
-                                continue
-
-                            processed_real_files.add(real_file_path)
-                            result = await self._process_model_file(
-                                file_path,
-                                root_path,
-                                hash_index=hash_index,
-                                excluded_models=excluded_models
-                            )
+                async for discovered in stream:
+                    if self.is_cancelled():
+                        break
+                    await queue.put(discovered)
+            finally:
+                await stream.aclose()
+                for _ in range(SCAN_LOAD_WORKERS):
+                    await queue.put(None)
 
-                            processed_files += 1
-
-                            if result:
-                                # Validate the entry before adding
-                                validation_result = CacheEntryValidator.validate(
-                                    result, auto_repair=True
-                                )
-                                if not validation_result.is_valid:
-                                    logger.warning(
-                                        f"Skipping invalid scan result: {file_path}"
-                                    )
-                                    continue
-                                result = validation_result.entry
-                                if result is None:
-                                    continue
-
-                                self._ensure_license_flags(result)
-                                raw_data.append(result)
-
-                                sha_value = result.get('sha256')
-                                model_path = result.get('file_path')
-                                if sha_value and model_path:
-                                    hash_index.add_entry(sha_value.lower(), model_path, result.get('autov3') or None)
-
-                                for tag in result.get('tags') or []:
-                                    tags_count[tag] = tags_count.get(tag, 0) + 1
-
-                            await handle_progress()
-                            await asyncio.sleep(0)
-                            if self.is_cancelled():
-                                return
-                        elif entry.is_dir(follow_symlinks=True):
-                            if _is_excluded_dir(entry.name):
-                                continue
-                            await scan_recursive(entry.path, root_path, visited_paths)
-                    except Exception as entry_error:
-                        logger.error(f"Error processing entry {entry.path}: {entry_error}")
-            except Exception as scan_error:
-                logger.error(f"Error scanning {current_path}: {scan_error}")
+        async def load() -> None:
+            nonlocal processed_files
 
-            if self.is_cancelled():
-                return
+            while True:
+                discovered = await queue.get()
+                if discovered is None:
+                    return
+                if self.is_cancelled():
+                    continue
 
-        for model_root in self.get_model_roots():
-            if not os.path.exists(model_root):
-                continue
+                try:
+                    # Scan hashing yields to interactive requests
+                    with hash_priority(HashPriority.BACKGROUND):
+                        result = await self._process_model_file(
+                            discovered.file_path,
+                            discovered.root_path,
+                            hash_index=hash_index,
+                            excluded_models=excluded_models
+                        )
 
-            await scan_recursive(model_root, model_root, set())
+                    if result:
+                        # Validate the entry before adding
+                        validation_result = CacheEntryValidator.validate(
+                            result, auto_repair=True
+                        )
+                        if not validation_result.is_valid:
+                            logger.warning(
+                                f"Skipping invalid scan result: {discovered.file_path}"
+                            )
+                        elif validation_result.entry is not None:
+                            results[discovered.index] = validation_result.entry
+                except Exception as entry_error:
+                    logger.error(f"Error processing entry {discovered.file_path}: {entry_error}")
+
+                processed_files += 1
+                await handle_progress()
+
+        # Directory walkers feed a bounded queue drained by concurrent sidecar
+        # loaders; results are assembled in discovery order afterwards so the
+        # outcome matches a sequential scan.
+        await asyncio.gather(discover(), *(load() for _ in range(SCAN_LOAD_WORKERS)))
+
+        for index in sorted(results):
+            result = results[index]
+            self._ensure_license_flags(result)
+            raw_data.append(result)
+
+            sha_value = result.get('sha256')
+            model_path = result.get('file_path')
+            if sha_value and model_path:
+                hash_index.add_entry(sha_value.lower(), model_path, result.get('autov3') or None)
+
+            for tag in result.get('tags') or []:
+                tags_count[tag] = tags_count.get(tag, 0) + 1
 
         return CacheBuildResult(
             raw_data=raw_data,
             hash_index=hash_index,
             tags_count=tags_count,
-            excluded_models=excluded_models
+            excluded_models=excluded_models,
+            dir_fingerprints=dict(walker.fingerprints),
         )
 
     async def add_model_to_cache(self, metadata_dict: Dict[str, Any], folder: str = '') -> bool:
@@ -1569,8 +2031,10 @@ class ModelScanner:
                 metadata_dict['file_path'],
                 metadata_dict.get('autov3') or None,
             )
-            await self._persist_current_cache()
+            self._forget_deferred([file_path])
+            self.mark_models_dirty([file_path])
             self.bump_cache_version()
+            self._sync_name_index([file_path] if file_path else [], metadata_dict)
             return True
         except Exception as e:
             logger.error(f"Error adding model to cache: {e}")
@@ -1774,12 +2238,92 @@ class ModelScanner:
         await cache.resort()
 
         if cache_modified:
-            await self._persist_current_cache()
+            self._forget_deferred([original_path, new_path.replace(os.sep, '/')])
+            self.mark_models_dirty([original_path, new_path.replace(os.sep, '/')])
             self.bump_cache_version()
+            self._sync_name_index([original_path], cache_entry)
 
         if metadata and cache_entry is not None:
             return cache_entry
         return True
+
+    async def update_models_cache_batch(
+        self, updates: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> int:
+        """Apply in-place metadata updates for many models at once.
+
+        Equivalent to :meth:`update_single_model_cache` with an unchanged
+        path for every ``(file_path, metadata)`` pair, but the folder list,
+        version index and sort order are rebuilt once for the whole batch
+        instead of once per model. Returns the number of entries written.
+        """
+        latest: Dict[str, Dict[str, Any]] = {}
+        for file_path, metadata in updates:
+            if metadata:
+                latest[file_path] = metadata
+        if not latest:
+            return 0
+
+        cache = await self.get_cached_data()
+        existing_items = {
+            item['file_path']: item for item in cache.raw_data if item['file_path'] in latest
+        }
+
+        for file_path, existing_item in existing_items.items():
+            for tag in existing_item.get('tags', []):
+                if tag in self._tags_count:
+                    self._tags_count[tag] = max(0, self._tags_count[tag] - 1)
+                    if self._tags_count[tag] == 0:
+                        del self._tags_count[tag]
+            self._hash_index.remove_by_path(file_path)
+
+        new_entries: Dict[str, Dict[str, Any]] = {}
+        for file_path, metadata in latest.items():
+            normalized_path = file_path.replace(os.sep, '/')
+            existing_item = existing_items.get(file_path)
+            if existing_item:
+                folder_value = existing_item.get('folder', self._calculate_folder(file_path))
+            else:
+                folder_value = self._calculate_folder(file_path)
+
+            cache_entry = self._build_cache_entry(
+                metadata,
+                folder=folder_value,
+                file_path_override=normalized_path,
+            )
+            if not cache_entry.get('sha256') and existing_item and existing_item.get('sha256'):
+                cache_entry['sha256'] = existing_item['sha256']
+
+            sha_value = cache_entry.get('sha256')
+            if sha_value:
+                self._hash_index.add_entry(
+                    sha_value.lower(),
+                    normalized_path,
+                    cache_entry.get('autov3') or None,
+                )
+            for tag in cache_entry.get('tags', []):
+                self._tags_count[tag] = self._tags_count.get(tag, 0) + 1
+            new_entries[file_path] = cache_entry
+
+        replaced = [new_entries.get(item['file_path'], item) for item in cache.raw_data]
+        replaced.extend(
+            entry for file_path, entry in new_entries.items() if file_path not in existing_items
+        )
+        cache.raw_data = replaced
+        cache.folders = sorted({item['folder'] for item in cache.raw_data}, key=lambda x: x.lower())
+        cache.rebuild_version_index()
+        await cache.resort()
+
+        touched_paths = list(latest.keys()) + [entry['file_path'] for entry in new_entries.values()]
+        self._forget_deferred(touched_paths)
+        self.mark_models_dirty(touched_paths)
+        self.bump_cache_version()
+        index = self._name_index
+        if index is not None and index.generation == self._cache_version - 1:
+            for file_path, cache_entry in new_entries.items():
+                index.apply([file_path], cache_entry, generation=self._cache_version)
+
+        return len(new_entries)
         
     async def sync_cache_from_metadata(
         self, file_path: str, metadata_dict: Dict[str, Any]
@@ -1791,8 +2335,7 @@ class ModelScanner:
         entry.  When the two are already identical this method returns
         ``False`` without touching anything — avoiding the overhead of
         ``update_single_model_cache``, which always removes and re-inserts
-        the entry, triggers a full resort, and persists via the heavyweight
-        ``save_cache()``.
+        the entry and triggers a full resort.
 
         When differences are detected the update is applied **in-place** with
         targeted operations:
@@ -1804,9 +2347,8 @@ class ModelScanner:
         * ``resort()`` is called **only** when a sort-relevant field changed
           (``model_name`` / ``file_name`` for name-sort, ``modified`` for
           date-sort, ``size`` for size-sort).
-        * The persistent (SQLite) cache receives a targeted single-row update
-          via :meth:`PersistentModelCache.update_single_model` rather than a
-          full-table ``save_cache()``.
+        * The persistent (SQLite) cache receives a targeted single-row write
+          through the write-behind journal (:meth:`mark_models_dirty`).
 
         Returns:
             ``True`` if any cache update was performed, ``False`` if the
@@ -1902,6 +2444,7 @@ class ModelScanner:
         # ---- In-place update of the cache entry ----
         existing_entry.clear()
         existing_entry.update(desired_entry)
+        self._forget_deferred([file_path])
         self.bump_cache_version()
 
         # ---- Incremental tag count update ----
@@ -1960,21 +2503,8 @@ class ModelScanner:
         if need_resort:
             await cache.resort()
 
-        # ---- Targeted SQL update (single row, not full save_cache) ----
-        persistent = getattr(self, "_persistent_cache", None)
-        if persistent is not None:
-            old_item_for_sql: Dict[str, Any] = {
-                "file_path": file_path,
-                "tags": old_tags,
-                "sha256": old_sha256,
-            }
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                persistent.update_single_model,
-                self.model_type,
-                desired_entry,
-                old_item_for_sql,
-            )
+        # ---- Targeted SQL update (journaled, not full save_cache) ----
+        self.mark_models_dirty([file_path])
 
         return True
 
@@ -2051,8 +2581,8 @@ class ModelScanner:
     def _cache_entries_differ(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
         """Return ``True`` when two cache-entry dicts differ in any field.
 
-        Tag lists are compared order-insensitively; all other keys use
-        standard equality.
+        Tag lists are compared order-insensitively; ``auto_tags`` is derived
+        by ``ModelCache`` and ignored; all other keys use standard equality.
         """
         a_tags = sorted(a.get("tags") or [])
         b_tags = sorted(b.get("tags") or [])
@@ -2061,7 +2591,7 @@ class ModelScanner:
 
         all_keys = set(a.keys()) | set(b.keys())
         for key in all_keys:
-            if key == "tags":
+            if key in ("tags", "auto_tags"):
                 continue
             if a.get(key) != b.get(key):
                 return True
@@ -2313,7 +2843,7 @@ class ModelScanner:
 
         updated = await self._cache.update_preview_url(file_path, preview_url, preview_nsfw_level)
         if updated:
-            await self._persist_current_cache()
+            self.mark_models_dirty([file_path])
         return updated
 
     async def bulk_delete_models(self, file_paths: List[str]) -> Dict[str, Any]:
@@ -2504,9 +3034,11 @@ class ModelScanner:
             self._cache.rebuild_version_index()
             await self._cache.resort()
 
-            await self._persist_current_cache()
+            self._forget_deferred(file_paths)
+            self.mark_models_dirty(file_paths)
 
             self.bump_cache_version()
+            self._sync_name_index(file_paths)
 
             return True
             
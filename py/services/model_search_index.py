@@ -0,0 +1,255 @@
+"""Trigram index answering substring searches over cached model entries.
+
+Every entry contributes the distinct lower-cased trigrams of its searchable
+fields (file name, model name, tags, creator and file path) to one posting
+list per trigram. A substring query looks up the postings of its own
+trigrams, intersects the shortest ones and hands the surviving entries to
+the caller for verification, so the work done per keystroke follows the
+number of candidates rather than the size of the library.
+
+The index is synced against the cache by entry identity and a signature of
+the indexed fields. Postings are append-only arrays of document ids; edited
+and removed entries are tombstoned and the index is compacted once dead
+documents make up a large share of it.
+
+Fuzzy searches use the same documents: the whitespace separated tokens of
+the fuzzy-searchable fields have their own postings, and a lazily built
+``FuzzyTokenIndex`` finds the tokens similar to each search word.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .fuzzy_token_index import FuzzyTokenIndex
+
+NGRAM_SIZE = 3
+
+# Rebuild postings once this share of indexed documents is dead
+COMPACT_RATIO = 0.25
+
+# Stop intersecting postings once the candidate set is this small
+VERIFY_THRESHOLD = 64
+
+
+def _creator_username(item: Mapping[str, Any]) -> str:
+    civitai = item.get("civitai")
+    if isinstance(civitai, dict):
+        creator = civitai.get("creator")
+        if isinstance(creator, dict):
+            username = creator.get("username")
+            if isinstance(username, str):
+                return username
+    return ""
+
+
+def _signature(item: Mapping[str, Any]) -> Tuple[Any, ...]:
+    tags = item.get("tags")
+    return (
+        item.get("file_name"),
+        item.get("model_name"),
+        tuple(tags) if isinstance(tags, list) else (),
+        _creator_username(item),
+        item.get("file_path"),
+    )
+
+
+def normalize_search_path(value: str) -> str:
+    """Lower-case ``value`` and use forward slashes, as indexed file paths do."""
+
+    return value.lower().replace("\\", "/")
+
+
+def _trigrams(text: str) -> Iterable[str]:
+    return (text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1))
+
+
+def _entry_trigrams(signature: Tuple[Any, ...]) -> Set[str]:
+    file_name, model_name, tags, creator, file_path = signature
+    values: List[str] = []
+    for value in (file_name, model_name, creator):
+        if isinstance(value, str):
+            values.append(value.lower())
+    values.extend(tag.lower() for tag in tags if isinstance(tag, str))
+    if isinstance(file_path, str):
+        values.append(normalize_search_path(file_path))
+
+    grams: Set[str] = set()
+    for value in values:
+        grams.update(_trigrams(value))
+    return grams
+
+
+def _entry_tokens(signature: Tuple[Any, ...]) -> Set[str]:
+    """Tokens ``fuzzy_match`` compares against, i.e. split lower-cased fields."""
+
+    file_name, model_name, tags, creator, _ = signature
+    tokens: Set[str] = set()
+    for value in (file_name, model_name, creator, *tags):
+        if isinstance(value, str):
+            tokens.update(value.lower().split())
+    return tokens
+
+
+class ModelSearchIndex:
+    """Incrementally maintained trigram index over cache entries."""
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, array] = {}
+        # token -> doc ids, for fuzzy lookups
+        self._tokens: Dict[str, array] = {}
+        self._fuzzy: Optional[FuzzyTokenIndex] = None
+        # doc id -> entry, for live documents only
+        self._docs: Dict[int, Dict[str, Any]] = {}
+        # id(entry) -> (doc id, signature)
+        self._entries: Dict[int, Tuple[int, Tuple[Any, ...]]] = {}
+        self._next_doc = 0
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, item: object) -> bool:
+        return id(item) in self._entries
+
+    def sync(self, entries: Sequence[Dict[str, Any]]) -> None:
+        """Bring the index in line with ``entries``.
+
+        New entries and entries whose indexed fields changed get a fresh
+        document; entries no longer present are tombstoned.
+        """
+
+        tracked = self._entries
+        seen: Set[int] = set()
+        for item in entries:
+            if not isinstance(item, dict):
+                continue
+            key = id(item)
+            if key in seen:
+                continue
+            seen.add(key)
+            signature = _signature(item)
+            record = tracked.get(key)
+            if record is not None:
+                if record[1] == signature:
+                    continue
+                self._drop(key)
+            self._add(item, signature)
+
+        for key in [key for key in tracked if key not in seen]:
+            self._drop(key)
+
+        if self._dead > max(len(self._docs), 1) * COMPACT_RATIO:
+            self._compact()
+
+    def candidates(self, term: str) -> Optional[List[Dict[str, Any]]]:
+        """Return entries that may contain the lower-cased ``term``.
+
+        ``None`` means the term is too short to use the index and the caller
+        has to scan. The result is a superset of the true matches.
+        """
+
+        doc_ids = self._substring_doc_ids(term)
+        if doc_ids is None:
+            return None
+        return self._resolve(doc_ids)
+
+    def fuzzy_candidates(self, pattern: str) -> Optional[List[Dict[str, Any]]]:
+        """Return entries that may satisfy ``fuzzy_match`` for ``pattern``.
+
+        Every word of the pattern has to occur as a substring or be similar
+        to one of an entry's tokens. Words shorter than a trigram cannot
+        narrow the result; ``None`` means no word could.
+        """
+
+        doc_ids: Optional[Set[int]] = None
+        for word in pattern.lower().split():
+            matched = self._substring_doc_ids(word)
+            if matched is None:
+                continue
+            for _, token in self._fuzzy_tokens().lookup(word):
+                matched.update(self._tokens.get(token, ()))
+            doc_ids = matched if doc_ids is None else doc_ids & matched
+            if not doc_ids:
+                return []
+
+        if doc_ids is None:
+            return None
+        return self._resolve(doc_ids)
+
+    def _substring_doc_ids(self, term: str) -> Optional[Set[int]]:
+        if len(term) < NGRAM_SIZE:
+            return None
+
+        postings = []
+        for gram in set(_trigrams(term)):
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+
+        doc_ids = set(postings[0])
+        for posting in postings[1:]:
+            if len(doc_ids) <= VERIFY_THRESHOLD:
+                break
+            doc_ids.intersection_update(posting)
+        return doc_ids
+
+    def _resolve(self, doc_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        docs = self._docs
+        return [docs[doc_id] for doc_id in doc_ids if doc_id in docs]
+
+    def _fuzzy_tokens(self) -> FuzzyTokenIndex:
+        # Built on the first fuzzy search and then extended by ``_add``.
+        # Tokens of removed entries stay in the tree; their postings only
+        # point at dead documents, which ``_resolve`` skips.
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyTokenIndex()
+            self._fuzzy.update(self._tokens)
+        return self._fuzzy
+
+    def _add(self, item: Dict[str, Any], signature: Tuple[Any, ...]) -> None:
+        doc_id = self._next_doc
+        self._next_doc += 1
+        self._docs[doc_id] = item
+        self._entries[id(item)] = (doc_id, signature)
+        postings = self._postings
+        for gram in _entry_trigrams(signature):
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = array("I", (doc_id,))
+            else:
+                posting.append(doc_id)
+
+        tokens = self._tokens
+        for token in _entry_tokens(signature):
+            posting = tokens.get(token)
+            if posting is None:
+                tokens[token] = array("I", (doc_id,))
+                if self._fuzzy is not None:
+                    self._fuzzy.add(token)
+            else:
+                posting.append(doc_id)
+
+    def _drop(self, key: int) -> None:
+        doc_id, _ = self._entries.pop(key)
+        self._docs.pop(doc_id, None)
+        self._dead += 1
+
+    def _compact(self) -> None:
+        # Doc ids are unique, so signatures are never compared while sorting
+        records = sorted(self._entries.values())
+        live = [(self._docs[doc_id], signature) for doc_id, signature in records]
+        # The token tree only gains entries, so keep it rather than rebuild
+        fuzzy, self._fuzzy = self._fuzzy, None
+        self._postings = {}
+        self._tokens = {}
+        self._docs = {}
+        self._entries = {}
+        self._next_doc = 0
+        self._dead = 0
+        for item, signature in live:
+            self._add(item, signature)
+        self._fuzzy = fuzzy
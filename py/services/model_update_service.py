@@ -13,10 +13,11 @@ import sqlite3
 import time
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 from .errors import RateLimitError, ResourceNotFoundError
 from .settings_manager import get_settings_manager
+from .sqlite_executor import get_sqlite_executor
 from ..utils.cache_paths import CacheType, resolve_cache_path_with_migration
 from ..utils.civitai_utils import rewrite_preview_url
 from ..utils.preview_selection import resolve_mature_threshold, select_preview_media
@@ -187,6 +188,25 @@ class ModelUpdateRecord:
             return True
         return version.usage_control == "Download"
 
+    @staticmethod
+    def _is_update_candidate(
+        version: ModelVersionRecord,
+        hide_early_access: bool,
+        hide_non_downloadable: bool,
+        hide_paid: bool,
+    ) -> bool:
+        """Return True when ``version`` may be offered as an update."""
+
+        if version.is_in_library or version.should_ignore:
+            return False
+        if hide_early_access and ModelUpdateRecord._is_early_access_active(version):
+            return False
+        if hide_paid and version.is_paid:
+            return False
+        if hide_non_downloadable and not ModelUpdateRecord._is_downloadable(version):
+            return False
+        return True
+
     def has_update_for_base(
         self,
         local_version_id: Optional[int],
@@ -229,13 +249,9 @@ class ModelUpdateRecord:
             return False
 
         for version in self.versions:
-            if version.is_in_library or version.should_ignore:
-                continue
-            if hide_early_access and ModelUpdateRecord._is_early_access_active(version):
-                continue
-            if hide_paid and version.is_paid:
-                continue
-            if hide_non_downloadable and not ModelUpdateRecord._is_downloadable(version):
+            if not ModelUpdateRecord._is_update_candidate(
+                version, hide_early_access, hide_non_downloadable, hide_paid
+            ):
                 continue
             version_base = _normalize_base_model(version.base_model)
             if version_base != normalized_base:
@@ -246,6 +262,129 @@ class ModelUpdateRecord:
         return False
 
 
+@dataclass
+class _ModelUpdateFlags:
+    """Precomputed update availability of one model."""
+
+    has_update: bool
+    # Normalized base model -> highest version id offered as an update
+    newest_candidate_by_base: Dict[str, int]
+    # Normalized base model -> highest version id in the library
+    newest_local_by_base: Dict[str, int]
+
+
+class UpdateAvailabilityIndex:
+    """Update flags of every tracked model for one combination of settings.
+
+    Answers the same questions as :meth:`ModelUpdateRecord.has_update` and
+    :meth:`ModelUpdateRecord.has_update_for_base` from precomputed values, so
+    listing and filtering by update availability cost a set lookup per item.
+    ``valid_until`` is the moment the earliest hidden early-access window
+    ends, after which the flags must be recomputed.
+    """
+
+    def __init__(self, hide_early_access: bool, hide_paid: bool) -> None:
+        self.hide_early_access = hide_early_access
+        self.hide_paid = hide_paid
+        self.valid_until: Optional[float] = None
+        self._flags: Dict[int, _ModelUpdateFlags] = {}
+        self._with_updates: Set[int] = set()
+
+    @property
+    def models_with_updates(self) -> frozenset:
+        """Model ids that have an update regardless of base model."""
+
+        return frozenset(self._with_updates)
+
+    def has_update(self, model_id: Optional[int]) -> bool:
+        return model_id in self._with_updates
+
+    def has_update_for_base(
+        self,
+        model_id: Optional[int],
+        base_model: Optional[str],
+        local_version_id: Optional[int],
+    ) -> bool:
+        """Return True when a newer version with the same base model exists.
+
+        The newest library version of ``base_model`` is the threshold;
+        ``local_version_id`` is used when the record knows of none.
+        """
+
+        flags = self._flags.get(model_id) if model_id is not None else None
+        if flags is None:
+            return False
+        normalized_base = _normalize_base_model(base_model)
+        if normalized_base is None:
+            return False
+        newest_candidate = flags.newest_candidate_by_base.get(normalized_base)
+        if newest_candidate is None:
+            return False
+        threshold = flags.newest_local_by_base.get(normalized_base)
+        if threshold is None:
+            threshold = _normalize_int(local_version_id)
+        return threshold is not None and newest_candidate > threshold
+
+    def is_expired(self, now: float) -> bool:
+        return self.valid_until is not None and now >= self.valid_until
+
+    def update_record(self, record: ModelUpdateRecord, now: float) -> None:
+        """Recompute the flags of a single model."""
+
+        flags, expires_at = self._build_flags(record, now)
+        self._flags[record.model_id] = flags
+        if flags.has_update:
+            self._with_updates.add(record.model_id)
+        else:
+            self._with_updates.discard(record.model_id)
+        if expires_at is not None and (
+            self.valid_until is None or expires_at < self.valid_until
+        ):
+            self.valid_until = expires_at
+
+    def _build_flags(
+        self, record: ModelUpdateRecord, now: float
+    ) -> Tuple[_ModelUpdateFlags, Optional[float]]:
+        newest_candidate: Dict[str, int] = {}
+        newest_local: Dict[str, int] = {}
+        expires_at: Optional[float] = None
+        if record.should_ignore_model:
+            return _ModelUpdateFlags(False, newest_candidate, newest_local), None
+
+        for version in record.versions:
+            version_base = _normalize_base_model(version.base_model)
+            if version.is_in_library:
+                if version_base is not None:
+                    current = newest_local.get(version_base)
+                    if current is None or version.version_id > current:
+                        newest_local[version_base] = version.version_id
+                continue
+            if self.hide_early_access and version.early_access_ends_at:
+                ends_at = self._parse_timestamp(version.early_access_ends_at)
+                if ends_at is not None and ends_at > now:
+                    if expires_at is None or ends_at < expires_at:
+                        expires_at = ends_at
+            if version_base is None or not ModelUpdateRecord._is_update_candidate(
+                version, self.hide_early_access, True, self.hide_paid
+            ):
+                continue
+            current = newest_candidate.get(version_base)
+            if current is None or version.version_id > current:
+                newest_candidate[version_base] = version.version_id
+
+        has_update = record.has_update(
+            hide_early_access=self.hide_early_access, hide_paid=self.hide_paid
+        )
+        return _ModelUpdateFlags(has_update, newest_candidate, newest_local), expires_at
+
+    @staticmethod
+    def _parse_timestamp(value: str) -> Optional[float]:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except (ValueError, AttributeError):
+            return None
+
+
 class ModelUpdateService:
     """Persist and query remote model version metadata."""
 
@@ -294,9 +433,30 @@ class ModelUpdateService:
         self._lock = asyncio.Lock()
         self._schema_initialized = False
         self._custom_db_path = db_path is not None
+        # (hide_early_access, hide_paid) -> materialized update flags
+        self._availability: Dict[Tuple[bool, bool], UpdateAvailabilityIndex] = {}
+        # Bumped whenever a stored record changes or the database is switched
+        self._revision = 0
         self._ensure_directory()
+        self._db = get_sqlite_executor(self._db_path)
         self._initialize_schema()
 
+    def current_revision(self) -> int:
+        """Return a counter that changes whenever update flags may have changed.
+
+        Besides record writes this covers hidden early-access windows that
+        ended: the affected availability indexes are dropped so they get
+        rebuilt on next use.
+        """
+
+        now = time.time()
+        expired = [key for key, index in self._availability.items() if index.is_expired(now)]
+        if expired:
+            for key in expired:
+                del self._availability[key]
+            self._revision += 1
+        return self._revision
+
     def _get_active_library_name(self) -> str:
         try:
             value = self._settings.get_active_library_name()
@@ -326,7 +486,10 @@ class ModelUpdateService:
         self._library_name = library_name
         self._db_path = new_path
         self._schema_initialized = False
+        self._availability = {}
+        self._revision += 1
         self._ensure_directory()
+        self._db = get_sqlite_executor(new_path)
         self._initialize_schema()
 
     def _ensure_directory(self) -> None:
@@ -334,26 +497,23 @@ class ModelUpdateService:
         if directory:
             os.makedirs(directory, exist_ok=True)
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        return conn
-
     def _initialize_schema(self) -> None:
         if self._schema_initialized:
             return
         try:
-            with self._connect() as conn:
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.executescript(self._SCHEMA)
-                self._apply_migrations(conn)
-                self._migrate_from_legacy_snapshot(conn)
+            self._db.write_sync(self._create_schema)
             self._schema_initialized = True
         except Exception as exc:  # pragma: no cover - defensive guard
             logger.error("Failed to initialize update schema: %s", exc, exc_info=True)
             raise
 
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        # The executor opens the writer connection in WAL mode
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript(self._SCHEMA)
+        self._apply_migrations(conn)
+        self._migrate_from_legacy_snapshot(conn)
+
     def _migrate_from_legacy_snapshot(self, conn: sqlite3.Connection) -> None:
         """Copy update tracking data out of the legacy model snapshot database."""
 
@@ -780,8 +940,11 @@ class ModelUpdateService:
         if metadata_provider and local_versions:
             now = time.time()
             async with self._lock:
+                existing_records = await self._load_records_bulk(
+                    model_type, list(local_versions.keys())
+                )
                 for model_id in local_versions.keys():
-                    existing = self._get_record(model_type, model_id)
+                    existing = existing_records.get(model_id)
                     if existing and existing.should_ignore_model and not force_refresh:
                         continue
                     if force_refresh or not existing or self._is_stale(existing, now):
@@ -879,7 +1042,7 @@ class ModelUpdateService:
 
         normalized_versions = self._normalize_sequence(version_ids)
         async with self._lock:
-            existing = self._get_record(model_type, model_id)
+            existing = await self._load_record(model_type, model_id)
             record = self._merge_with_local_versions(
                 existing,
                 normalized_versions,
@@ -887,7 +1050,7 @@ class ModelUpdateService:
                 model_id=model_id,
                 version_info=version_info,
             )
-            self._upsert_record(record)
+            await self._save_record(record)
             return record
 
     async def set_should_ignore(
@@ -896,7 +1059,7 @@ class ModelUpdateService:
         """Toggle the ignore flag for a model."""
 
         async with self._lock:
-            existing = self._get_record(model_type, model_id)
+            existing = await self._load_record(model_type, model_id)
             if existing:
                 record = ModelUpdateRecord(
                     model_type=existing.model_type,
@@ -913,7 +1076,7 @@ class ModelUpdateService:
                     last_checked_at=None,
                     should_ignore_model=should_ignore,
                 )
-            self._upsert_record(record)
+            await self._save_record(record)
             return record
 
     async def set_version_should_ignore(
@@ -926,7 +1089,7 @@ class ModelUpdateService:
         """Toggle the ignore flag for an individual version."""
 
         async with self._lock:
-            existing = self._get_record(model_type, model_id)
+            existing = await self._load_record(model_type, model_id)
             versions: List[ModelVersionRecord] = []
             found = False
             if existing:
@@ -962,14 +1125,14 @@ class ModelUpdateService:
                 last_checked_at=existing.last_checked_at if existing else None,
                 should_ignore_model=existing.should_ignore_model if existing else False,
             )
-            self._upsert_record(record)
+            await self._save_record(record)
             return record
 
     async def get_record(self, model_type: str, model_id: int) -> Optional[ModelUpdateRecord]:
         """Return a cached record without triggering remote fetches."""
 
         async with self._lock:
-            return self._get_record(model_type, model_id)
+            return await self._load_record(model_type, model_id)
 
     async def has_update(
         self,
@@ -1003,7 +1166,7 @@ class ModelUpdateService:
             return {}
 
         async with self._lock:
-            records = self._get_records_bulk(model_type, normalized_ids)
+            records = await self._load_records_bulk(model_type, normalized_ids)
 
         return {
             model_id: (
@@ -1016,6 +1179,35 @@ class ModelUpdateService:
             for model_id in normalized_ids
         }
 
+    async def get_update_availability(
+        self,
+        *,
+        hide_early_access: bool = False,
+        hide_paid: bool = False,
+    ) -> UpdateAvailabilityIndex:
+        """Return materialized update flags for every tracked model.
+
+        One index is kept per settings combination. Each is built from the
+        database on first use and patched whenever a record is written, so
+        toggling a setting only switches to (or builds) another index.
+        Model ids are unique across model types, as in ``model_update_status``.
+        """
+
+        key = (bool(hide_early_access), bool(hide_paid))
+        now = time.time()
+        async with self._lock:
+            index = self._availability.get(key)
+            if index is None or index.is_expired(now):
+                if index is not None:
+                    # A hidden early-access window ended
+                    self._revision += 1
+                index = UpdateAvailabilityIndex(*key)
+                records = await self._db.read(self._select_all_records)
+                for record in records.values():
+                    index.update_record(record, now)
+                self._availability[key] = index
+            return index
+
     async def get_records_bulk(
         self,
         model_type: str,
@@ -1028,7 +1220,7 @@ class ModelUpdateService:
             return {}
 
         async with self._lock:
-            return self._get_records_bulk(model_type, normalized_ids)
+            return await self._load_records_bulk(model_type, normalized_ids)
 
     async def _refresh_single_model(
         self,
@@ -1051,14 +1243,14 @@ class ModelUpdateService:
         )
         now = time.time()
         async with self._lock:
-            existing = self._get_record(model_type, model_id)
+            existing = await self._load_record(model_type, model_id)
             if existing and existing.should_ignore_model and not force_refresh:
                 record = self._merge_with_local_versions(
                     existing,
                     normalized_local,
                     all_local_version_ids=normalized_all,
                 )
-                self._upsert_record(record)
+                await self._save_record(record)
                 return record
 
             should_fetch = force_refresh or not existing or self._is_stale(existing, now)
@@ -1127,14 +1319,14 @@ class ModelUpdateService:
                 )
 
         async with self._lock:
-            existing = self._get_record(model_type, model_id)
+            existing = await self._load_record(model_type, model_id)
             if existing and existing.should_ignore_model and not force_refresh:
                 record = self._merge_with_local_versions(
                     existing,
                     normalized_local,
                     all_local_version_ids=normalized_all,
                 )
-                self._upsert_record(record)
+                await self._save_record(record)
                 return record
 
             if mark_model_as_ignored:
@@ -1147,7 +1339,7 @@ class ModelUpdateService:
                     all_local_version_ids=normalized_all,
                 )
                 record = replace(record, should_ignore_model=True)
-                self._upsert_record(record)
+                await self._save_record(record)
                 logger.info(
                     "Marked model %s (%s) as ignored after remote resource was not found",
                     model_id,
@@ -1174,7 +1366,7 @@ class ModelUpdateService:
                     last_checked_at=existing.last_checked_at if existing else None,
                     all_local_version_ids=normalized_all,
                 )
-            self._upsert_record(record)
+            await self._save_record(record)
             return record
 
     async def _enrich_version_entries(
@@ -1760,53 +1952,84 @@ class ModelUpdateService:
         rewritten, _ = rewrite_preview_url(url, media_type)
         return rewritten or url
 
-    def _get_record(self, model_type: str, model_id: int) -> Optional[ModelUpdateRecord]:
-        records = self._get_records_bulk(model_type, [model_id])
+    async def _load_record(self, model_type: str, model_id: int) -> Optional[ModelUpdateRecord]:
+        records = await self._load_records_bulk(model_type, [model_id])
         return records.get(model_id)
 
-    def _get_records_bulk(
+    async def _load_records_bulk(
         self,
         model_type: str,
         model_ids: Sequence[int],
     ) -> Dict[int, ModelUpdateRecord]:
         if not model_ids:
             return {}
+        return await self._db.read(self._select_records, model_type, list(model_ids))
 
-        ids = list(model_ids)
+    def _select_records(
+        self,
+        conn: sqlite3.Connection,
+        model_type: str,
+        ids: List[int],
+    ) -> Dict[int, ModelUpdateRecord]:
         status_rows: list[sqlite3.Row] = []
         version_rows: list[sqlite3.Row] = []
 
-        with self._connect() as conn:
-            for start in range(0, len(ids), self._SQLITE_MAX_VARIABLES):
-                chunk = tuple(ids[start : start + self._SQLITE_MAX_VARIABLES])
-                placeholders = ",".join("?" for _ in chunk)
+        for start in range(0, len(ids), self._SQLITE_MAX_VARIABLES):
+            chunk = tuple(ids[start : start + self._SQLITE_MAX_VARIABLES])
+            placeholders = ",".join("?" for _ in chunk)
 
-                chunk_status = conn.execute(
-                    f"""
-                    SELECT model_id, model_type, last_checked_at, should_ignore_model
-                    FROM model_update_status
-                    WHERE model_id IN ({placeholders})
-                    """,
-                    chunk,
-                ).fetchall()
-                status_rows.extend(chunk_status)
+            chunk_status = conn.execute(
+                f"""
+                SELECT model_id, model_type, last_checked_at, should_ignore_model
+                FROM model_update_status
+                WHERE model_id IN ({placeholders})
+                """,
+                chunk,
+            ).fetchall()
+            status_rows.extend(chunk_status)
+
+            chunk_versions = conn.execute(
+                f"""
+                SELECT model_id, version_id, sort_index, name, base_model, released_at,
+                       size_bytes, preview_url, is_in_library, should_ignore, early_access_ends_at,
+                       is_early_access, usage_control, paid_access, is_paid
+                FROM model_update_versions
+                WHERE model_id IN ({placeholders})
+                ORDER BY model_id ASC, sort_index ASC, version_id ASC
+                """,
+                chunk,
+            ).fetchall()
+            version_rows.extend(chunk_versions)
 
-                chunk_versions = conn.execute(
-                    f"""
-                    SELECT model_id, version_id, sort_index, name, base_model, released_at,
-                           size_bytes, preview_url, is_in_library, should_ignore, early_access_ends_at,
-                           is_early_access, usage_control, paid_access, is_paid
-                    FROM model_update_versions
-                    WHERE model_id IN ({placeholders})
-                    ORDER BY model_id ASC, sort_index ASC, version_id ASC
-                    """,
-                    chunk,
-                ).fetchall()
-                version_rows.extend(chunk_versions)
+        if not status_rows:
+            return {}
 
-            if not status_rows:
-                return {}
+        return self._records_from_rows(status_rows, version_rows, model_type)
+
+    def _select_all_records(self, conn: sqlite3.Connection) -> Dict[int, ModelUpdateRecord]:
+        status_rows = conn.execute(
+            """
+            SELECT model_id, model_type, last_checked_at, should_ignore_model
+            FROM model_update_status
+            """
+        ).fetchall()
+        version_rows = conn.execute(
+            """
+            SELECT model_id, version_id, sort_index, name, base_model, released_at,
+                   size_bytes, preview_url, is_in_library, should_ignore, early_access_ends_at,
+                   is_early_access, usage_control, paid_access, is_paid
+            FROM model_update_versions
+            ORDER BY model_id ASC, sort_index ASC, version_id ASC
+            """
+        ).fetchall()
+        return self._records_from_rows(status_rows, version_rows, None)
 
+    def _records_from_rows(
+        self,
+        status_rows: Sequence[sqlite3.Row],
+        version_rows: Sequence[sqlite3.Row],
+        model_type: Optional[str],
+    ) -> Dict[int, ModelUpdateRecord]:
         versions_by_model: Dict[int, List[ModelVersionRecord]] = {}
         for row in version_rows:
             model_id = int(row["model_id"])
@@ -1833,7 +2056,7 @@ class ModelUpdateService:
         for status in status_rows:
             model_id = int(status["model_id"])
             stored_type = status["model_type"]
-            if stored_type and stored_type != model_type:
+            if model_type is not None and stored_type and stored_type != model_type:
                 logger.debug(
                     "Model id %s requested as %s but stored as %s",
                     model_id,
@@ -1842,7 +2065,7 @@ class ModelUpdateService:
                 )
 
             record = ModelUpdateRecord(
-                model_type=stored_type or model_type,
+                model_type=stored_type or model_type or "",
                 model_id=model_id,
                 versions=self._sorted_versions(versions_by_model.get(model_id, [])),
                 last_checked_at=status["last_checked_at"],
@@ -1852,61 +2075,75 @@ class ModelUpdateService:
 
         return records
 
+    async def _save_record(self, record: ModelUpdateRecord) -> None:
+        await self._db.write(self._write_record, record)
+        self._note_record_written(record)
+
     def _upsert_record(self, record: ModelUpdateRecord) -> None:
+        """Blocking variant of :meth:`_save_record`."""
+
+        self._db.write_sync(self._write_record, record)
+        self._note_record_written(record)
+
+    def _note_record_written(self, record: ModelUpdateRecord) -> None:
+        now = time.time()
+        for index in self._availability.values():
+            index.update_record(record, now)
+        self._revision += 1
+
+    def _write_record(self, conn: sqlite3.Connection, record: ModelUpdateRecord) -> None:
         payload = (
             record.model_id,
             record.model_type,
             record.last_checked_at,
             1 if record.should_ignore_model else 0,
         )
-        with self._connect() as conn:
+        conn.execute(
+            """
+            INSERT INTO model_update_status (
+                model_id, model_type, last_checked_at, should_ignore_model
+            ) VALUES (?, ?, ?, ?)
+            ON CONFLICT(model_id) DO UPDATE SET
+                model_type = excluded.model_type,
+                last_checked_at = excluded.last_checked_at,
+                should_ignore_model = excluded.should_ignore_model
+            """,
+            payload,
+        )
+        conn.execute(
+            "DELETE FROM model_update_versions WHERE model_id = ?",
+            (record.model_id,),
+        )
+        for version in record.versions:
+            paid_access_value = (
+                version.paid_access
+                if version.paid_access is None
+                or isinstance(version.paid_access, str)
+                else json.dumps(version.paid_access)
+            )
             conn.execute(
                 """
-                INSERT INTO model_update_status (
-                    model_id, model_type, last_checked_at, should_ignore_model
-                ) VALUES (?, ?, ?, ?)
-                ON CONFLICT(model_id) DO UPDATE SET
-                    model_type = excluded.model_type,
-                    last_checked_at = excluded.last_checked_at,
-                    should_ignore_model = excluded.should_ignore_model
+                INSERT INTO model_update_versions (
+                    version_id, model_id, sort_index, name, base_model, released_at,
+                    size_bytes, preview_url, is_in_library, should_ignore, early_access_ends_at,
+                    is_early_access, usage_control, paid_access, is_paid
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                payload,
-            )
-            conn.execute(
-                "DELETE FROM model_update_versions WHERE model_id = ?",
-                (record.model_id,),
+                (
+                    version.version_id,
+                    record.model_id,
+                    version.sort_index,
+                    version.name,
+                    version.base_model,
+                    version.released_at,
+                    version.size_bytes,
+                    version.preview_url,
+                    1 if version.is_in_library else 0,
+                    1 if version.should_ignore else 0,
+                    version.early_access_ends_at,
+                    1 if version.is_early_access else 0,
+                    version.usage_control,
+                    paid_access_value,
+                    1 if version.is_paid else 0,
+                ),
             )
-            for version in record.versions:
-                paid_access_value = (
-                    version.paid_access
-                    if version.paid_access is None
-                    or isinstance(version.paid_access, str)
-                    else json.dumps(version.paid_access)
-                )
-                conn.execute(
-                    """
-                    INSERT INTO model_update_versions (
-                        version_id, model_id, sort_index, name, base_model, released_at,
-                        size_bytes, preview_url, is_in_library, should_ignore, early_access_ends_at,
-                        is_early_access, usage_control, paid_access, is_paid
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        version.version_id,
-                        record.model_id,
-                        version.sort_index,
-                        version.name,
-                        version.base_model,
-                        version.released_at,
-                        version.size_bytes,
-                        version.preview_url,
-                        1 if version.is_in_library else 0,
-                        1 if version.should_ignore else 0,
-                        version.early_access_ends_at,
-                        1 if version.is_early_access else 0,
-                        version.usage_control,
-                        paid_access_value,
-                        1 if version.is_paid else 0,
-                    ),
-                )
-            conn.commit()
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import asyncio
 import errno
+import inspect
 import json
 import logging
 import os
@@ -128,6 +129,14 @@ class PendingDeleteService:
         # the ops lock (the lock is not re-entrant).
         await self._opportunistic_purge()
 
+        # The snapshot outlives the persisted row, so load its deferred
+        # columns (notes, usage tips...) before it goes into the manifest.
+        ensure_hydrated = getattr(scanner, "ensure_hydrated", None)
+        if cached_entry is not None and callable(ensure_hydrated):
+            result = ensure_hydrated([cached_entry])
+            if inspect.isawaitable(result):
+                await result
+
         async with self._ops_lock:
             batch_dir: Optional[str] = None
             staged_pairs: List[Dict[str, Any]] = []
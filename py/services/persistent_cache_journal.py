@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Seconds a dirty path may wait before the background flusher writes it
+PERSIST_FLUSH_DELAY = 1.0
+# Number of pending paths that triggers an immediate flush
+PERSIST_FLUSH_THRESHOLD = 256
+
+
+class PersistentCacheJournal:
+    """Write-behind journal of model paths whose persisted rows are stale.
+
+    Scanner mutations record the file paths they touched; a flusher running on
+    the event loop coalesces them and hands the batch to ``flush_callback``
+    after ``delay`` seconds, or as soon as ``threshold`` paths are pending.
+    Repeated edits of one model before a flush therefore cost a single write.
+
+    Flushes are serialized and snapshot the pending set only once the previous
+    flush has finished, so a later state of a path is never overwritten by an
+    earlier one. Paths whose flush raised are queued again and retried after
+    ``delay`` seconds.
+    """
+
+    def __init__(
+        self,
+        flush_callback: Callable[[Set[str]], Awaitable[None]],
+        *,
+        delay: float = PERSIST_FLUSH_DELAY,
+        threshold: int = PERSIST_FLUSH_THRESHOLD,
+    ) -> None:
+        self._flush_callback = flush_callback
+        self._delay = max(0.0, delay)
+        self._threshold = max(1, threshold)
+        self._dirty: Set[str] = set()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> frozenset:
+        """Paths recorded but not yet handed to the flush callback."""
+        return frozenset(self._dirty)
+
+    def mark_dirty(self, paths: Iterable[str]) -> None:
+        """Record changed paths and schedule a background flush."""
+        before = len(self._dirty)
+        self._dirty.update(path for path in paths if path)
+        if len(self._dirty) == before:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to flush on; the next flush() picks the paths up.
+            return
+
+        if len(self._dirty) >= self._threshold:
+            self._schedule(loop, 0.0)
+        elif self._timer is None:
+            self._schedule(loop, self._delay)
+
+    def take_pending(self) -> Set[str]:
+        """Remove and return all pending paths without flushing them."""
+        self._cancel_timer()
+        paths, self._dirty = self._dirty, set()
+        return paths
+
+    def clear(self) -> None:
+        """Drop pending paths, e.g. when a full snapshot supersedes them."""
+        self.take_pending()
+
+    async def flush(self) -> None:
+        """Write every pending path now, after any flush already running."""
+        self._cancel_timer()
+        async with self._flush_lock:
+            paths = self.take_pending()
+            if not paths:
+                return
+            try:
+                await self._flush_callback(paths)
+            except Exception as exc:
+                logger.warning("Failed to flush %d persisted cache entries: %s", len(paths), exc)
+                self._dirty.update(paths)
+                if self._timer is None:
+                    self._schedule(asyncio.get_running_loop(), self._delay)
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, delay: float) -> None:
+        if self._timer is not None:
+            if delay > 0:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_later(delay, self._start_flush, loop)
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        task = loop.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from ..utils.cache_paths import CacheType, resolve_cache_path_with_migration
+from .sqlite_executor import configure_connection
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,8 @@ class PersistedCacheData:
     hash_rows: List[Tuple[str, str]]
     excluded_models: List[str]
     autov3_hash_rows: List[Tuple[str, str]] = field(default_factory=list)
+    # True when notes, usage tips, trained words and creator were not loaded
+    deferred: bool = False
 
 
 DEFAULT_LICENSE_FLAGS = 127  # 127 (0b1111111) encodes default CivitAI permissions with all commercial modes enabled.
@@ -62,6 +65,15 @@ class PersistentModelCache:
         "hf_url",
     )
     _MODEL_UPDATE_COLUMNS: Tuple[str, ...] = _MODEL_COLUMNS[2:]
+    # Bulky columns only needed for model details; load_cache can skip them
+    # and load_deferred_fields fetches them afterwards.
+    _DEFERRED_COLUMNS: Tuple[str, ...] = (
+        "notes",
+        "usage_tips",
+        "trained_words",
+        "civitai_creator_username",
+    )
+    _DEFERRED_QUERY_CHUNK = 500
     _instances: Dict[str, "PersistentModelCache"] = {}
     _instance_lock = threading.Lock()
 
@@ -95,18 +107,27 @@ class PersistentModelCache:
 
         return self._db_path
 
-    def load_cache(self, model_type: str) -> Optional[PersistedCacheData]:
+    def load_cache(self, model_type: str, defer_heavy_columns: bool = False) -> Optional[PersistedCacheData]:
+        """Load the persisted snapshot for ``model_type``.
+
+        With ``defer_heavy_columns`` the model rows are read without
+        ``_DEFERRED_COLUMNS``, so the entries lack notes, usage tips, trained
+        words and the creator until :meth:`load_deferred_fields` fills them in.
+        """
         if not self.is_enabled():
             return None
         if not self._schema_initialized:
             self._initialize_schema()
         if not self._schema_initialized:
             return None
+        columns = self._MODEL_COLUMNS[1:]
+        if defer_heavy_columns:
+            columns = tuple(column for column in columns if column not in self._DEFERRED_COLUMNS)
         try:
             with self._db_lock:
                 conn = self._connect(readonly=True)
                 try:
-                    model_columns_sql = ", ".join(self._MODEL_COLUMNS[1:])
+                    model_columns_sql = ", ".join(columns)
                     rows = conn.execute(
                         f"SELECT {model_columns_sql} FROM models WHERE model_type = ?",
                         (model_type,),
@@ -138,13 +159,11 @@ class PersistentModelCache:
         for row in rows:
             file_path: str = row["file_path"]
             trained_words = []
-            if row["trained_words"]:
-                try:
-                    trained_words = json.loads(row["trained_words"])
-                except json.JSONDecodeError:
-                    trained_words = []
+            creator_username = None
+            if not defer_heavy_columns:
+                trained_words = self._decode_trained_words(row["trained_words"])
+                creator_username = row["civitai_creator_username"]
 
-            creator_username = row["civitai_creator_username"]
             civitai: Optional[Dict[str, Any]] = None
             civitai_has_data = any(
                 row[col] is not None
@@ -183,8 +202,8 @@ class PersistentModelCache:
                 "preview_nsfw_level": row["preview_nsfw_level"] or 0,
                 "from_civitai": bool(row["from_civitai"]),
                 "favorite": bool(row["favorite"]),
-                "notes": row["notes"] or "",
-                "usage_tips": row["usage_tips"] or "",
+                "notes": "" if defer_heavy_columns else row["notes"] or "",
+                "usage_tips": "" if defer_heavy_columns else row["usage_tips"] or "",
                 "metadata_source": row["metadata_source"] or None,
                 "exclude": bool(row["exclude"]),
                 "db_checked": bool(row["db_checked"]),
@@ -221,8 +240,62 @@ class PersistentModelCache:
             hash_rows=hash_pairs,
             excluded_models=excluded_paths,
             autov3_hash_rows=autov3_pairs,
+            deferred=defer_heavy_columns,
         )
 
+    def load_deferred_fields(
+        self,
+        model_type: str,
+        file_paths: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the columns skipped by a deferred :meth:`load_cache`.
+
+        Maps each file path to ``notes``, ``usage_tips``, ``trained_words``
+        (decoded) and ``creator_username``. Reads every model of the type when
+        ``file_paths`` is ``None``.
+        """
+        if not self.is_enabled():
+            return {}
+        if not self._schema_initialized:
+            self._initialize_schema()
+        if not self._schema_initialized:
+            return {}
+
+        select_sql = "SELECT file_path, " + ", ".join(self._DEFERRED_COLUMNS) + " FROM models WHERE model_type = ?"
+        try:
+            with self._db_lock:
+                conn = self._connect(readonly=True)
+                try:
+                    if file_paths is None:
+                        rows = conn.execute(select_sql, (model_type,)).fetchall()
+                    else:
+                        rows = []
+                        paths = list(dict.fromkeys(path for path in file_paths if path))
+                        for start in range(0, len(paths), self._DEFERRED_QUERY_CHUNK):
+                            chunk = paths[start:start + self._DEFERRED_QUERY_CHUNK]
+                            placeholders = ", ".join(["?"] * len(chunk))
+                            rows.extend(
+                                conn.execute(
+                                    f"{select_sql} AND file_path IN ({placeholders})",
+                                    (model_type, *chunk),
+                                ).fetchall()
+                            )
+                finally:
+                    conn.close()
+        except Exception as exc:
+            logger.warning("Failed to load deferred cache fields for %s: %s", model_type, exc)
+            return {}
+
+        return {
+            row["file_path"]: {
+                "notes": row["notes"] or "",
+                "usage_tips": row["usage_tips"] or "",
+                "trained_words": self._decode_trained_words(row["trained_words"]),
+                "creator_username": row["civitai_creator_username"] or None,
+            }
+            for row in rows
+        }
+
     def save_cache(self, model_type: str, raw_data: Sequence[Dict[str, Any]], hash_index: Dict[str, List[str]], excluded_models: Sequence[str], autov3_hash_index: Optional[Dict[str, List[str]]] = None) -> None:
         if not self.is_enabled():
             return
@@ -475,6 +548,105 @@ class PersistentModelCache:
         except Exception as exc:
             logger.warning("Failed to persist cache for %s: %s", model_type, exc)
 
+    def save_changes(
+        self,
+        model_type: str,
+        entries: Sequence[Dict[str, Any]],
+        removed_paths: Sequence[str] = (),
+        excluded_states: Optional[Mapping[str, bool]] = None,
+    ) -> None:
+        """Write only the given models in one transaction.
+
+        Used by the scanner's write-behind journal instead of :meth:`save_cache`
+        so an edit never reads back the persisted library. Each entry replaces
+        its model row together with its tag, hash and AutoV3 rows; each
+        removed path loses all of them. ``excluded_states`` maps a path to
+        whether it should be listed in ``excluded_models``.
+
+        Unlike the other writers this raises when the transaction fails, so
+        the journal can queue the paths again instead of losing the edits.
+        """
+        if not self.is_enabled():
+            return
+        if not self._schema_initialized:
+            self._initialize_schema()
+        if not self._schema_initialized:
+            return
+
+        entries = [item for item in entries if item.get("file_path")]
+        model_rows = [self._prepare_model_row(model_type, item) for item in entries]
+        touched = [(model_type, row[1]) for row in model_rows]
+        touched.extend((model_type, path) for path in removed_paths if path)
+        if not touched and not excluded_states:
+            return
+
+        tag_rows: List[Tuple[str, str, str]] = []
+        hash_rows: List[Tuple[str, str, str]] = []
+        autov3_rows: List[Tuple[str, str, str]] = []
+        for row, item in zip(model_rows, entries):
+            file_path = row[1]
+            for tag in set(item.get("tags") or []):
+                tag_rows.append((model_type, file_path, tag))
+            if row[7]:  # sha256
+                hash_rows.append((model_type, row[7], file_path))
+            if row[8]:  # autov3
+                autov3_rows.append((model_type, row[8], file_path))
+
+        excluded_inserts = [
+            (model_type, path) for path, excluded in (excluded_states or {}).items() if path and excluded
+        ]
+        excluded_deletes = [
+            (model_type, path) for path, excluded in (excluded_states or {}).items() if path and not excluded
+        ]
+
+        with self._db_lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "DELETE FROM models WHERE model_type = ? AND file_path = ?",
+                    touched,
+                )
+                for table in ("model_tags", "hash_index", "autov3_index"):
+                    conn.executemany(
+                        f"DELETE FROM {table} WHERE model_type = ? AND file_path = ?",
+                        touched,
+                    )
+                if model_rows:
+                    conn.executemany(self._insert_model_sql(), model_rows)
+                if tag_rows:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO model_tags (model_type, file_path, tag) VALUES (?, ?, ?)",
+                        tag_rows,
+                    )
+                if hash_rows:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO hash_index (model_type, sha256, file_path) VALUES (?, ?, ?)",
+                        hash_rows,
+                    )
+                if autov3_rows:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO autov3_index (model_type, autov3, file_path) VALUES (?, ?, ?)",
+                        autov3_rows,
+                    )
+                if excluded_deletes:
+                    conn.executemany(
+                        "DELETE FROM excluded_models WHERE model_type = ? AND file_path = ?",
+                        excluded_deletes,
+                    )
+                if excluded_inserts:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO excluded_models (model_type, file_path) VALUES (?, ?)",
+                        excluded_inserts,
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+
     # Internal helpers -------------------------------------------------
 
     def _resolve_default_path(self, library_name: str) -> str:
@@ -554,6 +726,14 @@ class PersistentModelCache:
                             file_path TEXT NOT NULL,
                             PRIMARY KEY (model_type, file_path)
                         );
+
+                        CREATE TABLE IF NOT EXISTS dir_fingerprints (
+                            model_type TEXT NOT NULL,
+                            dir_path TEXT NOT NULL,
+                            mtime_ns INTEGER NOT NULL,
+                            entry_count INTEGER NOT NULL,
+                            PRIMARY KEY (model_type, dir_path)
+                        );
                         """
                     )
                     self._ensure_additional_model_columns(conn)
@@ -598,7 +778,7 @@ class PersistentModelCache:
             uri = True
         conn = sqlite3.connect(path, check_same_thread=False, uri=uri, detect_types=sqlite3.PARSE_DECLTYPES)
         conn.row_factory = sqlite3.Row
-        return conn
+        return configure_connection(conn, readonly=readonly)
 
     def _prepare_model_row(self, model_type: str, item: Dict[str, Any]) -> Tuple[Any, ...]:
         civitai = item.get("civitai") or {}
@@ -667,6 +847,15 @@ class PersistentModelCache:
             item.get("hf_url") or "",
         )
 
+    @staticmethod
+    def _decode_trained_words(value: Optional[str]) -> List[Any]:
+        if not value:
+            return []
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return []
+
     def _insert_model_sql(self) -> str:
         columns = ", ".join(self._MODEL_COLUMNS)
         placeholders = ", ".join(["?"] * len(self._MODEL_COLUMNS))
@@ -780,6 +969,63 @@ class PersistentModelCache:
                 exc,
             )
 
+    def load_dir_fingerprints(self, model_type: str) -> Dict[str, Tuple[int, int]]:
+        """Return ``dir_path -> (mtime_ns, entry_count)`` recorded by the last walk."""
+        if not self.is_enabled():
+            return {}
+        if not self._schema_initialized:
+            self._initialize_schema()
+        if not self._schema_initialized:
+            return {}
+        try:
+            with self._db_lock:
+                conn = self._connect(readonly=True)
+                try:
+                    rows = conn.execute(
+                        "SELECT dir_path, mtime_ns, entry_count FROM dir_fingerprints WHERE model_type = ?",
+                        (model_type,),
+                    ).fetchall()
+                finally:
+                    conn.close()
+            return {row["dir_path"]: (row["mtime_ns"], row["entry_count"]) for row in rows}
+        except Exception as exc:
+            logger.warning("Failed to load directory fingerprints for %s: %s", model_type, exc)
+            return {}
+
+    def save_dir_fingerprints(
+        self,
+        model_type: str,
+        fingerprints: Mapping[str, Tuple[int, int]],
+    ) -> None:
+        """Replace the directory fingerprints stored for ``model_type``."""
+        if not self.is_enabled():
+            return
+        if not self._schema_initialized:
+            self._initialize_schema()
+        if not self._schema_initialized:
+            return
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                try:
+                    conn.execute("BEGIN")
+                    conn.execute("DELETE FROM dir_fingerprints WHERE model_type = ?", (model_type,))
+                    conn.executemany(
+                        "INSERT INTO dir_fingerprints (model_type, dir_path, mtime_ns, entry_count) VALUES (?, ?, ?, ?)",
+                        [
+                            (model_type, dir_path, int(mtime_ns), int(entry_count))
+                            for dir_path, (mtime_ns, entry_count) in fingerprints.items()
+                        ],
+                    )
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+                finally:
+                    conn.close()
+        except Exception as exc:
+            logger.warning("Failed to persist directory fingerprints for %s: %s", model_type, exc)
+
     def get_models_missing_autov3(self, model_type: str) -> List[str]:
         """Return file paths whose models lack an AutoV3 checked state.
 
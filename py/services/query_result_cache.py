@@ -0,0 +1,131 @@
+"""LRU cache of filtered model lists for the paginated list endpoints.
+
+Paging through a library repeats the same query with a different ``page``,
+yet every request used to re-run sorting, grouping, filtering and search over
+the whole cache. ``QueryResultCache`` keeps the filtered (but unpaginated)
+list per normalised query so later pages only cost a slice plus the
+annotation of that page.
+
+Entries belong to one cache *generation* (the scanner's cache version plus
+the cache's own revision counter). Any mutation moves the generation on and
+the first lookup under a new generation drops every stored list, so stale
+results are never served and never linger in memory.
+
+The cache is bounded both by the number of queries and by the total number
+of list slots held, which is what dominates its memory use.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Mapping, Optional
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_ITEMS = 250_000
+
+
+def freeze_query_value(value: Any) -> Hashable:
+    """Return a hashable, order-stable form of a query parameter.
+
+    Empty containers and ``None`` are equivalent for every list filter, so
+    they normalise to ``None`` and share one cache entry.
+    """
+
+    if isinstance(value, Mapping):
+        if not value:
+            return None
+        return tuple(
+            sorted(
+                ((str(key), freeze_query_value(item)) for key, item in value.items()),
+                key=lambda pair: pair[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return None
+        return tuple(freeze_query_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        if not value:
+            return None
+        return tuple(sorted(freeze_query_value(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class QueryResultCache:
+    """Generation-scoped LRU of query key -> filtered entry list."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_items: int = DEFAULT_MAX_ITEMS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self._entries: "OrderedDict[Hashable, List[Dict[str, Any]]]" = OrderedDict()
+        self._generation: Any = None
+        self._item_count = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, generation: Any, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """Return the list stored for ``key`` under ``generation``, if any."""
+
+        self._sync_generation(generation)
+        items = self._entries.get(key)
+        if items is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return items
+
+    def put(self, generation: Any, key: Hashable, items: List[Dict[str, Any]]) -> None:
+        """Store ``items`` for ``key``; lists larger than the item budget are skipped."""
+
+        if len(items) > self.max_items or self.max_entries <= 0:
+            return
+        self._sync_generation(generation)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._item_count -= len(previous)
+        self._entries[key] = items
+        self._item_count += len(items)
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._item_count > self.max_items
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._item_count -= len(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._item_count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "items": self._item_count,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _sync_generation(self, generation: Any) -> None:
+        if generation == self._generation:
+            return
+        if self._entries:
+            self.invalidations += 1
+            self.clear()
+        self._generation = generation
@@ -1,7 +1,59 @@
 import asyncio
-from typing import Any, Iterable, List, Dict, Optional
+import logging
+from typing import Any, Iterable, List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from natsort import natsorted
+from natsort import natsort_keygen
+
+from .sorted_view import DescendingKey, SortedView
+
+logger = logging.getLogger(__name__)
+
+# Above this share of changed recipes the sorted views are rebuilt instead
+# of patched
+SORTED_VIEW_REBUILD_RATIO = 0.125
+
+_natsort_key = natsort_keygen()
+
+
+def _recipe_key(recipe: Dict[str, Any]) -> Optional[str]:
+    recipe_id = recipe.get("id")
+    return None if recipe_id is None else str(recipe_id)
+
+
+def _checkpoint_hash(checkpoint: Any) -> Optional[str]:
+    """Stored hash of a checkpoint entry, ``""`` when it has none."""
+
+    if isinstance(checkpoint, (list, tuple)) and len(checkpoint) == 1:
+        checkpoint = checkpoint[0]
+    if checkpoint is None:
+        return None
+    if isinstance(checkpoint, dict):
+        return (checkpoint.get("hash") or "").lower()
+    return ""
+
+
+def _index_keys(
+    recipe: Dict[str, Any],
+) -> Tuple[Tuple[str, ...], Optional[str], str, str]:
+    """Return the lora hashes, checkpoint hash, fingerprint and source path."""
+
+    lora_hashes: Set[str] = set()
+    loras = recipe.get("loras")
+    if isinstance(loras, list):
+        for lora in loras:
+            if isinstance(lora, dict):
+                hash_value = lora.get("hash")
+                if hash_value and isinstance(hash_value, str):
+                    lora_hashes.add(hash_value.lower())
+
+    fingerprint = recipe.get("fingerprint")
+    source_path = recipe.get("source_path")
+    return (
+        tuple(lora_hashes),
+        _checkpoint_hash(recipe.get("checkpoint")),
+        fingerprint if isinstance(fingerprint, str) else "",
+        source_path.strip() if isinstance(source_path, str) else "",
+    )
 
 
 @dataclass
@@ -29,16 +81,388 @@ class RecipeCache:
         # Normalize optional metadata containers
         self.folders = self.folders or []
         self.folder_tree = self.folder_tree or {}
+        # Bumped by every change made through the cache; see ``revision``
+        self._revision = 0
+        self._invalidate_indexes()
+        self._name_view: Optional[SortedView] = None
+        self._date_view: Optional[SortedView] = None
+        # id(recipe) -> (recipe, sort signature, name key, date key)
+        self._sort_entries: Dict[int, Tuple[Dict[str, Any], Tuple[Any, ...], Any, Any]] = {}
+
+    # Lookup indexes
+    #
+    # Recipes are indexed by id and through reverse indexes on lora hash,
+    # stored checkpoint hash, fingerprint and source path. Mutations made
+    # through this class keep them current. The indexes are rebuilt lazily
+    # when ``raw_data`` is swapped or resized behind the cache's back; code
+    # that edits an indexed field of a cached recipe in place calls
+    # ``reindex_recipe``.
+
+    def _invalidate_indexes(self) -> None:
+        self._indexed_data: Optional[List[Dict[str, Any]]] = None
+        self._indexed_length = 0
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._positions: Optional[Dict[str, int]] = None
+        self._index_keys: Dict[str, Tuple[Tuple[str, ...], Optional[str], str, str]] = {}
+        self._lora_index: Dict[str, Set[str]] = {}
+        self._checkpoint_index: Dict[str, Set[str]] = {}
+        self._unhashed_checkpoints: Set[str] = set()
+        self._fingerprint_index: Dict[str, Set[str]] = {}
+        self._source_index: Dict[str, Set[str]] = {}
+
+    def invalidate_indexes(self) -> None:
+        """Drop the lookup indexes; they are rebuilt on next use."""
+
+        self._indexed_data = None
+        self._revision += 1
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped by mutations, resorts and reindexing.
+
+        Replacing ``raw_data`` outright does not move it; callers that need
+        to detect that compare the list identity and length as well.
+        """
+
+        return self._revision
+
+    def _ensure_indexes(self) -> None:
+        if (
+            self._indexed_data is self.raw_data
+            and self._indexed_length == len(self.raw_data)
+        ):
+            return
+
+        self._invalidate_indexes()
+        for recipe in self.raw_data:
+            self._index_recipe(recipe)
+        self._mark_indexed()
+
+    def _mark_indexed(self) -> None:
+        self._indexed_data = self.raw_data
+        self._indexed_length = len(self.raw_data)
+
+    def _index_recipe(self, recipe: Dict[str, Any]) -> None:
+        key = _recipe_key(recipe)
+        if key is None or key in self._by_id:
+            return
+
+        self._by_id[key] = recipe
+        keys = _index_keys(recipe)
+        self._index_keys[key] = keys
+        lora_hashes, checkpoint_hash, fingerprint, source_path = keys
+        for lora_hash in lora_hashes:
+            self._lora_index.setdefault(lora_hash, set()).add(key)
+        if checkpoint_hash:
+            self._checkpoint_index.setdefault(checkpoint_hash, set()).add(key)
+        elif checkpoint_hash is not None:
+            self._unhashed_checkpoints.add(key)
+        if fingerprint:
+            self._fingerprint_index.setdefault(fingerprint, set()).add(key)
+        if source_path:
+            self._source_index.setdefault(source_path, set()).add(key)
+
+    def _unindex_recipe(self, key: str) -> None:
+        self._by_id.pop(key, None)
+        keys = self._index_keys.pop(key, None)
+        if keys is None:
+            return
+
+        lora_hashes, checkpoint_hash, fingerprint, source_path = keys
+        for lora_hash in lora_hashes:
+            self._discard(self._lora_index, lora_hash, key)
+        if checkpoint_hash:
+            self._discard(self._checkpoint_index, checkpoint_hash, key)
+        self._unhashed_checkpoints.discard(key)
+        if fingerprint:
+            self._discard(self._fingerprint_index, fingerprint, key)
+        if source_path:
+            self._discard(self._source_index, source_path, key)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], value: str, key: str) -> None:
+        keys = index.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[value]
+
+    def _position_of(self, key: str) -> Optional[int]:
+        positions = self._positions
+        if positions is None:
+            positions = {}
+            for position, recipe in enumerate(self.raw_data):
+                recipe_key = _recipe_key(recipe)
+                if recipe_key is not None:
+                    positions.setdefault(recipe_key, position)
+            self._positions = positions
+        return positions.get(key)
+
+    def _find_locked(self, recipe_id: Any) -> Optional[Dict[str, Any]]:
+        self._ensure_indexes()
+        key = str(recipe_id)
+        recipe = self._by_id.get(key)
+        if recipe is not None and _recipe_key(recipe) != key:
+            # The id was edited in place; index the recipes afresh
+            self.invalidate_indexes()
+            self._ensure_indexes()
+            recipe = self._by_id.get(key)
+        return recipe
+
+    def _resolve(self, keys: Iterable[str]) -> List[Dict[str, Any]]:
+        """Return the recipes for ``keys`` in ``raw_data`` order."""
+
+        positioned = []
+        for key in keys:
+            recipe = self._by_id.get(key)
+            position = self._position_of(key)
+            if recipe is not None and position is not None:
+                positioned.append((position, recipe))
+        positioned.sort(key=lambda pair: pair[0])
+        return [recipe for _, recipe in positioned]
+
+    def reindex_recipe(self, recipe: Dict[str, Any]) -> None:
+        """Refresh the reverse indexes after ``recipe`` was edited in place."""
+
+        self._revision += 1
+        self._ensure_indexes()
+        key = _recipe_key(recipe)
+        if key is None or self._by_id.get(key) is not recipe:
+            return
+        self._unindex_recipe(key)
+        self._index_recipe(recipe)
+
+    def get_cached_recipe(self, recipe_id: Any) -> Optional[Dict[str, Any]]:
+        """Return the cached recipe object for ``recipe_id`` (not a copy)."""
+
+        return self._find_locked(recipe_id)
+
+    def recipe_ids_with_lora(self, lora_hash: str) -> Set[str]:
+        self._ensure_indexes()
+        return set(self._lora_index.get(lora_hash.lower(), ()))
+
+    def recipes_with_lora(self, lora_hash: str) -> List[Dict[str, Any]]:
+        """Recipes holding a lora entry with the stored ``lora_hash``."""
+
+        self._ensure_indexes()
+        return self._resolve(self._lora_index.get(lora_hash.lower(), ()))
+
+    def recipe_ids_with_checkpoint(self, checkpoint_hash: str) -> Set[str]:
+        self._ensure_indexes()
+        return set(self._checkpoint_index.get(checkpoint_hash.lower(), ()))
+
+    def recipes_with_checkpoint(
+        self, checkpoint_hash: str, *, include_unhashed: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Recipes whose checkpoint carries the stored ``checkpoint_hash``.
+
+        ``include_unhashed`` adds recipes whose checkpoint has no stored
+        hash, for callers that resolve it from the version index.
+        """
+
+        self._ensure_indexes()
+        keys = set(self._checkpoint_index.get(checkpoint_hash.lower(), ()))
+        if include_unhashed:
+            keys |= self._unhashed_checkpoints
+        return self._resolve(keys)
+
+    def recipes_with_fingerprint(self, fingerprint: str) -> List[Dict[str, Any]]:
+        self._ensure_indexes()
+        return self._resolve(self._fingerprint_index.get(fingerprint, ()))
+
+    def recipes_with_source_path(self, source_path: str) -> List[Dict[str, Any]]:
+        self._ensure_indexes()
+        return self._resolve(self._source_index.get(source_path.strip(), ()))
+
+    def fingerprint_groups(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Recipes sharing a fingerprint, for fingerprints used more than once."""
+
+        self._ensure_indexes()
+        return {
+            fingerprint: self._resolve(keys)
+            for fingerprint, keys in self._fingerprint_index.items()
+            if len(keys) > 1
+        }
+
+    def source_path_groups(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Recipes sharing a source path, for paths used more than once."""
+
+        self._ensure_indexes()
+        return {
+            source_path: self._resolve(keys)
+            for source_path, keys in self._source_index.items()
+            if len(keys) > 1
+        }
+
+    # Sorted views
+    #
+    # ``sorted_by_name`` and ``sorted_by_date`` are the item lists of two
+    # maintained ``SortedView`` instances. Mutations made through this class
+    # move the affected recipe with a bisect removal and insertion; a resort
+    # diffs ``raw_data`` by identity and sort signature to pick up in-place
+    # edits, and only rebuilds the views when many recipes changed or the
+    # lists were replaced from outside.
+
+    @staticmethod
+    def _sort_signature(recipe: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (
+            recipe.get("title"),
+            recipe.get("file_path"),
+            recipe.get("modified"),
+            recipe.get("created_date"),
+        )
+
+    @staticmethod
+    def _name_sort_key(recipe: Dict[str, Any]) -> Any:
+        return _natsort_key(
+            (
+                (recipe.get("title") or "").lower(),
+                (recipe.get("file_path") or "").lower(),
+            )
+        )
+
+    @staticmethod
+    def _date_sort_key(recipe: Dict[str, Any]) -> DescendingKey:
+        return DescendingKey(
+            (
+                recipe.get("modified", recipe.get("created_date", 0)),
+                recipe.get("file_path", ""),
+            )
+        )
+
+    def _sorted_views_current(self) -> bool:
+        return (
+            self._name_view is not None
+            and self._date_view is not None
+            and self.sorted_by_name is self._name_view.items
+            and self.sorted_by_date is self._date_view.items
+        )
+
+    def rebuild_sorted_views(self) -> None:
+        """Sort ``raw_data`` into fresh name and date views."""
+
+        self._install_sorted_views(self._build_sorted_views(self.raw_data))
+
+    def _build_sorted_views(
+        self, recipes: List[Dict[str, Any]]
+    ) -> Tuple[Dict[int, Tuple[Dict[str, Any], Tuple[Any, ...], Any, Any]], SortedView, SortedView]:
+        """Sort ``recipes`` into new views without touching the live ones."""
+
+        entries: Dict[int, Tuple[Dict[str, Any], Tuple[Any, ...], Any, Any]] = {}
+        name_pairs = []
+        date_pairs = []
+        for recipe in recipes:
+            name_key = self._name_sort_key(recipe)
+            date_key = self._date_sort_key(recipe)
+            entries[id(recipe)] = (recipe, self._sort_signature(recipe), name_key, date_key)
+            name_pairs.append((name_key, recipe))
+            date_pairs.append((date_key, recipe))
+        return entries, SortedView.build(name_pairs), SortedView.build(date_pairs)
+
+    def _install_sorted_views(
+        self,
+        views: Tuple[Dict[int, Tuple[Dict[str, Any], Tuple[Any, ...], Any, Any]], SortedView, SortedView],
+    ) -> None:
+        self._revision += 1
+        self._sort_entries, self._name_view, self._date_view = views
+        self.sorted_by_name = self._name_view.items
+        self.sorted_by_date = self._date_view.items
+
+    def sync_sorted_views(self) -> None:
+        """Bring the sorted views in line with ``raw_data``."""
+
+        changes = self._pending_sort_changes()
+        if changes is None:
+            self.rebuild_sorted_views()
+        else:
+            self._apply_sort_changes(*changes)
+
+    def _pending_sort_changes(
+        self,
+    ) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """Return ``(changed, removed)`` recipes, or ``None`` if a rebuild is due."""
+
+        if not self._sorted_views_current():
+            return None
+
+        entries = self._sort_entries
+        seen = set()
+        changed = []
+        for recipe in self.raw_data:
+            ident = id(recipe)
+            seen.add(ident)
+            record = entries.get(ident)
+            if record is None or record[1] != self._sort_signature(recipe):
+                changed.append(recipe)
+
+        if len(seen) != len(self.raw_data):
+            # The same recipe object listed twice cannot be tracked by identity
+            return None
+
+        removed = [entries[ident][0] for ident in entries if ident not in seen]
+        if len(changed) + len(removed) > len(self.raw_data) * SORTED_VIEW_REBUILD_RATIO:
+            return None
+        return changed, removed
+
+    def _apply_sort_changes(
+        self, changed: List[Dict[str, Any]], removed: List[Dict[str, Any]]
+    ) -> None:
+        if not changed and not removed:
+            return
+        self._revision += 1
+        for recipe in removed:
+            self._untrack_sorted(recipe)
+        for recipe in changed:
+            self._untrack_sorted(recipe)
+            self._track_sorted(recipe)
+        if not self._sorted_views_current():
+            self.rebuild_sorted_views()
+
+    def _track_sorted(self, recipe: Dict[str, Any]) -> None:
+        if not self._sorted_views_current():
+            return
+        name_key = self._name_sort_key(recipe)
+        date_key = self._date_sort_key(recipe)
+        self._sort_entries[id(recipe)] = (
+            recipe,
+            self._sort_signature(recipe),
+            name_key,
+            date_key,
+        )
+        self._name_view.insert(name_key, recipe)
+        self._date_view.insert(date_key, recipe)
+
+    def _untrack_sorted(self, recipe: Dict[str, Any]) -> None:
+        if not self._sorted_views_current():
+            return
+        record = self._sort_entries.pop(id(recipe), None)
+        if record is None:
+            return
+        if not (
+            self._name_view.remove(record[2], recipe)
+            and self._date_view.remove(record[3], recipe)
+        ):
+            logger.debug("RecipeCache sorted views lost track of a recipe; rebuilding")
+            self._name_view = None
 
     async def resort(self, name_only: bool = False):
-        """Resort all cached data views in a thread pool to avoid blocking the event loop."""
+        """Bring the sorted views up to date without blocking the event loop.
+
+        ``get_paginated_data`` reads the live view lists without the lock, so
+        they are only ever patched on the loop; the bisect patches cost
+        O(k log n). A full rebuild sorts fresh lists in a thread pool and
+        swaps them in once complete. ``name_only`` is kept for existing callers.
+        """
         async with self._lock:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self._resort_locked,
-                name_only,
+            changes = self._pending_sort_changes()
+            if changes is not None:
+                self._apply_sort_changes(*changes)
+                return
+            loop = asyncio.get_running_loop()
+            views = await loop.run_in_executor(
+                None, self._build_sorted_views, list(self.raw_data)
             )
+            self._install_sorted_views(views)
 
     async def update_recipe_metadata(
         self, recipe_id: str, metadata: Dict[str, Any], *, resort: bool = True
@@ -53,21 +477,34 @@ class RecipeCache:
             bool: True if the update was successful, False if the recipe wasn't found
         """
         async with self._lock:
-            for item in self.raw_data:
-                if str(item.get("id")) == str(recipe_id):
-                    item.update(metadata)
-                    if resort:
-                        self._resort_locked()
-                    return True
-        return False  # Recipe not found
+            item = self._find_locked(recipe_id)
+            if item is None:
+                return False  # Recipe not found
+
+            self._untrack_sorted(item)
+            item.update(metadata)
+            self._revision += 1
+            self._track_sorted(item)
+            self.reindex_recipe(item)
+            if resort:
+                self._resort_locked(touched=(item,))
+            return True
 
     async def add_recipe(self, recipe_data: Dict[str, Any], *, resort: bool = False) -> None:
         """Add a new recipe to the cache."""
 
         async with self._lock:
+            self._ensure_indexes()
             self.raw_data.append(recipe_data)
+            self._revision += 1
+            self._index_recipe(recipe_data)
+            key = _recipe_key(recipe_data)
+            if self._positions is not None and key is not None:
+                self._positions.setdefault(key, len(self.raw_data) - 1)
+            self._mark_indexed()
+            self._track_sorted(recipe_data)
             if resort:
-                self._resort_locked()
+                self._resort_locked(touched=(recipe_data,))
 
     async def remove_recipe(
         self, recipe_id: str, *, resort: bool = False
@@ -82,13 +519,25 @@ class RecipeCache:
         """
 
         async with self._lock:
-            for index, recipe in enumerate(self.raw_data):
-                if str(recipe.get("id")) == str(recipe_id):
-                    removed = self.raw_data.pop(index)
-                    if resort:
-                        self._resort_locked()
-                    return removed
-        return None
+            if self._find_locked(recipe_id) is None:
+                return None
+
+            key = str(recipe_id)
+            index = self._position_of(key)
+            removed = self.raw_data.pop(index)
+            self._revision += 1
+            self._unindex_recipe(key)
+            # A duplicate id later in the list takes over the index entry
+            self._positions = None
+            for recipe in self.raw_data[index:]:
+                if _recipe_key(recipe) == key:
+                    self._index_recipe(recipe)
+                    break
+            self._mark_indexed()
+            self._untrack_sorted(removed)
+            if resort:
+                self._resort_locked()
+            return removed
 
     async def bulk_remove(
         self, recipe_ids: Iterable[str], *, resort: bool = False
@@ -107,6 +556,9 @@ class RecipeCache:
             self.raw_data = [
                 item for item in self.raw_data if str(item.get("id")) not in id_set
             ]
+            self._revision += 1
+            for item in removed:
+                self._untrack_sorted(item)
             if resort:
                 self._resort_locked()
             return removed
@@ -117,22 +569,29 @@ class RecipeCache:
         """Replace cached data for a recipe."""
 
         async with self._lock:
-            for index, recipe in enumerate(self.raw_data):
-                if str(recipe.get("id")) == str(recipe_id):
-                    self.raw_data[index] = new_data
-                    if resort:
-                        self._resort_locked()
-                    return True
-        return False
+            if self._find_locked(recipe_id) is None:
+                return False
+
+            key = str(recipe_id)
+            position = self._position_of(key)
+            self._untrack_sorted(self.raw_data[position])
+            self.raw_data[position] = new_data
+            self._revision += 1
+            self._track_sorted(new_data)
+            self._unindex_recipe(key)
+            self._index_recipe(new_data)
+            if _recipe_key(new_data) != key:
+                self._positions = None
+            if resort:
+                self._resort_locked(touched=(new_data,))
+            return True
 
     async def get_recipe(self, recipe_id: str) -> Optional[Dict[str, Any]]:
         """Return a shallow copy of a cached recipe."""
 
         async with self._lock:
-            for recipe in self.raw_data:
-                if str(recipe.get("id")) == str(recipe_id):
-                    return dict(recipe)
-        return None
+            recipe = self._find_locked(recipe_id)
+            return dict(recipe) if recipe is not None else None
 
     async def snapshot(self) -> List[Dict[str, Any]]:
         """Return a copy of all cached recipes."""
@@ -140,19 +599,23 @@ class RecipeCache:
         async with self._lock:
             return [dict(item) for item in self.raw_data]
 
-    def _resort_locked(self, name_only: bool = False) -> None:
-        """Sort cached views. Caller must hold ``_lock``."""
+    def _resort_locked(
+        self, name_only: bool = False, touched: Iterable[Dict[str, Any]] = ()
+    ) -> None:
+        """Bring cached views up to date for ``touched``. Caller must hold ``_lock``.
 
-        self.sorted_by_name = natsorted(
-            self.raw_data,
-            key=lambda x: (x.get("title", "").lower(), x.get("file_path", "").lower()),
-        )
-        if not name_only:
-            self.sorted_by_date = sorted(
-                self.raw_data,
-                key=lambda x: (
-                    x.get("modified", x.get("created_date", 0)),
-                    x.get("file_path", ""),
-                ),
-                reverse=True,
-            )
+        Mutators pass the recipes they changed, so only those are checked;
+        diffing all of ``raw_data`` is left to ``sync_sorted_views`` and
+        ``resort``. Both views are patched incrementally, so ``name_only`` no
+        longer saves any work; it is kept for existing callers.
+        """
+
+        if not self._sorted_views_current():
+            self.rebuild_sorted_views()
+            return
+        changed = []
+        for recipe in touched:
+            record = self._sort_entries.get(id(recipe))
+            if record is not None and record[1] != self._sort_signature(recipe):
+                changed.append(recipe)
+        self._apply_sort_changes(changed, [])
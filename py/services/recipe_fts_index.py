@@ -16,6 +16,7 @@ import time
 from typing import Any, Dict, List, Optional, Set
 
 from ..utils.cache_paths import CacheType, resolve_cache_path_with_migration
+from .sqlite_executor import configure_connection
 
 logger = logging.getLogger(__name__)
 
@@ -482,7 +483,7 @@ class RecipeFTSIndex:
             uri = True
         conn = sqlite3.connect(path, check_same_thread=False, uri=uri)
         conn.row_factory = sqlite3.Row
-        return conn
+        return configure_connection(conn, readonly=readonly)
 
     def _remove_recipe_locked(self, conn: sqlite3.Connection, recipe_id: str) -> None:
         """Remove a recipe entry. Caller must hold the lock."""
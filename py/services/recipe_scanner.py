@@ -94,12 +94,16 @@ class RecipeScanner:
             self._mutation_lock = asyncio.Lock()
             self._post_scan_task: Optional[asyncio.Task[Any]] = None
             self._resort_tasks: Set[asyncio.Task[Any]] = set()
+            self._resort_pending = False
             self._cancel_requested = False
             # FTS index for fast search
             self._fts_index: Optional[RecipeFTSIndex] = None
             self._fts_index_task: Optional[asyncio.Task[Any]] = None
             # Persistent cache for fast startup
             self._persistent_cache: Optional[PersistentRecipeCache] = None
+            # Persistent cache and FTS writes run on worker threads; the lock
+            # keeps them in the order the mutations were made
+            self._index_write_lock = asyncio.Lock()
             self._civitai_client: Any = None  # Lazily initialized from registry
             self._json_path_map: Dict[str, str] = {}  # recipe_id -> json_path
             if lora_scanner:
@@ -124,6 +128,13 @@ class RecipeScanner:
             self._local_filename_cache: dict[str, list[dict[str, Any]]] | None = None
             self._local_filename_cache_versions: tuple[int, int] | None = None
             self._local_filename_cache_lock = asyncio.Lock()
+            # The server loop owning the cache; other threads hand work to it
+            try:
+                loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            self._loop = loop
+            self.loop = loop
             self._initialized = True
 
     async def build_local_hash_cache(self) -> dict[str, dict[str, Any]]:
@@ -493,6 +504,7 @@ class RecipeScanner:
             if not task.done():
                 task.cancel()
         self._resort_tasks.clear()
+        self._resort_pending = False
 
         if self._post_scan_task and not self._post_scan_task.done():
             self._post_scan_task.cancel()
@@ -649,9 +661,7 @@ class RecipeScanner:
         async with self._mutation_lock:
             # Get raw recipe from cache directly to avoid formatted fields
             cache = await self.get_cached_data()
-            recipe = next(
-                (r for r in cache.raw_data if str(r.get("id", "")) == recipe_id), None
-            )
+            recipe = self._find_cached_recipe(cache, recipe_id)
 
             if not recipe:
                 raise RecipeNotFoundError(f"Recipe {recipe_id} not found")
@@ -801,9 +811,7 @@ class RecipeScanner:
         async with self._mutation_lock:
             # Get raw recipe from cache directly to avoid formatted fields
             cache = await self.get_cached_data()
-            recipe = next(
-                (r for r in cache.raw_data if str(r.get("id", "")) == recipe_id), None
-            )
+            recipe = self._find_cached_recipe(cache, recipe_id)
 
             if not recipe:
                 raise RecipeNotFoundError(f"Recipe {recipe_id} not found")
@@ -1000,7 +1008,7 @@ class RecipeScanner:
                 f"Failed to persist recipe {recipe.get('id')} after rematch"
             )
 
-        self._update_fts_index_for_recipe(recipe, "update")
+        await self._run_index_write(self._update_fts_index_for_recipe, recipe, "update")
         return (rematched, 0, details)
 
     async def rematch_all_recipes(
@@ -1343,6 +1351,7 @@ class RecipeScanner:
             # globally if needed, effectively overwriting it in-place.
             recipe.clear()
             recipe.update(clean_recipe)
+            self._reindex_cached_recipe(recipe)
 
             # 3. Save JSON
             with open(recipe_json_path, "w", encoding="utf-8") as f:
@@ -1350,7 +1359,9 @@ class RecipeScanner:
 
             # 4. Update persistent SQLite cache
             if self._persistent_cache:
-                self._persistent_cache.update_recipe(recipe, recipe_json_path)
+                await self._run_index_write(
+                    self._persistent_cache.update_recipe, recipe, recipe_json_path
+                )
                 self._json_path_map[str(recipe_id)] = recipe_json_path
 
             # 5. Update EXIF if image exists
@@ -1365,6 +1376,12 @@ class RecipeScanner:
             logger.error(f"Error persisting recipe {recipe_id}: {e}")
             return False
 
+    def _reindex_cached_recipe(self, recipe: Dict[str, Any]) -> None:
+        """Refresh the cache's lookup indexes after editing ``recipe`` in place."""
+
+        if isinstance(self._cache, RecipeCache):
+            self._cache.reindex_recipe(recipe)
+
     def _sanitize_recipe_for_storage(self, recipe: Dict[str, Any]) -> Dict[str, Any]:
         """Create a clean copy of the recipe without runtime convenience fields."""
         import copy
@@ -1841,6 +1858,9 @@ class RecipeScanner:
         """Sort cache data synchronously."""
         if self._cache is None:
             return
+        if isinstance(self._cache, RecipeCache):
+            self._cache.rebuild_sorted_views()
+            return
         try:
             # Sort by name
             self._cache.sorted_by_name = natsorted(
@@ -2067,6 +2087,14 @@ class RecipeScanner:
         except Exception as exc:
             logger.debug("Failed to update FTS index for recipe: %s", exc)
 
+    async def _run_index_write(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Run a blocking persistent cache or FTS index write on a worker thread.
+
+        Writes are serialised so they reach SQLite in the order they were made.
+        """
+        async with self._index_write_lock:
+            await asyncio.to_thread(fn, *args)
+
     @staticmethod
     def _normalize_recipe_gen_params(recipe_data: Dict[str, Any]) -> Dict[str, Any]:
         """Return a recipe copy with normalized generation parameter aliases added."""
@@ -2104,6 +2132,7 @@ class RecipeScanner:
             try:
                 metadata_updated = await self._update_lora_information(recipe)
                 if metadata_updated:
+                    self._reindex_cached_recipe(recipe)
                     recipe_id = recipe.get("id")
                     if recipe_id:
                         recipe_path = os.path.join(
@@ -2149,7 +2178,14 @@ class RecipeScanner:
         # Keep folder metadata up to date alongside sort order
         self._update_folder_metadata()
 
+        # A resort that has not started yet will see this change as well, so
+        # bursts of edits (a batch import) share one resort
+        if getattr(self, "_resort_pending", False):
+            return
+        self._resort_pending = True
+
         async def _resort_wrapper() -> None:
+            self._resort_pending = False
             try:
                 await cache.resort(name_only=name_only)
             except Exception as exc:  # pragma: no cover - defensive logging
@@ -2230,6 +2266,32 @@ class RecipeScanner:
         self._update_folder_metadata(cache)
         return cache.folder_tree or {}
 
+    async def get_state_token(self, sort_by: Optional[str] = None) -> Optional[Tuple[Any, ...]]:
+        """Return a token that changes whenever recipe listings may change.
+
+        Covers the recipe cache, the model caches recipes are enriched from
+        and the settings. ``None`` means the state cannot be captured: the
+        "opened" sort follows open statistics kept outside the cache.
+        """
+
+        if sort_by and sort_by.split(":")[0] == "opened":
+            return None
+        cache = await self.get_cached_data()
+        if not isinstance(cache, RecipeCache):
+            return None
+
+        from .settings_manager import get_settings_manager
+
+        return (
+            id(cache),
+            cache.revision,
+            id(cache.raw_data),
+            len(cache.raw_data),
+            getattr(getattr(self, "_lora_scanner", None), "cache_version", None),
+            getattr(getattr(self, "_checkpoint_scanner", None), "cache_version", None),
+            getattr(get_settings_manager(), "revision", None),
+        )
+
     @property
     def recipes_dir(self) -> str:
         """Get path to recipes directory"""
@@ -2355,7 +2417,7 @@ class RecipeScanner:
         self._schedule_resort()
 
         # Update FTS index
-        self._update_fts_index_for_recipe(recipe_data, "add")
+        await self._run_index_write(self._update_fts_index_for_recipe, recipe_data, "add")
 
         source = recipe_data.get("source_path")
         if source:
@@ -2369,10 +2431,16 @@ class RecipeScanner:
 
         # Persist to SQLite cache
         if self._persistent_cache:
+            persistent_cache = self._persistent_cache
             recipe_id = str(recipe_data.get("id", ""))
             json_path = self._json_path_map.get(recipe_id, "")
-            self._persistent_cache.update_recipe(recipe_data, json_path)
-            self._persistent_cache.save_image_id_map(cache.image_id_map)
+            image_id_map = dict(cache.image_id_map)
+
+            def _persist() -> None:
+                persistent_cache.update_recipe(recipe_data, json_path)
+                persistent_cache.save_image_id_map(image_id_map)
+
+            await self._run_index_write(_persist)
 
     async def remove_recipe(self, recipe_id: str) -> bool:
         """Remove a recipe from the cache by ID."""
@@ -2389,7 +2457,7 @@ class RecipeScanner:
         self._schedule_resort()
 
         # Update FTS index
-        self._update_fts_index_for_recipe(recipe_id, "remove")
+        await self._run_index_write(self._update_fts_index_for_recipe, recipe_id, "remove")
 
         # Remove any image_id entry pointing to this recipe
         stale = [k for k, v in cache.image_id_map.items() if v == recipe_id]
@@ -2398,8 +2466,14 @@ class RecipeScanner:
 
         # Remove from SQLite cache
         if self._persistent_cache:
-            self._persistent_cache.remove_recipe(recipe_id)
-            self._persistent_cache.save_image_id_map(cache.image_id_map)
+            persistent_cache = self._persistent_cache
+            image_id_map = dict(cache.image_id_map)
+
+            def _persist() -> None:
+                persistent_cache.remove_recipe(recipe_id)
+                persistent_cache.save_image_id_map(image_id_map)
+
+            await self._run_index_write(_persist)
             self._json_path_map.pop(recipe_id, None)
 
         return True
@@ -2416,15 +2490,22 @@ class RecipeScanner:
                 del cache.image_id_map[k]
 
             self._schedule_resort()
-            for recipe in removed:
-                recipe_id = str(recipe.get("id", ""))
-                self._update_fts_index_for_recipe(recipe_id, "remove")
-                if self._persistent_cache:
-                    self._persistent_cache.remove_recipe(recipe_id)
+            removed_id_list = [str(recipe.get("id", "")) for recipe in removed]
+            persistent_cache = self._persistent_cache
+            image_id_map = dict(cache.image_id_map)
+
+            def _persist() -> None:
+                for recipe_id in removed_id_list:
+                    self._update_fts_index_for_recipe(recipe_id, "remove")
+                    if persistent_cache:
+                        persistent_cache.remove_recipe(recipe_id)
+                if persistent_cache:
+                    persistent_cache.save_image_id_map(image_id_map)
+
+            await self._run_index_write(_persist)
+            if persistent_cache:
+                for recipe_id in removed_id_list:
                     self._json_path_map.pop(recipe_id, None)
-
-            if self._persistent_cache:
-                self._persistent_cache.save_image_id_map(cache.image_id_map)
         return len(removed)
 
     async def scan_all_recipes(self) -> List[Dict[str, Any]]:
@@ -3046,13 +3127,14 @@ class RecipeScanner:
         """
         cache = await self.get_cached_data()
 
-        # Get base dataset
+        # Get base dataset. The maintained views are only read (every filter
+        # below builds a new list), so they are not copied up front.
         sort_field = sort_by.split(":")[0] if ":" in sort_by else sort_by
 
         if sort_field == "date":
-            filtered_data = list(cache.sorted_by_date)
+            filtered_data = cache.sorted_by_date
         elif sort_field == "name":
-            filtered_data = list(cache.sorted_by_name)
+            filtered_data = cache.sorted_by_name
         else:
             filtered_data = list(cache.raw_data)
 
@@ -3073,7 +3155,15 @@ class RecipeScanner:
 
         # Special case: Filter by LoRA hash (takes precedence if bypass_filters is True)
         if lora_hash:
-            # Filter recipes that contain this LoRA hash
+            # Filter recipes that contain this LoRA hash; the cache index
+            # narrows the view and the stored hashes are still checked
+            if isinstance(cache, RecipeCache):
+                recipe_ids = cache.recipe_ids_with_lora(lora_hash)
+                filtered_data = [
+                    item
+                    for item in filtered_data
+                    if str(item.get("id")) in recipe_ids
+                ]
             filtered_data = [
                 item
                 for item in filtered_data
@@ -3090,6 +3180,15 @@ class RecipeScanner:
             # Otherwise continue with normal filtering after applying LoRA hash filter
         elif checkpoint_hash:
             normalized_checkpoint_hash = checkpoint_hash.lower()
+            if isinstance(cache, RecipeCache):
+                recipe_ids = cache.recipe_ids_with_checkpoint(
+                    normalized_checkpoint_hash
+                )
+                filtered_data = [
+                    item
+                    for item in filtered_data
+                    if str(item.get("id")) in recipe_ids
+                ]
             filtered_data = [
                 item
                 for item in filtered_data
@@ -3137,7 +3236,9 @@ class RecipeScanner:
                     }
 
                 # Try FTS search first if available (much faster)
-                fts_matching_ids = self._search_with_fts(search, search_options)
+                fts_matching_ids = await asyncio.to_thread(
+                    self._search_with_fts, search, search_options
+                )
                 if fts_matching_ids is not None:
                     # FTS search succeeded, filter by matching IDs
                     filtered_data = [
@@ -3214,26 +3315,18 @@ class RecipeScanner:
                             if not matches_exclude(item.get("tags"))
                         ]
 
-        # Apply sorting if not already handled by pre-sorted cache
+        # Apply sorting if not already handled by pre-sorted cache. Name and
+        # date orders come from the cache views (ascending by name, newest
+        # first), so the opposite direction is read back to front.
+        read_reversed = False
         if ":" in sort_by or sort_field in ("loras_count", "random", "opened"):
             field, order = (sort_by.split(":") + ["desc"])[:2]
             reverse = order.lower() == "desc"
 
             if field == "name":
-                filtered_data = natsorted(
-                    filtered_data,
-                    key=lambda x: x.get("title", "").lower(),
-                    reverse=reverse,
-                )
+                read_reversed = reverse
             elif field == "date":
-                # Use modified if available, falling back to created_date
-                filtered_data.sort(
-                    key=lambda x: (
-                        x.get("modified", x.get("created_date", 0)),
-                        x.get("file_path", ""),
-                    ),
-                    reverse=reverse,
-                )
+                read_reversed = not reverse
             elif field == "opened":
                 # "Recently Opened" view: recipes never opened are hidden.
                 # The open stats live outside recipe metadata; see
@@ -3265,9 +3358,16 @@ class RecipeScanner:
         end_idx = min(start_idx + page_size, total_items)
 
         # Get paginated items
+        if start_idx >= end_idx:
+            page_slice = []
+        elif read_reversed:
+            page_slice = filtered_data[
+                total_items - end_idx : total_items - start_idx
+            ][::-1]
+        else:
+            page_slice = filtered_data[start_idx:end_idx]
         paginated_items = [
-            self._normalize_recipe_gen_params(item)
-            for item in filtered_data[start_idx:end_idx]
+            self._normalize_recipe_gen_params(item) for item in page_slice
         ]
 
         # Add inLibrary information and URLs for each recipe
@@ -3304,6 +3404,17 @@ class RecipeScanner:
 
         return result
 
+    @staticmethod
+    def _find_cached_recipe(cache: Any, recipe_id: Any) -> Optional[Dict[str, Any]]:
+        """Return the cached recipe object with ``recipe_id``, if any."""
+
+        if isinstance(cache, RecipeCache):
+            return cache.get_cached_recipe(recipe_id)
+        recipe_id = str(recipe_id)
+        return next(
+            (r for r in cache.raw_data if str(r.get("id", "")) == recipe_id), None
+        )
+
     async def get_recipe_by_id(self, recipe_id: str) -> Optional[Dict[str, Any]]:
         """Get a single recipe by ID with all metadata and formatted URLs
 
@@ -3320,9 +3431,7 @@ class RecipeScanner:
         cache = await self.get_cached_data()
 
         # Find the recipe with the specified ID
-        recipe = next(
-            (r for r in cache.raw_data if str(r.get("id", "")) == recipe_id), None
-        )
+        recipe = self._find_cached_recipe(cache, recipe_id)
 
         if not recipe:
             return None
@@ -3433,11 +3542,8 @@ class RecipeScanner:
             return None
 
         cache = await self.get_cached_data()
-        folder = ""
-        for item in cache.raw_data:
-            if str(item.get("id")) == str(recipe_id):
-                folder = item.get("folder") or ""
-                break
+        item = self._find_cached_recipe(cache, recipe_id)
+        folder = (item.get("folder") or "") if item else ""
 
         candidate = os.path.normpath(
             os.path.join(recipes_dir, folder, f"{recipe_id}.recipe.json")
@@ -3487,11 +3593,15 @@ class RecipeScanner:
                 self._schedule_resort()
 
             # Update FTS index
-            self._update_fts_index_for_recipe(recipe_data, "update")
+            await self._run_index_write(
+                self._update_fts_index_for_recipe, recipe_data, "update"
+            )
 
             # Update persistent SQLite cache
             if self._persistent_cache:
-                self._persistent_cache.update_recipe(recipe_data, recipe_json_path)
+                await self._run_index_write(
+                    self._persistent_cache.update_recipe, recipe_data, recipe_json_path
+                )
                 self._json_path_map[recipe_id] = recipe_json_path
 
             # If the recipe has an image, update its EXIF metadata
@@ -3573,11 +3683,13 @@ class RecipeScanner:
         self._schedule_resort()
 
         # Update FTS index
-        self._update_fts_index_for_recipe(recipe_data, "update")
+        await self._run_index_write(self._update_fts_index_for_recipe, recipe_data, "update")
 
         # Update persistent SQLite cache
         if self._persistent_cache:
-            self._persistent_cache.update_recipe(recipe_data, recipe_json_path)
+            await self._run_index_write(
+                self._persistent_cache.update_recipe, recipe_data, recipe_json_path
+            )
             self._json_path_map[recipe_id] = recipe_json_path
 
         updated_lora = dict(lora_entry)
@@ -3601,7 +3713,11 @@ class RecipeScanner:
         cache = await self.get_cached_data()
         matching_recipes: List[Dict[str, Any]] = []
 
-        for recipe in cache.raw_data:
+        if isinstance(cache, RecipeCache):
+            candidates = cache.recipes_with_lora(normalized_hash)
+        else:
+            candidates = cache.raw_data
+        for recipe in candidates:
             loras = recipe.get("loras", [])
             if any(
                 (entry.get("hash") or "").lower() == normalized_hash for entry in loras
@@ -3627,7 +3743,15 @@ class RecipeScanner:
         cache = await self.get_cached_data()
         matching_recipes: List[Dict[str, Any]] = []
 
-        for recipe in cache.raw_data:
+        # Checkpoints without a stored hash may resolve to one via the
+        # version index, so they remain candidates
+        if isinstance(cache, RecipeCache):
+            candidates = cache.recipes_with_checkpoint(
+                normalized_hash, include_unhashed=True
+            )
+        else:
+            candidates = cache.raw_data
+        for recipe in candidates:
             checkpoint = self._normalize_checkpoint_entry(recipe.get("checkpoint"))
             if not checkpoint:
                 continue
@@ -3738,7 +3862,11 @@ class RecipeScanner:
 
         # Find recipes that need updating from the cache
         recipes_to_update = []
-        for recipe in cache.raw_data:
+        if isinstance(cache, RecipeCache):
+            candidates = cache.recipes_with_lora(hash_value)
+        else:
+            candidates = cache.raw_data
+        for recipe in candidates:
             loras = recipe.get("loras", [])
             if not isinstance(loras, list):
                 continue
@@ -3776,7 +3904,9 @@ class RecipeScanner:
 
                     # Update persistent SQLite cache
                     if self._persistent_cache:
-                        self._persistent_cache.update_recipe(recipe, recipe_path)
+                        await self._run_index_write(
+                            self._persistent_cache.update_recipe, recipe, recipe_path
+                        )
                         self._json_path_map[recipe_id] = recipe_path
                 except Exception as e:
                     logger.error(f"Error updating recipe file {recipe_path}: {e}")
@@ -3805,7 +3935,11 @@ class RecipeScanner:
 
         # Find recipes with matching fingerprint
         matching_recipes = []
-        for recipe in cache.raw_data:
+        if isinstance(cache, RecipeCache):
+            candidates = cache.recipes_with_fingerprint(fingerprint)
+        else:
+            candidates = cache.raw_data
+        for recipe in candidates:
             if recipe.get("fingerprint") == fingerprint:
                 recipe_details = {
                     "id": recipe.get("id"),
@@ -3839,6 +3973,12 @@ class RecipeScanner:
         # Get all recipes from cache
         cache = await self.get_cached_data()
 
+        if not include_prompt and isinstance(cache, RecipeCache):
+            return {
+                fingerprint: [recipe.get("id") for recipe in recipes]
+                for fingerprint, recipes in cache.fingerprint_groups().items()
+            }
+
         # Group recipes by fingerprint (optionally combined with the prompt)
         fingerprint_groups = {}
         for recipe in cache.raw_data:
@@ -3891,6 +4031,12 @@ class RecipeScanner:
         """
         cache = await self.get_cached_data()
 
+        if isinstance(cache, RecipeCache):
+            return {
+                source_url: [recipe.get("id") for recipe in recipes]
+                for source_url, recipes in cache.source_path_groups().items()
+            }
+
         url_groups = {}
         for recipe in cache.raw_data:
             source_url = recipe.get("source_path", "").strip()
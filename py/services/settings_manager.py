@@ -132,6 +132,8 @@ class SettingsManager:
     def __init__(self):
         self.settings_file = ensure_settings_file(logger)
         self._pending_portable_switch: Optional[Dict[str, str]] = None
+        # Bumped on every change made through set()/delete()
+        self._revision = 0
         self._standalone_mode = self._detect_standalone_mode()
         self._startup_messages: List[Dict[str, Any]] = []
         self._needs_initial_save = False
@@ -533,6 +535,7 @@ class SettingsManager:
             "default_embedding_root", ""
         )
         self.settings["recipes_path"] = active_library.get("recipes_path", "")
+        self._revision += 1
 
         if save:
             self._save_settings()
@@ -1387,6 +1390,11 @@ class SettingsManager:
             suggestions[model_type] = collect_canonical_tags(entries)
         return suggestions
 
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever the settings are changed and saved."""
+        return self._revision
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get setting value"""
         return self.settings.get(key, default)
@@ -1836,6 +1844,9 @@ class SettingsManager:
 
     def _save_settings(self) -> None:
         """Save settings to file"""
+        # Every change made through the manager is saved, including library
+        # activation and switching, so this is where the revision moves
+        self._revision += 1
         try:
             payload = self._serialize_settings_for_disk()
             with open(self.settings_file, "w", encoding="utf-8") as f:
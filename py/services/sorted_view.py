@@ -0,0 +1,123 @@
+"""Sorted permutations of cache entries maintained by bisection.
+
+Caches keep one view per sort mode instead of re-sorting everything after
+each edit: an entry moves with a bisect removal plus insertion, and pages
+are read straight from ``items``.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Tuple, overload
+
+
+class SortedView:
+    """Ascending permutation of cache entries with their precomputed sort keys."""
+
+    __slots__ = ("keys", "items", "_shared")
+
+    def __init__(self, keys: List[Any], items: List[Dict[str, Any]]):
+        self.keys = keys
+        self.items = items
+        # Set once ``items`` is handed out by ``materialize``
+        self._shared = False
+
+    @classmethod
+    def build(cls, pairs: List[Tuple[Any, Dict[str, Any]]]) -> "SortedView":
+        order = sorted(range(len(pairs)), key=lambda index: pairs[index][0])
+        return cls(
+            [pairs[index][0] for index in order],
+            [pairs[index][1] for index in order],
+        )
+
+    def insert(self, key: Any, item: Dict[str, Any]) -> None:
+        position = bisect_right(self.keys, key)
+        self._unshare()
+        self.keys.insert(position, key)
+        self.items.insert(position, item)
+
+    def remove(self, key: Any, item: Dict[str, Any]) -> bool:
+        position = bisect_left(self.keys, key)
+        while position < len(self.keys) and self.keys[position] == key:
+            if self.items[position] is item:
+                self._unshare()
+                del self.keys[position]
+                del self.items[position]
+                return True
+            position += 1
+        return False
+
+    def materialize(self, reverse: bool) -> "SortedViewSnapshot":
+        """Return the current order without copying it.
+
+        The view copies ``items`` before its next edit instead, so the
+        snapshot stays stable and a page read from it only touches the page.
+        """
+        self._shared = True
+        return SortedViewSnapshot(self.items, reverse)
+
+    def _unshare(self) -> None:
+        if self._shared:
+            self.items = list(self.items)
+            self._shared = False
+
+
+class SortedViewSnapshot(Sequence):
+    """Read-only sequence over a view's items, optionally in reverse.
+
+    Slicing returns a list holding just the requested entries.
+    """
+
+    __slots__ = ("_items", "_reverse")
+
+    def __init__(self, items: List[Dict[str, Any]], reverse: bool):
+        self._items = items
+        self._reverse = reverse
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return reversed(self._items) if self._reverse else iter(self._items)
+
+    @overload
+    def __getitem__(self, key: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(self, key):
+        if not self._reverse:
+            return self._items[key]
+        last = len(self._items) - 1
+        if isinstance(key, slice):
+            return [self._items[last - index] for index in range(*key.indices(len(self._items)))]
+        if key < 0:
+            key += len(self._items)
+        if not 0 <= key <= last:
+            raise IndexError("snapshot index out of range")
+        return self._items[last - key]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class DescendingKey:
+    """Sort key wrapper that orders ``value`` from largest to smallest."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "DescendingKey") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DescendingKey) and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
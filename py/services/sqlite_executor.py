@@ -0,0 +1,300 @@
+"""Pooled, non-blocking access to the services' SQLite databases.
+
+The download queue, download history and model update services used to call
+``sqlite3`` directly from coroutines, so every query (and every fsync on
+commit) ran on the event loop.  :class:`SQLiteExecutor` moves that work off
+the loop: each database file gets one dedicated writer thread, which keeps
+writes serialised exactly as before, and a small pool of reader threads
+that query concurrently against the WAL snapshot.  Connections live as long
+as their thread, so pragmas are applied once and the per-connection
+statement cache keeps frequently used statements prepared.
+
+Callables receive the thread's connection as first argument::
+
+    rows = await executor.read(lambda conn: conn.execute(sql).fetchall())
+
+Writes are committed when the callable returns and rolled back when it
+raises.  Every call is timed per label (the callable's qualified name by
+default); :meth:`SQLiteExecutor.stats` exposes the numbers and calls slower
+than ``COMFYUI_SQLITE_SLOW_QUERY_MS`` are logged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_READERS = 2
+DEFAULT_SLOW_QUERY_MS = 250.0
+BUSY_TIMEOUT_MS = 5000
+# Negative values are KiB for ``PRAGMA cache_size``
+PAGE_CACHE_KIB = 8192
+# sqlite3's default is 128 prepared statements per connection
+STATEMENT_CACHE_SIZE = 256
+
+
+def _resolve_slow_query_seconds() -> float:
+    raw = os.environ.get("COMFYUI_SQLITE_SLOW_QUERY_MS")
+    if raw:
+        try:
+            return max(0.0, float(raw)) / 1000
+        except ValueError:
+            logger.warning("Ignoring invalid COMFYUI_SQLITE_SLOW_QUERY_MS value: %r", raw)
+    return DEFAULT_SLOW_QUERY_MS / 1000
+
+
+def _is_in_memory(db_path: str) -> bool:
+    return db_path == ":memory:" or db_path.startswith("file::memory:")
+
+
+def configure_connection(conn: sqlite3.Connection, *, readonly: bool = False) -> sqlite3.Connection:
+    """Apply the per-connection pragmas shared by all service databases.
+
+    ``journal_mode=WAL`` is persistent and set by whoever creates the
+    schema; the settings here only last for the connection's lifetime.
+    """
+
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    # Durable across application crashes in WAL mode, without an fsync per commit
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA cache_size = -{PAGE_CACHE_KIB}")
+    if readonly:
+        conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def open_connection(db_path: str, *, readonly: bool = False) -> sqlite3.Connection:
+    """Open a configured connection returning :class:`sqlite3.Row` rows."""
+
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        uri=db_path.startswith("file:"),
+    )
+    conn.row_factory = sqlite3.Row
+    return configure_connection(conn, readonly=readonly)
+
+
+def _label_for(fn: Callable[..., Any]) -> str:
+    label = getattr(fn, "__qualname__", None) or repr(fn)
+    return label.replace("<locals>.", "")
+
+
+class SQLiteExecutor:
+    """Run SQLite work for one database file on dedicated threads."""
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        readers: int = DEFAULT_READERS,
+        slow_query_seconds: Optional[float] = None,
+    ) -> None:
+        self._db_path = db_path
+        # Every connection to ``:memory:`` is a separate database, so reads
+        # must share the writer's connection
+        self._readers = 0 if _is_in_memory(db_path) else max(0, int(readers))
+        self._slow_query_seconds = (
+            _resolve_slow_query_seconds() if slow_query_seconds is None else slow_query_seconds
+        )
+        self._state_lock = threading.Lock()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._reader_pool: Optional[ThreadPoolExecutor] = None
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # label -> [calls, total seconds, slowest seconds, total queue wait seconds]
+        self._stats: Dict[str, List[float]] = {}
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    async def write(self, fn: Callable[..., T], *args: Any, label: Optional[str] = None) -> T:
+        """Run ``fn(conn, *args)`` on the writer thread and commit."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._writer_executor(), self._run, fn, args, label, True, time.perf_counter()
+        )
+
+    async def read(self, fn: Callable[..., T], *args: Any, label: Optional[str] = None) -> T:
+        """Run ``fn(conn, *args)`` on a reader thread."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._read_executor(), self._run, fn, args, label, False, time.perf_counter()
+        )
+
+    def write_sync(self, fn: Callable[..., T], *args: Any, label: Optional[str] = None) -> T:
+        """Blocking variant of :meth:`write` for synchronous call sites."""
+
+        future = self._writer_executor().submit(
+            self._run, fn, args, label, True, time.perf_counter()
+        )
+        return future.result()
+
+    def read_sync(self, fn: Callable[..., T], *args: Any, label: Optional[str] = None) -> T:
+        """Blocking variant of :meth:`read` for synchronous call sites."""
+
+        future = self._read_executor().submit(
+            self._run, fn, args, label, False, time.perf_counter()
+        )
+        return future.result()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return per-label call counts and latencies in milliseconds."""
+
+        with self._stats_lock:
+            snapshot = {label: list(values) for label, values in self._stats.items()}
+        return {
+            label: {
+                "calls": int(calls),
+                "total_ms": total * 1000,
+                "avg_ms": total * 1000 / calls,
+                "max_ms": slowest * 1000,
+                "avg_wait_ms": waited * 1000 / calls,
+            }
+            for label, (calls, total, slowest, waited) in snapshot.items()
+        }
+
+    def close(self) -> None:
+        """Finish queued work and close every connection.
+
+        The executor stays usable: the next call opens fresh threads and
+        connections.  Closing releases the database files, which Windows
+        requires before they can be deleted.
+        """
+
+        with self._state_lock:
+            pools = [pool for pool in (self._writer, self._reader_pool) if pool is not None]
+            self._writer = None
+            self._reader_pool = None
+            # Holding the state lock keeps new work out until the pools drained
+            for pool in pools:
+                pool.shutdown(wait=True)
+            with self._connections_lock:
+                connections, self._connections = self._connections, []
+            self._writer_conn = None
+            self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:  # pragma: no cover - defensive guard
+                logger.debug("Failed to close SQLite connection to %s", self._db_path, exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _writer_executor(self) -> ThreadPoolExecutor:
+        with self._state_lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lm-sqlite-writer")
+            return self._writer
+
+    def _read_executor(self) -> ThreadPoolExecutor:
+        if not self._readers:
+            return self._writer_executor()
+        with self._state_lock:
+            if self._reader_pool is None:
+                self._reader_pool = ThreadPoolExecutor(
+                    max_workers=self._readers, thread_name_prefix="lm-sqlite-reader"
+                )
+            return self._reader_pool
+
+    def _open(self, readonly: bool) -> sqlite3.Connection:
+        conn = open_connection(self._db_path, readonly=readonly)
+        if not readonly and not _is_in_memory(self._db_path):
+            conn.execute("PRAGMA journal_mode = WAL")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _connection(self, write: bool) -> sqlite3.Connection:
+        if write or not self._readers:
+            if self._writer_conn is None:
+                self._writer_conn = self._open(readonly=False)
+            return self._writer_conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open(readonly=True)
+            self._local.conn = conn
+        return conn
+
+    def _run(
+        self,
+        fn: Callable[..., T],
+        args: tuple,
+        label: Optional[str],
+        write: bool,
+        submitted_at: float,
+    ) -> T:
+        started_at = time.perf_counter()
+        conn = self._connection(write)
+        try:
+            result = fn(conn, *args)
+            if conn.in_transaction:
+                conn.commit()
+            return result
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._record(label or _label_for(fn), started_at - submitted_at, time.perf_counter() - started_at)
+
+    def _record(self, label: str, waited: float, elapsed: float) -> None:
+        with self._stats_lock:
+            entry = self._stats.get(label)
+            if entry is None:
+                self._stats[label] = [1, elapsed, elapsed, waited]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] = max(entry[2], elapsed)
+                entry[3] += waited
+        if elapsed >= self._slow_query_seconds:
+            logger.warning(
+                "Slow SQLite call %s on %s: %.1f ms (queued %.1f ms)",
+                label,
+                os.path.basename(self._db_path),
+                elapsed * 1000,
+                waited * 1000,
+            )
+
+
+_executors: "weakref.WeakValueDictionary[str, SQLiteExecutor]" = weakref.WeakValueDictionary()
+_executors_lock = threading.Lock()
+
+
+def get_sqlite_executor(db_path: str) -> SQLiteExecutor:
+    """Return the executor shared by everyone using ``db_path``.
+
+    Executors are dropped once no service references them any more.
+    """
+
+    if _is_in_memory(db_path):
+        return SQLiteExecutor(db_path)
+    key = os.path.normcase(os.path.abspath(db_path))
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            executor = SQLiteExecutor(db_path)
+            _executors[key] = executor
+        return executor
@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 from ..utils.cache_paths import CacheType, resolve_cache_path_with_migration
+from .sqlite_executor import configure_connection
 
 logger = logging.getLogger(__name__)
 
@@ -686,7 +687,7 @@ class TagFTSIndex:
             uri = True
         conn = sqlite3.connect(path, check_same_thread=False, uri=uri)
         conn.row_factory = sqlite3.Row
-        return conn
+        return configure_connection(conn, readonly=readonly)
 
     def _build_fts_query(self, query: str) -> str:
         """Build an FTS5 query string with prefix matching.
@@ -0,0 +1,320 @@
+"""Downscaled card thumbnails backed by a content-addressed disk cache.
+
+Model cards display previews at a few hundred pixels, but the files on disk
+are often full-size PNGs or multi-megabyte videos.  This service renders
+small WebP (or AVIF) thumbnails on demand and keeps them under
+``{settings_dir}/cache/thumbnail``.  Cache keys hash the resolved source path
+together with its modification time and size, so an edited or replaced
+preview automatically gets a fresh thumbnail and stale entries simply age
+out of the bounded cache.  Encoding runs in a dedicated worker pool so a
+page of cards never blocks the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, ImageOps, features
+
+from ..utils.cache_paths import get_cache_base_dir
+
+logger = logging.getLogger(__name__)
+
+# Requested widths are rounded up to one of these so that nearby sizes share
+# cache entries and arbitrary query values cannot fill the disk.
+THUMBNAIL_WIDTHS = (160, 240, 320, 480, 640, 960)
+DEFAULT_THUMBNAIL_WIDTH = 480
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024
+# Eviction trims the cache to this fraction of the limit to avoid thrashing
+_EVICTION_TARGET_RATIO = 0.9
+# Bump when the rendering changes so old cache entries are not reused
+_RENDER_VERSION = 1
+_FFMPEG_TIMEOUT_SECONDS = 15
+_MAX_FAILED_KEYS = 4096
+
+VIDEO_EXTENSIONS = frozenset({".mp4", ".webm", ".mov", ".avi", ".mkv"})
+
+# format name -> (file extension, PIL format, content type, save options)
+_FORMATS: Dict[str, Tuple[str, str, str, Dict[str, object]]] = {
+    "webp": (".webp", "WEBP", "image/webp", {"quality": 80, "method": 4}),
+    "avif": (".avif", "AVIF", "image/avif", {"quality": 60, "speed": 8}),
+}
+
+
+def snap_width(width: int) -> int:
+    """Return the smallest supported thumbnail width covering ``width``."""
+
+    for candidate in THUMBNAIL_WIDTHS:
+        if width <= candidate:
+            return candidate
+    return THUMBNAIL_WIDTHS[-1]
+
+
+def is_format_supported(fmt: str) -> bool:
+    if fmt not in _FORMATS:
+        return False
+    try:
+        return bool(features.check(fmt))
+    except Exception:  # pragma: no cover - depends on the Pillow build
+        return False
+
+
+def content_type_for(path: Path) -> str:
+    for extension, _pil_format, content_type, _options in _FORMATS.values():
+        if path.suffix == extension:
+            return content_type
+    return "application/octet-stream"
+
+
+class ThumbnailService:
+    """Render and cache preview thumbnails."""
+
+    _instance: Optional["ThumbnailService"] = None
+    _instance_lock = asyncio.Lock()
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        max_workers: Optional[int] = None,
+        ffmpeg_path: Optional[str] = None,
+    ) -> None:
+        self._cache_dir = Path(cache_dir or os.path.join(get_cache_base_dir(create=True), "thumbnail"))
+        self._max_bytes = max(0, int(max_bytes))
+        workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lm-thumbnail")
+        self._workers = workers
+        self._ffmpeg_path = ffmpeg_path if ffmpeg_path is not None else shutil.which("ffmpeg")
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._failed: set[str] = set()
+        self._cache_bytes: Optional[int] = None
+        self._evicting = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    async def get_instance(cls) -> "ThumbnailService":
+        async with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def cache_path_for(self, source: Path, width: int, fmt: str = "webp") -> Optional[Path]:
+        """Return where the thumbnail for ``source`` is cached, or ``None`` if it is missing."""
+
+        try:
+            stat = source.stat()
+        except OSError:
+            return None
+        key_source = "|".join(
+            (str(_RENDER_VERSION), str(source), str(stat.st_mtime_ns), str(stat.st_size), str(width), fmt)
+        )
+        key = hashlib.sha1(key_source.encode("utf-8")).hexdigest()
+        return self._cache_dir / key[:2] / f"{key}{_FORMATS[fmt][0]}"
+
+    async def get_thumbnail(self, source: Path, width: int, fmt: str = "webp") -> Optional[Path]:
+        """Return a cached thumbnail for ``source``, rendering it if needed.
+
+        ``None`` means no thumbnail could be produced (an unreadable image or
+        a video without ``ffmpeg``); callers should fall back to the original.
+        """
+
+        if not is_format_supported(fmt):
+            fmt = "webp"
+        width = snap_width(width)
+        target = self.cache_path_for(source, width, fmt)
+        if target is None:
+            return None
+        key = target.stem
+        if key in self._failed:
+            return None
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            if target.is_file():
+                self.hits += 1
+                self._touch(target)
+                return target
+            self.misses += 1
+            loop = asyncio.get_running_loop()
+            pending = loop.run_in_executor(self._executor, self._render, source, target, width, fmt)
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _future, key=key: self._inflight.pop(key, None))
+            written = await asyncio.shield(pending)
+            await self._account(written)
+        else:
+            written = await asyncio.shield(pending)
+
+        if not written:
+            if len(self._failed) >= _MAX_FAILED_KEYS:
+                self._failed.clear()
+            self._failed.add(key)
+            return None
+        return target
+
+    async def prewarm(self, sources: Iterable[Path], width: int = DEFAULT_THUMBNAIL_WIDTH) -> int:
+        """Render thumbnails for ``sources`` ahead of the first page load.
+
+        Returns the number of thumbnails available afterwards.
+        """
+
+        semaphore = asyncio.Semaphore(self._workers)
+
+        async def _warm(source: Path) -> bool:
+            async with semaphore:
+                try:
+                    # Resolve like the preview route so both share cache keys
+                    resolved = source.expanduser().resolve(strict=False)
+                    return await self.get_thumbnail(resolved, width) is not None
+                except Exception as exc:  # pragma: no cover - defensive guard
+                    logger.debug("Failed to pre-warm thumbnail for %s: %s", source, exc)
+                    return False
+
+        normalized = (Path(str(source).replace("\\", "/")) for source in sources)
+        results = await asyncio.gather(*(_warm(source) for source in normalized))
+        return sum(1 for result in results if result)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "cache_bytes": self._cache_bytes,
+            "max_bytes": self._max_bytes,
+            "video_posters": bool(self._ffmpeg_path),
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        # The cache is evicted by modification time, so a hit refreshes it
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _render(self, source: Path, target: Path, width: int, fmt: str) -> int:
+        """Encode ``source`` into ``target`` and return the bytes written."""
+
+        extension, pil_format, _content_type, options = _FORMATS[fmt]
+        try:
+            if source.suffix.lower() in VIDEO_EXTENSIONS:
+                image = self._extract_video_frame(source)
+                if image is None:
+                    return 0
+            else:
+                image = Image.open(source)
+                # JPEG can decode straight at a reduced scale
+                image.draft("RGB", (width, width * 4))
+
+            with image:
+                # Animated GIF/WebP previews use their first frame
+                image.seek(0)
+                frame = ImageOps.exif_transpose(image) or image
+                if frame.mode not in ("RGB", "RGBA"):
+                    frame = frame.convert("RGBA" if "A" in frame.getbands() or "transparency" in frame.info else "RGB")
+                if frame.width > width:
+                    height = max(1, round(frame.height * width / frame.width))
+                    frame = frame.resize((width, height), Image.LANCZOS)
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = target.with_name(f"{target.stem}.{os.getpid()}.tmp{extension}")
+                frame.save(temp_path, format=pil_format, **options)
+            os.replace(temp_path, target)
+            return target.stat().st_size
+        except Exception as exc:
+            logger.debug("Failed to render thumbnail for %s: %s", source, exc)
+            return 0
+
+    def _extract_video_frame(self, source: Path) -> Optional[Image.Image]:
+        if not self._ffmpeg_path:
+            return None
+        command = [
+            self._ffmpeg_path,
+            "-v", "error",
+            "-i", str(source),
+            "-frames:v", "1",
+            "-f", "image2pipe",
+            "-vcodec", "png",
+            "-",
+        ]
+        try:
+            completed = subprocess.run(
+                command,
+                capture_output=True,
+                timeout=_FFMPEG_TIMEOUT_SECONDS,
+                check=True,
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            logger.debug("ffmpeg could not extract a poster from %s: %s", source, exc)
+            return None
+        if not completed.stdout:
+            return None
+        return Image.open(io.BytesIO(completed.stdout))
+
+    async def _account(self, written: int) -> None:
+        if not written:
+            return
+        loop = asyncio.get_running_loop()
+        if self._cache_bytes is None:
+            self._cache_bytes = await loop.run_in_executor(self._executor, self._measure_cache)
+        else:
+            self._cache_bytes += written
+        if self._cache_bytes > self._max_bytes and not self._evicting:
+            self._evicting = True
+            try:
+                await loop.run_in_executor(self._executor, self._evict)
+            finally:
+                self._evicting = False
+
+    def _list_entries(self) -> List[Tuple[float, int, Path]]:
+        entries: List[Tuple[float, int, Path]] = []
+        if not self._cache_dir.is_dir():
+            return entries
+        for shard in self._cache_dir.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in shard.iterdir():
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+        return entries
+
+    def _measure_cache(self) -> int:
+        return sum(size for _mtime, size, _path in self._list_entries())
+
+    def _evict(self) -> None:
+        """Delete least recently used thumbnails until the cache fits again."""
+
+        entries = sorted(self._list_entries(), key=lambda entry: entry[0])
+        total = sum(size for _mtime, size, _path in entries)
+        target = int(self._max_bytes * _EVICTION_TARGET_RATIO)
+        for _mtime, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self._cache_bytes = total
@@ -0,0 +1,331 @@
+"""SQLite storage for model usage statistics.
+
+Usage counts used to live in ``lora_manager_stats.json``, which was
+rewritten in full on every save and carried a per-day history for every
+model ever used.  This store keeps an append-only ``usage_events`` log and
+maintains three rollups next to it: per-model totals, daily counts and
+weekly counts.  :meth:`UsageStatsStore.record` inserts only the events
+gathered since the previous flush and bumps the matching rollup rows in the
+same transaction, so a save costs O(new events).  Top-N lists and timelines
+are answered from the indexed rollups instead of walking every history.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .sqlite_executor import get_sqlite_executor
+
+CATEGORIES = ("loras", "checkpoints", "embeddings")
+
+# (category, sha256, YYYY-MM-DD day) -> number of uses
+UsageKey = Tuple[str, str, str]
+
+
+def week_start(day: str) -> str:
+    """Return the Monday starting the ISO week that contains ``day``."""
+
+    parsed = date.fromisoformat(day)
+    return (parsed - timedelta(days=parsed.weekday())).isoformat()
+
+
+class UsageStatsStore:
+    """Append-only usage log with incrementally maintained rollups."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS usage_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            day TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            recorded_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS usage_totals (
+            category TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            total INTEGER NOT NULL,
+            last_used_day TEXT,
+            PRIMARY KEY (category, sha256)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_usage_totals_rank
+            ON usage_totals(category, total DESC, sha256);
+        CREATE TABLE IF NOT EXISTS usage_daily (
+            category TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            day TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (category, sha256, day)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_usage_daily_day ON usage_daily(day, category);
+        CREATE TABLE IF NOT EXISTS usage_weekly (
+            category TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            week TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (category, sha256, week)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_usage_weekly_week ON usage_weekly(week, category);
+        CREATE TABLE IF NOT EXISTS usage_meta (
+            key TEXT PRIMARY KEY,
+            value REAL NOT NULL
+        );
+    """
+
+    _TABLES = ("usage_events", "usage_totals", "usage_daily", "usage_weekly", "usage_meta")
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = get_sqlite_executor(db_path)
+        self._db.write_sync(lambda conn: conn.executescript(self._SCHEMA), label="usage_schema")
+
+    def get_database_path(self) -> str:
+        return self._db_path
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    async def record(
+        self,
+        counts: Mapping[UsageKey, int],
+        executions: int = 0,
+        recorded_at: Optional[float] = None,
+    ) -> None:
+        """Append ``counts`` to the event log and fold them into the rollups."""
+
+        recorded_at = time.time() if recorded_at is None else recorded_at
+        await self._db.write(self._record, dict(counts), executions, recorded_at)
+
+    def import_legacy(self, stats: Mapping[str, Any]) -> int:
+        """Replace the store's contents with a legacy JSON snapshot.
+
+        Each day of a model's ``history`` becomes one event.  Totals are
+        taken from ``total`` because converted pre-history files carry
+        counts without a matching day.  Returns the number of models
+        imported.
+        """
+
+        return self._db.write_sync(self._import_legacy, stats)
+
+    def _record(
+        self,
+        conn: sqlite3.Connection,
+        counts: Dict[UsageKey, int],
+        executions: int,
+        recorded_at: float,
+    ) -> None:
+        rows = [(category, sha256, day, count) for (category, sha256, day), count in counts.items() if count]
+        conn.executemany(
+            "INSERT INTO usage_events (category, sha256, day, count, recorded_at) VALUES (?, ?, ?, ?, ?)",
+            [(*row, recorded_at) for row in rows],
+        )
+        self._apply_rollups(conn, rows, totals=None)
+        self._bump_meta(conn, "total_executions", executions)
+        self._set_meta(conn, "last_save_time", recorded_at)
+
+    def _import_legacy(self, conn: sqlite3.Connection, stats: Mapping[str, Any]) -> int:
+        for table in self._TABLES:
+            conn.execute(f"DELETE FROM {table}")
+
+        imported_at = time.time()
+        rows: List[Tuple[str, str, str, int]] = []
+        totals: Dict[Tuple[str, str], int] = {}
+        for category in CATEGORIES:
+            models = stats.get(category)
+            if not isinstance(models, Mapping):
+                continue
+            for sha256, entry in models.items():
+                if not isinstance(entry, Mapping):
+                    continue
+                history = entry.get("history")
+                if isinstance(history, Mapping):
+                    for day, count in history.items():
+                        if isinstance(day, str) and isinstance(count, int) and count > 0:
+                            rows.append((category, sha256, day, count))
+                total = entry.get("total")
+                if isinstance(total, int):
+                    totals[(category, sha256)] = total
+
+        conn.executemany(
+            "INSERT INTO usage_events (category, sha256, day, count, recorded_at) VALUES (?, ?, ?, ?, ?)",
+            [(*row, imported_at) for row in rows],
+        )
+        self._apply_rollups(conn, rows, totals=totals)
+        self._set_meta(conn, "total_executions", float(stats.get("total_executions") or 0))
+        self._set_meta(conn, "last_save_time", float(stats.get("last_save_time") or 0))
+        return len(totals)
+
+    @staticmethod
+    def _apply_rollups(
+        conn: sqlite3.Connection,
+        rows: Iterable[Tuple[str, str, str, int]],
+        *,
+        totals: Optional[Dict[Tuple[str, str], int]],
+    ) -> None:
+        model_counts: Dict[Tuple[str, str], List[Any]] = {}
+        weekly: Dict[Tuple[str, str, str], int] = {}
+        daily: List[Tuple[str, str, str, int]] = []
+        for category, sha256, day, count in rows:
+            daily.append((category, sha256, day, count))
+            week_key = (category, sha256, week_start(day))
+            weekly[week_key] = weekly.get(week_key, 0) + count
+            entry = model_counts.setdefault((category, sha256), [0, day])
+            entry[0] += count
+            entry[1] = max(entry[1], day)
+
+        if totals is not None:
+            for key, total in totals.items():
+                model_counts.setdefault(key, [0, None])[0] = total
+
+        conn.executemany(
+            """
+            INSERT INTO usage_daily (category, sha256, day, count) VALUES (?, ?, ?, ?)
+            ON CONFLICT(category, sha256, day) DO UPDATE SET count = count + excluded.count
+            """,
+            daily,
+        )
+        conn.executemany(
+            """
+            INSERT INTO usage_weekly (category, sha256, week, count) VALUES (?, ?, ?, ?)
+            ON CONFLICT(category, sha256, week) DO UPDATE SET count = count + excluded.count
+            """,
+            [(*key, count) for key, count in weekly.items()],
+        )
+        conn.executemany(
+            """
+            INSERT INTO usage_totals (category, sha256, total, last_used_day) VALUES (?, ?, ?, ?)
+            ON CONFLICT(category, sha256) DO UPDATE SET
+                total = total + excluded.total,
+                last_used_day = MAX(COALESCE(last_used_day, ''), excluded.last_used_day)
+            """,
+            [(category, sha256, total, last_day) for (category, sha256), (total, last_day) in model_counts.items()],
+        )
+
+    @staticmethod
+    def _bump_meta(conn: sqlite3.Connection, key: str, amount: float) -> None:
+        conn.execute(
+            """
+            INSERT INTO usage_meta (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = value + excluded.value
+            """,
+            (key, amount),
+        )
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: float) -> None:
+        conn.execute(
+            """
+            INSERT INTO usage_meta (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """,
+            (key, value),
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    async def get_meta(self, key: str, default: float = 0) -> float:
+        def _select(conn: sqlite3.Connection) -> float:
+            row = conn.execute("SELECT value FROM usage_meta WHERE key = ?", (key,)).fetchone()
+            return row["value"] if row else default
+
+        return await self._db.read(_select)
+
+    async def get_count(self, category: str, sha256: str) -> int:
+        def _select(conn: sqlite3.Connection) -> int:
+            row = conn.execute(
+                "SELECT total FROM usage_totals WHERE category = ? AND sha256 = ?",
+                (category, sha256),
+            ).fetchone()
+            return row["total"] if row else 0
+
+        return await self._db.read(_select)
+
+    async def get_totals(self, category: str) -> Dict[str, int]:
+        """Return ``{sha256: total}`` for every model used in ``category``."""
+
+        def _select(conn: sqlite3.Connection) -> Dict[str, int]:
+            rows = conn.execute(
+                "SELECT sha256, total FROM usage_totals WHERE category = ?",
+                (category,),
+            )
+            return {row["sha256"]: row["total"] for row in rows}
+
+        return await self._db.read(_select)
+
+    async def get_top(self, category: str, limit: int) -> List[Tuple[str, int]]:
+        """Return the ``limit`` most used models as ``(sha256, total)`` pairs."""
+
+        def _select(conn: sqlite3.Connection) -> List[Tuple[str, int]]:
+            rows = conn.execute(
+                """
+                SELECT sha256, total FROM usage_totals
+                WHERE category = ?
+                ORDER BY total DESC, sha256
+                LIMIT ?
+                """,
+                (category, limit),
+            )
+            return [(row["sha256"], row["total"]) for row in rows]
+
+        return await self._db.read(_select)
+
+    async def get_timeline(
+        self, first: str, last: str, *, weekly: bool = False
+    ) -> Dict[str, Dict[str, int]]:
+        """Return ``{bucket: {category: uses}}`` for buckets in ``[first, last]``.
+
+        Buckets are days, or week starts (Mondays) when ``weekly`` is set.
+        """
+
+        table, column = ("usage_weekly", "week") if weekly else ("usage_daily", "day")
+
+        def _select(conn: sqlite3.Connection) -> Dict[str, Dict[str, int]]:
+            rows = conn.execute(
+                f"""
+                SELECT {column} AS bucket, category, SUM(count) AS uses
+                FROM {table}
+                WHERE {column} BETWEEN ? AND ?
+                GROUP BY {column}, category
+                """,
+                (first, last),
+            )
+            timeline: Dict[str, Dict[str, int]] = {}
+            for row in rows:
+                timeline.setdefault(row["bucket"], {})[row["category"]] = row["uses"]
+            return timeline
+
+        return await self._db.read(_select)
+
+    async def export(self) -> Dict[str, Any]:
+        """Return everything in the legacy ``lora_manager_stats.json`` shape."""
+
+        def _select(conn: sqlite3.Connection) -> Dict[str, Any]:
+            exported: Dict[str, Any] = {category: {} for category in CATEGORIES}
+            for row in conn.execute("SELECT category, sha256, total FROM usage_totals"):
+                exported.setdefault(row["category"], {})[row["sha256"]] = {
+                    "total": row["total"],
+                    "history": {},
+                }
+            for row in conn.execute("SELECT category, sha256, day, count FROM usage_daily ORDER BY day"):
+                entry = exported.get(row["category"], {}).get(row["sha256"])
+                if entry is not None:
+                    entry["history"][row["day"]] = row["count"]
+            meta = {row["key"]: row["value"] for row in conn.execute("SELECT key, value FROM usage_meta")}
+            exported["total_executions"] = int(meta.get("total_executions", 0))
+            exported["last_save_time"] = meta.get("last_save_time", 0)
+            return exported
+
+        return await self._db.read(_select)
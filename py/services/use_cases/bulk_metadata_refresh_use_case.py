@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, Protocol, Sequence
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
 
+from ..errors import RateLimitError
 from ..metadata_sync_service import MetadataSyncService
+from ..model_scanner import ModelScanner
 from ...utils.metadata_manager import MetadataManager
 
+# Models looked up per batch hash request (the CivitAI by-hash limit)
+REFRESH_BATCH_SIZE = 100
+# Models hydrated and written concurrently within a batch
+REFRESH_CONCURRENCY = 4
+# Consecutive rate-limited models after which the refresh gives up
+RATE_LIMIT_ABORT_THRESHOLD = 3
+
 
 class MetadataRefreshProgressReporter(Protocol):
     """Protocol for progress reporters used during metadata refresh."""
@@ -17,6 +27,33 @@ class MetadataRefreshProgressReporter(Protocol):
         """Handle a metadata refresh progress update."""
 
 
+class _CacheUpdateBuffer:
+    """Collect per-model cache updates and apply them once per batch.
+
+    ``ModelScanner.update_single_model_cache`` re-sorts the whole cache on
+    every call; the real scanner gets the batched equivalent instead. Other
+    scanners receive the per-model updates unchanged.
+    """
+
+    def __init__(self, scanner) -> None:
+        self._scanner = scanner
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self._batched = isinstance(scanner, ModelScanner)
+        self.update_func = self._collect if self._batched else scanner.update_single_model_cache
+
+    async def _collect(self, original_path: str, new_path: str, metadata: Dict[str, Any]) -> bool:
+        if original_path != new_path:
+            return await self._scanner.update_single_model_cache(original_path, new_path, metadata)
+        self._pending.append((original_path, metadata))
+        return True
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        await self._scanner.update_models_cache_batch(pending)
+
+
 class BulkMetadataRefreshUseCase:
     """Coordinate bulk metadata refreshes with progress emission."""
 
@@ -101,16 +138,26 @@ class BulkMetadataRefreshUseCase:
 
         await emit("started")
 
-        RATE_LIMIT_ABORT_THRESHOLD = 3
         consecutive_rate_limits = 0
-
-        for model in to_process:
-            if self._service.scanner.is_cancelled():
-                self._logger.info("Bulk metadata refresh cancelled by user")
-                await emit("cancelled", processed=processed, success=success)
-                return {"success": False, "message": "Operation cancelled", "processed": processed, "updated": success, "total": total_models, "failures": failures, "failure_count": len(failures), "skipped_count": skipped_count, "elapsed_seconds": int(time.monotonic() - start_time)}
-            try:
-                original_name = model.get("model_name")
+        rate_limited = False
+        cancelled = False
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+        cache_updates = _CacheUpdateBuffer(self._service.scanner)
+
+        def check_cancelled() -> bool:
+            nonlocal cancelled
+            if not cancelled and self._service.scanner.is_cancelled():
+                cancelled = True
+            return cancelled
+
+        async def prepare(batch: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            """Resolve hashes for a batch, returning the models ready to fetch."""
+            nonlocal processed, skipped_count, handled_count
+
+            ready: List[Dict[str, Any]] = []
+            for model in batch:
+                if check_cancelled():
+                    break
 
                 # Handle lazy hash calculation for models with pending hash status
                 sha256 = model.get("sha256", "")
@@ -126,7 +173,6 @@ class BulkMetadataRefreshUseCase:
                         if sha256:
                             model["sha256"] = sha256
                             model["hash_status"] = "completed"
-                            hash_status = "completed"
                         else:
                             self._logger.error(f"Failed to calculate hash for {file_path}")
                             failures.append({"name": model.get("model_name", file_path or "Unknown"), "error": "Failed to calculate hash"})
@@ -148,23 +194,75 @@ class BulkMetadataRefreshUseCase:
                     handled_count += 1
                     continue
 
-                await MetadataManager.hydrate_model_data(model)
+                ready.append(model)
+            return ready
+
+        async def prefetch(models: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+            # Deleted models go straight to the archive providers, so only
+            # live CivitAI candidates are worth a batch lookup.
+            hashes = [
+                model["sha256"].lower()
+                for model in models
+                if model.get("civitai_deleted") is not True
+            ]
+            if not hashes or not isinstance(self._metadata_sync, MetadataSyncService):
+                return {}
+            try:
+                return await self._metadata_sync.prefetch_by_hashes(hashes)
+            except RateLimitError as exc:
+                # The per-model lookups below hit the same limit and drive the
+                # usual abort logic.
+                self._logger.warning("Batch hash lookup rate-limited: %s", exc)
+            except Exception as exc:  # pragma: no cover - logging path
+                self._logger.warning("Batch hash lookup failed: %s", exc)
+            return {}
+
+        async def refresh(model: Dict[str, Any], prefetched: Dict[str, Dict[str, Any]]) -> None:
+            nonlocal processed, success, handled_count, needs_resort
+            nonlocal consecutive_rate_limits, rate_limited
 
-                # hydrate_model_data replaces model with .metadata.json content,
-                # which may lack sha256. Restore from cache and persist the fix.
-                if not model.get("sha256"):
-                    model["sha256"] = sha256
-                    model["hash_status"] = model.get("hash_status", hash_status)
-                    data_to_save = model.copy()
-                    data_to_save.pop("folder", None)
-                    await MetadataManager.save_metadata(file_path, data_to_save)
-
-                result, error_msg = await self._metadata_sync.fetch_and_update_model(
-                    sha256=model["sha256"],
-                    file_path=model["file_path"],
-                    model_data=model,
-                    update_cache_func=self._service.scanner.update_single_model_cache,
-                )
+            async with semaphore:
+                if rate_limited or check_cancelled():
+                    return
+                original_name = model.get("model_name")
+                file_path = model.get("file_path")
+                try:
+                    sha256 = model["sha256"]
+                    hash_status = model.get("hash_status", "completed")
+                    await MetadataManager.hydrate_model_data(model)
+
+                    # hydrate_model_data replaces model with .metadata.json content,
+                    # which may lack sha256. Restore from cache and persist the fix.
+                    if not model.get("sha256"):
+                        model["sha256"] = sha256
+                        model["hash_status"] = model.get("hash_status", hash_status)
+                        data_to_save = model.copy()
+                        data_to_save.pop("folder", None)
+                        await MetadataManager.save_metadata(file_path, data_to_save)
+
+                    fetch_kwargs: Dict[str, Any] = {}
+                    prefetched_metadata = prefetched.get(model["sha256"].lower())
+                    if prefetched_metadata:
+                        fetch_kwargs["prefetched_metadata"] = prefetched_metadata
+
+                    result, error_msg = await self._metadata_sync.fetch_and_update_model(
+                        sha256=model["sha256"],
+                        file_path=model["file_path"],
+                        model_data=model,
+                        update_cache_func=cache_updates.update_func,
+                        **fetch_kwargs,
+                    )
+                except Exception as exc:  # pragma: no cover - logging path
+                    processed += 1
+                    handled_count += 1
+                    current_name = model.get("model_name", model.get("file_path", "Unknown"))
+                    failures.append({"name": current_name, "error": str(exc)})
+                    self._logger.error(
+                        "Error fetching CivitAI data for %s: %s",
+                        model.get("file_path"),
+                        exc,
+                    )
+                    return
 
                 if not result and error_msg and "Rate limited" in error_msg:
                     consecutive_rate_limits += 1
@@ -176,55 +274,87 @@ class BulkMetadataRefreshUseCase:
                     failures.append({"name": current_name, "error": error_msg or "Unknown error"})
                     self._logger.warning("Failed to fetch metadata for %s: %s", current_name, error_msg)
 
+                # The model was attempted even when it trips the abort below,
+                # so it counts as processed to keep the summary consistent.
+                processed += 1
+                handled_count += 1
+
                 if consecutive_rate_limits >= RATE_LIMIT_ABORT_THRESHOLD:
-                    # The current model was attempted and failed due to rate limiting;
-                    # count it before aborting so the summary is consistent.
-                    processed += 1
-                    handled_count += 1
-                    self._logger.warning(
-                        "Bulk metadata refresh aborted: %d consecutive rate limits detected. "
-                        "Processed %d/%d models.",
-                        consecutive_rate_limits,
-                        processed,
-                        total_to_process,
-                    )
-                    await emit(
-                        "rate_limited",
-                    )
-                    return {
-                        "success": False,
-                        "message": f"Rate limit detected; {total_to_process - processed} models skipped",
-                        "processed": processed,
-                        "updated": success,
-                        "total": total_models,
-                        "failures": failures,
-                        "failure_count": len(failures),
-                        "skipped_count": skipped_count,
-                        "elapsed_seconds": int(time.monotonic() - start_time),
-                    }
+                    rate_limited = True
+                    return
 
                 if result:
                     success += 1
                     if original_name != model.get("model_name"):
                         needs_resort = True
-                processed += 1
-                handled_count += 1
                 await emit(
                     "processing",
                     processed=processed,
                     success=success,
                     current_name=model.get("model_name", "Unknown"),
                 )
-            except Exception as exc:  # pragma: no cover - logging path
-                processed += 1
-                handled_count += 1
-                current_name = model.get("model_name", model.get("file_path", "Unknown"))
-                failures.append({"name": current_name, "error": str(exc)})
-                self._logger.error(
-                    "Error fetching CivitAI data for %s: %s",
-                    model.get("file_path"),
-                    exc,
-                )
+
+        async def prepare_then_prefetch(
+            batch: Sequence[Dict[str, Any]],
+        ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+            ready = await prepare(batch)
+            return ready, await prefetch(ready)
+
+        batches = [
+            to_process[start : start + REFRESH_BATCH_SIZE]
+            for start in range(0, len(to_process), REFRESH_BATCH_SIZE)
+        ]
+        next_batch: Optional[asyncio.Task] = None
+        if batches:
+            next_batch = asyncio.create_task(prepare_then_prefetch(batches[0]))
+        try:
+            for index in range(len(batches)):
+                if next_batch is None:
+                    break
+                current, prefetched = await next_batch
+                next_batch = None
+                # Hash and look up the next batch while this one is being applied
+                if index + 1 < len(batches) and not check_cancelled():
+                    next_batch = asyncio.create_task(prepare_then_prefetch(batches[index + 1]))
+
+                await asyncio.gather(*(refresh(model, prefetched) for model in current))
+                await cache_updates.flush()
+                if rate_limited or check_cancelled():
+                    break
+        finally:
+            if next_batch is not None and not next_batch.done():
+                next_batch.cancel()
+                # Let an interrupted hash unwind before the summary is built
+                await asyncio.gather(next_batch, return_exceptions=True)
+            await cache_updates.flush()
+
+        if rate_limited:
+            self._logger.warning(
+                "Bulk metadata refresh aborted: %d consecutive rate limits detected. "
+                "Processed %d/%d models.",
+                consecutive_rate_limits,
+                processed,
+                total_to_process,
+            )
+            await emit(
+                "rate_limited",
+            )
+            return {
+                "success": False,
+                "message": f"Rate limit detected; {total_to_process - processed} models skipped",
+                "processed": processed,
+                "updated": success,
+                "total": total_models,
+                "failures": failures,
+                "failure_count": len(failures),
+                "skipped_count": skipped_count,
+                "elapsed_seconds": int(time.monotonic() - start_time),
+            }
+
+        if cancelled:
+            self._logger.info("Bulk metadata refresh cancelled by user")
+            await emit("cancelled", processed=processed, success=success)
+            return {"success": False, "message": "Operation cancelled", "processed": processed, "updated": success, "total": total_models, "failures": failures, "failure_count": len(failures), "skipped_count": skipped_count, "elapsed_seconds": int(time.monotonic() - start_time)}
 
         if needs_resort:
             await cache.resort()
@@ -1,16 +1,141 @@
 import logging
+import os
 from aiohttp import web
-from typing import Set, Dict, Optional, Any
+from itertools import count
+from typing import Callable, Hashable, Iterable, Set, Dict, Optional, Any
 from uuid import uuid4
 import asyncio
 from datetime import datetime, timedelta
 
+from ..utils.http_responses import dumps_json
+
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between two flushes to the same client. Progress frames
+# published in between are coalesced so only the newest one per topic is sent.
+DEFAULT_PROGRESS_INTERVAL = 0.25
+# Frames queued for a client that cannot keep up; older ones are dropped
+MAX_PENDING_FRAMES = 512
+
+# Broadcast message types that report the latest state of an operation,
+# mapped to the payload field telling concurrent operations apart
+_PROGRESS_MESSAGE_TYPES: Dict[str, Optional[str]] = {
+    'auto_organize_progress': None,
+    'batch_import_progress': 'operation_id',
+    'example_images_progress': None,
+    'hash_progress': 'file_path',
+}
+
+
+def _resolve_progress_interval() -> float:
+    raw_value = os.environ.get('COMFYUI_WS_PROGRESS_INTERVAL')
+    try:
+        return max(0.0, float(raw_value)) if raw_value else DEFAULT_PROGRESS_INTERVAL
+    except ValueError:
+        return DEFAULT_PROGRESS_INTERVAL
+
+
+def _progress_topic(data: Dict[str, Any]) -> Optional[str]:
+    """Return the coalescing topic of a broadcast payload, if it reports progress."""
+    message_type = data.get('type')
+    if message_type not in _PROGRESS_MESSAGE_TYPES:
+        return None
+    field = _PROGRESS_MESSAGE_TYPES[message_type]
+    return f'{message_type}:{data.get(field)}' if field else message_type
+
+
+class _ClientChannel:
+    """Rate-limited outgoing frames for one WebSocket client.
+
+    Frames are queued per topic, so a newer frame replaces one the client has
+    not received yet, and a drain task sends them at most once per interval.
+    A slow client only delays itself: frames keep coalescing while its sends
+    wait for the socket to drain.
+
+    The queue and drain task belong to the loop serving the socket. Frames
+    published from another loop (e.g. a scan running in a worker thread) are
+    handed over to it, so the drain task never dies with a short-lived loop.
+    """
+
+    _unique_keys = count()
+
+    def __init__(
+        self,
+        ws: web.WebSocketResponse,
+        interval: float,
+        on_error: Callable[[web.WebSocketResponse], None],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self.ws = ws
+        self.interval = interval
+        self._on_error = on_error
+        self._loop = loop
+        self._pending: Dict[Hashable, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._next_flush_at = 0.0
+        self.dropped = 0
+
+    def publish(self, frame: str, topic: Optional[str] = None) -> None:
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._enqueue(frame, topic)
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._enqueue, frame, topic)
+        except RuntimeError:
+            # The serving loop is closed, so is the socket
+            logger.debug("Dropping WebSocket frame for a client whose loop is closed")
+
+    def _enqueue(self, frame: str, topic: Optional[str]) -> None:
+        key: Hashable = topic if topic is not None else ('frame', next(self._unique_keys))
+        if key in self._pending:
+            self.dropped += 1
+        elif len(self._pending) >= MAX_PENDING_FRAMES:
+            del self._pending[next(iter(self._pending))]
+            self.dropped += 1
+        self._pending[key] = frame
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._drain())
+
+    async def wait_idle(self) -> None:
+        while self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+    def close(self) -> None:
+        self._pending.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            delay = self._next_flush_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            frames = list(self._pending.values())
+            self._pending.clear()
+            self._next_flush_at = loop.time() + self.interval
+            try:
+                for frame in frames:
+                    await self.ws.send_str(frame)
+            except Exception as e:
+                logger.error(f"Error sending WebSocket frame: {e}")
+                self._pending.clear()
+                self._on_error(self.ws)
+                return
+
+
 class WebSocketManager:
     """Manages WebSocket connections and broadcasts"""
     
-    def __init__(self):
+    def __init__(self, progress_interval: Optional[float] = None):
+        self._progress_interval = (
+            _resolve_progress_interval() if progress_interval is None else max(0.0, progress_interval)
+        )
+        self._channels: Dict[web.WebSocketResponse, _ClientChannel] = {}
         self._websockets: Set[web.WebSocketResponse] = set()
         self._init_websockets: Set[web.WebSocketResponse] = set()  # New set for initialization progress clients
         self._download_websockets: Dict[str, web.WebSocketResponse] = {}  # New dict for download-specific clients
@@ -30,6 +155,7 @@ class WebSocketManager:
         """Handle new WebSocket connection"""
         ws = web.WebSocketResponse()
         await ws.prepare(request)
+        self._channel(ws)
         self._websockets.add(ws)
         
         try:
@@ -38,12 +164,14 @@ class WebSocketManager:
                     logger.error(f'WebSocket error: {ws.exception()}')
         finally:
             self._websockets.discard(ws)
+            self._close_channel(ws)
         return ws
     
     async def handle_init_connection(self, request: web.Request) -> web.WebSocketResponse:
         """Handle new WebSocket connection for initialization progress"""
         ws = web.WebSocketResponse()
         await ws.prepare(request)
+        self._channel(ws)
         self._init_websockets.add(ws)
 
         try:
@@ -54,6 +182,7 @@ class WebSocketManager:
                     logger.error(f'Init WebSocket error: {ws.exception()}')
         finally:
             self._init_websockets.discard(ws)
+            self._close_channel(ws)
         return ws
     
     async def handle_download_connection(self, request: web.Request) -> web.WebSocketResponse:
@@ -69,6 +198,7 @@ class WebSocketManager:
             download_id = str(uuid4())
         
         # Store the websocket with its download ID
+        self._channel(ws)
         self._download_websockets[download_id] = ws
         
         try:
@@ -84,6 +214,7 @@ class WebSocketManager:
         finally:
             if download_id in self._download_websockets:
                 del self._download_websockets[download_id]
+            self._close_channel(ws)
             
             # Schedule cleanup of completed downloads after WebSocket disconnection
             asyncio.create_task(self._delayed_cleanup(download_id))
@@ -97,16 +228,70 @@ class WebSocketManager:
             self.cleanup_download_progress(download_id)
             logger.debug(f"Delayed cleanup completed for download {download_id}")
     
-    async def broadcast(self, data: Dict[str, Any]):
-        """Broadcast message to all connected clients"""
-        if not self._websockets:
+    def _channel(self, ws: web.WebSocketResponse) -> _ClientChannel:
+        """Return the channel of ``ws``, bound to the loop that first asks for it.
+
+        Connection handlers create it on connect, so it lives on the server loop.
+        """
+        channel = self._channels.get(ws)
+        if channel is None:
+            channel = _ClientChannel(
+                ws,
+                self._progress_interval,
+                self._discard_client,
+                asyncio.get_running_loop(),
+            )
+            self._channels[ws] = channel
+        return channel
+
+    def _close_channel(self, ws: web.WebSocketResponse) -> None:
+        channel = self._channels.pop(ws, None)
+        if channel is not None:
+            channel.close()
+
+    def _discard_client(self, ws: web.WebSocketResponse) -> None:
+        """Forget a client whose socket failed while sending."""
+        self._websockets.discard(ws)
+        self._init_websockets.discard(ws)
+        for download_id, download_ws in list(self._download_websockets.items()):
+            if download_ws is ws:
+                del self._download_websockets[download_id]
+        self._channels.pop(ws, None)
+
+    async def _publish(
+        self,
+        clients: Iterable[web.WebSocketResponse],
+        data: Dict[str, Any],
+        topic: Optional[str] = None,
+    ) -> None:
+        """Encode ``data`` once and queue it for every client in ``clients``."""
+        clients = list(clients)
+        if not clients:
             return
-            
-        for ws in self._websockets:
-            try:
-                await ws.send_json(data)
-            except Exception as e:
-                logger.error(f"Error sending progress: {e}")
+        try:
+            frame = dumps_json(data).decode('utf-8')
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error encoding WebSocket payload: {e}")
+            return
+        for ws in clients:
+            self._channel(ws).publish(frame, topic)
+        # Let idle clients start sending before returning to the caller
+        await asyncio.sleep(0)
+
+    async def flush(self) -> None:
+        """Wait until every queued frame has been handed to its socket."""
+        await asyncio.gather(
+            *(channel.wait_idle() for channel in list(self._channels.values())),
+            return_exceptions=True,
+        )
+
+    async def broadcast(self, data: Dict[str, Any], topic: Optional[str] = None):
+        """Broadcast message to all connected clients
+
+        Progress messages are coalesced per ``topic``, which is derived from
+        the message type when not given.
+        """
+        await self._publish(self._websockets, data, topic or _progress_topic(data))
     
     async def broadcast_init_progress(self, data: Dict[str, Any]):
         """Broadcast initialization progress to connected clients"""
@@ -122,19 +307,7 @@ class WebSocketManager:
         key = self._get_init_progress_key(payload)
         self._last_init_progress[key] = dict(payload)
 
-        if not self._init_websockets:
-            return
-
-        stale_clients = []
-        for ws in list(self._init_websockets):
-            try:
-                await ws.send_json(payload)
-            except Exception as e:
-                logger.error(f"Error sending initialization progress: {e}")
-                stale_clients.append(ws)
-
-        for ws in stale_clients:
-            self._init_websockets.discard(ws)
+        await self._publish(self._init_websockets, payload, f'init:{key}')
 
     async def _send_cached_init_progress(self, ws: web.WebSocketResponse) -> None:
         """Send cached initialization progress payloads to a new client"""
@@ -178,20 +351,19 @@ class WebSocketManager:
         if download_id not in self._download_websockets:
             logger.debug(f"No WebSocket found for download ID: {download_id}")
             return
-            
-        ws = self._download_websockets[download_id]
-        try:
-            await ws.send_json(data)
-        except Exception as e:
-            logger.error(f"Error sending download progress: {e}")
-            
+
+        await self._publish(
+            [self._download_websockets[download_id]], data, f'download:{download_id}'
+        )
+
+
     async def broadcast_auto_organize_progress(self, data: Dict[str, Any]):
         """Broadcast auto-organize progress to connected clients"""
         # Store progress data in memory
         self._auto_organize_progress = data
         
         # Broadcast via WebSocket
-        await self.broadcast(data)
+        await self.broadcast(data, topic='auto_organize_progress')
     
     async def broadcast_recipe_repair_progress(self, data: Dict[str, Any]):
         """Broadcast recipe repair progress to connected clients"""
@@ -199,7 +371,7 @@ class WebSocketManager:
         self._recipe_repair_progress = data
         
         # Broadcast via WebSocket
-        await self.broadcast(data)
+        await self.broadcast(data, topic='recipe_repair_progress')
     
     def get_auto_organize_progress(self) -> Optional[Dict[str, Any]]:
         """Get current auto-organize progress"""
@@ -231,7 +403,7 @@ class WebSocketManager:
         self._recipe_rematch_progress = data
         
         # Broadcast via WebSocket
-        await self.broadcast(data)
+        await self.broadcast(data, topic='recipe_rematch_progress')
     
     def get_recipe_rematch_progress(self) -> Optional[Dict[str, Any]]:
         """Get current recipe rematch progress"""
@@ -15,9 +15,13 @@ Target structure:
         │   └── {library_name}.sqlite
         ├── recipe/
         │   └── {library_name}.sqlite
-        └── fts/
-            ├── recipe_fts.sqlite
-            └── tag_fts.sqlite
+        ├── fts/
+        │   ├── recipe_fts.sqlite
+        │   └── tag_fts.sqlite
+        ├── hash/
+        │   └── hash_memo.sqlite
+        └── thumbnail/
+            └── {ab}/{content hash}.webp
 """
 
 from __future__ import annotations
@@ -43,6 +47,7 @@ class CacheType(Enum):
     RECIPE_FTS = "recipe_fts"
     TAG_FTS = "tag_fts"
     SYMLINK = "symlink"
+    HASH_MEMO = "hash_memo"
 
 
 # Subdirectory structure for each cache type
@@ -53,6 +58,7 @@ _CACHE_SUBDIRS = {
     CacheType.RECIPE_FTS: "fts",
     CacheType.TAG_FTS: "fts",
     CacheType.SYMLINK: "symlink",
+    CacheType.HASH_MEMO: "hash",
 }
 
 # Filename patterns for each cache type
@@ -63,6 +69,7 @@ _CACHE_FILENAMES = {
     CacheType.RECIPE_FTS: "recipe_fts.sqlite",
     CacheType.TAG_FTS: "tag_fts.sqlite",
     CacheType.SYMLINK: "symlink_map.json",
+    CacheType.HASH_MEMO: "hash_memo.sqlite",
 }
 
 
@@ -38,6 +38,11 @@ def _get_hash_chunk_size_bytes() -> int:
 async def calculate_sha256(file_path: str) -> str:
     """Calculate SHA256 hash of a file (full file content).
 
+    The file is read in a worker thread of the shared hash service, so large
+    models never block the event loop and concurrent requests for the same
+    file share one read. Hashes requested inside a
+    :func:`~py.services.hash_service.hash_priority` block use that lane.
+
     Uses ``posix_fadvise`` with ``POSIX_FADV_DONTNEED`` to avoid polluting the OS page
     cache — critical on WSL where cached file pages live inside the VM and are not
     accounted for in guest ``used`` memory, causing VmmemWSL to balloon.
@@ -45,18 +50,9 @@ async def calculate_sha256(file_path: str) -> str:
     On Windows/macOS where ``posix_fadvise`` is not available the hint is silently
     skipped.
     """
-    sha256_hash = hashlib.sha256()
-    chunk_size = _get_hash_chunk_size_bytes()
-    with open(file_path, "rb") as f:
-        fd = f.fileno()
-        for byte_block in iter(lambda: f.read(chunk_size), b""):
-            sha256_hash.update(byte_block)
-        # Evict pages after reading so the data doesn't linger in the kernel page
-        # cache — on WSL this otherwise appears as unreclaimable VmmemWSL growth.
-        # Guard against platforms (Windows, macOS) that lack posix_fadvise.
-        if hasattr(os, "posix_fadvise") and hasattr(os, "POSIX_FADV_DONTNEED"):
-            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
-    return sha256_hash.hexdigest()
+    from ..services.hash_service import get_hash_service
+
+    return await get_hash_service().hash_file(file_path)
 
 
 def calculate_autov2(file_path: str) -> str:
@@ -0,0 +1,160 @@
+"""JSON responses with conditional GET and compression for the library APIs.
+
+List pages, folder trees and tag/base model summaries are requested again
+whenever the UI is refreshed, although the library rarely changed in the
+meantime. Handlers compute a weak ETag from the state a response depends on
+(cache generations, settings revision and query parameters) *before* doing
+any work, answer a matching ``If-None-Match`` with ``304 Not Modified`` and
+otherwise serialise once (with ``orjson`` when it is installed) and compress
+large bodies with brotli or gzip, depending on what the client accepts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+from typing import Any, Iterable, Optional, Tuple
+
+from aiohttp import web
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import brotli  # pyright: ignore[reportMissingTypeStubs]
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Bodies smaller than this are sent as-is; compression would not pay off
+COMPRESSION_MIN_BYTES = 1024
+# Compress larger bodies in a worker thread instead of the event loop
+COMPRESSION_OFFLOAD_BYTES = 256 * 1024
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+
+class EncodedJSONResponse(web.Response):
+    """JSON response whose body may already carry a content coding.
+
+    ComfyUI can install a middleware that calls ``enable_compression`` on
+    every JSON response; doing so on a pre-compressed body would encode it
+    twice.
+    """
+
+    def enable_compression(self, *args: Any, **kwargs: Any) -> None:
+        if "Content-Encoding" in self.headers:
+            return
+        super().enable_compression(*args, **kwargs)
+
+
+def dumps_json(payload: Any) -> bytes:
+    """Serialise ``payload`` to UTF-8 JSON, preferring ``orjson``."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Fall back for values orjson refuses (e.g. integers over 64 bits)
+            pass
+    return json.dumps(payload).encode("utf-8")
+
+
+def build_etag(*parts: Any) -> str:
+    """Return a weak ETag for the given state parts."""
+
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def query_fingerprint(request: web.Request, ignore: Iterable[str] = ()) -> Tuple[Tuple[str, str], ...]:
+    """Return the request's query parameters in a stable order."""
+
+    skipped = set(ignore)
+    return tuple(sorted((key, value) for key, value in request.query.items() if key not in skipped))
+
+
+def _header(request: web.Request, name: str) -> str:
+    headers = getattr(request, "headers", None)
+    return headers.get(name, "") if headers is not None else ""
+
+
+def etag_matches(request: web.Request, etag: str) -> bool:
+    """Check ``If-None-Match`` using the weak comparison of RFC 9110."""
+
+    header = _header(request, "If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> web.Response:
+    response = web.Response(status=304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def _preferred_encoding(request: web.Request) -> Optional[str]:
+    accepted = {}
+    for part in _header(request, "Accept-Encoding").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)  # pyright: ignore[reportOptionalMemberAccess]
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+async def json_response(
+    request: web.Request,
+    payload: Any,
+    *,
+    etag: Optional[str] = None,
+    status: int = 200,
+) -> web.Response:
+    """Build a JSON response, compressed when large and tagged with ``etag``."""
+
+    body = dumps_json(payload)
+    encoding = _preferred_encoding(request) if len(body) >= COMPRESSION_MIN_BYTES else None
+    if encoding is not None:
+        if len(body) >= COMPRESSION_OFFLOAD_BYTES:
+            body = await asyncio.to_thread(_compress, body, encoding)
+        else:
+            body = _compress(body, encoding)
+
+    response = EncodedJSONResponse(body=body, status=status, content_type="application/json")
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+    return response
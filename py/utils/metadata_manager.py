@@ -1,4 +1,5 @@
 from datetime import datetime
+import asyncio
 import os
 import json
 import logging
@@ -34,13 +35,11 @@ class MetadataManager:
         """
         metadata_path = f"{os.path.splitext(file_path)[0]}.metadata.json"
         
-        # Check if metadata file exists
-        if not os.path.exists(metadata_path):
-            return None, False
-        
         try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read and parse off the event loop so concurrent scans overlap I/O
+            data = await asyncio.to_thread(MetadataManager._read_metadata_file, metadata_path)
+            if data is None:
+                return None, False
             
             # Create model instance
             metadata = model_class.from_dict(data)
@@ -55,6 +54,14 @@ class MetadataManager:
             logger.error(f"{error_type} in metadata file: {metadata_path}. Error: {str(e)}. Skipping model to preserve existing data.")
             return None, True  # should_skip = True
 
+    @staticmethod
+    def _read_metadata_file(metadata_path: str) -> Optional[Any]:
+        """Return the parsed sidecar JSON, or ``None`` when the file does not exist."""
+        if not os.path.exists(metadata_path):
+            return None
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
     @staticmethod
     def _fill_local_file_facts(payload: Dict[str, Any], file_path: str) -> None:
         """Fill missing local file facts (``file_name``/``size``/``modified``) from disk.
@@ -212,17 +219,11 @@ class MetadataManager:
             if 'preview_url' in metadata_dict:
                 metadata_dict['preview_url'] = normalize_path(metadata_dict['preview_url'])
 
-            # Local file facts are required schema fields; fill them when a
-            # payload rebuilt without them (e.g. self-heal) is being persisted.
-            if metadata_dict.get("file_path"):
-                MetadataManager._fill_local_file_facts(metadata_dict, metadata_dict["file_path"])
-
-            # Write to temporary file first
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata_dict, f, indent=2, ensure_ascii=False)
-            
-            # Atomic rename operation
-            os.replace(temp_path, metadata_path)
+            # Sidecar writes run off the event loop so bulk refreshes can
+            # overlap them with network lookups.
+            await asyncio.to_thread(
+                MetadataManager._write_metadata_file, metadata_path, temp_path, metadata_dict
+            )
             return True
             
         except Exception as e:
@@ -235,6 +236,20 @@ class MetadataManager:
                     pass
             return False
     
+    @staticmethod
+    def _write_metadata_file(metadata_path: str, temp_path: str, metadata_dict: Dict[str, Any]) -> None:
+        # Local file facts are required schema fields; fill them when a
+        # payload rebuilt without them (e.g. self-heal) is being persisted.
+        if metadata_dict.get("file_path"):
+            MetadataManager._fill_local_file_facts(metadata_dict, metadata_dict["file_path"])
+
+        # Write to temporary file first
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata_dict, f, indent=2, ensure_ascii=False)
+
+        # Atomic rename operation
+        os.replace(temp_path, metadata_path)
+
     @staticmethod
     async def create_default_metadata(file_path: str, model_class: Type[BaseModelMetadata] = LoraMetadata) -> Optional[BaseModelMetadata]:
         """
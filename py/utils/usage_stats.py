@@ -6,11 +6,12 @@ import asyncio
 import logging
 import datetime
 import shutil
-from typing import Any, Awaitable, Dict, Set, cast
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple, cast
 
 from ..config import config
 from ..services.service_registry import ServiceRegistry
 from ..services.model_scanner import _is_excluded_dir
+from ..services.usage_stats_store import UsageStatsStore
 from ..utils.settings_paths import get_settings_dir
 
 # Check if running in standalone mode
@@ -49,14 +50,16 @@ _DEFAULT_CHECKPOINT_EXTENSIONS = {
 }
 
 class UsageStats:
-    """Track usage statistics for models and save to JSON"""
+    """Track usage statistics for models and persist them to SQLite"""
     
     _instance = None
     _lock = asyncio.Lock()  # For thread safety
     
-    # Default stats file name
+    # Legacy JSON stats file, imported into the SQLite store once
     STATS_FILENAME = "lora_manager_stats.json"
+    STORE_FILENAME = "usage_stats.sqlite"
     BACKUP_SUFFIX = ".backup"
+    MIGRATED_SUFFIX = ".migrated"
     
     def __new__(cls):
         if cls._instance is None:
@@ -68,25 +71,21 @@ class UsageStats:
         if self._initialized:
             return
             
-        # Initialize stats storage
-        self.stats: Dict[str, Any] = {
-            "checkpoints": {},  # sha256 -> { total: count, history: { date: count } }
-            "loras": {},        # sha256 -> { total: count, history: { date: count } }
-            "embeddings": {},   # sha256 -> { total: count, history: { date: count } }
-            "total_executions": 0,
-            "last_save_time": 0
-        }
-        
-        # Track if stats have been modified since last save
-        self._is_dirty = False
+        # Usage recorded since the last flush: (category, sha256, date) -> count
+        self._pending: Dict[Tuple[str, str, str], int] = {}
+        self._pending_executions = 0
+        self._last_save_time = 0.0
         
         # Queue for prompt_ids to process
         self.pending_prompt_ids = set()
         
-        # Load existing stats if available
+        # Open the store and import the legacy JSON file if one is left over
         self._stats_file_path = self._get_stats_file_path()
+        self._store = UsageStatsStore(
+            os.path.join(os.path.dirname(self._stats_file_path), self.STORE_FILENAME)
+        )
         self._migrate_from_old_location()
-        self._load_stats()
+        self._import_legacy_stats()
         
         # Save interval in seconds
         self.save_interval = 90  # 1.5 minutes
@@ -96,9 +95,14 @@ class UsageStats:
         
         self._initialized = True
         logger.debug("Usage statistics tracker initialized")
+
+    @property
+    def _is_dirty(self) -> bool:
+        """Whether usage has been recorded since the last flush"""
+        return bool(self._pending or self._pending_executions)
     
     def _get_stats_file_path(self) -> str:
-        """Get the path to the stats JSON file in the settings directory."""
+        """Get the path to the legacy stats JSON file in the settings directory."""
         settings_dir = get_settings_dir(create=True)
         return os.path.join(settings_dir, "stats", self.STATS_FILENAME)
 
@@ -200,82 +204,79 @@ class UsageStats:
         
         return False
     
-    def _load_stats(self):
-        """Load existing statistics from file"""
+    def _import_legacy_stats(self):
+        """Import the legacy JSON stats file into the store and retire it.
+
+        The file replaces whatever the store holds, so restoring an old
+        backup behaves as it did before.  It is renamed afterwards so the
+        import happens only once.
+        """
+        if not os.path.exists(self._stats_file_path):
+            return
         try:
-            if os.path.exists(self._stats_file_path):
-                with open(self._stats_file_path, 'r', encoding='utf-8') as f:
-                    loaded_stats = json.load(f)
-                
-                # Check if old format and needs conversion
-                if self._is_old_format(loaded_stats):
-                    logger.info("Detected old stats format, performing conversion")
-                    self._backup_old_stats()
-                    self.stats = self._convert_old_format(loaded_stats)
-                else:
-                    # Update our stats with loaded data (already in new format)
-                    if isinstance(loaded_stats, dict):
-                        # Update individual sections to maintain structure
-                        if "checkpoints" in loaded_stats and isinstance(loaded_stats["checkpoints"], dict):
-                            self.stats["checkpoints"] = loaded_stats["checkpoints"]
-                        
-                        if "loras" in loaded_stats and isinstance(loaded_stats["loras"], dict):
-                            self.stats["loras"] = loaded_stats["loras"]
-                        
-                        if "embeddings" in loaded_stats and isinstance(loaded_stats["embeddings"], dict):
-                            self.stats["embeddings"] = loaded_stats["embeddings"]
-                        
-                        if "total_executions" in loaded_stats:
-                            self.stats["total_executions"] = loaded_stats["total_executions"]
-                        
-                        if "last_save_time" in loaded_stats:
-                            self.stats["last_save_time"] = loaded_stats["last_save_time"]
-                
-                logger.debug(f"Loaded usage statistics from {self._stats_file_path}")
+            with open(self._stats_file_path, 'r', encoding='utf-8') as f:
+                loaded_stats = json.load(f)
+            if not isinstance(loaded_stats, dict):
+                raise ValueError("stats file does not contain an object")
+
+            # Check if old format and needs conversion
+            if self._is_old_format(loaded_stats):
+                logger.info("Detected old stats format, performing conversion")
+                self._backup_old_stats()
+                loaded_stats = self._convert_old_format(loaded_stats)
+
+            imported = self._store.import_legacy(loaded_stats)
+            os.replace(self._stats_file_path, f"{self._stats_file_path}{self.MIGRATED_SUFFIX}")
+            logger.info(
+                "Imported usage statistics for %d models from %s",
+                imported,
+                self._stats_file_path,
+            )
         except Exception as e:
-            logger.error(f"Error loading usage statistics: {e}")
+            logger.error(f"Error importing usage statistics: {e}")
     
     async def save_stats(self, force=False):
-        """Save statistics to file"""
+        """Flush usage recorded since the last save to the store"""
         try:
             # Only save if:
             # 1. force is True, OR
             # 2. stats have been modified (is_dirty) AND save_interval has passed
-            current_time = time.time()
-            time_since_last_save = current_time - self.stats.get("last_save_time", 0)
-
             if not force:
                 if not self._is_dirty:
                     # No changes to save
                     return False
-                if time_since_last_save < self.save_interval:
+                if time.time() - self._last_save_time < self.save_interval:
                     # Too soon since last save
                     return False
 
-            # Use a lock to prevent concurrent writes
-            async with self._lock:
-                # Update last save time
-                self.stats["last_save_time"] = current_time
-
-                # Create directory if it doesn't exist
-                os.makedirs(os.path.dirname(self._stats_file_path), exist_ok=True)
-
-                # Write to a temporary file first, then move it to avoid corruption
-                temp_path = f"{self._stats_file_path}.tmp"
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.stats, f, indent=2, ensure_ascii=False)
-
-                # Replace the old file with the new one
-                os.replace(temp_path, self._stats_file_path)
-
-                # Clear dirty flag since we've saved
-                self._is_dirty = False
-
-                logger.debug(f"Saved usage statistics to {self._stats_file_path}")
-                return True
+            await self._flush()
+            return True
         except Exception as e:
             logger.error(f"Error saving usage statistics: {e}", exc_info=True)
             return False
+
+    async def _flush(self) -> bool:
+        """Append pending usage to the store; returns False if nothing was pending"""
+        # Use a lock so concurrent flushes cannot record the same counts twice
+        async with self._lock:
+            if not self._is_dirty:
+                return False
+
+            pending, self._pending = self._pending, {}
+            executions, self._pending_executions = self._pending_executions, 0
+            saved_at = time.time()
+            try:
+                await self._store.record(pending, executions, saved_at)
+            except Exception:
+                # Keep the counts for the next attempt
+                for key, count in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + count
+                self._pending_executions += executions
+                raise
+
+            self._last_save_time = saved_at
+            logger.debug(f"Saved usage statistics to {self._store.get_database_path()}")
+            return True
     
     def register_execution(self, prompt_id):
         """Register a completed execution by prompt_id for later processing"""
@@ -333,8 +334,7 @@ class UsageStats:
             return
 
         # Increment total executions count
-        self.stats["total_executions"] += 1
-        self._is_dirty = True
+        self._pending_executions += 1
         
         # Get today's date in YYYY-MM-DD format
         today = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -353,17 +353,8 @@ class UsageStats:
 
     def _increment_usage_counter(self, category: str, stat_key: str, today_date: str) -> None:
         """Increment usage counters for a resolved stats key."""
-        if stat_key not in self.stats[category]:
-            self.stats[category][stat_key] = {
-                "total": 0,
-                "history": {}
-            }
-
-        self.stats[category][stat_key]["total"] += 1
-
-        if today_date not in self.stats[category][stat_key]["history"]:
-            self.stats[category][stat_key]["history"][today_date] = 0
-        self.stats[category][stat_key]["history"][today_date] += 1
+        key = (category, stat_key, today_date)
+        self._pending[key] = self._pending.get(key, 0) + 1
 
     def _normalize_model_lookup_name(self, model_name: str) -> str:
         """Normalize a model reference to its base filename without extension."""
@@ -608,21 +599,80 @@ class UsageStats:
             logger.error("Error processing embedding usage: %s", e, exc_info=True)
 
     async def get_stats(self) -> Dict[str, Any]:
-        """Get current usage statistics"""
-        return self.stats
+        """Get all usage statistics in the legacy JSON layout"""
+        await self._flush()
+        return await self._store.export()
+
+    async def get_usage_counts(self, category: str) -> Dict[str, int]:
+        """Get total usage per model hash for 'loras', 'checkpoints' or 'embeddings'"""
+        await self._flush()
+        return await self._store.get_totals(category)
+
+    async def get_top_models(self, category: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Get the most used models of a category as (sha256, total) pairs"""
+        await self._flush()
+        return await self._store.get_top(category, limit)
+
+    async def get_total_executions(self) -> int:
+        """Get the number of executions recorded so far"""
+        await self._flush()
+        return int(await self._store.get_meta("total_executions"))
+
+    async def get_usage_timeline(
+        self,
+        periods: int = 30,
+        *,
+        granularity: str = "day",
+        today: Optional[datetime.date] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get per-category usage for the last ``periods`` days or weeks, oldest first.
+
+        Weekly buckets are labelled with the Monday starting the week.
+        """
+        if granularity not in ("day", "week"):
+            raise ValueError(f"Unsupported timeline granularity: {granularity}")
+
+        await self._flush()
+        today = today or datetime.date.today()
+        if granularity == "week":
+            step = datetime.timedelta(weeks=1)
+            last = today - datetime.timedelta(days=today.weekday())
+        else:
+            step = datetime.timedelta(days=1)
+            last = today
+        buckets = [(last - step * offset).isoformat() for offset in range(periods - 1, -1, -1)]
+        if not buckets:
+            return []
+
+        usage = await self._store.get_timeline(
+            buckets[0], buckets[-1], weekly=granularity == "week"
+        )
+        timeline = []
+        for bucket in buckets:
+            counts = usage.get(bucket, {})
+            entry = {
+                "date": bucket,
+                "lora_usage": counts.get("loras", 0),
+                "checkpoint_usage": counts.get("checkpoints", 0),
+                "embedding_usage": counts.get("embeddings", 0),
+            }
+            entry["total_usage"] = (
+                entry["lora_usage"] + entry["checkpoint_usage"] + entry["embedding_usage"]
+            )
+            timeline.append(entry)
+        return timeline
     
     async def get_model_usage_count(self, model_type, sha256):
         """Get usage count for a specific model by hash"""
-        if model_type == "checkpoint":
-            if sha256 in self.stats["checkpoints"]:
-                return self.stats["checkpoints"][sha256]["total"]
-        elif model_type == "lora":
-            if sha256 in self.stats["loras"]:
-                return self.stats["loras"][sha256]["total"]
-        elif model_type == "embedding":
-            if sha256 in self.stats["embeddings"]:
-                return self.stats["embeddings"][sha256]["total"]
-        return 0
+        category = {
+            "checkpoint": "checkpoints",
+            "lora": "loras",
+            "embedding": "embeddings",
+        }.get(model_type)
+        if category is None:
+            return 0
+        await self._flush()
+        return await self._store.get_count(category, sha256)
     
     async def process_execution(self, prompt_id):
         """Process a prompt execution immediately (synchronous approach)"""
@@ -8,12 +8,47 @@ from ..services.settings_manager import get_settings_manager
 import asyncio
 
 
+def _get_lora_name_index():
+    """Return the LoRA scanner's name index when it can be queried synchronously."""
+    scanner = ServiceRegistry.get_service_sync("lora_scanner")
+    get_name_index = getattr(scanner, "get_name_index", None)
+    if get_name_index is None:
+        return None
+    return get_name_index()
+
+
+def _get_trigger_words(item):
+    civitai = item.get("civitai", {})
+    return civitai.get("trainedWords", []) if civitai else []
+
+
 def get_lora_info(lora_name):
     """Get the lora path and trigger words from cache"""
 
+    name_index = _get_lora_name_index()
+    if name_index is not None:
+        match = name_index.resolve(lora_name)
+        if match is None:
+            return lora_name, []
+        file_path = match.item.get("file_path")
+        if match.exact:
+            for root in list(config.loras_roots or []) + list(
+                config.extra_loras_roots or []
+            ):
+                root = root.replace(os.sep, "/")
+                if file_path.startswith(root):
+                    relative_path = os.path.relpath(file_path, root).replace(
+                        os.sep, "/"
+                    )
+                    return relative_path, _get_trigger_words(match.item)
+        return file_path, _get_trigger_words(match.item)
+
     async def _get_lora_info_async():
         scanner = await ServiceRegistry.get_lora_scanner()
         cache = await scanner.get_cached_data()
+        ensure_hydrated = getattr(scanner, "ensure_hydrated", None)
+        if ensure_hydrated is not None:
+            await ensure_hydrated()
 
         lora_name_normalized = lora_name.replace("\\", "/")
         lora_name_no_ext = lora_name_normalized
@@ -107,9 +142,19 @@ def get_lora_info_absolute(lora_name):
                file system path to the LoRA file, or original lora_name if not found
     """
 
+    name_index = _get_lora_name_index()
+    if name_index is not None:
+        match = name_index.resolve(lora_name)
+        if match is None:
+            return lora_name, []
+        return match.item.get("file_path"), _get_trigger_words(match.item)
+
     async def _get_lora_info_absolute_async():
         scanner = await ServiceRegistry.get_lora_scanner()
         cache = await scanner.get_cached_data()
+        ensure_hydrated = getattr(scanner, "ensure_hydrated", None)
+        if ensure_hydrated is not None:
+            await ensure_hydrated()
 
         lora_name_normalized = lora_name.replace("\\", "/")
         lora_name_no_ext = lora_name_normalized
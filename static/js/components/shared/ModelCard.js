@@ -10,6 +10,16 @@ import { showDeleteModal } from '../../utils/modalUtils.js';
 import { translate } from '../../utils/i18nHelpers.js';
 import { eventManager } from '../../utils/EventManager.js';
 
+// Cards request downscaled thumbnails; the modal keeps the full preview
+const CARD_THUMBNAIL_WIDTH = 480;
+
+function getCardThumbnailUrl(previewUrl) {
+    if (!previewUrl.startsWith('/api/lm/previews?')) {
+        return previewUrl;
+    }
+    return `${previewUrl}&w=${CARD_THUMBNAIL_WIDTH}`;
+}
+
 // Helper function to get display name based on settings
 function getDisplayName(model) {
     const displayNameSetting = state.global.settings.model_name_display || 'model_name';
@@ -309,7 +319,7 @@ function getCardPreviewUrl(card) {
     if (!cardMedia) return '';
     return cardMedia.tagName === 'VIDEO'
         ? (cardMedia.dataset.src || '')
-        : (cardMedia.src || '');
+        : (cardMedia.dataset.fullSrc || cardMedia.src || '');
 }
 
 async function showModelModalFromCard(card, modelType) {
@@ -573,6 +583,10 @@ export function createModelCard(model, modelType) {
         'preload="none"',
         `data-src="${versionedPreviewUrl}"`
     ];
+    const thumbnailUrl = getCardThumbnailUrl(versionedPreviewUrl);
+    if (isVideo && thumbnailUrl !== versionedPreviewUrl) {
+        videoAttrs.push(`poster="${thumbnailUrl}"`);
+    }
 
     if (!autoplayOnHover) {
         videoAttrs.push('data-autoplay="true"');
@@ -650,7 +664,7 @@ export function createModelCard(model, modelType) {
         <div class="card-preview ${shouldBlur ? 'blurred' : ''}">
             ${isVideo ?
             `<video ${videoAttrs.join(' ')} style="pointer-events: none;"></video>` :
-            `<img draggable="false" src="${versionedPreviewUrl}" alt="${model.model_name}" onerror="this.onerror=null; this.src='/loras_static/images/no-preview.png'">`
+            `<img draggable="false" src="${thumbnailUrl}" data-full-src="${versionedPreviewUrl}" alt="${model.model_name}" onerror="this.onerror=null; this.src='/loras_static/images/no-preview.png'">`
         }
             <div class="card-header">
                 ${shouldBlur ?
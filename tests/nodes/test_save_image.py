@@ -1,11 +1,14 @@
+import asyncio
 import json
 import os
+import threading
 from typing import Any, cast
 
 import numpy as np
 import piexif  # pyright: ignore[reportMissingTypeStubs]
 from PIL import Image
 
+from py.services.recipe_cache import RecipeCache
 from py.services.service_registry import ServiceRegistry
 from py.nodes.save_image import SaveImageLM
 
@@ -403,6 +406,37 @@ def test_save_image_as_recipe_writes_recipe_without_async_scanner_calls(
     assert scanner.fts_updates == [(recipe["id"], "add")]
 
 
+def test_saved_recipe_is_added_to_the_cache_on_the_server_loop():
+    loop = asyncio.new_event_loop()
+    server = threading.Thread(target=loop.run_forever)
+    server.start()
+
+    class _RecipeScanner:
+        def __init__(self):
+            self.loop = loop
+            self._cache = RecipeCache(raw_data=[], sorted_by_name=[], sorted_by_date=[])
+            self._json_path_map = {}
+            self.added_on = []
+
+        async def add_recipe(self, recipe_data):
+            self.added_on.append(threading.current_thread())
+            await self._cache.add_recipe(recipe_data, resort=True)
+
+    scanner = _RecipeScanner()
+    recipe = {"id": "r1", "title": "saved", "file_path": "saved.webp", "modified": 1.0}
+    try:
+        future = SaveImageLM._sync_recipe_cache(scanner, recipe, "r1.recipe.json")
+        future.result(timeout=5)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        server.join()
+        loop.close()
+
+    assert scanner.added_on == [server]
+    assert scanner._json_path_map == {"r1": "r1.recipe.json"}
+    assert [item["id"] for item in scanner._cache.sorted_by_name] == ["r1"]
+
+
 # ---------------------------------------------------------------------------
 # Tests for webp_method and jpeg_subsampling parameters
 # ---------------------------------------------------------------------------
@@ -8,11 +8,15 @@ from __future__ import annotations
 
 import random
 import string
+import tracemalloc
 from typing import Any, Dict, cast
 
 import pytest
 
+from py.services.model_entry_store import compact_entry
 from py.services.model_hash_index import ModelHashIndex
+from py.services.model_query import SearchStrategy
+from py.services.model_search_index import ModelSearchIndex
 from py.utils.utils import fuzzy_match, calculate_recipe_fingerprint
 
 
@@ -150,6 +154,62 @@ class TestFuzzyMatchPerformance:
         benchmark(match)
 
 
+class TestFuzzySearchIndexPerformance:
+    """Fuzzy library search with and without the token index."""
+
+    _WORDS = [
+        "anime", "realistic", "portrait", "detail", "style", "flux", "character",
+        "landscape", "cyberpunk", "fantasy", "pixel", "watercolor", "sketch",
+        "neon", "armor", "dragon", "castle", "forest", "ocean", "robot",
+    ]
+
+    @pytest.mark.parametrize("size", [10_000, 50_000])
+    def test_fuzzy_search_with_index(self, benchmark, size):
+        """Benchmark an indexed fuzzy search over the whole library."""
+        entries = self._create_entries(size)
+        index = ModelSearchIndex()
+        index.sync(entries)
+        strategy = SearchStrategy()
+        options = strategy.normalize_options({"tags": True})
+        # Build the lazily created token tree outside the measurement
+        index.fuzzy_candidates("warmup")
+
+        def search():
+            return strategy.apply(entries, "realistc portrat", options, True, search_index=index)
+
+        result = benchmark(search)
+        assert result
+        assert result == strategy.apply(entries, "realistc portrat", options, True)
+
+    @pytest.mark.parametrize("size", [10_000, 50_000])
+    def test_fuzzy_search_linear_scan(self, benchmark, size):
+        """Benchmark the same fuzzy search scanning every entry."""
+        entries = self._create_entries(size)
+        strategy = SearchStrategy()
+        options = strategy.normalize_options({"tags": True})
+
+        def search():
+            return strategy.apply(entries, "realistc portrat", options, True)
+
+        benchmark.pedantic(search, rounds=1, iterations=1)
+
+    def _create_entries(self, n: int) -> list[Dict[str, Any]]:
+        rng = random.Random(n)
+        entries = []
+        for i in range(n):
+            words = rng.sample(self._WORDS, 3)
+            suffix = "".join(rng.choices(string.ascii_lowercase, k=4))
+            entries.append(
+                {
+                    "file_name": f"{words[0]}_{suffix}_{i}",
+                    "model_name": f"{words[1].title()} {words[2].title()} {suffix}",
+                    "tags": rng.sample(self._WORDS, 2),
+                    "file_path": f"/loras/{words[0]}/{words[0]}_{suffix}_{i}.safetensors",
+                }
+            )
+        return entries
+
+
 class TestRecipeFingerprintPerformance:
     """Performance benchmarks for recipe fingerprint calculation."""
 
@@ -191,3 +251,72 @@ class TestRecipeFingerprintPerformance:
             }
             loras.append(lora)
         return loras
+
+
+class TestModelEntryMemory:
+    """Memory footprint of cached model entries, plain versus compact."""
+
+    ENTRY_COUNT = 10000
+
+    def test_compact_entries_use_less_memory(self):
+        """Compare bytes allocated per 10,000 cache entries."""
+        plain = self._measure(lambda index: self._create_entry(index))
+        compact = self._measure(lambda index: compact_entry(self._create_entry(index)))
+
+        print(
+            f"\nper {self.ENTRY_COUNT} entries: plain={plain / 1024:.0f} KiB "
+            f"compact={compact / 1024:.0f} KiB ({compact / plain:.0%})"
+        )
+        assert compact < plain
+
+    def _measure(self, build) -> int:
+        tracemalloc.start()
+        try:
+            entries = [build(index) for index in range(self.ENTRY_COUNT)]
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(entries) == self.ENTRY_COUNT
+        return current
+
+    def _create_entry(self, index: int) -> Dict[str, Any]:
+        """Create a cache entry shaped like ModelScanner._build_cache_entry output.
+
+        Strings are built at runtime, as they are when read from disk or SQLite,
+        so repeated values are distinct objects unless interned.
+        """
+        folder = "/".join(["characters", f"set_{index % 40}"])
+        return {
+            "file_path": f"/models/loras/{folder}/model_{index}.safetensors",
+            "file_name": f"model_{index}",
+            "model_name": f"Model {index}",
+            "folder": folder,
+            "size": 150_000_000 + index,
+            "modified": 1_700_000_000.0 + index,
+            "sha256": f"{index:064x}",
+            "autov3": f"{index:012x}",
+            "base_model": "".join(["SD", "XL 1.0"]) if index % 2 else "".join(["Illus", "trious"]),
+            "preview_url": f"/models/loras/{folder}/model_{index}.preview.webp",
+            "preview_nsfw_level": index % 4,
+            "from_civitai": True,
+            "favorite": False,
+            "notes": "",
+            "usage_tips": "",
+            "metadata_source": "".join(["civitai", "_api"]),
+            "exclude": False,
+            "db_checked": False,
+            "last_checked_at": 0.0,
+            "tags": ["".join(["char", "acter"]), "".join(["an", "ime"]), f"tag_{index % 200}"],
+            "civitai": {
+                "id": index,
+                "modelId": index // 2,
+                "name": "".join(["v", "1.0"]),
+                "creator": {"username": f"artist_{index % 300}"},
+                "model": {"type": "".join(["LO", "RA"])},
+            },
+            "civitai_deleted": False,
+            "skip_metadata_refresh": False,
+            "hf_url": "",
+            "license_flags": 127,
+            "hash_status": "".join(["comp", "leted"]),
+        }
@@ -97,3 +97,55 @@ async def test_model_query_handler_search_tags_clamps_negative_limit():
     )
 
     assert service.received_limit == 20
+
+
+class VersionedBaseModelService(DummyService):
+    """Service stub exposing a state token like BaseModelService."""
+
+    def __init__(self):
+        super().__init__()
+        self.token = ("lora", 1)
+        self.calls = 0
+
+    async def get_state_token(self, sort_by=None):
+        return self.token
+
+    async def get_base_models(self, limit):
+        self.calls += 1
+        return await super().get_base_models(limit)
+
+
+@pytest.mark.asyncio
+async def test_model_query_handler_answers_matching_etag_with_304():
+    from aiohttp.test_utils import make_mocked_request
+
+    service = VersionedBaseModelService()
+    handler = ModelQueryHandler(service=service, logger=logging.getLogger(__name__))
+
+    first = await handler.get_base_models(
+        make_mocked_request("GET", "/api/lm/loras/base-models?limit=5")
+    )
+    etag = first.headers["ETag"]
+
+    cached = await handler.get_base_models(
+        make_mocked_request(
+            "GET", "/api/lm/loras/base-models?limit=5", headers={"If-None-Match": etag}
+        )
+    )
+    other_query = await handler.get_base_models(
+        make_mocked_request(
+            "GET", "/api/lm/loras/base-models?limit=6", headers={"If-None-Match": etag}
+        )
+    )
+    service.token = ("lora", 2)
+    changed = await handler.get_base_models(
+        make_mocked_request(
+            "GET", "/api/lm/loras/base-models?limit=5", headers={"If-None-Match": etag}
+        )
+    )
+
+    assert cached.status == 304
+    assert other_query.status == 200
+    assert changed.status == 200
+    assert changed.headers["ETag"] != etag
+    assert service.calls == 3
@@ -1096,3 +1096,55 @@ async def test_bc1_old_format_manifest_falls_back_to_top_level_snapshot(
     assert scanner._cache.raw_data[0] == snapshot
     assert scanner._tags_count == {"beta": 1}
     assert model.read_bytes() == b"old-format-data"
+
+
+# ---------------------------------------------------------------------------
+# Deferred columns survive delete + undo
+# ---------------------------------------------------------------------------
+async def test_undo_restores_deferred_columns_of_unhydrated_entry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "loras"
+    root.mkdir()
+    model = root / "model.safetensors"
+    model.write_bytes(b"model-data")
+    # Loaded from the persisted cache without notes/usage tips
+    entry = {"file_path": str(model), "sha256": "d" * 64, "notes": "", "usage_tips": ""}
+    persisted = {str(model): {"notes": "keep me", "usage_tips": '{"strength": 0.7}'}}
+
+    class DeferredScanner(FakeScanner):
+        async def ensure_hydrated(self, items: Sequence[Dict[str, Any]]) -> None:
+            for item in items:
+                fields = persisted.get(item["file_path"])
+                if fields:
+                    item.update(fields)
+
+    scanner = DeferredScanner(root, model_type="lora")
+    scanner._cache.raw_data = [entry]
+    await _register_scanners(monkeypatch, lora=scanner)
+
+    service = await PendingDeleteService.get_instance()
+    batch_id = await service.stage_model_delete(
+        scanner=scanner,
+        target_dir=str(root),
+        file_name="model",
+        main_extension=".safetensors",
+        original_file_path=str(model),
+        cached_entry=entry,
+    )
+    assert batch_id is not None
+
+    # The write-behind flush drops the persisted row with the cache entry
+    scanner._cache.raw_data = []
+    persisted.clear()
+
+    from py.routes.handlers.pending_delete_handler import PendingDeleteHandler
+
+    response = await PendingDeleteHandler().undo_delete(
+        _make_undo_request(batch_id=batch_id)  # pyright: ignore[reportArgumentType]
+    )
+    assert response.status == 200
+
+    restored = scanner._cache.raw_data[0]
+    assert restored["notes"] == "keep me"
+    assert restored["usage_tips"] == '{"strength": 0.7}'
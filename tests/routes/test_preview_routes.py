@@ -348,3 +348,76 @@ async def test_deep_symlink_discovered_on_first_access(tmp_path):
 
     # Deep symlink should now be in mappings
     assert normalized_external in config._path_mappings
+
+
+def _library_config(library_root):
+    config = Config()
+    config.apply_library_settings(
+        {
+            "folder_paths": {
+                "loras": [str(library_root)],
+                "checkpoints": [],
+                "unet": [],
+                "embeddings": [],
+            }
+        }
+    )
+    return config
+
+
+async def test_preview_handler_serves_thumbnail_for_width_query(tmp_path):
+    from PIL import Image
+
+    from py.services.thumbnail_service import ThumbnailService
+
+    library_root = tmp_path / "library"
+    library_root.mkdir()
+    preview_file = library_root / "model.png"
+    Image.new("RGB", (1024, 1024)).save(preview_file)
+
+    thumbnails = ThumbnailService(cache_dir=str(tmp_path / "thumbs"), ffmpeg_path="")
+    handler = PreviewHandler(config=_library_config(library_root), thumbnail_service=thumbnails)
+    encoded_path = urllib.parse.quote(str(preview_file), safe="")
+
+    try:
+        response = await handler.serve_preview(
+            make_mocked_request("GET", f"/api/lm/previews?path={encoded_path}&w=320")
+        )
+
+        assert isinstance(response, web.FileResponse)
+        assert Path(response._path).parent.parent == tmp_path / "thumbs"
+        assert response.headers["Content-Type"] == "image/webp"
+
+        with pytest.raises(web.HTTPBadRequest):
+            await handler.serve_preview(
+                make_mocked_request("GET", f"/api/lm/previews?path={encoded_path}&w=wide")
+            )
+    finally:
+        thumbnails.close()
+
+
+async def test_preview_handler_has_no_poster_without_frame_extractor(tmp_path):
+    from py.services.thumbnail_service import ThumbnailService
+
+    library_root = tmp_path / "library"
+    library_root.mkdir()
+    video_file = library_root / "model.mp4"
+    video_file.write_bytes(b"video")
+
+    thumbnails = ThumbnailService(cache_dir=str(tmp_path / "thumbs"), ffmpeg_path="")
+    handler = PreviewHandler(config=_library_config(library_root), thumbnail_service=thumbnails)
+    encoded_path = urllib.parse.quote(str(video_file), safe="")
+
+    try:
+        with pytest.raises(web.HTTPNotFound):
+            await handler.serve_preview(
+                make_mocked_request("GET", f"/api/lm/previews?path={encoded_path}&w=320")
+            )
+
+        # Without a width the video itself is still served
+        response = await handler.serve_preview(
+            make_mocked_request("GET", f"/api/lm/previews?path={encoded_path}")
+        )
+        assert Path(response._path) == video_file
+    finally:
+        thumbnails.close()
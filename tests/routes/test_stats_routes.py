@@ -5,6 +5,8 @@ import pytest
 from aiohttp.test_utils import make_mocked_request
 
 from py.routes import stats_routes as stats_module
+from py.services.usage_stats_store import UsageStatsStore
+from py.utils.usage_stats import UsageStats
 
 
 class FakeCache:
@@ -52,7 +54,7 @@ class FakeSettings:
 
 
 @pytest.fixture
-def stats_routes(monkeypatch):
+def stats_routes(monkeypatch, tmp_path):
     sample_data = {
         "loras": [
             {
@@ -164,14 +166,14 @@ def stats_routes(monkeypatch):
         classmethod(fake_get_embedding_scanner),
     )
 
-    class FakeUsageStats:
-        def __init__(self):
-            self._data = usage_data
-
-        async def get_stats(self):
-            return self._data
+    # A real tracker over a temporary store, without the background task
+    usage_stats = object.__new__(UsageStats)
+    usage_stats._pending = {}
+    usage_stats._pending_executions = 0
+    usage_stats._store = UsageStatsStore(str(tmp_path / "usage_stats.sqlite"))
+    usage_stats._store.import_legacy(usage_data)
 
-    monkeypatch.setattr(stats_module, "UsageStats", FakeUsageStats)
+    monkeypatch.setattr(stats_module, "UsageStats", lambda: usage_stats)
 
     fake_server = FakeServerI18n()
     monkeypatch.setattr(stats_module, "server_i18n", fake_server)
@@ -261,6 +263,32 @@ async def test_get_usage_analytics(stats_routes):
     assert previous_entry["lora_usage"] == 2
 
 
+@pytest.mark.asyncio
+async def test_get_usage_analytics_weekly_timeline(stats_routes):
+    request = make_mocked_request("GET", "/api/lm/stats/usage-analytics?granularity=week")
+
+    response = await stats_routes.routes.get_usage_analytics(request)
+    payload = json.loads(response.text)
+
+    assert payload["success"] is True
+    timeline = payload["data"]["usage_timeline"]
+    assert len(timeline) == 12
+    # 2024-01-14 is a Sunday, so it belongs to the week before 2024-01-15
+    assert timeline[-1]["date"] == "2024-01-15"
+    assert timeline[-1]["total_usage"] == 7
+    assert timeline[-2]["date"] == "2024-01-08"
+    assert timeline[-2]["lora_usage"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_usage_analytics_rejects_unknown_granularity(stats_routes):
+    request = make_mocked_request("GET", "/api/lm/stats/usage-analytics?granularity=year")
+
+    response = await stats_routes.routes.get_usage_analytics(request)
+
+    assert response.status == 400
+
+
 @pytest.mark.asyncio
 async def test_get_storage_analytics(stats_routes):
     request = make_mocked_request("GET", "/api/lm/stats/storage-analytics")
@@ -1,12 +1,14 @@
 import json
 import os
 import sqlite3
+import zipfile
 from pathlib import Path
 
 import pytest
 
 import py.services.backup_service as backup_service
 from py.services.model_update_service import ModelUpdateService
+from py.services.usage_stats_store import UsageStatsStore
 from py.utils.cache_paths import CacheType
 
 
@@ -99,6 +101,81 @@ async def test_backup_round_trip_restores_user_state(tmp_path, monkeypatch):
     assert model_update_db.read_bytes() == b"model-update-v1"
 
 
+@pytest.mark.asyncio
+async def test_backup_includes_uncheckpointed_usage_stats(tmp_path, monkeypatch):
+    settings_dir, _ = _configure_backup_paths(monkeypatch, tmp_path)
+    settings_file = settings_dir / "settings.json"
+    settings_file.parent.mkdir(parents=True, exist_ok=True)
+    settings_file.write_text("{}", encoding="utf-8")
+
+    usage_db = settings_dir / "stats" / "usage_stats.sqlite"
+    usage_db.parent.mkdir(parents=True, exist_ok=True)
+    # Keep a connection open so the committed row stays in the WAL file
+    live = sqlite3.connect(usage_db)
+    live.execute("PRAGMA journal_mode = WAL")
+    live.execute("CREATE TABLE usage_totals (sha256 TEXT, total INTEGER)")
+    live.execute("INSERT INTO usage_totals VALUES ('lora-hash', 3)")
+    live.commit()
+
+    service = backup_service.BackupService(
+        settings_manager=DummySettings(settings_file),
+        backup_dir=str(tmp_path / "backups"),
+    )
+    try:
+        snapshot = await service.create_snapshot(snapshot_type="manual", persist=False)
+    finally:
+        live.close()
+
+    archive_path = tmp_path / snapshot["archive_name"]
+    archive_path.write_bytes(snapshot["archive_bytes"])
+    with zipfile.ZipFile(archive_path) as zf:
+        copied = tmp_path / "copied.sqlite"
+        copied.write_bytes(zf.read("stats/usage_stats.sqlite"))
+
+    with sqlite3.connect(copied) as conn:
+        assert conn.execute("SELECT sha256, total FROM usage_totals").fetchall() == [("lora-hash", 3)]
+
+    # Archives from before the SQLite store restore the legacy JSON file
+    assert service._resolve_restore_target("usage_stats", "stats/lora_manager_stats.json") == str(
+        settings_dir / "stats" / "lora_manager_stats.json"
+    )
+
+
+
+@pytest.mark.asyncio
+async def test_restore_swaps_live_usage_stats_database(tmp_path, monkeypatch):
+    settings_dir, _ = _configure_backup_paths(monkeypatch, tmp_path)
+    settings_file = settings_dir / "settings.json"
+    settings_file.parent.mkdir(parents=True, exist_ok=True)
+    settings_file.write_text("{}", encoding="utf-8")
+
+    usage_db = settings_dir / "stats" / "usage_stats.sqlite"
+    store = UsageStatsStore(str(usage_db))
+    await store.record({("loras", "lora-hash", "2024-01-01"): 3})
+
+    service = backup_service.BackupService(
+        settings_manager=DummySettings(settings_file),
+        backup_dir=str(tmp_path / "backups"),
+    )
+    try:
+        snapshot = await service.create_snapshot(snapshot_type="manual", persist=False)
+        archive_path = tmp_path / snapshot["archive_name"]
+        archive_path.write_bytes(snapshot["archive_bytes"])
+
+        # Newer uses stay in the live store's WAL until it is closed
+        await store.record({("loras", "lora-hash", "2024-01-02"): 5})
+        assert await store.get_count("loras", "lora-hash") == 8
+
+        result = await service.restore_snapshot(str(archive_path))
+
+        assert result["success"] is True
+        assert not os.path.exists(f"{usage_db}-wal")
+        # The store's pooled connections reopen on the restored file
+        assert await store.get_count("loras", "lora-hash") == 3
+    finally:
+        store.close()
+
+
 def test_prune_snapshots_keeps_latest_auto_only(tmp_path, monkeypatch):
     settings_dir, _ = _configure_backup_paths(monkeypatch, tmp_path)
     settings_file = settings_dir / "settings.json"
@@ -721,6 +721,71 @@ async def test_get_paginated_data_filters_update_available_only():
     assert response["total_pages"] == 1
 
 
+@pytest.mark.asyncio
+async def test_update_available_only_reads_materialized_index(tmp_path):
+    from py.services.model_update_service import ModelUpdateService
+
+    items = [
+        {"model_name": "Pony", "base_model": "Pony", "civitai": {"modelId": 1, "id": 10}},
+        {"model_name": "Flux", "base_model": "Flux", "civitai": {"modelId": 1, "id": 20}},
+        {"model_name": "Other", "base_model": "SDXL", "civitai": {"modelId": 2, "id": 50}},
+        {"model_name": "Local", "base_model": "SDXL"},
+    ]
+    update_service = ModelUpdateService(str(tmp_path / "updates.sqlite"), ttl_seconds=3600)
+
+    def version(version_id, base_model, in_library):
+        return ModelVersionRecord(
+            version_id=version_id,
+            name=None,
+            base_model=base_model,
+            released_at=None,
+            size_bytes=None,
+            preview_url=None,
+            is_in_library=in_library,
+            should_ignore=False,
+        )
+
+    update_service._upsert_record(
+        ModelUpdateRecord(
+            "stub", 1, [version(10, "Pony", True), version(20, "Flux", True), version(30, "Pony", False)], None, False
+        )
+    )
+    update_service._upsert_record(
+        ModelUpdateRecord("stub", 2, [version(50, "SDXL", True)], None, False)
+    )
+
+    async def fail_records_bulk(*args, **kwargs):
+        raise AssertionError("records should come from the availability index")
+
+    update_service.get_records_bulk = fail_records_bulk  # type: ignore[method-assign]
+
+    service = DummyService(
+        model_type="stub",
+        scanner=object(),
+        metadata_class=BaseModelMetadata,
+        cache_repository=StubRepository(items),
+        filter_set=PassThroughFilterSet(),
+        search_strategy=NoSearchStrategy(),
+        settings_provider=StubSettings({"version_grouping": "same_base"}),
+        update_service=update_service,
+    )
+
+    response = await service.get_paginated_data(
+        page=1,
+        page_size=10,
+        sort_by="name:asc",
+        update_available_only=True,
+    )
+
+    assert [item["model_name"] for item in response["items"]] == ["Pony"]
+    assert response["items"][0]["update_available"] is True
+    assert "update_available" not in items[0]
+
+    response = await service.get_paginated_data(page=1, page_size=10, sort_by="name:asc")
+    flags = {item["model_name"]: item["update_available"] for item in response["items"]}
+    assert flags == {"Pony": True, "Flux": False, "Other": False, "Local": False}
+
+
 @pytest.mark.asyncio
 async def test_get_paginated_data_update_available_only_without_update_service():
     items = [
@@ -1394,3 +1459,49 @@ class TestApplyHashFilters:
         result = await service._apply_hash_filters(data, {})
 
         assert result == data
+
+
+@pytest.mark.asyncio
+async def test_state_token_tracks_cache_settings_and_update_records():
+    from py.services.model_cache import ModelCache
+
+    class VersionedSettings(StubSettings):
+        revision = 0
+
+    class VersionedUpdateService:
+        revision = 0
+
+        def current_revision(self):
+            return self.revision
+
+    cache = ModelCache(raw_data=[{"file_path": "/a.safetensors", "model_name": "A"}], folders=[])
+    scanner = FakeScanner(cache)
+    scanner.cache_version = 0
+    settings = VersionedSettings({})
+    update_service = VersionedUpdateService()
+    service = DummyService(
+        "lora",
+        scanner,
+        BaseModelMetadata,
+        settings_provider=settings,
+        update_service=update_service,
+    )
+
+    token = await service.get_state_token("name:asc")
+    assert token is not None
+    assert await service.get_state_token("name:asc") == token
+    assert await service.get_state_token("usage:desc") is None
+
+    seen = {token}
+    for change in (
+        lambda: setattr(scanner, "cache_version", 1),
+        lambda: setattr(settings, "revision", 1),
+        lambda: setattr(update_service, "revision", 1),
+    ):
+        change()
+        token = await service.get_state_token()
+        assert token not in seen
+        seen.add(token)
+
+    await cache.update_preview_url("/a.safetensors", "/a.png", 0)
+    assert await service.get_state_token() not in seen
@@ -110,7 +110,7 @@ async def test_persisted_cache_restores_model_type(tmp_path: Path, monkeypatch):
     )
 
     class FakePersistentCache:
-        def load_cache(self, model_type: str):
+        def load_cache(self, model_type: str, defer_heavy_columns: bool = False):
             assert model_type == "checkpoint"
             return persisted
 
@@ -292,6 +292,41 @@ async def test_get_model_versions_bulk_handles_errors(monkeypatch, downloader):
     assert result is None
 
 
+async def test_get_models_by_hashes_uses_batch_endpoints(monkeypatch, downloader):
+    requests = []
+
+    async def fake_make_request(method, url, use_auth=True, **kwargs):
+        requests.append((method, url))
+        if url.endswith("/model-versions/by-hash"):
+            assert method == "POST"
+            assert kwargs["json"] == ["aaa", "bbb", "ccc"]
+            return True, [
+                {"id": 11, "modelId": 1, "model": {"name": "One"}, "files": [{"hashes": {"SHA256": "AAA"}}]},
+                {"id": 22, "modelId": 2, "model": {"name": "Two"}, "files": [{"hashes": {"SHA256": "BBB"}}]},
+            ]
+        assert url.endswith("/models")
+        assert kwargs["params"] == {"ids": "1,2", "nsfw": "true"}
+        return True, {
+            "items": [
+                {"id": 1, "description": "first", "tags": ["style"], "creator": {"username": "artist"}},
+                {"id": 2, "description": "second", "tags": [], "creator": None},
+            ]
+        }
+
+    downloader.make_request = fake_make_request
+
+    client = await CivitaiClient.get_instance()
+
+    result = await client.get_models_by_hashes(["AAA", "bbb", "ccc"])
+
+    assert set(result) == {"aaa", "bbb"}
+    assert result["aaa"]["model"]["description"] == "first"
+    assert result["aaa"]["model"]["tags"] == ["style"]
+    assert result["aaa"]["creator"] == {"username": "artist"}
+    assert result["bbb"]["id"] == 22
+    assert len(requests) == 2
+
+
 async def test_get_model_version_by_version_id(monkeypatch, downloader):
     async def fake_make_request(method, url, use_auth=True, **kwargs):
         if url.endswith("/model-versions/7"):
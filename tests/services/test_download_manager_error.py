@@ -1250,6 +1250,97 @@ async def test_execute_download_waits_for_paused_pre_transfer_gate(monkeypatch,
     assert result == {"success": True}
 
 
+@pytest.mark.asyncio
+async def test_execute_download_verifies_inline_sha256(monkeypatch, tmp_path):
+    manager = DownloadManager()
+
+    save_dir = tmp_path / "downloads"
+    save_dir.mkdir()
+    target_path = save_dir / "file.safetensors"
+    expected = "a" * 64
+
+    class DummyMetadata:
+        def __init__(self, path: Path):
+            self.file_path = str(path)
+            self.sha256 = expected.upper()
+            self.file_name = path.stem
+            self.preview_url = None
+            self.autov3: Optional[str] = ""
+            self.size = 0
+
+        def generate_unique_filename(self, *_args, **_kwargs):
+            return os.path.basename(self.file_path)
+
+        def update_file_info(self, _path):
+            return None
+
+        def to_dict(self):
+            return {"file_path": self.file_path}
+
+    pause_control = DownloadStreamControl()
+    manager._pause_events["download-1"] = pause_control
+    manager._active_downloads["download-1"] = {"status": "downloading"}
+
+    class HashingDownloader:
+        stall_timeout = 120.0
+
+        def __init__(self):
+            self.urls = []
+
+        async def download_file(self, url, path, progress_callback=None, use_auth=None, pause_event=None):
+            self.urls.append(url)
+            Path(path).write_text("content")
+            # The first mirror serves a corrupt copy
+            pause_event.completed_sha256 = "b" * 64 if len(self.urls) == 1 else expected
+            return True, path
+
+    downloader = HashingDownloader()
+    monkeypatch.setattr(download_manager, "get_downloader", AsyncMock(return_value=downloader))
+    rehash = AsyncMock(return_value="c" * 64)
+    monkeypatch.setattr(download_manager, "calculate_sha256", rehash)
+    dummy_scanner = SimpleNamespace(add_model_to_cache=AsyncMock(return_value=None))
+    monkeypatch.setattr(
+        DownloadManager, "_get_lora_scanner", AsyncMock(return_value=dummy_scanner)
+    )
+    monkeypatch.setattr(MetadataManager, "save_metadata", AsyncMock(return_value=True))
+
+    result = await manager._execute_download(
+        download_urls=[
+            "https://first.example/file.safetensors",
+            "https://second.example/file.safetensors",
+        ],
+        save_dir=str(save_dir),
+        metadata=DummyMetadata(target_path),
+        version_info={"images": []},
+        relative_path="",
+        progress_callback=None,
+        model_type="lora",
+        download_id="download-1",
+        transfer_backend="python",
+    )
+
+    assert result == {"success": True}
+    assert len(downloader.urls) == 2
+    rehash.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_build_metadata_entries_uses_inline_sha256(monkeypatch, tmp_path):
+    manager = DownloadManager()
+    model_path = tmp_path / "model.safetensors"
+    model_path.write_bytes(b"weights")
+    rehash = AsyncMock(return_value="c" * 64)
+    monkeypatch.setattr(download_manager, "calculate_sha256", rehash)
+    metadata = SimpleNamespace(sha256="", autov3="", file_path="", file_name="", size=0)
+
+    entries = await manager._build_metadata_entries(
+        metadata, [str(model_path)], sha256="D" * 64
+    )
+
+    assert entries[0].sha256 == "d" * 64
+    rehash.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_execute_download_reuses_existing_aria2_partial_path(monkeypatch, tmp_path):
     manager = DownloadManager()
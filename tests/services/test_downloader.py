@@ -1,11 +1,12 @@
 import asyncio
+import hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import Sequence
 
 import pytest
 
-from py.services.downloader import Downloader
+from py.services.downloader import Downloader, DownloadStreamControl
 
 
 class FakeStream:
@@ -237,6 +238,37 @@ async def test_download_file_resumes_after_incomplete_integrity_check(tmp_path):
     assert not Path(str(target_path) + ".part").exists()
 
 
+@pytest.mark.asyncio
+async def test_download_file_reports_sha256_across_resumes(tmp_path):
+    target_path = tmp_path / "model" / "file.bin"
+    target_path.parent.mkdir()
+    # A previous run left the first byte behind
+    Path(str(target_path) + ".part").write_bytes(b"a")
+
+    responses = [
+        lambda: FakeResponse(
+            status=206,
+            headers={"content-length": "5", "Content-Range": "bytes 1-5/6"},
+            chunks=[b"bc"],
+        ),
+        lambda: FakeResponse(
+            status=206,
+            headers={"content-length": "3", "Content-Range": "bytes 3-5/6"},
+            chunks=[b"def"],
+        ),
+    ]
+
+    downloader = _build_downloader(responses, max_retries=1)
+    control = DownloadStreamControl()
+
+    success, _ = await downloader.download_file(
+        "https://example.com/file", str(target_path), pause_event=control
+    )
+
+    assert success is True
+    assert control.completed_sha256 == hashlib.sha256(b"abcdef").hexdigest()
+
+
 @pytest.mark.asyncio
 async def test_download_file_retries_redirected_url_when_range_not_honored(tmp_path):
     target_path = tmp_path / "model" / "file.bin"
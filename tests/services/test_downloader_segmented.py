@@ -0,0 +1,255 @@
+import asyncio
+import hashlib
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from py.services.downloader import (
+    SEGMENT_MAP_SUFFIX,
+    Downloader,
+    DownloadStreamControl,
+)
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+@asynccontextmanager
+async def range_server(
+    payload: bytes,
+    *,
+    advertise_ranges: bool = True,
+    honor_ranges: bool = True,
+    etag: Optional[str] = None,
+    range_skew: int = 0,
+    seen_if_ranges: Optional[List[Optional[str]]] = None,
+) -> AsyncIterator[tuple[str, List[Optional[str]]]]:
+    """Serve ``payload`` from a local server that records each Range header.
+
+    With ``etag`` set, ranges whose ``If-Range`` names another version are
+    answered in full. ``range_skew`` shifts every answered range away from
+    the one requested.
+    """
+
+    seen_ranges: List[Optional[str]] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        range_header = request.headers.get("Range")
+        seen_ranges.append(range_header)
+        if seen_if_ranges is not None and range_header:
+            seen_if_ranges.append(request.headers.get("If-Range"))
+        headers = {"Accept-Ranges": "bytes"} if advertise_ranges else {}
+        if etag:
+            headers["ETag"] = etag
+        if_range = request.headers.get("If-Range")
+        if range_header and honor_ranges and if_range in (None, etag):
+            start_text, _, end_text = range_header.removeprefix("bytes=").partition("-")
+            start = int(start_text) + range_skew
+            end = int(end_text) if end_text else len(payload) - 1
+            end = min(end + range_skew, len(payload) - 1)
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(payload)}"
+            return web.Response(status=206, body=payload[start : end + 1], headers=headers)
+        return web.Response(body=payload, headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/model.safetensors", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url("/model.safetensors")), seen_ranges
+    finally:
+        await server.close()
+
+
+@pytest.fixture
+async def downloader():
+    instance = Downloader()
+    instance.segment_count = 4
+    instance.segment_min_size = 64 * 1024
+    instance.base_delay = 0
+    yield instance
+    await instance.close()
+
+
+def _read(path) -> bytes:
+    with open(path, "rb") as handle:
+        return handle.read()
+
+
+async def test_large_files_are_fetched_over_parallel_ranges(tmp_path, downloader):
+    target = tmp_path / "model.safetensors"
+    snapshots = []
+
+    async def on_progress(snapshot, _snapshot=None):
+        snapshots.append(snapshot)
+
+    control = DownloadStreamControl()
+
+    async with range_server(PAYLOAD) as (url, seen_ranges):
+        success, result = await downloader.download_file(
+            url, str(target), progress_callback=on_progress, pause_event=control
+        )
+
+    assert success, result
+    assert _read(target) == PAYLOAD
+    assert not os.path.exists(f"{target}.part")
+    assert not os.path.exists(f"{target}.part{SEGMENT_MAP_SUFFIX}")
+    quarter = len(PAYLOAD) // 4
+    assert seen_ranges[0] is None
+    assert sorted(seen_ranges[1:]) == sorted(
+        f"bytes={index * quarter}-{(index + 1) * quarter - 1}" for index in range(4)
+    )
+    assert snapshots[-1].percent_complete == 100.0
+    assert snapshots[-1].bytes_downloaded == len(PAYLOAD)
+    assert control.completed_sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+
+
+async def test_segmented_download_resumes_from_persisted_map(tmp_path, downloader):
+    target = tmp_path / "model.safetensors"
+    part_path = f"{target}.part"
+    half = len(PAYLOAD) // 2
+
+    # An earlier run finished the first half and 1000 bytes of the second
+    with open(part_path, "wb") as handle:
+        handle.truncate(len(PAYLOAD))
+        handle.write(PAYLOAD[:half])
+        handle.seek(half)
+        handle.write(PAYLOAD[half : half + 1000])
+    with open(part_path + SEGMENT_MAP_SUFFIX, "w", encoding="utf-8") as handle:
+        json.dump(
+            {
+                "version": 1,
+                "total_size": len(PAYLOAD),
+                "validator": '"v1"',
+                "segments": [[0, half - 1, half], [half, len(PAYLOAD) - 1, 1000]],
+            },
+            handle,
+        )
+
+    control = DownloadStreamControl()
+    if_ranges: List[Optional[str]] = []
+
+    async with range_server(PAYLOAD, etag='"v1"', seen_if_ranges=if_ranges) as (
+        url,
+        seen_ranges,
+    ):
+        success, result = await downloader.download_file(
+            url, str(target), pause_event=control
+        )
+
+    assert success, result
+    assert seen_ranges == [f"bytes={half + 1000}-{len(PAYLOAD) - 1}"]
+    assert if_ranges == ['"v1"']
+    assert _read(target) == PAYLOAD
+    assert control.completed_sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+    assert not os.path.exists(part_path + SEGMENT_MAP_SUFFIX)
+
+
+async def test_resume_restarts_when_the_file_changed_on_the_host(tmp_path, downloader):
+    target = tmp_path / "model.safetensors"
+    part_path = f"{target}.part"
+    half = len(PAYLOAD) // 2
+    stale = bytes(reversed(PAYLOAD))
+
+    # The first half on disk belongs to an older version of the file
+    with open(part_path, "wb") as handle:
+        handle.truncate(len(PAYLOAD))
+        handle.write(stale[:half])
+    with open(part_path + SEGMENT_MAP_SUFFIX, "w", encoding="utf-8") as handle:
+        json.dump(
+            {
+                "version": 1,
+                "total_size": len(PAYLOAD),
+                "validator": '"v1"',
+                "segments": [[0, half - 1, half], [half, len(PAYLOAD) - 1, 0]],
+            },
+            handle,
+        )
+
+    async with range_server(PAYLOAD, etag='"v2"') as (url, seen_ranges):
+        success, result = await downloader.download_file(url, str(target))
+
+    assert success, result
+    assert _read(target) == PAYLOAD
+    assert seen_ranges[-1] is None
+    assert not os.path.exists(part_path + SEGMENT_MAP_SUFFIX)
+
+
+async def test_segment_requests_carry_the_probed_validator(tmp_path, downloader):
+    target = tmp_path / "model.safetensors"
+    if_ranges: List[Optional[str]] = []
+
+    async with range_server(PAYLOAD, etag='"v1"', seen_if_ranges=if_ranges) as (
+        url,
+        _seen_ranges,
+    ):
+        success, result = await downloader.download_file(url, str(target))
+
+    assert success, result
+    assert _read(target) == PAYLOAD
+    assert if_ranges == ['"v1"'] * 4
+
+
+async def test_mismatched_content_range_falls_back_to_a_single_stream(
+    tmp_path, downloader
+):
+    target = tmp_path / "model.safetensors"
+
+    async with range_server(PAYLOAD, range_skew=1) as (url, seen_ranges):
+        success, result = await downloader.download_file(url, str(target))
+
+    assert success, result
+    assert _read(target) == PAYLOAD
+    assert seen_ranges[-1] is None
+    assert not os.path.exists(f"{target}.part{SEGMENT_MAP_SUFFIX}")
+
+
+async def test_hosts_without_range_support_use_a_single_stream(tmp_path, downloader):
+    target = tmp_path / "model.safetensors"
+
+    async with range_server(PAYLOAD, advertise_ranges=False) as (url, seen_ranges):
+        success, result = await downloader.download_file(url, str(target))
+
+    assert success, result
+    assert seen_ranges == [None]
+    assert _read(target) == PAYLOAD
+
+
+async def test_ignored_ranges_fall_back_to_a_single_stream(tmp_path, downloader):
+    target = tmp_path / "model.safetensors"
+
+    async with range_server(PAYLOAD, honor_ranges=False) as (url, seen_ranges):
+        success, result = await downloader.download_file(url, str(target))
+
+    assert success, result
+    assert _read(target) == PAYLOAD
+    assert seen_ranges[-1] is None
+    assert not os.path.exists(f"{target}.part{SEGMENT_MAP_SUFFIX}")
+
+
+async def test_paused_segments_wait_for_resume(tmp_path, downloader):
+    target = tmp_path / "model.safetensors"
+    map_path = f"{target}.part{SEGMENT_MAP_SUFFIX}"
+    control = DownloadStreamControl()
+    control.pause()
+
+    async with range_server(PAYLOAD) as (url, _seen_ranges):
+        task = asyncio.create_task(
+            downloader.download_file(url, str(target), pause_event=control)
+        )
+        await asyncio.sleep(0.3)
+
+        assert not task.done()
+        with open(map_path, encoding="utf-8") as handle:
+            segments = json.load(handle)["segments"]
+        assert sum(downloaded for _start, _end, downloaded in segments) == 0
+
+        control.resume()
+        success, result = await asyncio.wait_for(task, timeout=10)
+
+    assert success, result
+    assert _read(target) == PAYLOAD
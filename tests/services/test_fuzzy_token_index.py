@@ -0,0 +1,93 @@
+import random
+from difflib import SequenceMatcher
+
+from py.services.fuzzy_token_index import FuzzyTokenIndex, lcs_length
+from py.services.model_search_index import ModelSearchIndex
+from py.services.model_query import SearchStrategy
+from py.utils.utils import fuzzy_match
+
+
+def _vocabulary(size, seed=7):
+    rng = random.Random(seed)
+    syllables = ["ka", "ra", "mi", "to", "an", "ime", "sty", "le", "det", "ail", "xl", "flux", "real", "ist", "ic"]
+    tokens = set()
+    while len(tokens) < size:
+        tokens.add("".join(rng.choice(syllables) for _ in range(rng.randint(1, 5))))
+    return sorted(tokens)
+
+
+def test_lcs_length_matches_dynamic_programming():
+    def reference(a, b):
+        row = [0] * (len(b) + 1)
+        for char in a:
+            previous = 0
+            for j, other in enumerate(b, 1):
+                current = row[j]
+                row[j] = previous + 1 if char == other else max(row[j], row[j - 1])
+                previous = current
+        return row[-1]
+
+    words = _vocabulary(60)
+    for a in words[:30]:
+        for b in words[30:]:
+            assert lcs_length(a, b) == reference(a, b)
+
+
+def test_lookup_matches_brute_force_sequence_matcher():
+    vocabulary = _vocabulary(2000)
+    index = FuzzyTokenIndex()
+    index.update(vocabulary)
+
+    for word in ["realistic", "animestyle", "detail", "fluxx", "karami"]:
+        expected = {
+            token
+            for token in vocabulary
+            if SequenceMatcher(None, token, word).ratio() >= 0.85
+        }
+        found = index.lookup(word)
+        assert {token for _, token in found} == expected
+        ratios = [ratio for ratio, _ in found]
+        assert ratios == sorted(ratios, reverse=True)
+
+
+def test_lookup_limit_keeps_closest_tokens():
+    index = FuzzyTokenIndex()
+    index.update(["portrait", "portraits", "portrayal", "landscape"])
+
+    assert index.lookup("portrait", limit=1) == [(1.0, "portrait")]
+    assert [token for _, token in index.lookup("portrait")] == ["portrait", "portraits"]
+
+
+def test_fuzzy_candidates_cover_every_fuzzy_match():
+    rng = random.Random(3)
+    vocabulary = _vocabulary(400)
+    entries = [
+        {
+            "file_name": "_".join(rng.sample(vocabulary, 2)),
+            "model_name": " ".join(rng.sample(vocabulary, 3)),
+            "tags": rng.sample(vocabulary, 2),
+            "file_path": f"/loras/model_{i}.safetensors",
+        }
+        for i in range(300)
+    ]
+    index = ModelSearchIndex()
+    index.sync(entries)
+    strategy = SearchStrategy()
+    options = strategy.normalize_options({"tags": True})
+
+    for pattern in ["realistc", "anime styel", "flux ka", "detale", "mi"]:
+        expected = strategy.apply(entries, pattern, options, fuzzy=True)
+        indexed = strategy.apply(entries, pattern, options, fuzzy=True, search_index=index)
+        assert indexed == expected
+
+        candidates = index.fuzzy_candidates(pattern)
+        if candidates is not None:
+            brute = [
+                entry
+                for entry in entries
+                if any(
+                    fuzzy_match(value, pattern)
+                    for value in [entry["file_name"], entry["model_name"], *entry["tags"]]
+                )
+            ]
+            assert all(any(entry is c for c in candidates) for entry in brute)
@@ -0,0 +1,164 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from py.services import hash_service
+from py.services.hash_memo import HashMemo
+from py.services.hash_service import HashService
+
+
+def _write_settled(path: Path, content: bytes) -> str:
+    """Write a file whose mtime lies outside the racy window."""
+    path.write_bytes(content)
+    settled = time.time_ns() - 60 * 1_000_000_000
+    os.utime(path, ns=(settled, settled))
+    return str(path)
+
+
+@pytest.fixture
+def memo(tmp_path):
+    return HashMemo(db_path=str(tmp_path / "hash_memo.sqlite"))
+
+
+def test_memo_survives_rename_and_restart(tmp_path, memo):
+    original = _write_settled(tmp_path / "model.safetensors", b"weights")
+    assert memo.record(original, "ABC123")
+
+    moved = tmp_path / "archive" / "renamed.safetensors"
+    moved.parent.mkdir()
+    os.replace(original, moved)
+
+    assert memo.lookup(str(moved)) == "abc123"
+    assert HashMemo(db_path=memo.get_database_path()).lookup(str(moved)) == "abc123"
+
+
+def test_memo_invalidates_changed_and_skips_racy_files(tmp_path, memo):
+    file_path = _write_settled(tmp_path / "model.safetensors", b"weights")
+    memo.record(file_path, "abc")
+
+    with open(file_path, "ab") as handle:
+        handle.write(b"more")
+    assert memo.lookup(file_path) is None
+    assert len(memo) == 0
+
+    # A freshly written file may change again within the same mtime tick
+    assert memo.record(file_path, "def") is False
+    assert memo.lookup(file_path) is None
+
+    # Nor is a digest kept when the file changed while it was being read
+    settled = _write_settled(tmp_path / "other.safetensors", b"v1")
+    before = os.stat(settled)
+    _write_settled(tmp_path / "other.safetensors", b"v22")
+    assert memo.record(settled, "ghi", before) is False
+
+
+def test_seed_from_hash_index_rows(tmp_path, memo):
+    first = _write_settled(tmp_path / "a.safetensors", b"aaaa")
+    second = _write_settled(tmp_path / "b.safetensors", b"bb")
+    memo.record(first, "computed")
+
+    added = memo.seed(
+        [("seeded-a", first), ("seeded-b", second), ("gone", str(tmp_path / "missing"))],
+        sizes={second: 2},
+    )
+
+    assert added == 1
+    assert memo.lookup(first) == "computed"
+    assert memo.lookup(second) == "seeded-b"
+    assert memo.seed([("stale", second)], sizes={second: 99}) == 0
+
+
+def test_seed_skips_files_rewritten_after_indexing(tmp_path, memo):
+    indexed = _write_settled(tmp_path / "indexed.safetensors", b"aaaa")
+    rewritten = _write_settled(tmp_path / "rewritten.safetensors", b"bbbb")
+    indexed_at = os.stat(indexed).st_mtime
+    # Same size, new content, written after the hash index recorded it
+    newer = time.time_ns() - 30 * 1_000_000_000
+    os.utime(rewritten, ns=(newer, newer))
+
+    added = memo.seed(
+        [("kept", indexed), ("stale", rewritten), ("unknown", str(tmp_path / "c.safetensors"))],
+        sizes={indexed: 4, rewritten: 4},
+        modified={indexed: indexed_at, rewritten: indexed_at},
+    )
+
+    assert added == 1
+    assert memo.lookup(indexed) == "kept"
+    assert memo.lookup(rewritten) is None
+    assert memo.seed([("untimed", rewritten)], modified={}) == 0
+
+
+def test_memo_evicts_least_recently_used_entries(tmp_path):
+    db_path = str(tmp_path / "hash_memo.sqlite")
+    # A table written before the recency column existed is migrated in place
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE hash_memo (st_dev TEXT NOT NULL, st_ino TEXT NOT NULL, size INTEGER NOT NULL, "
+        "mtime_ns INTEGER NOT NULL, sha256 TEXT NOT NULL, PRIMARY KEY (st_dev, st_ino))"
+    )
+    conn.commit()
+    conn.close()
+
+    memo = HashMemo(db_path=db_path, max_entries=2)
+    first, second, third = (
+        _write_settled(tmp_path / f"{name}.safetensors", name.encode()) for name in ("a", "bb", "ccc")
+    )
+    memo.record(first, "aaa")
+    memo.record(second, "bbb")
+    assert memo.lookup(first) == "aaa"
+
+    memo.record(third, "ccc")
+    assert len(memo) == 2
+    assert memo.lookup(second) is None
+
+    reloaded = HashMemo(db_path=db_path, max_entries=2)
+    assert len(reloaded) == 2
+    assert reloaded.lookup(first) == "aaa"
+    assert reloaded.lookup(third) == "ccc"
+
+
+@pytest.mark.asyncio
+async def test_hash_service_skips_reading_memoised_files(tmp_path, memo, monkeypatch):
+    content = b"model-bytes" * 100
+    file_path = _write_settled(tmp_path / "model.safetensors", content)
+    calls = []
+    original = hash_service._hash_file_blocking
+
+    def counting_hash(path, *args):
+        calls.append(path)
+        return original(path, *args)
+
+    monkeypatch.setattr(hash_service, "_hash_file_blocking", counting_hash)
+
+    service = HashService(max_workers=1, memo=memo)
+    first = await service.hash_file(file_path)
+    moved = str(tmp_path / "moved.safetensors")
+    os.replace(file_path, moved)
+    second = await service.hash_file(moved)
+
+    assert first == second == hashlib.sha256(content).hexdigest()
+    assert calls == [file_path]
+
+
+@pytest.mark.asyncio
+async def test_hash_service_looks_up_memo_off_the_event_loop(tmp_path, memo, monkeypatch):
+    file_path = _write_settled(tmp_path / "model.safetensors", b"weights")
+    memo.record(file_path, "abc")
+    lookup_threads = []
+    original_lookup = memo.lookup
+
+    def tracking_lookup(path):
+        lookup_threads.append(threading.current_thread())
+        return original_lookup(path)
+
+    monkeypatch.setattr(memo, "lookup", tracking_lookup)
+
+    service = HashService(max_workers=1, memo=memo)
+
+    assert await service.hash_file(file_path) == "abc"
+    assert lookup_threads and threading.main_thread() not in lookup_threads
@@ -0,0 +1,116 @@
+import asyncio
+import hashlib
+import threading
+from pathlib import Path
+
+import pytest
+
+from py.services import hash_service
+from py.services.hash_service import (
+    HashCancelledError,
+    HashPriority,
+    HashService,
+    hash_priority,
+)
+
+
+def _write(path: Path, content: bytes) -> str:
+    path.write_bytes(content)
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_hash_file_matches_hashlib_and_reports_progress(tmp_path):
+    content = b"model-bytes" * 1000
+    file_path = _write(tmp_path / "model.safetensors", content)
+    progress = []
+
+    service = HashService(max_workers=2)
+    digest = await service.hash_file(
+        file_path,
+        progress_callback=lambda path, done, total: progress.append((done, total)),
+    )
+    await asyncio.sleep(0)
+
+    assert digest == hashlib.sha256(content).hexdigest()
+    assert progress[-1] == (len(content), len(content))
+    assert service.pending_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_read(tmp_path, monkeypatch):
+    file_path = _write(tmp_path / "shared.safetensors", b"shared")
+    calls = []
+    original = hash_service._hash_file_blocking
+
+    def counting_hash(path, *args):
+        calls.append(path)
+        return original(path, *args)
+
+    monkeypatch.setattr(hash_service, "_hash_file_blocking", counting_hash)
+
+    service = HashService(max_workers=2)
+    results = await asyncio.gather(*[service.hash_file(file_path) for _ in range(5)])
+
+    assert len(set(results)) == 1
+    assert calls == [file_path]
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_jump_the_background_queue(tmp_path, monkeypatch):
+    paths = {name: _write(tmp_path / f"{name}.bin", name.encode()) for name in ("busy", "backfill", "user")}
+    release = threading.Event()
+    order = []
+
+    def recording_hash(path, *args):
+        if path == paths["busy"]:
+            release.wait(5)
+        order.append(path)
+        return "digest"
+
+    monkeypatch.setattr(hash_service, "_hash_file_blocking", recording_hash)
+
+    service = HashService(max_workers=1)
+    busy = asyncio.ensure_future(service.hash_file(paths["busy"]))
+    await asyncio.sleep(0.05)
+    with hash_priority(HashPriority.BACKGROUND):
+        backfill = asyncio.ensure_future(service.hash_file(paths["backfill"]))
+    await asyncio.sleep(0)
+    user = asyncio.ensure_future(service.hash_file(paths["user"]))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(busy, backfill, user)
+
+    assert order == [paths["busy"], paths["user"], paths["backfill"]]
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_queued_and_running_jobs(tmp_path, monkeypatch):
+    running_path = _write(tmp_path / "running.bin", b"x" * 64)
+    queued_path = _write(tmp_path / "queued.bin", b"y")
+    started = threading.Event()
+
+    def slow_hash(path, chunk_size, cancel_event, report=None):
+        started.set()
+        while not cancel_event.wait(0.01):
+            pass
+        raise HashCancelledError(path)
+
+    monkeypatch.setattr(hash_service, "_hash_file_blocking", slow_hash)
+
+    service = HashService(max_workers=1)
+    running = asyncio.ensure_future(service.hash_file(running_path))
+    queued = asyncio.ensure_future(service.hash_file(queued_path))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+    assert service.cancel(queued_path) is True
+    with pytest.raises(HashCancelledError):
+        await queued
+
+    assert service.cancel(running_path) is True
+    with pytest.raises(HashCancelledError):
+        await running
+
+    assert service.cancel(running_path) is False
+    assert service.pending_count() == 0
@@ -653,3 +653,28 @@ async def test_pool_filter_name_patterns_invalid_regex(lora_service):
     # Should not crash and should match using substring fallback
     filtered = await lora_service._apply_pool_filters(sample_loras, pool_config)
     assert len(filtered) == 1  # Substring match works even with invalid regex
+
+
+@pytest.mark.asyncio
+async def test_random_loras_hydrate_usage_tips_before_recommended_strength(lora_service):
+    """Recommended strengths must be read after the deferred usage tips load."""
+    lora = {"file_name": "tips.safetensors", "folder": "", "usage_tips": ""}
+    lora_service.scanner.get_cached_data.return_value.raw_data = [lora]
+
+    async def ensure_hydrated(items):
+        for item in items:
+            item["usage_tips"] = '{"strength": 0.8, "clipStrength": 0.6}'
+
+    lora_service.scanner.ensure_hydrated = ensure_hydrated
+
+    result = await lora_service.get_random_loras(
+        count=1,
+        use_same_clip_strength=False,
+        use_recommended_strength=True,
+        recommended_strength_scale_min=1.0,
+        recommended_strength_scale_max=1.0,
+        seed=1,
+    )
+
+    assert result[0]["strength"] == 0.8
+    assert result[0]["clipStrength"] == 0.6
@@ -242,6 +242,45 @@ async def test_fetch_and_update_model_success_updates_cache(tmp_path):
     update_cache.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_fetch_and_update_model_uses_prefetched_metadata(tmp_path):
+    helpers = build_service()
+    helpers.default_provider.get_models_by_hashes = AsyncMock(
+        return_value={
+            "abc": {
+                "source": "api",
+                "model": {"name": "Remote", "description": "", "tags": []},
+                "images": [],
+                "baseModel": "sdxl",
+            }
+        }
+    )
+
+    prefetched = await helpers.service.prefetch_by_hashes(["abc", "def"])
+    model_path = tmp_path / "model.safetensors"
+    model_data = {"model_name": "Local", "folder": "root", "file_path": str(model_path)}
+
+    ok, error = await helpers.service.fetch_and_update_model(
+        sha256="abc",
+        file_path=str(model_path),
+        model_data=model_data,
+        update_cache_func=AsyncMock(return_value=True),
+        prefetched_metadata=prefetched.get("abc"),
+    )
+
+    assert ok and error is None
+    assert model_data["model_name"] == "Remote"
+    assert model_data["civitai_deleted"] is False
+    helpers.default_provider.get_model_by_hash.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_by_hashes_without_batch_support_returns_nothing():
+    helpers = build_service()
+
+    assert await helpers.service.prefetch_by_hashes(["abc"]) == {}
+
+
 @pytest.mark.asyncio
 async def test_fetch_and_update_model_keeps_deleted_flag_false_for_archive_source(tmp_path):
     helpers = build_service()
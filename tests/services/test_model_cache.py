@@ -145,3 +145,146 @@ async def test_version_files_index_rebuild_from_raw_data():
     # Invalid ids normalize to empty results
     assert cache.get_files_by_version_id('not-an-int') == []
     assert cache.get_files_by_version_id(None) == []
+
+
+def _sort_entry(index, name):
+    return {
+        'file_path': f'/models/{name}_{index}.safetensors',
+        'file_name': f'{name}_{index}',
+        'model_name': f'{name} v{index % 12}',
+        'folder': '',
+        'modified': float(index % 7),
+        'size': (index * 37) % 11,
+    }
+
+
+@pytest.mark.asyncio
+async def test_sort_views_track_adds_edits_and_removals():
+    names = ['alpha', 'Beta', 'gamma', 'Delta2', 'delta10']
+    cache = ModelCache(
+        raw_data=[_sort_entry(i, names[i % len(names)]) for i in range(40)],
+        folders=[],
+    )
+
+    def assert_matches_full_sort():
+        for sort_key in ('name', 'date', 'size', 'versions_count'):
+            for order in ('asc', 'desc'):
+                expected = cache._sort_data(cache.raw_data, sort_key, order)
+                assert cache._get_sorted_view(sort_key, order) == expected
+
+    assert_matches_full_sort()
+    view = cache._sort_views['name']
+
+    # Single edits, additions and removals patch the existing views
+    cache.raw_data[3]['model_name'] = 'zzz'
+    cache.raw_data[5]['modified'] = 99.0
+    cache.raw_data.append(_sort_entry(100, 'epsilon'))
+    cache.raw_data = [item for item in cache.raw_data if item['file_path'] != cache.raw_data[8]['file_path']]
+    await cache.resort()
+    assert cache._sort_views['name'] is view
+    assert_matches_full_sort()
+
+    # Switching the display mode invalidates every precomputed key
+    await cache.update_name_display_mode('file_name')
+    assert_matches_full_sort()
+
+    # Replacing the whole library rebuilds instead of patching
+    cache.raw_data = [_sort_entry(i, 'omega') for i in range(30)]
+    await cache.resort()
+    assert_matches_full_sort()
+
+
+@pytest.mark.asyncio
+async def test_get_sorted_data_switches_modes_without_full_resort(monkeypatch):
+    cache = ModelCache(raw_data=[_sort_entry(i, 'model') for i in range(20)], folders=[])
+    await cache.get_sorted_data('name', 'asc')
+    await cache.get_sorted_data('date', 'desc')
+
+    def fail_sort(*args, **kwargs):
+        raise AssertionError('full sort should not run for maintained views')
+
+    monkeypatch.setattr(cache, '_sort_data', fail_sort)
+    by_name = await cache.get_sorted_data('name', 'desc')
+    by_date = await cache.get_sorted_data('date', 'asc')
+
+    assert len(by_name) == len(by_date) == 20
+    assert by_date[0]['modified'] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_sorted_data_pages_without_copying_and_survives_edits():
+    cache = ModelCache(raw_data=[_sort_entry(i, 'model') for i in range(20)], folders=[])
+    ascending = await cache.get_sorted_data('name', 'asc')
+    expected_asc = cache._sort_data(cache.raw_data, 'name', 'asc')
+    view = cache._sort_views['name']
+    assert ascending._items is view.items
+
+    descending = cache._get_sorted_view('name', 'desc')
+    expected_desc = cache._sort_data(cache.raw_data, 'name', 'desc')
+    assert descending[2:5] == expected_desc[2:5]
+    assert descending[-1] is expected_desc[-1]
+    assert descending[::-3] == expected_desc[::-3]
+
+    # Edits copy the view before patching it, so handed-out snapshots stay put
+    cache.raw_data.append(_sort_entry(100, 'aaa'))
+    await cache.resort()
+    assert view.items is not ascending._items
+    assert list(ascending) == expected_asc
+    assert len(descending) == 20
+    assert cache._get_sorted_view('name', 'asc')[0]['model_name'] == 'aaa v4'
+
+
+@pytest.mark.asyncio
+async def test_auto_tags_are_recomputed_only_when_sources_change(monkeypatch):
+    from py.services import model_cache as model_cache_module
+
+    wan = {
+        'file_path': '/models/wan.safetensors',
+        'file_name': 'wan_i2v_high',
+        'base_model': 'Wan Video 2.2',
+        'tags': [],
+    }
+    plain = {'file_path': '/models/plain.safetensors', 'file_name': 'plain', 'tags': []}
+    cache = ModelCache(raw_data=[wan, plain], folders=[])
+    assert wan['auto_tags'] == ['HIGH', 'I2V']
+    assert plain['auto_tags'] == []
+
+    calls = []
+    original = model_cache_module.extract_auto_tags
+
+    def counting_extract(item):
+        calls.append(item['file_path'])
+        return original(item)
+
+    monkeypatch.setattr(model_cache_module, 'extract_auto_tags', counting_extract)
+
+    await cache.get_sorted_data('name', 'asc')
+    await cache.resort()
+    assert calls == []
+
+    plain['tags'].append('turbo')
+    wan['model_name'] = 'renamed'
+    await cache.resort()
+    assert calls == ['/models/plain.safetensors']
+    assert plain['auto_tags'] == ['Turbo']
+
+    cache.raw_data.append({'file_path': '/models/new.safetensors', 'file_name': 'x_t2v'})
+    await cache.resort()
+    assert calls[-1] == '/models/new.safetensors'
+    assert cache.raw_data[-1]['auto_tags'] == ['T2V']
+
+
+@pytest.mark.asyncio
+async def test_get_entries_by_path_follows_edits_and_removals():
+    cache = ModelCache(raw_data=[_sort_entry(i, 'model') for i in range(10)], folders=[])
+    first, last = cache.raw_data[0]['file_path'], cache.raw_data[9]['file_path']
+
+    found = cache.get_entries_by_path({first, '/missing'})
+    assert list(found) == [first]
+    assert found[first] is cache.raw_data[0]
+
+    # Removing an entry shifts positions; lookups must still resolve
+    removed = cache.raw_data.pop(0)
+    found = cache.get_entries_by_path({removed['file_path'], last})
+    assert list(found) == [last]
+    assert found[last] is cache.raw_data[-1]
@@ -0,0 +1,61 @@
+import json
+
+from py.services.model_entry_store import compact_entry
+
+
+def _entry(index: int) -> dict:
+    return {
+        'hash_status': 'completed',
+        'file_path': f'/models/loras/style/model_{index}.safetensors',
+        'file_name': f'model_{index}',
+        'folder': ''.join(['sty', 'le']),
+        'base_model': ''.join(['SD', 'XL']),
+        'tags': [''.join(['an', 'ime'])],
+        'civitai': {'id': index, 'creator': {'username': ''.join(['arti', 'st'])}},
+        'extra_field': index,
+    }
+
+
+def test_compact_entry_is_an_equal_plain_dict():
+    source = _entry(1)
+
+    entry = compact_entry(source)
+
+    assert type(entry) is dict
+    assert entry == source
+    assert entry is not source
+    assert list(entry)[:3] == ['file_path', 'file_name', 'folder']
+    assert list(entry)[-1] == 'extra_field'
+    assert json.loads(json.dumps(entry)) == source
+
+
+def test_compact_entries_share_repeated_strings():
+    first = compact_entry(_entry(1))
+    second = compact_entry(_entry(2))
+
+    assert first['folder'] is second['folder']
+    assert first['base_model'] is second['base_model']
+    assert first['tags'][0] is second['tags'][0]
+    assert first['civitai']['creator']['username'] is second['civitai']['creator']['username']
+
+
+def test_compact_entry_stays_mutable():
+    entry = compact_entry(_entry(1))
+
+    entry['auto_tags'] = ['style']
+    del entry['folder']
+    entry['tags'].append('new')
+
+    assert entry['auto_tags'] == ['style']
+    assert 'folder' not in entry
+    assert entry['tags'] == ['anime', 'new']
+
+
+def test_compact_entries_can_be_disabled(monkeypatch):
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_COMPACT_ENTRIES', '1')
+    source = _entry(1)
+
+    entry = compact_entry(source)
+
+    assert entry == source
+    assert list(entry) == list(source)
@@ -0,0 +1,143 @@
+import asyncio
+import os
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from py.services import model_scanner
+from py.services.model_file_walker import ModelFileWalker
+from py.services.model_hash_index import ModelHashIndex
+from py.services.model_scanner import ModelScanner
+from py.utils.models import BaseModelMetadata
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(path.name, encoding="utf-8")
+
+
+def _sequential_walk(root: str) -> List[str]:
+    """Reference depth-first scandir traversal used by the scanner before."""
+    found: List[str] = []
+    visited = set()
+
+    def recurse(path: str) -> None:
+        real = os.path.realpath(path)
+        if real in visited:
+            return
+        visited.add(real)
+        with os.scandir(path) as iterator:
+            for entry in list(iterator):
+                if entry.is_file(follow_symlinks=True):
+                    if entry.name.endswith(".safetensors"):
+                        found.append(entry.path.replace(os.sep, "/"))
+                elif entry.is_dir(follow_symlinks=True) and not entry.name.startswith("."):
+                    recurse(entry.path)
+
+    recurse(root)
+    return found
+
+
+async def _collect(walker: ModelFileWalker, roots: List[str], **kwargs) -> List[str]:
+    return [item.file_path async for item in walker.walk(roots, **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_walk_matches_sequential_depth_first_order(tmp_path: Path):
+    for index in range(40):
+        _touch(tmp_path / f"d{index % 5}" / f"s{index % 3}" / f"m{index}.safetensors")
+    _touch(tmp_path / "top.safetensors")
+    _touch(tmp_path / "notes.txt")
+    _touch(tmp_path / ".hidden" / "skipped.safetensors")
+
+    walker = ModelFileWalker({".safetensors"}, skip_dir=lambda name: name.startswith("."), max_workers=3)
+    discovered = [item async for item in walker.walk([str(tmp_path)])]
+
+    assert [item.file_path for item in discovered] == _sequential_walk(str(tmp_path))
+    assert [item.index for item in discovered] == list(range(41))
+    assert {item.root_path for item in discovered} == {str(tmp_path)}
+
+
+@pytest.mark.asyncio
+async def test_walk_dedupes_symlinked_trees_and_survives_loops(tmp_path: Path):
+    library = tmp_path / "library"
+    shared = tmp_path / "shared"
+    _touch(shared / "one.safetensors")
+    _touch(library / "own.safetensors")
+    library.joinpath("link").symlink_to(shared, target_is_directory=True)
+    library.joinpath("loop").symlink_to(library, target_is_directory=True)
+    shared.joinpath("alias.safetensors").symlink_to(shared / "one.safetensors")
+
+    walker = ModelFileWalker({".safetensors"})
+    paths = await _collect(walker, [str(library), str(shared), str(tmp_path / "missing")])
+
+    # The shared file is reported once, under the first path that reached it
+    assert len(paths) == 2
+    assert str(library / "own.safetensors").replace(os.sep, "/") in paths
+    assert any(path.startswith(str(library / "link").replace(os.sep, "/")) for path in paths)
+
+    # Aliases inside distinct real directories are all reported when asked for
+    aliases = await _collect(walker, [str(shared)], unique_files=False)
+    assert len(aliases) == 2
+
+
+class SlowScanner(ModelScanner):
+    def __init__(self, root: Path):
+        self._root = str(root)
+        super().__init__(
+            model_type="slow",
+            model_class=BaseModelMetadata,
+            file_extensions={".safetensors"},
+            hash_index=ModelHashIndex(),
+        )
+
+    def get_model_roots(self) -> List[str]:
+        return [self._root]
+
+    async def _process_model_file(self, file_path, root_path, *, hash_index=None, excluded_models=None) -> Optional[Dict[str, Any]]:
+        # Finish out of order to exercise the concurrent loaders
+        await asyncio.sleep(random.random() / 200)
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        return {
+            "file_path": file_path,
+            "folder": os.path.dirname(os.path.relpath(file_path, root_path)).replace(os.sep, "/"),
+            "file_name": name,
+            "model_name": name,
+            "sha256": f"hash-{name}",
+            "tags": [name[:2]],
+            "size": 1,
+            "modified": 1.0,
+        }
+
+
+@pytest.fixture
+def isolated_scanner(monkeypatch):
+    ModelScanner._instances.clear()
+    monkeypatch.setenv("LORA_MANAGER_DISABLE_PERSISTENT_CACHE", "1")
+
+    async def noop(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(model_scanner.ServiceRegistry, "register_service", noop)
+    yield
+    ModelScanner._instances.clear()
+
+
+@pytest.mark.asyncio
+async def test_gather_model_data_keeps_discovery_order(tmp_path: Path, isolated_scanner):
+    for index in range(60):
+        _touch(tmp_path / f"f{index % 4}" / f"m{index:02d}.safetensors")
+    progress = []
+
+    async def record(processed, total):
+        progress.append(processed)
+
+    scanner = SlowScanner(tmp_path)
+    result = await scanner._gather_model_data(total_files=60, progress_callback=record)
+
+    assert [item["file_path"] for item in result.raw_data] == _sequential_walk(str(tmp_path))
+    assert result.hash_index.get_path("hash-m07").endswith("/m07.safetensors")
+    assert sum(result.tags_count.values()) == 60
+    assert progress[-1] == 60
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from py.services import model_scanner
+from py.services.model_cache import ModelCache
+from py.services.model_hash_index import ModelHashIndex
+from py.services.model_name_index import ModelNameIndex
+from py.services.model_scanner import ModelScanner
+from py.utils.models import BaseModelMetadata
+
+
+def _entry(file_name: str, folder: str = "", **extra):
+    file_path = f"/loras/{folder}/{file_name}.safetensors" if folder else f"/loras/{file_name}.safetensors"
+    return {"file_name": file_name, "folder": folder, "file_path": file_path, "sha256": f"hash-{folder}-{file_name}", "tags": [], **extra}
+
+
+class NamedDummyScanner(ModelScanner):
+    def __init__(self, root: Path):
+        self._root = str(root)
+        super().__init__(
+            model_type="dummy",
+            model_class=BaseModelMetadata,
+            file_extensions={".safetensors"},
+            hash_index=ModelHashIndex(),
+            name_index=ModelNameIndex(),
+        )
+
+    def get_model_roots(self) -> List[str]:
+        return [self._root]
+
+
+@pytest.fixture(autouse=True)
+def reset_model_scanner_singletons(monkeypatch):
+    ModelScanner._instances.clear()
+    monkeypatch.setenv("LORA_MANAGER_DISABLE_PERSISTENT_CACHE", "1")
+
+    async def noop(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(model_scanner.ServiceRegistry, "register_service", noop)
+    yield
+    ModelScanner._instances.clear()
+
+
+def test_resolve_matches_name_path_and_extension():
+    index = ModelNameIndex()
+    index.rebuild([
+        _entry("mylora", "SDXL/Styles"),
+        _entry("other"),
+    ])
+
+    assert index.resolve("mylora").item["folder"] == "SDXL/Styles"
+    assert index.resolve("SDXL\\Styles\\mylora.safetensors").exact is True
+    assert index.resolve("other.SAFETENSORS").item["file_name"] == "other"
+    assert index.resolve("missing") is None
+    assert index.resolve("Other/missing") is None
+
+
+def test_resolve_basename_fallback_prefers_folder_prefix():
+    index = ModelNameIndex()
+    index.rebuild([
+        _entry("mylora", "V1"),
+        _entry("mylora", "V2"),
+    ])
+
+    # The exact folder/file key wins over the first basename match
+    assert index.resolve("V2/mylora").item["folder"] == "V2"
+
+    moved = index.resolve("OldFolder/mylora")
+    assert moved.exact is False
+    assert moved.item["folder"] == "V1"
+
+    nested = index.resolve("V2/sub/mylora")
+    assert nested.exact is False
+    assert nested.item["folder"] == "V2"
+
+
+def test_apply_replaces_and_removes_entries():
+    index = ModelNameIndex()
+    index.rebuild([_entry("a"), _entry("b", "x")], generation=1)
+
+    index.apply(["/loras/a.safetensors"], _entry("a", "moved"), generation=2)
+    assert index.generation == 2
+    assert index.resolve("a").item["folder"] == "moved"
+    assert index.resolve("moved/a").exact is True
+
+    index.apply(["/loras/x/b.safetensors"], generation=3)
+    assert index.resolve("b") is None
+    assert len(index) == 1
+
+
+@pytest.mark.asyncio
+async def test_scanner_keeps_name_index_in_step():
+    scanner = NamedDummyScanner(Path("/loras"))
+    scanner._cache = ModelCache(raw_data=[_entry("first")], folders=[])
+
+    index = scanner.get_name_index()
+    assert index is not None
+    assert index.resolve("first") is not None
+
+    assert await scanner.add_model_to_cache(_entry("second", "new"), folder="new")
+    assert index.generation == scanner.cache_version
+    assert index.resolve("new/second").item["file_name"] == "second"
+
+    moved = _entry("first", "archive")
+    await scanner.update_single_model_cache("/loras/first.safetensors", moved["file_path"], moved)
+    assert index.generation == scanner.cache_version
+    assert index.resolve("first").item["folder"] == "archive"
+
+    assert await scanner._batch_update_cache_for_deleted_models([moved["file_path"]])
+    assert index.generation == scanner.cache_version
+    assert index.resolve("first") is None
+
+
+@pytest.mark.asyncio
+async def test_scanner_rebuilds_stale_name_index(tmp_path: Path):
+    scanner = NamedDummyScanner(tmp_path)
+    scanner._cache = ModelCache(raw_data=[_entry("first")], folders=[])
+    scanner.get_name_index()
+
+    # Writers outside the scanner rewrite raw_data and only bump the version
+    scanner._cache.raw_data = [_entry("replaced")]
+    scanner.bump_cache_version()
+
+    index = scanner.get_name_index()
+    assert index.resolve("first") is None
+    assert index.resolve("replaced") is not None
+
+    scanner._is_initializing = True
+    assert scanner.get_name_index() is None
@@ -0,0 +1,188 @@
+"""Tests for the bitmap-backed model query index."""
+
+import pytest
+
+from py.services.base_model_service import BaseModelService
+from py.services.model_cache import ModelCache
+from py.services.model_query import FilterCriteria, ModelCacheRepository, ModelFilterSet
+from py.services.model_query_index import (
+    ModelQueryIndex,
+    iter_set_bits,
+    mask_from_positions,
+)
+
+
+class DictSettings(dict):
+    pass
+
+
+class DummyService(BaseModelService):
+    async def format_response(self, model_data):
+        return model_data
+
+
+class CacheScanner:
+    def __init__(self, cache):
+        self._cache = cache
+        self.cache_version = 0
+
+    async def get_cached_data(self, *args, **kwargs):
+        return self._cache
+
+
+class ListRepository(ModelCacheRepository):
+    """Serves copies of the sorted view so the index is never used."""
+
+    async def fetch_sorted(self, params):
+        return list(await super().fetch_sorted(params))
+
+
+def _build_items():
+    folders = ["", "anime", "anime/style", "anime-extra", "realistic", "realistic/people"]
+    base_models = ["SD 1.5", "SDXL", "Flux.1 D"]
+    tag_pool = ["Anime", "style", "character", "photo"]
+    items = []
+    for index in range(60):
+        tags = [tag_pool[(index + offset) % len(tag_pool)] for offset in range(index % 3)]
+        items.append(
+            {
+                "file_path": f"/models/{folders[index % len(folders)]}/model_{index}.safetensors",
+                "file_name": f"model_{index}",
+                "model_name": f"Model {index:02d}",
+                "folder": folders[index % len(folders)],
+                "base_model": base_models[index % len(base_models)],
+                "favorite": index % 4 == 0,
+                "preview_nsfw_level": (0, 1, 4, 16)[index % 4],
+                "license_flags": (127, 126, 125, 0)[index % 4],
+                "tags": tags,
+                "sub_type": "locon" if index % 5 == 0 else "lora",
+                "auto_tags": ["style"] if index % 6 == 0 else [],
+                "sha256": f"{index:064x}",
+            }
+        )
+    return items
+
+
+CRITERIA = [
+    FilterCriteria(),
+    FilterCriteria(favorites_only=True),
+    FilterCriteria(folder="anime"),
+    FilterCriteria(folder="anime", search_options={"recursive": False}),
+    FilterCriteria(folder="anime/"),
+    FilterCriteria(folder=""),
+    FilterCriteria(folder="", search_options={"recursive": False}),
+    FilterCriteria(folder_exclude=["anime"]),
+    FilterCriteria(folder_exclude=["realistic/", "anime/style"]),
+    FilterCriteria(folder_include=["realistic"]),
+    FilterCriteria(folder_include=["anime"], search_options={"recursive": False}),
+    FilterCriteria(folder="anime", folder_include=["anime/style"]),
+    FilterCriteria(base_models=["SDXL", "Flux.1 D"]),
+    FilterCriteria(tags={"anime": "include"}),
+    FilterCriteria(tags={"anime": "include", "style": "include"}),
+    FilterCriteria(tags={"anime": "include", "style": "include"}, tag_logic="all"),
+    FilterCriteria(tags={"__no_tags__": "include"}),
+    FilterCriteria(tags={"__no_tags__": "include", "photo": "include"}, tag_logic="all"),
+    FilterCriteria(tags={"photo": "exclude"}),
+    FilterCriteria(tags={"__no_tags__": "exclude", "character": "include"}),
+    FilterCriteria(model_types=["LoCon"]),
+    FilterCriteria(auto_tags={"style": "include"}),
+    FilterCriteria(auto_tags={"style": "exclude"}),
+    FilterCriteria(
+        folder="realistic",
+        base_models=["SD 1.5"],
+        tags={"character": "exclude"},
+        favorites_only=True,
+    ),
+]
+
+
+@pytest.mark.parametrize("show_only_sfw", [False, True])
+@pytest.mark.parametrize("criteria", CRITERIA)
+def test_apply_index_matches_list_filters(criteria, show_only_sfw):
+    items = _build_items()
+    filter_set = ModelFilterSet(DictSettings(show_only_sfw=show_only_sfw))
+    index = ModelQueryIndex(items)
+
+    expected = filter_set.apply(items, criteria)
+    selection = filter_set.apply_index(index, criteria)
+
+    assert len(selection) == len(expected)
+    assert list(selection) == expected
+
+
+def test_selection_supports_paging_and_indexing():
+    items = _build_items()
+    index = ModelQueryIndex(items)
+    selection = index.select(index.mask_for("favorite", True))
+    expected = [item for item in items if item["favorite"]]
+
+    assert len(selection) == len(expected)
+    assert selection[3:7] == expected[3:7]
+    assert selection[-2:] == expected[-2:]
+    assert selection[::4] == expected[::4]
+    assert selection[100:] == []
+    assert selection[0] is expected[0]
+    assert selection[-1] is expected[-1]
+    with pytest.raises(IndexError):
+        selection[len(expected)]
+
+
+def test_iter_set_bits_skips_by_rank():
+    positions = [0, 3, 63, 64, 65, 200, 1023]
+    mask = mask_from_positions(positions, 1024)
+
+    assert list(iter_set_bits(mask)) == positions
+    assert list(iter_set_bits(mask, 3)) == positions[3:]
+    assert list(iter_set_bits(mask, len(positions))) == []
+    assert list(iter_set_bits(0)) == []
+
+
+@pytest.mark.asyncio
+async def test_model_cache_reuses_and_invalidates_query_index():
+    items = _build_items()
+    cache = ModelCache(raw_data=items, folders=[])
+    sorted_data = await cache.get_sorted_data("name", "asc")
+
+    first = await cache.get_query_index(sorted_data, generation=1)
+    assert first is not None
+    assert await cache.get_query_index(sorted_data, generation=1) is first
+
+    # A different generation or a list the cache did not produce is not served
+    assert await cache.get_query_index(sorted_data, generation=2) is not first
+    assert await cache.get_query_index(list(sorted_data), generation=2) is None
+
+    await cache.resort()
+    resorted = await cache.get_sorted_data("name", "asc")
+    rebuilt = await cache.get_query_index(resorted, generation=2)
+    assert rebuilt is not None
+    assert rebuilt.entries is resorted
+
+
+@pytest.mark.asyncio
+async def test_paginated_data_matches_list_path():
+    settings = DictSettings()
+    scanner = CacheScanner(ModelCache(raw_data=_build_items(), folders=[]))
+    indexed = DummyService("lora", scanner, dict, settings_provider=settings)
+    linear = DummyService(
+        "lora",
+        scanner,
+        dict,
+        settings_provider=settings,
+        cache_repository=ListRepository(scanner),
+    )
+    query = dict(
+        page=2,
+        page_size=2,
+        sort_by="name:desc",
+        folder="anime",
+        tags={"character": "exclude"},
+        credit_required=True,
+        allow_selling_generated_content=False,
+    )
+
+    expected = await linear.get_paginated_data(**query)
+    result = await indexed.get_paginated_data(**query)
+
+    assert result == expected
+    assert result["total"] > 0
+    assert scanner._cache._query_index is not None
@@ -194,7 +194,7 @@ async def test_initialize_cache_sync_returns_result_without_mutating_state(tmp_p
     assert result.tags_count == {"alpha": 1, "beta": 1}
     assert ws_stub.payloads, "expected progress updates from websocket manager"
 
-    assert scanner._cache.raw_data == [{"file_path": "sentinel", "folder": ""}]
+    assert scanner._cache.raw_data == [{"file_path": "sentinel", "folder": "", "auto_tags": []}]
     assert scanner._hash_index.get_path("hash-one") is None
 
 
@@ -383,6 +383,7 @@ async def test_load_persisted_cache_populates_cache(tmp_path: Path, monkeypatch)
     entry = cache.raw_data[0]
     assert entry['file_path'] == normalized
     assert entry['tags'] == ['alpha']
+    await scanner.ensure_hydrated()
     assert entry['civitai']['trainedWords'] == ['abc']
     assert cache.version_index[11]['file_path'] == normalized
     assert scanner._hash_index.get_path('hash-one') == normalized
@@ -391,6 +392,57 @@ async def test_load_persisted_cache_populates_cache(tmp_path: Path, monkeypatch)
     assert ws_stub.payloads[-1]['progress'] == 1
 
 
+@pytest.mark.asyncio
+async def test_persisted_cache_defers_heavy_columns_until_hydrated(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    store = PersistentModelCache(db_path=str(tmp_path / 'cache.sqlite'))
+
+    file_path = tmp_path / 'one.txt'
+    file_path.write_text('one', encoding='utf-8')
+    normalized = _normalize_path(file_path)
+    raw_model = {
+        'file_path': normalized,
+        'file_name': 'one',
+        'model_name': 'one',
+        'folder': '',
+        'size': 3,
+        'modified': 123.0,
+        'sha256': 'hash-one',
+        'base_model': 'test',
+        'notes': 'long notes',
+        'usage_tips': '{"strength": 0.8}',
+        'tags': [],
+        'civitai': {'id': 11, 'modelId': 22, 'trainedWords': ['abc'], 'creator': {'username': 'artist'}},
+    }
+    store.save_cache('dummy', [raw_model], {'hash-one': [normalized]}, [])
+
+    monkeypatch.setattr(model_scanner, 'get_persistent_cache', lambda: store)
+    monkeypatch.setattr(model_scanner, 'ws_manager', RecordingWebSocketManager())
+    scanner = DummyScanner(tmp_path)
+    # Keep the background hydration from racing the assertions below
+    async def no_background_hydration():
+        return None
+
+    monkeypatch.setattr(scanner, '_hydrate_deferred_entries', no_background_hydration)
+
+    assert await scanner._load_persisted_cache('dummy') is True
+    entry = scanner._cache.raw_data[0]
+    assert entry['notes'] == ''
+    assert 'trainedWords' not in entry['civitai']
+
+    await scanner.ensure_hydrated([entry])
+    assert entry['notes'] == 'long notes'
+    assert entry['usage_tips'] == '{"strength": 0.8}'
+    assert entry['civitai']['trainedWords'] == ['abc']
+    assert entry['civitai']['creator']['username'] == 'artist'
+
+    # A full snapshot after hydration must not wipe the deferred columns
+    await scanner._persist_current_cache()
+    persisted = store.load_cache('dummy')
+    assert persisted.raw_data[0]['notes'] == 'long notes'
+    assert persisted.raw_data[0]['civitai']['trainedWords'] == ['abc']
+
+
 @pytest.mark.asyncio
 async def test_update_single_model_cache_persists_changes(tmp_path: Path, monkeypatch):
     monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
@@ -417,6 +469,7 @@ async def test_update_single_model_cache_persists_changes(tmp_path: Path, monkey
     }
 
     await scanner.update_single_model_cache(normalized, normalized, updated_metadata)
+    await scanner.flush_persistent_cache()
 
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
@@ -439,6 +492,31 @@ async def test_update_single_model_cache_persists_changes(tmp_path: Path, monkey
         assert tags == {'gamma', 'delta'}
 
 
+@pytest.mark.asyncio
+async def test_update_models_cache_batch_applies_all_updates_once(tmp_path: Path):
+    _create_files(tmp_path)
+    scanner = DummyScanner(tmp_path)
+    await scanner._initialize_cache()
+    cache = await scanner.get_cached_data()
+    version_before = scanner.cache_version
+
+    first = _normalize_path(tmp_path / 'one.txt')
+    second = _normalize_path(tmp_path / 'nested' / 'two.txt')
+    updates = []
+    for path, name, sha in ((first, 'zeta', 'hash-a'), (second, 'alpha', 'hash-b')):
+        existing = next(item for item in cache.raw_data if item['file_path'] == path)
+        updates.append((path, {**existing, 'model_name': name, 'sha256': sha, 'tags': ['batch']}))
+
+    assert await scanner.update_models_cache_batch(updates) == 2
+
+    assert len(cache.raw_data) == 2
+    assert scanner.cache_version == version_before + 1
+    assert [item['model_name'] for item in await cache.get_sorted_data('name', 'asc')] == ['alpha', 'zeta']
+    assert scanner._hash_index.get_path('hash-b') == second
+    assert scanner._tags_count['batch'] == 2
+    assert cache.folders == sorted({item['folder'] for item in cache.raw_data}, key=str.lower)
+
+
 @pytest.mark.asyncio
 async def test_batch_delete_persists_removal(tmp_path: Path, monkeypatch):
     monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
@@ -455,6 +533,7 @@ async def test_batch_delete_persists_removal(tmp_path: Path, monkeypatch):
     removed = await scanner._batch_update_cache_for_deleted_models([normalized])
 
     assert removed is True
+    await scanner.flush_persistent_cache()
 
     with sqlite3.connect(db_path) as conn:
         remaining = conn.execute(
@@ -465,6 +544,118 @@ async def test_batch_delete_persists_removal(tmp_path: Path, monkeypatch):
     assert remaining == 0
 
 
+@pytest.mark.asyncio
+async def test_preview_update_is_journaled_as_targeted_write(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    db_path = tmp_path / 'cache.sqlite'
+    monkeypatch.setenv('LORA_MANAGER_CACHE_DB', str(db_path))
+    monkeypatch.setattr(PersistentModelCache, '_instances', {}, raising=False)
+
+    first, _, _ = _create_files(tmp_path)
+    scanner = DummyScanner(tmp_path)
+
+    await scanner._initialize_cache()
+
+    persistent = scanner._persistent_cache
+    full_saves = []
+    monkeypatch.setattr(persistent, 'save_cache', lambda *args, **kwargs: full_saves.append(args))
+
+    normalized = _normalize_path(first)
+    assert await scanner.update_preview_in_cache(normalized, 'preview/one.webp', 2)
+    assert await scanner.update_preview_in_cache(normalized, 'preview/two.webp', 3)
+    assert scanner._persist_journal.pending == {normalized}
+
+    await scanner.flush_persistent_cache()
+
+    assert full_saves == []
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT preview_url, preview_nsfw_level FROM models WHERE file_path = ?",
+            (normalized,),
+        ).fetchone()
+
+    assert row == ('preview/two.webp', 3)
+
+
+async def _load_deferred_scanner(tmp_path: Path, monkeypatch) -> tuple[DummyScanner, PersistentModelCache, str]:
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    store = PersistentModelCache(db_path=str(tmp_path / 'cache.sqlite'))
+    file_path = tmp_path / 'one.txt'
+    file_path.write_text('one', encoding='utf-8')
+    normalized = _normalize_path(file_path)
+    raw_model = {
+        'file_path': normalized,
+        'file_name': 'one',
+        'model_name': 'one',
+        'folder': '',
+        'size': 3,
+        'modified': 123.0,
+        'sha256': 'hash-one',
+        'notes': 'long notes',
+        'tags': [],
+        'civitai': {'id': 11, 'modelId': 22, 'trainedWords': ['abc']},
+    }
+    store.save_cache('dummy', [raw_model], {'hash-one': [normalized]}, [])
+
+    monkeypatch.setattr(model_scanner, 'get_persistent_cache', lambda: store)
+    monkeypatch.setattr(model_scanner, 'ws_manager', RecordingWebSocketManager())
+    scanner = DummyScanner(tmp_path)
+
+    async def no_background_hydration():
+        return None
+
+    monkeypatch.setattr(scanner, '_hydrate_deferred_entries', no_background_hydration)
+    assert await scanner._load_persisted_cache('dummy') is True
+    return scanner, store, normalized
+
+
+@pytest.mark.asyncio
+async def test_flush_keeps_rows_when_library_switches_mid_write(tmp_path: Path, monkeypatch):
+    scanner, store, normalized = await _load_deferred_scanner(tmp_path, monkeypatch)
+    assert await scanner.update_preview_in_cache(normalized, 'preview/one.webp', 1)
+
+    original_load = store.load_deferred_fields
+
+    def switch_library_while_loading(model_type, paths):
+        # Another library becomes active while the write is in flight
+        scanner._cache = None
+        return original_load(model_type, paths)
+
+    monkeypatch.setattr(store, 'load_deferred_fields', switch_library_while_loading)
+    await scanner.flush_persistent_cache()
+
+    persisted = store.load_cache('dummy')
+    assert [item['file_path'] for item in persisted.raw_data] == [normalized]
+    assert persisted.raw_data[0]['preview_url'] == 'preview/one.webp'
+    assert store.load_deferred_fields('dummy', [normalized])[normalized]['notes'] == 'long notes'
+
+
+@pytest.mark.asyncio
+async def test_library_switch_drain_writes_off_the_loop(tmp_path: Path, monkeypatch):
+    import threading
+
+    scanner, store, normalized = await _load_deferred_scanner(tmp_path, monkeypatch)
+    assert await scanner.update_preview_in_cache(normalized, 'preview/one.webp', 1)
+
+    loaded_on = []
+    original_load = store.load_deferred_fields
+
+    def recording_load(model_type, paths):
+        loaded_on.append(threading.current_thread())
+        return original_load(model_type, paths)
+
+    monkeypatch.setattr(store, 'load_deferred_fields', recording_load)
+    drain = scanner._drain_persist_journal()
+    assert drain is not None
+    assert scanner._persist_journal.pending == set()
+
+    await drain
+    assert loaded_on and loaded_on[0] is not threading.current_thread()
+    persisted = store.load_cache('dummy')
+    assert persisted.raw_data[0]['preview_url'] == 'preview/one.webp'
+    assert store.load_deferred_fields('dummy', [normalized])[normalized]['notes'] == 'long notes'
+
+
 @pytest.mark.asyncio
 async def test_version_index_tracks_version_ids(tmp_path: Path):
     scanner = DummyScanner(tmp_path)
@@ -1210,3 +1401,98 @@ async def test_bulk_delete_cancelled_after_one_staged_batch_present(
     assert not first.exists()
     # The second file was never touched.
     assert second.exists()
+
+
+def _settle_tree(root: Path) -> None:
+    """Backdate directory mtimes so their fingerprints are trusted."""
+    settled = time.time_ns() - 60 * 1_000_000_000
+    for directory in [root, *[path for path in root.rglob("*") if path.is_dir()]]:
+        os.utime(directory, ns=(settled, settled))
+
+
+@pytest.mark.asyncio
+async def test_reconcile_only_lists_directories_changed_since_last_walk(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    store = PersistentModelCache(db_path=str(tmp_path / 'cache.sqlite'))
+    monkeypatch.setattr(model_scanner, 'get_persistent_cache', lambda: store)
+
+    root = tmp_path / 'loras'
+    for relative in ('a/one.txt', 'a/two.txt', 'b/three.txt', 'b/deep/four.txt'):
+        (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        (root / relative).write_text(relative, encoding='utf-8')
+    _settle_tree(root)
+
+    scanner = DummyScanner(root)
+    await scanner._initialize_cache()
+    assert len(store.load_dir_fingerprints('dummy')) == 4
+
+    listed: List[str] = []
+    original_scandir = os.scandir
+
+    def recording_scandir(path):
+        listed.append(_normalize_path(Path(path)).rstrip('/'))
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', recording_scandir)
+
+    await scanner._reconcile_cache()
+    assert listed == []
+    assert len(scanner._cache.raw_data) == 4
+
+    (root / 'b' / 'deep' / 'five.txt').write_text('five', encoding='utf-8')
+    (root / 'a' / 'two.txt').unlink()
+
+    await scanner._reconcile_cache()
+    assert sorted(listed) == [_normalize_path(root / 'a'), _normalize_path(root / 'b' / 'deep')]
+    assert {item['model_name'] for item in scanner._cache.raw_data} == {'one', 'three', 'four', 'five'}
+
+    # Dropping a model from the cache makes its directory untrustworthy
+    _settle_tree(root)
+    await scanner._reconcile_cache()
+    scanner._cache.raw_data = [item for item in scanner._cache.raw_data if item['model_name'] != 'three']
+    listed.clear()
+    await scanner._reconcile_cache()
+    assert listed == [_normalize_path(root / 'b')]
+    assert len(scanner._cache.raw_data) == 4
+
+    listed.clear()
+    await scanner.get_cached_data(force_refresh=True, deep_reconcile=True)
+    assert len(listed) == 4
+
+
+@pytest.mark.asyncio
+async def test_reconcile_resolves_cached_real_paths_only_for_unmatched_files(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    store = PersistentModelCache(db_path=str(tmp_path / 'cache.sqlite'))
+    monkeypatch.setattr(model_scanner, 'get_persistent_cache', lambda: store)
+
+    root = tmp_path / 'loras'
+    for relative in ('a/one.txt', 'a/two.txt', 'b/three.txt'):
+        (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        (root / relative).write_text(relative, encoding='utf-8')
+    _settle_tree(root)
+
+    scanner = DummyScanner(root)
+    await scanner._initialize_cache()
+    cached_files = {item['file_path'] for item in scanner._cache.raw_data}
+
+    resolved: List[str] = []
+    original_realpath = os.path.realpath
+
+    def recording_realpath(path, *args, **kwargs):
+        resolved.append(_normalize_path(Path(path)))
+        return original_realpath(path, *args, **kwargs)
+
+    monkeypatch.setattr(os.path, 'realpath', recording_realpath)
+
+    # Nothing changed: no cached entry is resolved on a warm start
+    await scanner._reconcile_cache()
+    assert resolved == []
+
+    # A new file is matched against trusted directories, not their files
+    (root / 'b' / 'alias.txt').symlink_to(root / 'a' / 'one.txt')
+    await scanner._reconcile_cache()
+    trusted_files = {path for path in cached_files if '/a/' in path}
+    assert not trusted_files & set(resolved)
+    assert _normalize_path(root / 'a') in resolved
+    assert {item['model_name'] for item in scanner._cache.raw_data} == {'one', 'two', 'three'}
@@ -0,0 +1,65 @@
+from py.services.model_search_index import ModelSearchIndex
+
+
+def _entry(file_name, **extra):
+    entry = {
+        "file_name": file_name,
+        "model_name": extra.pop("model_name", file_name),
+        "file_path": extra.pop("file_path", f"/loras/{file_name}.safetensors"),
+        "tags": extra.pop("tags", []),
+    }
+    entry.update(extra)
+    return entry
+
+
+def _names(candidates):
+    return sorted(item["file_name"] for item in candidates)
+
+
+def test_candidates_cover_substring_matches_across_fields():
+    entries = [
+        _entry("alpha_style", tags=["Portrait"]),
+        _entry("beta", civitai={"creator": {"username": "Painter"}}),
+        _entry("gamma", file_path="/loras/Characters/gamma.safetensors"),
+    ]
+    index = ModelSearchIndex()
+    index.sync(entries)
+
+    assert _names(index.candidates("style")) == ["alpha_style"]
+    assert _names(index.candidates("portr")) == ["alpha_style"]
+    assert _names(index.candidates("paint")) == ["beta"]
+    assert _names(index.candidates("characters/")) == ["gamma"]
+    assert index.candidates("zzz") == []
+
+
+def test_short_terms_fall_back_to_scan():
+    index = ModelSearchIndex()
+    index.sync([_entry("alpha")])
+
+    assert index.candidates("al") is None
+
+
+def test_sync_tracks_edits_and_removals():
+    first = _entry("alpha")
+    second = _entry("beta")
+    index = ModelSearchIndex()
+    index.sync([first, second])
+
+    first["model_name"] = "Renamed"
+    index.sync([first])
+
+    assert second not in index
+    assert len(index) == 1
+    assert _names(index.candidates("renamed")) == ["alpha"]
+    assert index.candidates("beta") == []
+
+
+def test_compaction_keeps_live_documents_searchable():
+    entries = [_entry(f"model_{i}") for i in range(10)]
+    index = ModelSearchIndex()
+    index.sync(entries)
+
+    index.sync(entries[:3])
+
+    assert index._dead == 0
+    assert _names(index.candidates("model_")) == ["model_0", "model_1", "model_2"]
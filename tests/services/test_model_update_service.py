@@ -798,3 +798,132 @@ def test_build_record_from_remote_preserves_paid_fields(tmp_path):
     rebuilt = record.versions[0]
     assert rebuilt.paid_access == '{"permanent": true, "endsAt": null}'
     assert rebuilt.is_paid is True
+
+
+@pytest.mark.asyncio
+async def test_update_availability_index_matches_record_checks(tmp_path):
+    service = ModelUpdateService(str(tmp_path / "updates.sqlite"), ttl_seconds=3600)
+    records = [
+        make_record(
+            make_version(10, in_library=True, base_model="SDXL"),
+            make_version(11, in_library=False, base_model="SDXL"),
+            make_version(20, in_library=False, base_model="Flux", is_paid=True),
+        ),
+        make_record(
+            make_version(30, in_library=True, base_model="SD 1.5"),
+            make_version(31, in_library=False, base_model="SD 1.5", is_early_access=True),
+        ),
+        make_record(
+            make_version(40, in_library=True, base_model="SDXL"),
+            make_version(41, in_library=False, base_model="SDXL"),
+            should_ignore_model=True,
+        ),
+    ]
+    for model_id, record in enumerate(records, start=1):
+        service._upsert_record(
+            ModelUpdateRecord("lora", model_id, record.versions, None, record.should_ignore_model)
+        )
+
+    for hide_early_access in (False, True):
+        for hide_paid in (False, True):
+            index = await service.get_update_availability(
+                hide_early_access=hide_early_access, hide_paid=hide_paid
+            )
+            for model_id, record in enumerate(records, start=1):
+                assert index.has_update(model_id) == record.has_update(
+                    hide_early_access=hide_early_access, hide_paid=hide_paid
+                )
+                for base_model in ("SDXL", "Flux", "SD 1.5", "Other", None):
+                    local_ids = [
+                        version.version_id
+                        for version in record.versions
+                        if version.is_in_library
+                        and (version.base_model or "").lower() == (base_model or "").lower()
+                    ]
+                    for local_version in (None, 5, 10, 30):
+                        threshold = max(local_ids) if local_ids else local_version
+                        assert index.has_update_for_base(
+                            model_id, base_model, local_version
+                        ) == record.has_update_for_base(
+                            threshold,
+                            base_model,
+                            hide_early_access=hide_early_access,
+                            hide_paid=hide_paid,
+                        )
+
+@pytest.mark.asyncio
+async def test_update_availability_index_follows_record_writes(tmp_path):
+    service = ModelUpdateService(str(tmp_path / "updates.sqlite"), ttl_seconds=3600)
+    service._upsert_record(
+        ModelUpdateRecord(
+            "lora",
+            5,
+            [
+                make_version(50, in_library=True, base_model="SDXL"),
+                make_version(51, in_library=False, base_model="SDXL"),
+            ],
+            None,
+            False,
+        )
+    )
+
+    index = await service.get_update_availability()
+    assert index.models_with_updates == frozenset({5})
+
+    await service.set_should_ignore("lora", 5, True)
+    assert index.has_update(5) is False
+
+    await service.set_should_ignore("lora", 5, False)
+    await service.update_in_library_versions("lora", 5, [50, 51])
+    assert index.has_update(5) is False
+    assert index.has_update_for_base(5, "SDXL", 50) is False
+    assert await service.get_update_availability() is index
+
+
+@pytest.mark.asyncio
+async def test_update_availability_index_expires_with_early_access(tmp_path):
+    service = ModelUpdateService(str(tmp_path / "updates.sqlite"), ttl_seconds=3600)
+    service._upsert_record(
+        ModelUpdateRecord(
+            "lora",
+            6,
+            [
+                make_version(60, in_library=True, base_model="SDXL"),
+                make_version(
+                    61,
+                    in_library=False,
+                    base_model="SDXL",
+                    early_access_ends_at="2099-01-01T00:00:00Z",
+                ),
+            ],
+            None,
+            False,
+        )
+    )
+
+    hidden = await service.get_update_availability(hide_early_access=True)
+    shown = await service.get_update_availability(hide_early_access=False)
+
+    assert hidden.has_update(6) is False
+    assert shown.has_update(6) is True
+    assert shown.valid_until is None
+    assert hidden.valid_until is not None
+    assert hidden.is_expired(hidden.valid_until)
+
+
+@pytest.mark.asyncio
+async def test_current_revision_moves_with_writes_and_expired_windows(tmp_path):
+    service = ModelUpdateService(str(tmp_path / "updates.sqlite"), ttl_seconds=3600)
+    start = service.current_revision()
+
+    await service.set_should_ignore("lora", 7, True)
+    written = service.current_revision()
+    assert written != start
+
+    hidden = await service.get_update_availability(hide_early_access=True)
+    assert service.current_revision() == written
+
+    # An early-access window that ended invalidates the hidden flags
+    hidden.valid_until = 0.0
+    assert service.current_revision() != written
+    assert await service.get_update_availability(hide_early_access=True) is not hidden
@@ -0,0 +1,107 @@
+import asyncio
+from typing import List, Set
+
+import pytest
+
+from py.services.persistent_cache_journal import PersistentCacheJournal
+
+
+class RecordingFlush:
+    def __init__(self) -> None:
+        self.batches: List[Set[str]] = []
+        self.fail_next = False
+
+    async def __call__(self, paths: Set[str]) -> None:
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("disk full")
+        self.batches.append(set(paths))
+
+
+@pytest.mark.asyncio
+async def test_marks_are_coalesced_into_one_timed_flush():
+    flush = RecordingFlush()
+    journal = PersistentCacheJournal(flush, delay=0.01, threshold=100)
+
+    journal.mark_dirty(["a", "b"])
+    journal.mark_dirty(["a", ""])
+    assert journal.pending == {"a", "b"}
+
+    await asyncio.sleep(0.05)
+
+    assert flush.batches == [{"a", "b"}]
+    assert not journal.pending
+
+
+@pytest.mark.asyncio
+async def test_threshold_flushes_without_waiting_for_timer():
+    flush = RecordingFlush()
+    journal = PersistentCacheJournal(flush, delay=60.0, threshold=3)
+
+    journal.mark_dirty(["a", "b"])
+    await asyncio.sleep(0)
+    assert flush.batches == []
+
+    journal.mark_dirty(["c"])
+    await asyncio.sleep(0.01)
+
+    assert flush.batches == [{"a", "b", "c"}]
+
+
+@pytest.mark.asyncio
+async def test_explicit_flush_writes_pending_and_cancels_timer():
+    flush = RecordingFlush()
+    journal = PersistentCacheJournal(flush, delay=0.01, threshold=100)
+
+    journal.mark_dirty(["a"])
+    await journal.flush()
+    await asyncio.sleep(0.05)
+
+    assert flush.batches == [{"a"}]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_paths():
+    flush = RecordingFlush()
+    flush.fail_next = True
+    journal = PersistentCacheJournal(flush, delay=60.0, threshold=100)
+
+    journal.mark_dirty(["a"])
+    await journal.flush()
+    assert journal.pending == {"a"}
+
+    await journal.flush()
+    assert flush.batches == [{"a"}]
+    assert not journal.pending
+
+
+@pytest.mark.asyncio
+async def test_failed_background_flush_is_retried_after_delay():
+    flush = RecordingFlush()
+    flush.fail_next = True
+    journal = PersistentCacheJournal(flush, delay=0.01, threshold=100)
+
+    journal.mark_dirty(["a"])
+    await asyncio.sleep(0.1)
+
+    assert flush.batches == [{"a"}]
+    assert not journal.pending
+
+
+@pytest.mark.asyncio
+async def test_paths_marked_during_flush_are_written_by_the_next_flush():
+    journal: PersistentCacheJournal
+    batches: List[Set[str]] = []
+
+    async def slow_flush(paths: Set[str]) -> None:
+        batches.append(set(paths))
+        if len(batches) == 1:
+            journal.mark_dirty(["a"])
+            await asyncio.sleep(0.01)
+
+    journal = PersistentCacheJournal(slow_flush, delay=60.0, threshold=100)
+    journal.mark_dirty(["a"])
+
+    await asyncio.gather(journal.flush(), journal.flush())
+
+    assert batches == [{"a"}, {"a"}]
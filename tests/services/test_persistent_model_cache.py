@@ -1,3 +1,4 @@
+import sqlite3
 from pathlib import Path
 from typing import Any, Dict
 
@@ -451,3 +452,124 @@ def test_get_models_missing_autov3_self_terminates_after_marking(tmp_path: Path,
     store.update_single_model('dummy', new_item, old_item=old_item)
 
     assert store.get_models_missing_autov3('dummy') == []
+
+
+# ── save_changes ──────────────────────────────────────────────────────
+
+
+def test_save_changes_writes_only_given_paths(tmp_path: Path, monkeypatch) -> None:
+    """Targeted writes replace the touched rows without reading the library."""
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    store = PersistentModelCache(db_path=str(tmp_path / 'cache.sqlite'))
+
+    kept = (tmp_path / 'kept.txt').as_posix()
+    edited = (tmp_path / 'edited.txt').as_posix()
+    removed = (tmp_path / 'removed.txt').as_posix()
+    store.save_cache(
+        'dummy',
+        [
+            {**_autov3_entry(kept, 'hash-kept'), 'tags': ['keep']},
+            {**_autov3_entry(edited, 'hash-old', autov3='av-old'), 'tags': ['old']},
+            _autov3_entry(removed, 'hash-removed'),
+        ],
+        {'hash-kept': [kept], 'hash-old': [edited], 'hash-removed': [removed]},
+        [],
+        {'av-old': [edited]},
+    )
+
+    statements: list[str] = []
+    original_connect = store._connect
+
+    def _recording_connect(readonly: bool = False):
+        conn = original_connect(readonly=readonly)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    store._connect = _recording_connect  # type: ignore[method-assign]
+
+    store.save_changes(
+        'dummy',
+        [{**_autov3_entry(edited, 'hash-new', autov3='av-new'), 'model_name': 'Edited', 'tags': ['new']}],
+        [removed],
+        {removed: True},
+    )
+
+    assert not [stmt for stmt in statements if stmt.lstrip().upper().startswith('SELECT')]
+
+    store._connect = original_connect  # type: ignore[method-assign]
+    persisted = store.load_cache('dummy')
+    assert persisted is not None
+    items = {item['file_path']: item for item in persisted.raw_data}
+    assert set(items) == {kept, edited}
+    assert items[kept]['tags'] == ['keep']
+    assert items[edited]['model_name'] == 'Edited'
+    assert items[edited]['tags'] == ['new']
+    assert sorted(persisted.hash_rows) == [('hash-kept', kept), ('hash-new', edited)]
+    assert persisted.autov3_hash_rows == [('av-new', edited)]
+    assert persisted.excluded_models == [removed]
+
+
+def test_save_changes_clears_excluded_state(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    store = PersistentModelCache(db_path=str(tmp_path / 'cache.sqlite'))
+
+    model = (tmp_path / 'model.txt').as_posix()
+    stale = (tmp_path / 'stale.txt').as_posix()
+    store.save_cache('dummy', [_autov3_entry(model, 'hash-m')], {}, [stale])
+
+    store.save_changes('dummy', [], [stale], {stale: False})
+
+    persisted = store.load_cache('dummy')
+    assert persisted is not None
+    assert persisted.excluded_models == []
+    assert [item['file_path'] for item in persisted.raw_data] == [model]
+
+
+def test_save_changes_raises_when_the_write_fails(tmp_path: Path, monkeypatch) -> None:
+    """Failures reach the write-behind journal so it can queue the paths again."""
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    store = PersistentModelCache(db_path=str(tmp_path / 'cache.sqlite'))
+    model = (tmp_path / 'model.txt').as_posix()
+    store.save_cache('dummy', [_autov3_entry(model, 'hash-m')], {}, [])
+
+    conn = store._connect()
+    conn.execute('DROP TABLE model_tags')
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(sqlite3.OperationalError):
+        store.save_changes('dummy', [{**_autov3_entry(model, 'hash-m'), 'tags': ['t']}])
+
+
+def test_deferred_load_skips_heavy_columns(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv('LORA_MANAGER_DISABLE_PERSISTENT_CACHE', '0')
+    store = PersistentModelCache(db_path=str(tmp_path / 'cache.sqlite'))
+
+    model = (tmp_path / 'model.txt').as_posix()
+    entry = _autov3_entry(model, 'hash-m')
+    entry.update(
+        notes='notes',
+        usage_tips='{"strength": 1}',
+        civitai={'id': 1, 'modelId': 2, 'trainedWords': ['w'], 'creator': {'username': 'me'}},
+    )
+    store.save_cache('dummy', [entry], {'hash-m': [model]}, [])
+
+    persisted = store.load_cache('dummy', defer_heavy_columns=True)
+    assert persisted is not None and persisted.deferred
+    item = persisted.raw_data[0]
+    assert item['notes'] == ''
+    assert item['usage_tips'] == ''
+    assert item['civitai']['id'] == 1
+    assert 'trainedWords' not in item['civitai']
+    assert 'creator' not in item['civitai']
+
+    fields = store.load_deferred_fields('dummy', [model, 'missing'])
+    assert fields == {
+        model: {
+            'notes': 'notes',
+            'usage_tips': '{"strength": 1}',
+            'trained_words': ['w'],
+            'creator_username': 'me',
+        }
+    }
+    assert store.load_deferred_fields('dummy') == fields
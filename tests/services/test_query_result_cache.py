@@ -0,0 +1,130 @@
+"""Tests for the list query result cache."""
+
+import pytest
+
+from py.services.base_model_service import BaseModelService
+from py.services.model_cache import ModelCache
+from py.services.query_result_cache import QueryResultCache, freeze_query_value
+
+
+class DictSettings(dict):
+    pass
+
+
+class DummyService(BaseModelService):
+    async def format_response(self, model_data):
+        return model_data
+
+
+class CacheScanner:
+    def __init__(self, cache):
+        self._cache = cache
+        self.cache_version = 0
+
+    async def get_cached_data(self, *args, **kwargs):
+        return self._cache
+
+
+def _build_items(count=12):
+    return [
+        {
+            "file_path": f"/models/{'anime' if index % 2 else 'real'}/model_{index}.safetensors",
+            "file_name": f"model_{index}",
+            "model_name": f"Model {index:02d}",
+            "folder": "anime" if index % 2 else "real",
+            "base_model": "SDXL",
+            "preview_nsfw_level": 16 if index % 3 == 0 else 0,
+            "tags": [],
+            "sha256": f"{index:064x}",
+        }
+        for index in range(count)
+    ]
+
+
+def _names(page):
+    return [item["file_name"] for item in page["items"]]
+
+
+def test_freeze_query_value_normalises_empty_and_nested_values():
+    assert freeze_query_value([]) is None
+    assert freeze_query_value({}) is None
+    assert freeze_query_value({"b": ["x"], "a": 1}) == (("a", 1), ("b", ("x",)))
+    assert freeze_query_value({"x", "y"}) == ("x", "y")
+
+
+def test_lru_evicts_by_entry_count_and_item_budget():
+    cache = QueryResultCache(max_entries=2, max_items=5)
+    cache.put(1, "a", [{}])
+    cache.put(1, "b", [{}])
+    assert cache.get(1, "a") is not None
+    cache.put(1, "c", [{}])
+
+    assert cache.get(1, "b") is None
+    assert cache.get(1, "c") is not None
+
+    # Four more items exceed the budget of five, evicting "a"
+    cache.put(1, "d", [{}] * 4)
+    assert cache.get(1, "a") is None
+    assert len(cache) == 2
+
+    # Lists larger than the whole budget are not stored
+    cache.put(1, "e", [{}] * 6)
+    assert cache.get(1, "e") is None
+
+    stats = cache.stats()
+    assert stats["items"] == 5
+    assert stats["evictions"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 3
+    assert stats["hit_rate"] == 0.4
+
+
+def test_new_generation_drops_stored_results():
+    cache = QueryResultCache()
+    cache.put(1, "a", [{}])
+
+    assert cache.get(2, "a") is None
+    assert len(cache) == 0
+    assert cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_paginated_data_reuses_filtered_list_across_pages():
+    scanner = CacheScanner(ModelCache(raw_data=_build_items(), folders=[]))
+    service = DummyService(
+        "lora", scanner, dict, settings_provider=DictSettings(show_only_sfw=False)
+    )
+    query = dict(page_size=2, sort_by="name:asc", folder="anime")
+
+    first = await service.get_paginated_data(page=1, **query)
+    second = await service.get_paginated_data(page=2, **query)
+
+    assert _names(first) == ["model_1", "model_3"]
+    assert _names(second) == ["model_5", "model_7"]
+    assert second["total"] == 6
+    assert service.result_cache.hits == 1
+    assert service.result_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_paginated_data_recomputes_after_cache_changes():
+    cache = ModelCache(raw_data=_build_items(), folders=[])
+    scanner = CacheScanner(cache)
+    settings = DictSettings(show_only_sfw=False)
+    service = DummyService("lora", scanner, dict, settings_provider=settings)
+    query = dict(page=1, page_size=20, sort_by="name:asc")
+
+    assert (await service.get_paginated_data(**query))["total"] == 12
+
+    settings["show_only_sfw"] = True
+    assert (await service.get_paginated_data(**query))["total"] == 8
+
+    # Edits made through the cache move its revision without a version bump
+    await cache.update_preview_url("/models/real/model_0.safetensors", "", 0)
+    assert (await service.get_paginated_data(**query))["total"] == 9
+
+    cache.raw_data.pop()
+    await cache.resort()
+    scanner.cache_version += 1
+    assert (await service.get_paginated_data(**query))["total"] == 8
+    assert service.result_cache.hits == 0
@@ -0,0 +1,226 @@
+import threading
+
+import pytest
+
+from py.services.recipe_cache import RecipeCache
+
+
+def _recipe(recipe_id, *, loras=(), checkpoint=None, fingerprint="", source_path=""):
+    recipe = {
+        "id": recipe_id,
+        "title": f"Recipe {recipe_id}",
+        "file_path": f"/recipes/{recipe_id}.webp",
+        "loras": [{"hash": value} for value in loras],
+        "fingerprint": fingerprint,
+        "source_path": source_path,
+    }
+    if checkpoint is not None:
+        recipe["checkpoint"] = checkpoint
+    return recipe
+
+
+def _cache(recipes):
+    return RecipeCache(raw_data=list(recipes), sorted_by_name=[], sorted_by_date=[])
+
+
+def _ids(recipes):
+    return [recipe["id"] for recipe in recipes]
+
+
+@pytest.mark.asyncio
+async def test_reverse_indexes_follow_add_replace_and_remove():
+    cache = _cache(
+        [
+            _recipe("a", loras=["AAA", "bbb"], fingerprint="fp1", source_path="https://x/1"),
+            _recipe("b", loras=["aaa"], checkpoint={"hash": "CKPT"}, fingerprint="fp1"),
+        ]
+    )
+
+    assert _ids(cache.recipes_with_lora("aaa")) == ["a", "b"]
+    assert _ids(cache.recipes_with_checkpoint("ckpt")) == ["b"]
+    assert _ids(cache.recipes_with_fingerprint("fp1")) == ["a", "b"]
+    assert _ids(cache.recipes_with_source_path(" https://x/1 ")) == ["a"]
+
+    await cache.add_recipe(_recipe("c", loras=["bbb"], source_path="https://x/1"))
+    assert _ids(cache.recipes_with_lora("bbb")) == ["a", "c"]
+    assert {key: _ids(value) for key, value in cache.source_path_groups().items()} == {
+        "https://x/1": ["a", "c"]
+    }
+
+    assert await cache.replace_recipe("a", _recipe("a", loras=["ccc"]))
+    assert _ids(cache.recipes_with_lora("aaa")) == ["b"]
+    assert _ids(cache.recipes_with_lora("ccc")) == ["a"]
+    assert cache.fingerprint_groups() == {}
+
+    removed = await cache.remove_recipe("b")
+    assert removed["id"] == "b"
+    assert cache.recipes_with_lora("aaa") == []
+    assert cache.get_cached_recipe("b") is None
+    assert (await cache.get_recipe("c"))["id"] == "c"
+    assert _ids(cache.raw_data) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_update_metadata_and_in_place_edits_are_reindexed():
+    recipe = _recipe("a", loras=["aaa"], checkpoint={"name": "model"})
+    cache = _cache([recipe])
+
+    assert _ids(cache.recipes_with_checkpoint("ckpt", include_unhashed=True)) == ["a"]
+    assert cache.recipes_with_checkpoint("ckpt") == []
+
+    assert await cache.update_recipe_metadata("a", {"fingerprint": "fp2"}, resort=False)
+    assert _ids(cache.recipes_with_fingerprint("fp2")) == ["a"]
+
+    recipe["loras"][0]["hash"] = "ddd"
+    recipe["checkpoint"]["hash"] = "ckpt"
+    cache.reindex_recipe(recipe)
+    assert _ids(cache.recipes_with_lora("ddd")) == ["a"]
+    assert cache.recipes_with_lora("aaa") == []
+    assert cache.recipe_ids_with_checkpoint("CKPT") == {"a"}
+
+
+def test_indexes_rebuild_when_raw_data_is_swapped_or_appended():
+    cache = _cache([_recipe("a", loras=["aaa"])])
+    assert _ids(cache.recipes_with_lora("aaa")) == ["a"]
+
+    cache.raw_data = [_recipe("b", loras=["aaa"])]
+    assert _ids(cache.recipes_with_lora("aaa")) == ["b"]
+    assert cache.get_cached_recipe("a") is None
+
+    cache.raw_data.append(_recipe("c", loras=["aaa"]))
+    assert _ids(cache.recipes_with_lora("aaa")) == ["b", "c"]
+    assert cache.get_cached_recipe("c") is cache.raw_data[1]
+
+
+def _dated(recipe_id, title, modified):
+    return {
+        "id": recipe_id,
+        "title": title,
+        "file_path": f"/recipes/{recipe_id}.webp",
+        "modified": modified,
+        "loras": [],
+    }
+
+
+def _assert_views_sorted(cache):
+    expected = _cache(list(cache.raw_data))
+    expected.rebuild_sorted_views()
+    assert _ids(cache.sorted_by_name) == _ids(expected.sorted_by_name)
+    assert _ids(cache.sorted_by_date) == _ids(expected.sorted_by_date)
+
+
+@pytest.mark.asyncio
+async def test_sorted_views_are_patched_by_mutations():
+    cache = _cache([_dated(f"r{i}", f"Recipe {i}", float(i)) for i in range(10)])
+    cache.rebuild_sorted_views()
+    name_view = cache.sorted_by_name
+
+    await cache.add_recipe(_dated("new", "Recipe 4b", 4.5))
+    await cache.update_recipe_metadata("r7", {"title": "AAA", "modified": 0.5}, resort=False)
+    await cache.replace_recipe("r2", _dated("r2", "Recipe 99", 20.0))
+    await cache.remove_recipe("r5")
+    await cache.bulk_remove(["r0", "r9"])
+
+    assert cache.sorted_by_name is name_view
+    assert _ids(cache.sorted_by_name)[:2] == ["r7", "r1"]
+    assert _ids(cache.sorted_by_date)[0] == "r2"
+    _assert_views_sorted(cache)
+
+
+
+@pytest.mark.asyncio
+async def test_mutations_with_resort_patch_only_the_touched_recipes(monkeypatch):
+    cache = _cache([_dated(f"r{i}", f"Recipe {i}", float(i)) for i in range(20)])
+    cache.rebuild_sorted_views()
+
+    def fail_full_diff():
+        raise AssertionError("mutators must not diff every recipe")
+
+    monkeypatch.setattr(cache, "_pending_sort_changes", fail_full_diff)
+
+    await cache.add_recipe(_dated("new", "Recipe 4b", 4.5), resort=True)
+    await cache.update_recipe_metadata("r7", {"title": "AAA", "modified": 0.5})
+    await cache.replace_recipe("r2", _dated("r2", "Recipe 99", 20.0), resort=True)
+    await cache.remove_recipe("r5", resort=True)
+    await cache.bulk_remove(["r0", "r9"], resort=True)
+
+    assert _ids(cache.sorted_by_name)[0] == "r7"
+    assert _ids(cache.sorted_by_date)[0] == "r2"
+    _assert_views_sorted(cache)
+
+@pytest.mark.asyncio
+async def test_resort_picks_up_in_place_edits_without_rebuilding():
+    cache = _cache([_dated(f"r{i}", f"Recipe {i}", float(i)) for i in range(20)])
+    cache.rebuild_sorted_views()
+    date_view = cache.sorted_by_date
+
+    cache.raw_data[3]["modified"] = 100.0
+    cache.raw_data.append(_dated("late", "Late", 50.0))
+    await cache.resort()
+
+    assert cache.sorted_by_date is date_view
+    assert _ids(cache.sorted_by_date)[:2] == ["r3", "late"]
+    _assert_views_sorted(cache)
+
+    cache.sorted_by_name = []
+    await cache.resort()
+    assert len(cache.sorted_by_name) == len(cache.raw_data)
+    _assert_views_sorted(cache)
+
+
+@pytest.mark.asyncio
+async def test_resort_never_patches_views_off_the_event_loop(monkeypatch):
+    cache = _cache([_dated(f"r{i}", f"Recipe {i}", float(i)) for i in range(20)])
+    cache.rebuild_sorted_views()
+    offloaded = []
+    monkeypatch.setattr(cache, "_apply_sort_changes", _recording(cache._apply_sort_changes, offloaded))
+
+    cache.raw_data[3]["modified"] = 100.0
+    await cache.resort()
+
+    # The small patch ran inline on the loop thread
+    assert offloaded == [threading.main_thread()]
+
+    # A rebuild sorts fresh lists; a reader holding the old ones sees them intact
+    reader_view = cache.sorted_by_name
+    reader_snapshot = list(reader_view)
+    for recipe in cache.raw_data:
+        recipe["title"] = f"Renamed {recipe['id']}"
+    await cache.resort()
+
+    assert cache.sorted_by_name is not reader_view
+    assert reader_view == reader_snapshot
+    _assert_views_sorted(cache)
+
+
+def _recording(method, calls):
+    def wrapper(*args, **kwargs):
+        calls.append(threading.current_thread())
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+@pytest.mark.asyncio
+async def test_revision_moves_with_every_cache_change():
+    cache = _cache([_recipe("a"), _recipe("b")])
+    cache.rebuild_sorted_views()
+    seen = {cache.revision}
+
+    async def step(action):
+        await action
+        assert cache.revision not in seen
+        seen.add(cache.revision)
+
+    await step(cache.add_recipe(_recipe("c")))
+    await step(cache.update_recipe_metadata("a", {"favorite": True}, resort=False))
+    await step(cache.replace_recipe("b", _recipe("b", loras=["x"])))
+    await step(cache.remove_recipe("c"))
+
+    before = cache.revision
+    await cache.resort()
+    assert cache.revision == before
+
+    cache.raw_data[0]["title"] = "Renamed"
+    await cache.resort()
+    assert cache.revision > before
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import os
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Dict
@@ -12,6 +13,7 @@ from py.services import model_scanner as model_scanner_module
 from py.services.model_cache import ModelCache
 from py.services.model_hash_index import ModelHashIndex
 from py.services.model_scanner import CacheBuildResult, ModelScanner
+from py.services.recipe_cache import RecipeCache
 from py.services.recipe_scanner import RecipeScanner
 from py.services import settings_manager as settings_manager_module
 from py.utils.models import BaseModelMetadata
@@ -272,6 +274,47 @@ async def test_remove_recipe_during_reads(recipe_scanner):
     assert {item["id"] for item in cache.raw_data} == {"alpha", "gamma"}
 
 
+async def test_index_writes_and_searches_run_off_the_event_loop(recipe_scanner):
+    scanner, _ = recipe_scanner
+    loop_thread = threading.get_ident()
+    calls: list[tuple[str, bool]] = []
+
+    def recorder(name, result=None):
+        def _call(*_args, **_kwargs):
+            calls.append((name, threading.get_ident() == loop_thread))
+            return result
+
+        return _call
+
+    scanner._persistent_cache = SimpleNamespace(
+        update_recipe=recorder("cache.update_recipe"),
+        remove_recipe=recorder("cache.remove_recipe"),
+        save_image_id_map=recorder("cache.save_image_id_map"),
+    )
+    scanner._fts_index = SimpleNamespace(
+        is_ready=lambda: True,
+        update_recipe=recorder("fts.update_recipe", True),
+        remove_recipe=recorder("fts.remove_recipe", True),
+        search=recorder("fts.search", {"one"}),
+    )
+
+    await scanner.add_recipe(
+        {"id": "one", "file_path": "path/one.png", "title": "One", "loras": []}
+    )
+    await scanner.get_paginated_data(page=1, page_size=10, search="one")
+    await scanner.bulk_remove(["one"])
+
+    assert calls == [
+        ("fts.update_recipe", False),
+        ("cache.update_recipe", False),
+        ("cache.save_image_id_map", False),
+        ("fts.search", False),
+        ("fts.remove_recipe", False),
+        ("cache.remove_recipe", False),
+        ("cache.save_image_id_map", False),
+    ]
+
+
 async def test_update_lora_entry_updates_cache_and_file(tmp_path: Path, recipe_scanner):
     scanner, stub = recipe_scanner
     recipes_dir = Path(config.loras_roots[0]) / "recipes"
@@ -4184,3 +4227,46 @@ async def test_find_all_duplicate_recipes_include_prompt_missing_gen_params(reci
     groups = await scanner.find_all_duplicate_recipes(include_prompt=True)
     # Recipes without gen_params/prompt normalize to empty prompt and match
     assert groups == {"abc:0.8\x1f": ["r1", "r2"]}
+
+
+async def test_paginated_name_and_date_orders_read_cache_views(recipe_scanner, monkeypatch):
+    scanner, _ = recipe_scanner
+    resorts: list[bool] = []
+    original_resort = RecipeCache.resort
+
+    async def counting_resort(self, *args, **kwargs):
+        resorts.append(True)
+        return await original_resort(self, *args, **kwargs)
+
+    monkeypatch.setattr(RecipeCache, "resort", counting_resort)
+
+    # Bursts of edits share a single pending resort
+    await asyncio.gather(
+        *(
+            scanner.add_recipe(
+                {
+                    "id": title,
+                    "file_path": f"path/{title}.png",
+                    "title": title,
+                    "modified": float(index),
+                    "created_date": float(index),
+                    "loras": [],
+                }
+            )
+            for index, title in enumerate(["delta", "alpha", "charlie", "bravo", "echo"])
+        )
+    )
+    await _wait_for_resort(scanner)
+    assert len(resorts) == 1
+
+    async def page_ids(sort_by, page):
+        result = await scanner.get_paginated_data(page=page, page_size=2, sort_by=sort_by)
+        return [item["id"] for item in result["items"]]
+
+    assert await page_ids("name", 1) == ["alpha", "bravo"]
+    assert await page_ids("name:desc", 1) == ["echo", "delta"]
+    assert await page_ids("name:desc", 3) == ["alpha"]
+    assert await page_ids("date", 1) == ["echo", "bravo"]
+    assert await page_ids("date:asc", 1) == ["delta", "alpha"]
+    assert await page_ids("date:asc", 3) == ["echo"]
+    assert await page_ids("date:asc", 4) == []
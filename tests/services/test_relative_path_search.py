@@ -379,3 +379,22 @@ async def test_search_relative_paths_no_filters_regression():
         f"flux{os.sep}detail-model.safetensors",
     ]
 
+
+
+@pytest.mark.asyncio
+async def test_search_relative_paths_uses_cache_search_index():
+    from py.services.model_cache import ModelCache
+
+    raw_data = [
+        {"file_path": "/models/flux/detail-model.safetensors", "file_name": "detail-model"},
+        {"file_path": "/models/flux/only-flux.safetensors", "file_name": "only-flux"},
+        {"file_path": "/models/sdxl/detail-xl.safetensors", "file_name": "detail-xl"},
+    ]
+    scanner = FakeScanner([], ["/models"])
+    scanner._cache = ModelCache(raw_data=raw_data, folders=[])
+    service = DummyService("stub", scanner, BaseModelMetadata)
+
+    matching = await service.search_relative_paths("flux/detail")
+
+    assert matching == [f"flux{os.sep}detail-model.safetensors"]
+    assert len(scanner._cache._search_index) == 3
@@ -997,6 +997,36 @@ def test_library_switch_preserves_extra_paths(manager, tmp_path):
     assert str(extra_dir2) in lib2["extra_folder_paths"]["loras"]
 
 
+
+def test_revision_moves_with_library_switches(tmp_path, monkeypatch):
+    settings_path = tmp_path / "settings.json"
+    monkeypatch.setattr(
+        "py.services.settings_manager.ensure_settings_file",
+        lambda logger=None: str(settings_path),
+    )
+    mgr = SettingsManager()
+    mgr.settings_file = str(settings_path)
+    lora_dir1 = tmp_path / "lib1_loras"
+    lora_dir2 = tmp_path / "lib2_loras"
+    lora_dir1.mkdir()
+    lora_dir2.mkdir()
+    mgr.create_library("library1", folder_paths={"loras": [str(lora_dir1)]}, activate=True)
+    mgr.create_library("library2", folder_paths={"loras": [str(lora_dir2)]})
+    seen = {mgr.revision}
+
+    def assert_moved():
+        assert mgr.revision not in seen
+        seen.add(mgr.revision)
+
+    mgr.activate_library("library2")
+    assert_moved()
+    mgr.set("civitai_api_key", "key")
+    assert_moved()
+    mgr.delete("civitai_api_key")
+    assert_moved()
+    mgr.delete_library("library2")
+    assert_moved()
+
 def test_extra_paths_validation_no_overlap_with_other_libraries(manager, tmp_path):
     """Test that extra paths cannot overlap with other libraries' paths."""
     lora_dir1 = tmp_path / "lib1_loras"
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from py.services.sqlite_executor import SQLiteExecutor, get_sqlite_executor
+
+
+@pytest.fixture
+def executor(tmp_path):
+    instance = SQLiteExecutor(str(tmp_path / "test.sqlite"), slow_query_seconds=60)
+    instance.write_sync(lambda conn: conn.execute("CREATE TABLE items (name TEXT PRIMARY KEY)"))
+    yield instance
+    instance.close()
+
+
+def _names(conn):
+    return [row["name"] for row in conn.execute("SELECT name FROM items ORDER BY name")]
+
+
+async def test_writes_commit_and_are_visible_to_readers(executor):
+    def _insert(conn, name):
+        conn.execute("INSERT INTO items (name) VALUES (?)", (name,))
+        return threading.current_thread().name
+
+    writer_thread = await executor.write(_insert, "alpha")
+    await executor.write(_insert, "beta")
+
+    assert writer_thread.startswith("lm-sqlite-writer")
+    assert await executor.read(_names) == ["alpha", "beta"]
+    reader_thread = await executor.read(lambda conn: threading.current_thread().name)
+    assert reader_thread.startswith("lm-sqlite-reader")
+    journal_mode = await executor.read(lambda conn: conn.execute("PRAGMA journal_mode").fetchone()[0])
+    assert journal_mode == "wal"
+
+
+async def test_failed_writes_roll_back(executor):
+    def _insert_then_fail(conn):
+        conn.execute("INSERT INTO items (name) VALUES ('partial')")
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await executor.write(_insert_then_fail)
+
+    assert await executor.read(_names) == []
+
+
+async def test_readers_are_read_only(executor):
+    with pytest.raises(Exception, match="readonly"):
+        await executor.read(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('x')"))
+
+
+async def test_slow_queries_do_not_block_the_event_loop(executor):
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(_ticker())
+    try:
+        await executor.read(lambda conn: time.sleep(0.2))
+    finally:
+        ticker.cancel()
+
+    assert ticks >= 5
+
+
+async def test_stats_record_each_label(executor):
+    await executor.write(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('a')"), label="insert")
+    await executor.read(_names)
+    await executor.read(_names)
+
+    stats = executor.stats()
+
+    assert stats["insert"]["calls"] == 1
+    assert stats["_names"]["calls"] == 2
+    assert stats["_names"]["max_ms"] >= stats["_names"]["avg_ms"] >= 0
+
+
+async def test_close_releases_connections_and_reopens_on_demand(executor):
+    await executor.write(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('kept')"))
+    await executor.read(_names)
+
+    executor.close()
+
+    assert executor._connections == []
+    assert await executor.read(_names) == ["kept"]
+
+
+def test_in_memory_databases_share_the_writer_connection():
+    executor = SQLiteExecutor(":memory:")
+    try:
+        executor.write_sync(lambda conn: conn.execute("CREATE TABLE items (name TEXT)"))
+        executor.write_sync(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('x')"))
+
+        assert executor.read_sync(_names) == ["x"]
+    finally:
+        executor.close()
+
+
+def test_executors_are_shared_per_database_file(tmp_path):
+    path = str(tmp_path / "shared.sqlite")
+
+    assert get_sqlite_executor(path) is get_sqlite_executor(path)
+    assert get_sqlite_executor(path) is not get_sqlite_executor(str(tmp_path / "other.sqlite"))
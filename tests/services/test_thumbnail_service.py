@@ -0,0 +1,102 @@
+"""Tests for the preview thumbnail cache."""
+
+import os
+
+import pytest
+from PIL import Image
+
+from py.services.thumbnail_service import ThumbnailService, snap_width
+
+
+def _write_image(path, size=(1200, 800), color=(200, 40, 40)):
+    Image.new("RGB", size, color).save(path, format="PNG")
+    return path
+
+
+@pytest.fixture
+def service(tmp_path):
+    thumbnails = ThumbnailService(cache_dir=str(tmp_path / "thumbs"), max_workers=2, ffmpeg_path="")
+    yield thumbnails
+    thumbnails.close()
+
+
+def test_snap_width_rounds_up_to_supported_sizes():
+    assert snap_width(1) == 160
+    assert snap_width(320) == 320
+    assert snap_width(321) == 480
+    assert snap_width(5000) == 960
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_is_downscaled_and_reused(tmp_path, service):
+    source = _write_image(tmp_path / "preview.png")
+
+    first = await service.get_thumbnail(source, 300)
+    second = await service.get_thumbnail(source, 320)
+
+    assert first == second
+    assert first.suffix == ".webp"
+    with Image.open(first) as image:
+        assert image.format == "WEBP"
+        assert image.size == (320, 213)
+    assert (service.hits, service.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_changed_source_gets_a_new_thumbnail(tmp_path, service):
+    source = _write_image(tmp_path / "preview.png")
+    first = await service.get_thumbnail(source, 320)
+
+    _write_image(source, size=(640, 640))
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = await service.get_thumbnail(source, 320)
+
+    assert second != first
+    with Image.open(second) as image:
+        assert image.size == (320, 320)
+
+
+@pytest.mark.asyncio
+async def test_videos_without_ffmpeg_have_no_poster(tmp_path, service):
+    video = tmp_path / "preview.mp4"
+    video.write_bytes(b"\x00\x00\x00\x18ftypmp42")
+
+    assert await service.get_thumbnail(video, 320) is None
+    # The failure is remembered instead of retried on every request
+    assert await service.get_thumbnail(video, 320) is None
+    assert service.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_thumbnails(tmp_path):
+    sources = [
+        _write_image(tmp_path / f"preview_{index}.png", color=(index * 40, 0, 0))
+        for index in range(4)
+    ]
+    service = ThumbnailService(cache_dir=str(tmp_path / "thumbs"), max_workers=1, ffmpeg_path="")
+    try:
+        first = await service.get_thumbnail(sources[0], 160)
+        size = first.stat().st_size
+        service._max_bytes = size * 2 + size // 2
+        os.utime(first, (1, 1))
+
+        for source in sources[1:]:
+            await service.get_thumbnail(source, 160)
+
+        assert not first.exists()
+        assert service.evictions >= 1
+        assert service.stats()["cache_bytes"] <= service._max_bytes
+    finally:
+        service.close()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_renders_existing_previews(tmp_path, service):
+    sources = [_write_image(tmp_path / f"preview_{index}.png") for index in range(3)]
+
+    warmed = await service.prewarm([*map(str, sources), str(tmp_path / "missing.png")], 320)
+
+    assert warmed == 3
+    assert await service.get_thumbnail(sources[0].resolve(), 320) is not None
+    assert service.hits == 1
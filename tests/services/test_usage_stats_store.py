@@ -0,0 +1,85 @@
+import pytest
+
+from py.services.usage_stats_store import UsageStatsStore, week_start
+
+
+@pytest.fixture
+def store(tmp_path):
+    instance = UsageStatsStore(str(tmp_path / "usage_stats.sqlite"))
+    yield instance
+    instance.close()
+
+
+def _event_count(store):
+    return store._db.read_sync(lambda conn: conn.execute("SELECT COUNT(*) FROM usage_events").fetchone()[0])
+
+
+def test_week_start_is_the_monday_of_the_week():
+    assert week_start("2024-01-15") == "2024-01-15"
+    assert week_start("2024-01-14") == "2024-01-08"
+    assert week_start("2024-01-01") == "2024-01-01"
+
+
+async def test_record_appends_events_and_updates_rollups(store):
+    await store.record({("loras", "a", "2024-01-14"): 2, ("loras", "b", "2024-01-15"): 1}, executions=2)
+    await store.record({("loras", "a", "2024-01-15"): 3, ("checkpoints", "c", "2024-01-15"): 1}, executions=1)
+
+    assert _event_count(store) == 4
+    assert await store.get_totals("loras") == {"a": 5, "b": 1}
+    assert await store.get_count("checkpoints", "c") == 1
+    assert await store.get_count("checkpoints", "missing") == 0
+    assert await store.get_meta("total_executions") == 3
+
+
+async def test_top_models_are_ranked_by_total(store):
+    await store.record(
+        {
+            ("loras", "low", "2024-01-15"): 1,
+            ("loras", "high", "2024-01-15"): 9,
+            ("loras", "mid", "2024-01-15"): 4,
+            ("checkpoints", "other", "2024-01-15"): 20,
+        }
+    )
+
+    assert await store.get_top("loras", 2) == [("high", 9), ("mid", 4)]
+
+
+async def test_timeline_sums_usage_per_day_and_week(store):
+    await store.record(
+        {
+            ("loras", "a", "2024-01-08"): 1,
+            ("loras", "a", "2024-01-14"): 2,
+            ("loras", "b", "2024-01-15"): 3,
+            ("embeddings", "e", "2024-01-15"): 1,
+        }
+    )
+
+    daily = await store.get_timeline("2024-01-14", "2024-01-15")
+    weekly = await store.get_timeline("2024-01-08", "2024-01-15", weekly=True)
+
+    assert daily == {"2024-01-14": {"loras": 2}, "2024-01-15": {"loras": 3, "embeddings": 1}}
+    assert weekly == {"2024-01-08": {"loras": 3}, "2024-01-15": {"loras": 3, "embeddings": 1}}
+
+
+async def test_import_legacy_replaces_contents_and_round_trips(store):
+    await store.record({("loras", "stale", "2023-12-01"): 5}, executions=5)
+    legacy = {
+        "checkpoints": {"c": {"total": 4, "history": {"2024-01-15": 4}}},
+        "loras": {"a": {"total": 7, "history": {"2024-01-14": 2, "2024-01-15": 3}}},
+        "embeddings": {},
+        "total_executions": 12,
+        "last_save_time": 100.0,
+    }
+
+    assert store.import_legacy(legacy) == 2
+
+    exported = await store.export()
+    assert exported["loras"] == {"a": {"total": 7, "history": {"2024-01-14": 2, "2024-01-15": 3}}}
+    assert exported["checkpoints"] == legacy["checkpoints"]
+    assert exported["embeddings"] == {}
+    assert exported["total_executions"] == 12
+    assert exported["last_save_time"] == 100.0
+    assert await store.get_timeline("2024-01-08", "2024-01-15", weekly=True) == {
+        "2024-01-08": {"loras": 2},
+        "2024-01-15": {"loras": 3, "checkpoints": 4},
+    }
@@ -1,3 +1,6 @@
+import asyncio
+import json
+import threading
 from datetime import datetime, timedelta
 
 import pytest
@@ -15,10 +18,25 @@ class DummyWebSocket:
             raise RuntimeError("WebSocket closed")
         self.messages.append(data)
 
+    async def send_str(self, data):
+        await self.send_json(json.loads(data))
+
+
+class GatedWebSocket(DummyWebSocket):
+    """A client whose sends block until the test opens the gate."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def send_str(self, data):
+        await self.gate.wait()
+        await super().send_str(data)
+
 
 @pytest.fixture
 def manager():
-    return WebSocketManager()
+    return WebSocketManager(progress_interval=0.05)
 
 
 async def test_broadcast_init_progress_replays_cached_payloads(manager):
@@ -119,9 +137,100 @@ async def test_broadcast_download_progress_to_multiple_updates(manager):
     await manager.broadcast_download_progress(download_id, {"progress": 10})
     await manager.broadcast_download_progress(download_id, {"progress": 75})
 
-    assert ws.messages == [{"progress": 10}, {"progress": 75}]
+    # The second frame waits for the client's next flush
+    assert ws.messages == [{"progress": 10}]
     assert manager.get_download_progress(download_id)["progress"] == 75
 
+    await manager.flush()
+    assert ws.messages == [{"progress": 10}, {"progress": 75}]
+
+
+async def test_progress_frames_are_coalesced_per_topic(manager):
+    ws = DummyWebSocket()
+    manager._download_websockets["a"] = ws
+    manager._download_websockets["b"] = ws
+
+    await manager.broadcast_download_progress("a", {"id": "a", "progress": 1})
+    for progress in range(2, 10):
+        await manager.broadcast_download_progress("a", {"id": "a", "progress": progress})
+        await manager.broadcast_download_progress("b", {"id": "b", "progress": progress})
+    await manager.flush()
+
+    assert ws.messages == [
+        {"id": "a", "progress": 1},
+        {"id": "a", "progress": 9},
+        {"id": "b", "progress": 9},
+    ]
+
+
+async def test_slow_client_does_not_delay_others_and_gets_latest_frame(manager):
+    slow = GatedWebSocket()
+    fast = DummyWebSocket()
+    manager._websockets.update({slow, fast})
+
+    for processed in range(1, 6):
+        await manager.broadcast({"type": "example_images_progress", "processed": processed})
+        await asyncio.sleep(0.06)
+    await manager.broadcast({"type": "models_changed"})
+
+    # The stalled client did not hold back the other one
+    assert {"type": "example_images_progress", "processed": 5} in fast.messages
+    assert slow.messages == []
+
+    slow.gate.set()
+    await manager.flush()
+
+    # Intermediate progress for the stalled client was dropped
+    assert slow.messages == [
+        {"type": "example_images_progress", "processed": 1},
+        {"type": "example_images_progress", "processed": 5},
+        {"type": "models_changed"},
+    ]
+    assert fast.messages[-1] == {"type": "models_changed"}
+
+
+async def test_failed_client_is_discarded(manager):
+    ws = DummyWebSocket()
+    ws.closed = True
+    manager._init_websockets.add(ws)
+
+    await manager.broadcast_init_progress({"progress": 5})
+
+    assert ws not in manager._init_websockets
+
+
+async def test_frames_published_from_a_worker_loop_are_sent_on_the_server_loop(manager):
+    ws = DummyWebSocket()
+    # Connection handlers bind the channel to the loop serving the socket
+    manager._channel(ws)
+    manager._init_websockets.add(ws)
+
+    def cold_scan():
+        # Like a cold cache build: a private loop closed once the scan is done
+        loop = asyncio.new_event_loop()
+        try:
+            for page_type in ("loras", "checkpoints"):
+                loop.run_until_complete(
+                    manager.broadcast_init_progress({"pageType": page_type})
+                )
+        finally:
+            loop.close()
+
+    worker = threading.Thread(target=cold_scan)
+    worker.start()
+    await asyncio.to_thread(worker.join)
+    await asyncio.sleep(0)
+    await manager.flush()
+
+    await manager.broadcast_init_progress({"pageType": "embeddings"})
+    await asyncio.wait_for(manager.flush(), timeout=5)
+
+    assert [message["pageType"] for message in ws.messages] == [
+        "loras",
+        "checkpoints",
+        "embeddings",
+    ]
+
 
 async def test_broadcast_download_progress_missing_socket(manager):
     await manager.broadcast_download_progress("missing", {"progress": 30})
@@ -181,14 +290,14 @@ async def test_broadcast_recipe_rematch_progress_stores_and_broadcasts(manager,
     payload = {"status": "started", "total": 3}
     broadcast_calls = []
 
-    async def fake_broadcast(data):
-        broadcast_calls.append(data)
+    async def fake_broadcast(data, topic=None):
+        broadcast_calls.append((data, topic))
 
     monkeypatch.setattr(manager, "broadcast", fake_broadcast)
 
     await manager.broadcast_recipe_rematch_progress(payload)
 
-    assert broadcast_calls == [payload]
+    assert broadcast_calls == [(payload, "recipe_rematch_progress")]
     assert manager.get_recipe_rematch_progress() == payload
 
 
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from types import SimpleNamespace
 from typing import Any, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from py.services.metadata_sync_service import MetadataSyncService
 from py.services.use_cases.bulk_metadata_refresh_use_case import (
     BulkMetadataRefreshUseCase,
     MetadataRefreshProgressReporter,
@@ -402,3 +405,112 @@ async def test_model_without_hash_skipped(use_case, mock_service, mock_metadata_
 
     assert result["processed"] == 1
     assert result["updated"] == 0
+
+
+class BatchingMetadataSync(MetadataSyncService):
+    """Metadata sync double exposing the batch hash lookup."""
+
+    def __init__(self, prefetched, result=(True, None)):
+        self.prefetched = prefetched
+        self.result = result
+        self.prefetch_calls = []
+        self.fetch_calls = []
+
+    async def prefetch_by_hashes(self, hashes):
+        self.prefetch_calls.append(list(hashes))
+        return {key: value for key, value in self.prefetched.items() if key in hashes}
+
+    async def fetch_and_update_model(self, **kwargs):
+        self.fetch_calls.append(kwargs)
+        return self.result
+
+
+def _pending_models(count):
+    return [
+        {
+            "file_path": f"/models/model_{index}.safetensors",
+            "sha256": f"HASH{index}",
+            "model_name": f"Model {index}",
+            "civitai": {},
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+@patch.object(metadata_manager.MetadataManager, "hydrate_model_data")
+async def test_hashes_are_looked_up_in_batches(mock_hydrate, mock_service, mock_settings):
+    mock_hydrate.return_value = None
+    models = _pending_models(3)
+    models[2]["civitai_deleted"] = True
+    mock_service.scanner.get_cached_data.return_value = SimpleNamespace(raw_data=models, resort=AsyncMock())
+    sync = BatchingMetadataSync({"hash0": {"id": 10}})
+    use_case = BulkMetadataRefreshUseCase(
+        service=mock_service, metadata_sync=sync, settings_service=mock_settings
+    )
+
+    result = await use_case.execute()
+
+    # Deleted models are resolved by the archive providers, not the batch lookup
+    assert sync.prefetch_calls == [["hash0", "hash1"]]
+    prefetched = {call["sha256"]: call.get("prefetched_metadata") for call in sync.fetch_calls}
+    assert prefetched == {"HASH0": {"id": 10}, "HASH1": None, "HASH2": None}
+    assert result["processed"] == 3
+    assert result["updated"] == 3
+
+
+@pytest.mark.asyncio
+@patch.object(metadata_manager.MetadataManager, "hydrate_model_data")
+async def test_consecutive_rate_limits_abort_the_refresh(mock_hydrate, mock_service, mock_settings):
+    mock_hydrate.return_value = None
+    mock_service.scanner.get_cached_data.return_value = SimpleNamespace(
+        raw_data=_pending_models(250), resort=AsyncMock()
+    )
+    sync = BatchingMetadataSync({}, result=(False, "Error fetching metadata: Rate limited"))
+    progress = MockProgressReporter()
+    use_case = BulkMetadataRefreshUseCase(
+        service=mock_service, metadata_sync=sync, settings_service=mock_settings
+    )
+
+    result = await use_case.execute(progress_callback=progress)
+
+    assert result["success"] is False
+    assert "Rate limit detected" in result["message"]
+    assert progress.progress_calls[-1]["status"] == "rate_limited"
+    # In-flight models may finish, but no further batch is started
+    assert 3 <= len(sync.fetch_calls) <= 100
+    assert len(sync.prefetch_calls) <= 2
+    assert result["processed"] == len(sync.fetch_calls)
+
+
+@pytest.mark.asyncio
+@patch.object(metadata_manager.MetadataManager, "hydrate_model_data")
+async def test_next_batch_is_hashed_while_the_current_one_refreshes(mock_hydrate, mock_service, mock_settings):
+    mock_hydrate.return_value = None
+    models = _pending_models(101)
+    models[100].update(sha256="", hash_status="pending")
+    mock_service.scanner.get_cached_data.return_value = SimpleNamespace(raw_data=models, resort=AsyncMock())
+    first_batch_refreshing = asyncio.Event()
+
+    async def calculate_hash(_file_path):
+        # Only completes once the first batch is already being refreshed
+        await first_batch_refreshing.wait()
+        return "HASH100"
+
+    mock_service.scanner.calculate_hash_for_model = calculate_hash
+
+    class SignallingSync(BatchingMetadataSync):
+        async def fetch_and_update_model(self, **kwargs):
+            first_batch_refreshing.set()
+            await asyncio.sleep(0)
+            return await super().fetch_and_update_model(**kwargs)
+
+    sync = SignallingSync({})
+    use_case = BulkMetadataRefreshUseCase(
+        service=mock_service, metadata_sync=sync, settings_service=mock_settings
+    )
+
+    result = await asyncio.wait_for(use_case.execute(), timeout=5)
+
+    assert result["processed"] == 101
+    assert sync.fetch_calls[-1]["sha256"] == "HASH100"
@@ -0,0 +1,98 @@
+import gzip
+import json
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from py.utils import http_responses
+from py.utils.http_responses import (
+    build_etag,
+    dumps_json,
+    etag_matches,
+    json_response,
+    not_modified,
+)
+
+
+def _request(headers=None, path="/api/lm/loras/list"):
+    return make_mocked_request("GET", path, headers=headers or {})
+
+
+def test_etag_matches_uses_weak_comparison_and_lists():
+    etag = build_etag("list", (1, 2))
+    opaque = etag[2:]
+
+    assert etag_matches(_request({"If-None-Match": etag}), etag)
+    assert etag_matches(_request({"If-None-Match": opaque}), etag)
+    assert etag_matches(_request({"If-None-Match": f'"other", {etag}'}), etag)
+    assert etag_matches(_request({"If-None-Match": "*"}), etag)
+    assert not etag_matches(_request({"If-None-Match": '"other"'}), etag)
+    assert not etag_matches(_request(), etag)
+
+
+def test_build_etag_depends_on_every_part():
+    assert build_etag("list", 1) == build_etag("list", 1)
+    assert build_etag("list", 1) != build_etag("list", 2)
+    assert build_etag("list", 1) != build_etag("tags", 1)
+
+
+def test_not_modified_carries_validator():
+    response = not_modified('W/"abc"')
+
+    assert response.status == 304
+    assert response.headers["ETag"] == 'W/"abc"'
+
+
+def test_dumps_json_falls_back_for_values_orjson_rejects():
+    payload = {"big": 2**70, "name": "ü"}
+
+    assert json.loads(dumps_json(payload)) == payload
+
+
+@pytest.mark.asyncio
+async def test_small_payloads_are_not_compressed():
+    response = await json_response(
+        _request({"Accept-Encoding": "gzip"}), {"success": True}, etag='W/"x"'
+    )
+
+    assert "Content-Encoding" not in response.headers
+    assert json.loads(response.body) == {"success": True}
+    assert response.headers["ETag"] == 'W/"x"'
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_are_gzipped_when_accepted():
+    payload = {"items": [{"name": f"model {i}"} for i in range(200)]}
+
+    response = await json_response(_request({"Accept-Encoding": "gzip, deflate"}), payload)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert json.loads(gzip.decompress(response.body)) == payload
+
+    # A later enable_compression() call must not encode the body again
+    response.enable_compression()
+    assert response.compression is False
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_prefer_brotli_when_available():
+    brotli = pytest.importorskip("brotli")
+    payload = {"items": [{"name": f"model {i}"} for i in range(200)]}
+
+    response = await json_response(_request({"Accept-Encoding": "gzip, br"}), payload)
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(response.body)) == payload
+
+
+@pytest.mark.asyncio
+async def test_refused_encodings_are_not_used(monkeypatch):
+    monkeypatch.setattr(http_responses, "brotli", None)
+    payload = {"items": [{"name": f"model {i}"} for i in range(200)]}
+
+    response = await json_response(_request({"Accept-Encoding": "br, gzip;q=0"}), payload)
+
+    assert "Content-Encoding" not in response.headers
+    assert json.loads(response.body) == payload
@@ -83,14 +83,16 @@ async def test_usage_stats_converts_legacy_format(tmp_path, monkeypatch):
     stats = UsageStats()
 
     today = datetime.now().strftime("%Y-%m-%d")
-    converted = stats.stats
+    converted = await stats.get_stats()
 
     assert converted["total_executions"] == 9
     assert converted["checkpoints"]["hash1"] == {"total": 3, "history": {today: 3}}
     assert converted["loras"]["hash2"] == {"total": 5, "history": {today: 5}}
 
     new_stats_path = settings_dir / "stats" / UsageStats.STATS_FILENAME
-    assert new_stats_path.exists()
+    assert not new_stats_path.exists()
+    assert new_stats_path.with_name(new_stats_path.name + UsageStats.MIGRATED_SUFFIX).exists()
+    assert (settings_dir / "stats" / UsageStats.STORE_FILENAME).exists()
 
     backup_path = new_stats_path.with_suffix(new_stats_path.suffix + UsageStats.BACKUP_SUFFIX)
     assert backup_path.exists()
@@ -98,17 +100,38 @@ async def test_usage_stats_converts_legacy_format(tmp_path, monkeypatch):
     await _finalize_usage_stats(created_tasks)
 
 
-async def test_usage_stats_save_stats_persists_file(tmp_path, monkeypatch):
+async def test_usage_stats_save_stats_persists_to_store(tmp_path, monkeypatch):
     stats, tasks, settings_dir, _ = _prepare_usage_stats(tmp_path, monkeypatch)
-    stats.stats["total_executions"] = 4
+    stats._pending_executions = 4
+    stats._increment_usage_counter("loras", "lora-hash", "2024-01-01")
+    stats._increment_usage_counter("loras", "lora-hash", "2024-01-01")
 
     saved = await stats.save_stats(force=True)
     assert saved is True
+    assert stats._is_dirty is False
+    assert not (settings_dir / "stats" / UsageStats.STATS_FILENAME).exists()
 
-    stats_path = settings_dir / "stats" / UsageStats.STATS_FILENAME
-    persisted = json.loads(stats_path.read_text(encoding="utf-8"))
-    assert persisted["total_executions"] == 4
-    assert persisted["last_save_time"] == stats.stats["last_save_time"]
+    UsageStats._instance = None
+    reopened = UsageStats()
+
+    assert await reopened.get_total_executions() == 4
+    assert await reopened.get_model_usage_count("lora", "lora-hash") == 2
+
+    await _finalize_usage_stats(tasks)
+
+
+async def test_usage_stats_save_respects_interval(tmp_path, monkeypatch):
+    stats, tasks, _, _ = _prepare_usage_stats(tmp_path, monkeypatch)
+    stats._increment_usage_counter("loras", "lora-hash", "2024-01-01")
+    assert await stats.save_stats() is True
+
+    stats._increment_usage_counter("loras", "lora-hash", "2024-01-02")
+    assert await stats.save_stats() is False
+    assert stats._is_dirty is True
+
+    # Reads flush pending usage regardless of the interval
+    assert await stats.get_usage_counts("loras") == {"lora-hash": 2}
+    assert stats._is_dirty is False
 
     await _finalize_usage_stats(tasks)
 
@@ -154,11 +177,12 @@ async def test_usage_stats_background_processor_handles_pending_prompts(tmp_path
 
     assert metadata_calls == ["prompt-42"]
     assert stats.pending_prompt_ids == set()
-    assert stats.stats["total_executions"] == 1
+    recorded = await stats.get_stats()
+    assert recorded["total_executions"] == 1
 
     today = datetime.now().strftime("%Y-%m-%d")
-    assert stats.stats["checkpoints"]["ckpt-hash"]["history"][today] == 1
-    assert stats.stats["loras"]["lora-hash"]["history"][today] == 1
+    assert recorded["checkpoints"]["ckpt-hash"]["history"][today] == 1
+    assert recorded["loras"]["lora-hash"]["history"][today] == 1
 
     await _finalize_usage_stats(tasks)
 
@@ -198,7 +222,7 @@ async def test_usage_stats_calculates_pending_checkpoint_hash_on_demand(tmp_path
 
     today = datetime.now().strftime("%Y-%m-%d")
     checkpoint_scanner.calculate_hash_for_model.assert_awaited_once_with("/models/pending_model.safetensors")
-    assert stats.stats["checkpoints"]["resolved-hash"]["history"][today] == 1
+    assert (await stats.get_stats())["checkpoints"]["resolved-hash"]["history"][today] == 1
 
     await _finalize_usage_stats(tasks)
 
@@ -237,7 +261,7 @@ async def test_usage_stats_skips_failed_checkpoint_hash_retry(tmp_path, monkeypa
     await stats._process_metadata(metadata_payload)
 
     checkpoint_scanner.calculate_hash_for_model.assert_not_awaited()
-    assert stats.stats["checkpoints"] == {}
+    assert await stats.get_usage_counts("checkpoints") == {}
 
     await _finalize_usage_stats(tasks)
 
@@ -276,7 +300,7 @@ async def test_usage_stats_resolves_manually_copied_checkpoint_from_disk(tmp_pat
     )
 
     today = datetime.now().strftime("%Y-%m-%d")
-    assert stats.stats["checkpoints"]["resolved-hash"]["history"][today] == 1
+    assert (await stats.get_stats())["checkpoints"]["resolved-hash"]["history"][today] == 1
 
     await _finalize_usage_stats(tasks)
 
@@ -299,8 +323,7 @@ async def test_usage_stats_skips_name_fallback_for_missing_lora_hash(tmp_path, m
 
     await stats._process_metadata(metadata_payload)
 
-    assert stats.stats["loras"] == {}
-    assert not any(key.startswith("name:") for key in stats.stats["loras"])
+    assert await stats.get_usage_counts("loras") == {}
 
     await _finalize_usage_stats(tasks)
 
@@ -336,10 +359,13 @@ async def test_usage_stats_migrates_from_old_location(tmp_path, monkeypatch):
     stats = UsageStats()
 
     new_path = settings_dir / "stats" / UsageStats.STATS_FILENAME
-    assert new_path.exists(), "Stats file should be migrated to new location"
+    migrated_path = new_path.with_name(new_path.name + UsageStats.MIGRATED_SUFFIX)
+    assert migrated_path.exists(), "Stats file should be migrated to new location and imported"
     assert not old_path.exists(), "Old stats file should be removed after migration"
-    assert stats.stats["total_executions"] == 3
-    assert stats.stats["loras"]["lora-hash"]["total"] == 3
+    assert await stats.get_total_executions() == 3
+    assert await stats.get_usage_counts("loras") == {"lora-hash": 3}
+    timeline = await stats.get_usage_timeline(1, today=datetime(2025, 1, 1).date())
+    assert timeline[0]["lora_usage"] == 3
 
     await _finalize_usage_stats(created_tasks)
 
@@ -375,7 +401,7 @@ async def test_usage_stats_uses_new_location_directly(tmp_path, monkeypatch):
 
     stats = UsageStats()
 
-    assert stats.stats["total_executions"] == 7
+    assert await stats.get_total_executions() == 7
     assert not loras_root.joinpath(UsageStats.STATS_FILENAME).exists()
 
     await _finalize_usage_stats(created_tasks)
@@ -287,3 +287,29 @@ def test_get_lora_info_not_found_returns_original(mock_lora_scanner):
 
     assert path == "nonexistent"
     assert triggers == []
+
+
+def test_get_lora_info_uses_registered_scanner_name_index(monkeypatch):
+    from py.config import config
+    from py.services.model_name_index import ModelNameIndex
+
+    index = ModelNameIndex()
+    index.rebuild([
+        {"file_name": "mylora", "folder": "SDXL", "file_path": "/models/Lora/SDXL/mylora.safetensors", "civitai": {"trainedWords": ["fast"]}},
+    ])
+
+    class _IndexedScanner:
+        def get_name_index(self):
+            return index
+
+    async def fail_async_lookup():
+        raise AssertionError("name index lookups must not touch the async cache API")
+
+    monkeypatch.setitem(ServiceRegistry._services, "lora_scanner", _IndexedScanner())
+    monkeypatch.setattr(ServiceRegistry, "get_lora_scanner", fail_async_lookup)
+    monkeypatch.setattr(config, "loras_roots", ["/models/Lora"])
+    monkeypatch.setattr(config, "extra_loras_roots", [])
+
+    assert get_lora_info("SDXL/mylora.safetensors") == ("SDXL/mylora.safetensors", ["fast"])
+    assert get_lora_info_absolute("mylora") == ("/models/Lora/SDXL/mylora.safetensors", ["fast"])
+    assert get_lora_info_absolute("missing") == ("missing", [])